@@ -1,7 +1,13 @@
 """Point d'entrée pour PyInstaller : assure que le package est sur sys.path puis lance l'app."""
+import multiprocessing
 import sys
 import os
 
+if __name__ == "__main__":
+    # Exécutable gelé : un worker du process pool (spawn) relancé sur ce script s'arrête ici au lieu
+    # de relancer l'interface. Sans effet hors PyInstaller.
+    multiprocessing.freeze_support()
+
 if getattr(sys, "frozen", False):
     # Exécutable PyInstaller : le bundle est extrait dans _MEIPASS
     sys.path.insert(0, sys._MEIPASS)
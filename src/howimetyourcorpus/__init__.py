@@ -1,8 +1,15 @@
 """HowIMetYourCorpus — Pipeline de corpus + exploration + QA."""
 
-from importlib.metadata import version as _pkg_version, PackageNotFoundError as _PNF
 
-try:
-    __version__: str = _pkg_version("howimetyourcorpus")
-except _PNF:
-    __version__ = "0.0.0+dev"
+def __getattr__(name: str) -> str:
+    # __version__ paresseux : importlib.metadata coûte ~30 ms au démarrage (CLI himyc).
+    if name == "__version__":
+        from importlib.metadata import version as _pkg_version, PackageNotFoundError as _PNF
+
+        try:
+            value = _pkg_version("howimetyourcorpus")
+        except _PNF:
+            value = "0.0.0+dev"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
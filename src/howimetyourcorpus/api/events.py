@@ -0,0 +1,123 @@
+"""api/events.py — Diffusion en process des événements de jobs (transitions, progression, logs).
+
+Chaque abonné (flux SSE GET /jobs/events) reçoit sa propre file bornée : un client lent ne
+bloque jamais le worker. Si la file est pleine, l'événement le plus ancien est abandonné
+(compteur `dropped`) ; les transitions d'état restent récupérables via GET /jobs.
+Le flux SSE attend avec `Subscription.get_async` : la boucle asyncio est réveillée par
+`call_soon_threadsafe`, sans thread du pool Starlette bloqué par client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import threading
+from typing import Any
+
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 256
+
+EVENT_SNAPSHOT = "snapshot"
+EVENT_JOB      = "job"
+EVENT_PROGRESS = "progress"
+EVENT_LOG      = "log"
+
+
+class Subscription:
+    """File bornée d'un abonné."""
+
+    def __init__(self, maxsize: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE) -> None:
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=max(1, maxsize))
+        self.dropped = 0
+        self._lock = threading.Lock()
+        # (boucle, événement) du lecteur asynchrone en attente (get_async), réveillé par offer().
+        self._waiter: tuple[asyncio.AbstractEventLoop, asyncio.Event] | None = None
+
+    def offer(self, event: dict[str, Any]) -> None:
+        """Ajoute sans bloquer ; abandonne le plus ancien événement si la file est pleine."""
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                break
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+        with self._lock:
+            waiter = self._waiter
+        if waiter is not None:
+            loop, ready = waiter
+            try:
+                loop.call_soon_threadsafe(ready.set)
+            except RuntimeError:
+                pass  # boucle fermée : plus de lecteur
+
+    def get(self, timeout: float | None = None) -> dict[str, Any] | None:
+        """Prochain événement, ou None après `timeout` secondes."""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    async def get_async(self, timeout: float) -> dict[str, Any] | None:
+        """Comme get(), depuis une coroutine : attend sur la boucle sans occuper de thread."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._waiter is None or self._waiter[0] is not loop:
+                self._waiter = (loop, asyncio.Event())
+            ready = self._waiter[1]
+        deadline = loop.time() + timeout
+        while True:
+            # clear() avant de regarder la file : un offer() concurrent reposera l'événement.
+            ready.clear()
+            try:
+                return self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(ready.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+
+class EventBroadcaster:
+    """Diffuseur thread-safe : publish() est non bloquant quel que soit le nombre d'abonnés."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: list[Subscription] = []
+
+    def subscribe(self, maxsize: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE) -> Subscription:
+        sub = Subscription(maxsize)
+        with self._lock:
+            self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, event_type: str, data: dict[str, Any]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        if not subscribers:
+            return
+        event = {"event": event_type, "data": data}
+        for sub in subscribers:
+            sub.offer(event)
+
+
+def format_sse(event: dict[str, Any]) -> str:
+    """Sérialise un événement au format text/event-stream."""
+    payload = json.dumps(event["data"], ensure_ascii=False)
+    return f"event: {event['event']}\ndata: {payload}\n\n"
@@ -4,24 +4,48 @@ Jobs supportés :
   - normalize_transcript : NormalizeEpisodeStep (raw → clean)
   - normalize_srt        : normalize_subtitle_track (cues text_raw → text_clean via DB)
   - segment_transcript   : SegmentEpisodeStep (clean → segments)
-
-Persistance : {project_path}/jobs.json (réécrit à chaque mutation).
-Reprise     : les jobs "running" au redémarrage sont remis en "pending".
-Worker      : thread unique, prend les jobs pending dans l'ordre FIFO.
+  - align                : AlignEpisodeStep (segments/cues → liens d'alignement)
+  - *_batch              : même traitement sur params["episode_ids"] (liste résolue à la création,
+                           ex. depuis un filtre de saison) ; une seule session DB, un seul chargement
+                           des profils ; résultat par épisode dans result["items"].
+
+Persistance : {project_path}/jobs.db (SQLite, une ligne par job : chaque transition d'état
+              est un UPSERT d'une ligne). La progression (mark_progress) reste en mémoire.
+              Un ancien jobs.json est importé au premier démarrage puis renommé jobs.json.bak.
+Rétention   : les jobs terminés au-delà de JOB_RETENTION_DAYS / JOB_RETENTION_MAX_FINISHED
+              sont purgés au démarrage (prune()).
+Reprise     : les jobs "running" au redémarrage sont remis en "pending". Les jobs batch d'alignement
+              tiennent un checkpoint par job_id (checkpoints/<job_id>.json, voir core.pipeline.checkpoint) :
+              relancés (redémarrage ou resume() après annulation), ils sautent les épisodes déjà faits.
+              Un job batch en cours s'annule via son CancellationToken (cancel()).
+Traçage     : params["trace"] = true active un Tracer pendant le job ; trace Chrome, CSV et résumé
+              sont écrits dans runs/<job_id>.* (résumé servi par GET /runs/traces).
+Événements  : JobStore.events diffuse transitions, progression et logs (flux SSE GET /jobs/events).
+Worker      : pool de threads par file typée (JOB_LANES) : "cpu" (normalisation, segmentation,
+              exécutées dans des sous-processus) et "align" (thread, progression). Réveil par
+              variable de condition (pas de polling). Un seul job à la fois par épisode, dans
+              l'ordre FIFO de création. Un job batch verrouille tous ses épisodes.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import multiprocessing
+import os
+import sqlite3
 import threading
 import time
 import uuid
-from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from howimetyourcorpus.api.events import EVENT_JOB, EVENT_LOG, EVENT_PROGRESS, EventBroadcaster
 from howimetyourcorpus.core.constants import DEFAULT_NORMALIZE_PROFILE
+from howimetyourcorpus.core.pipeline.checkpoint import CancellationToken, StepCheckpoint, discard_checkpoint
+from howimetyourcorpus.core.utils.tracing import Tracer, activate, trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -33,13 +57,73 @@ DONE     = "done"
 ERROR    = "error"
 CANCELLED = "cancelled"
 
+FINISHED_STATUSES = (DONE, ERROR, CANCELLED)
+
+JOBS_DB_FILENAME          = "jobs.db"
+LEGACY_JOBS_JSON_FILENAME = "jobs.json"
+
+JOB_RETENTION_DAYS         = 30
+"""Les jobs terminés plus anciens sont purgés au démarrage."""
+JOB_RETENTION_MAX_FINISHED = 1000
+"""Nombre maximal de jobs terminés conservés (les plus récents)."""
+
 JOB_TYPES = frozenset([
     "normalize_transcript",
     "normalize_srt",
     "segment_transcript",
     "align",
+    "normalize_transcript_batch",
+    "segment_batch",
+    "align_batch",
 ])
 
+BATCH_JOB_TYPES: dict[str, str] = {
+    "normalize_transcript_batch": "normalize_transcript",
+    "segment_batch":              "segment_transcript",
+    "align_batch":                "align",
+}
+"""Type batch -> type unitaire appliqué à chaque épisode de params["episode_ids"]."""
+
+# ── Files typées ───────────────────────────────────────────────────────────
+
+LANE_CPU   = "cpu"
+LANE_ALIGN = "align"
+
+JOB_LANES: dict[str, str] = {
+    "normalize_transcript": LANE_CPU,
+    "normalize_srt":        LANE_CPU,
+    "segment_transcript":   LANE_CPU,
+    "align":                LANE_ALIGN,
+    "normalize_transcript_batch": LANE_CPU,
+    "segment_batch":              LANE_CPU,
+    "align_batch":                LANE_ALIGN,
+}
+"""File de chaque type de job : un align long ne bloque pas les normalisations."""
+
+PROCESS_JOB_TYPES = frozenset(["normalize_transcript", "normalize_srt", "segment_transcript"])
+"""Jobs CPU exécutés dans un sous-processus (pas de callback de progression).
+Les batchs CPU restent dans le thread : ils répartissent eux-mêmes leurs épisodes (DagPipelineRunner)."""
+
+DEFAULT_LANE_WORKERS: dict[str, int] = {
+    LANE_CPU:   max(1, min(4, os.cpu_count() or 1)),
+    LANE_ALIGN: 1,
+}
+
+
+class JobCancelled(RuntimeError):
+    """Job interrompu par son CancellationToken ; `result` porte l'état partiel."""
+
+    def __init__(self, result: dict[str, Any] | None = None) -> None:
+        super().__init__("Job annulé")
+        self.result = result or {}
+
+
+def job_episode_ids(job_type: str, episode_id: str, params: dict[str, Any]) -> list[str]:
+    """Épisodes couverts par un job : params["episode_ids"] pour un batch, sinon [episode_id]."""
+    if job_type in BATCH_JOB_TYPES:
+        return [str(e) for e in params.get("episode_ids") or []]
+    return [episode_id]
+
 
 # ── JobRecord ──────────────────────────────────────────────────────────────
 
@@ -106,40 +190,124 @@ class JobRecord:
 
 # ── JobStore ───────────────────────────────────────────────────────────────
 
+_JOBS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id     TEXT PRIMARY KEY,
+    job_type   TEXT NOT NULL,
+    episode_id TEXT NOT NULL,
+    source_key TEXT NOT NULL DEFAULT '',
+    status     TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    error_msg  TEXT,
+    result     TEXT NOT NULL DEFAULT '{}',
+    params     TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_updated ON jobs(status, updated_at);
+"""
+
+_INSERT_JOB_SQL = """
+INSERT INTO jobs (job_id, job_type, episode_id, source_key, status, created_at, updated_at,
+                  error_msg, result, params)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPSERT_JOB_SQL = _INSERT_JOB_SQL + """
+ON CONFLICT(job_id) DO UPDATE SET
+    status = excluded.status,
+    updated_at = excluded.updated_at,
+    error_msg = excluded.error_msg,
+    result = excluded.result
+"""
+
+
+def _job_row(job: JobRecord) -> tuple[Any, ...]:
+    # _progress est un état transitoire en mémoire : jamais écrit sur disque.
+    result = {k: v for k, v in job.result.items() if k != "_progress"}
+    return (
+        job.job_id, job.job_type, job.episode_id, job.source_key, job.status,
+        job.created_at, job.updated_at, job.error_msg,
+        json.dumps(result, ensure_ascii=False), json.dumps(job.params, ensure_ascii=False),
+    )
+
+
 class JobStore:
-    """File de jobs persistante sur disque.
+    """File de jobs persistante sur disque (journal SQLite jobs.db).
 
-    Thread-safe via Lock interne. Le worker thread appelle get_next_pending() /
-    mark_running() / mark_done() / mark_error() au fil de l'exécution.
+    Les jobs sont gardés en mémoire (lecture, ordonnancement) ; chaque transition d'état
+    durable n'écrit que la ligne du job concerné. Thread-safe via Lock interne.
+
+    Les workers appellent claim_next() (bloquant sur une variable de condition, réveillée
+    par create() et par la fin d'un job) puis mark_done() / mark_error() / mark_cancelled().
     """
 
     def __init__(self, project_path: Path) -> None:
-        self._path = project_path / "jobs.json"
+        self._root = project_path
+        self._path = project_path / JOBS_DB_FILENAME
+        self._legacy_path = project_path / LEGACY_JOBS_JSON_FILENAME
         self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
         self._jobs: dict[str, JobRecord] = {}
+        self._busy_episodes: set[str] = set()
+        self._tokens: dict[str, CancellationToken] = {}
+        self.events = EventBroadcaster()
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_JOBS_SCHEMA)
+        self._import_legacy_json()
         self._load()
         self._recover_interrupted()
+        self.prune(older_than_days=JOB_RETENTION_DAYS, keep_finished=JOB_RETENTION_MAX_FINISHED)
 
     # ── Persistance ────────────────────────────────────────────────────
 
-    def _load(self) -> None:
-        if not self._path.exists():
+    def _import_legacy_json(self) -> None:
+        """Importe un jobs.json (ancien format, réécrit à chaque mutation) puis le renomme en .bak."""
+        if not self._legacy_path.exists():
             return
         try:
-            data = json.loads(self._path.read_text(encoding="utf-8"))
-            for d in data.get("jobs", []):
-                rec = JobRecord.from_dict(d)
-                self._jobs[rec.job_id] = rec
+            data = json.loads(self._legacy_path.read_text(encoding="utf-8"))
+            records = [JobRecord.from_dict(d) for d in data.get("jobs", [])]
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    _INSERT_JOB_SQL + " ON CONFLICT(job_id) DO NOTHING",
+                    [_job_row(r) for r in records],
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            self._legacy_path.replace(self._legacy_path.with_name(LEGACY_JOBS_JSON_FILENAME + ".bak"))
+            logger.info("JobStore : %d job(s) importé(s) depuis jobs.json", len(records))
         except Exception:
-            logger.exception("JobStore : erreur lecture jobs.json — démarrage avec file vide")
+            logger.exception("JobStore : erreur import jobs.json — ancien fichier conservé")
 
-    def _save(self) -> None:
-        """Réécrit jobs.json (appelé sous lock)."""
+    def _load(self) -> None:
         try:
-            payload = {"jobs": [j.to_dict() for j in self._jobs.values()]}
-            self._path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        except Exception:
-            logger.exception("JobStore : erreur écriture jobs.json")
+            rows = self._conn.execute(
+                "SELECT job_id, job_type, episode_id, source_key, status, created_at, updated_at,"
+                " error_msg, result, params FROM jobs ORDER BY rowid"
+            ).fetchall()
+        except sqlite3.Error:
+            logger.exception("JobStore : erreur lecture jobs.db — démarrage avec file vide")
+            return
+        for job_id, job_type, episode_id, source_key, status, created_at, updated_at, error_msg, result, params in rows:
+            self._jobs[job_id] = JobRecord(
+                job_type, episode_id, source_key,
+                job_id=job_id, status=status, created_at=created_at, updated_at=updated_at,
+                error_msg=error_msg, result=json.loads(result or "{}"), params=json.loads(params or "{}"),
+            )
+
+    def _persist(self, job: JobRecord) -> None:
+        """Écrit la ligne d'un job (appelé sous lock) : O(1) quel que soit l'historique.
+        Diffuse aussi la transition aux abonnés (non bloquant)."""
+        try:
+            self._conn.execute(_UPSERT_JOB_SQL, _job_row(job))
+        except sqlite3.Error:
+            logger.exception("JobStore : erreur écriture jobs.db (%s)", job.job_id)
+        self.events.publish(EVENT_JOB, job.to_dict())
 
     def _recover_interrupted(self) -> None:
         """Remet en 'pending' les jobs bloqués en 'running' au redémarrage."""
@@ -149,11 +317,56 @@ class JobStore:
                 if job.status == RUNNING:
                     job.status     = PENDING
                     job.updated_at = _now()
+                    self._persist(job)
                     recovered += 1
             if recovered:
-                self._save()
                 logger.info("JobStore : %d job(s) remis en pending après redémarrage", recovered)
 
+    def prune(
+        self,
+        *,
+        older_than_days: float | None = None,
+        keep_finished: int | None = None,
+    ) -> int:
+        """
+        Purge les jobs terminés (done/error/cancelled) : ceux mis à jour il y a plus de
+        `older_than_days` jours, puis au-delà des `keep_finished` plus récents.
+        Retourne le nombre de jobs supprimés.
+        """
+        with self._lock:
+            finished = sorted(
+                (j for j in self._jobs.values() if j.status in FINISHED_STATUSES),
+                key=lambda j: j.updated_at,
+                reverse=True,
+            )
+            doomed: list[str] = []
+            if older_than_days is not None:
+                cutoff = (datetime.now(timezone.utc) - timedelta(days=older_than_days)).isoformat()
+                doomed += [j.job_id for j in finished if j.updated_at < cutoff]
+            if keep_finished is not None:
+                doomed += [j.job_id for j in finished[max(0, keep_finished):]]
+            doomed = list(dict.fromkeys(doomed))
+            if not doomed:
+                return 0
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.executemany("DELETE FROM jobs WHERE job_id = ?", [(jid,) for jid in doomed])
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                logger.exception("JobStore : erreur purge jobs.db")
+                return 0
+            for jid in doomed:
+                del self._jobs[jid]
+                discard_checkpoint(self._root, jid)
+            logger.info("JobStore : %d job(s) terminé(s) purgé(s)", len(doomed))
+            return len(doomed)
+
+    def close(self) -> None:
+        """Ferme la connexion jobs.db."""
+        with self._lock:
+            self._conn.close()
+
     # ── CRUD ────────────────────────────────────────────────────────────
 
     def create(
@@ -161,9 +374,10 @@ class JobStore:
         *, params: dict[str, Any] | None = None,
     ) -> JobRecord:
         rec = JobRecord(job_type, episode_id, source_key, params=params)
-        with self._lock:
+        with self._cond:
             self._jobs[rec.job_id] = rec
-            self._save()
+            self._persist(rec)
+            self._cond.notify_all()
         return rec
 
     def get(self, job_id: str) -> JobRecord | None:
@@ -175,39 +389,108 @@ class JobStore:
             return list(self._jobs.values())
 
     def cancel(self, job_id: str) -> bool:
-        """Annule un job en 'pending'. Retourne True si annulé."""
+        """
+        Annule un job 'pending', ou demande l'arrêt d'un job 'running' interruptible (batch) :
+        il passe en 'cancelled' à la fin de son épisode courant. Retourne True si accepté.
+        """
         with self._lock:
             job = self._jobs.get(job_id)
             if job and job.status == PENDING:
                 job.status     = CANCELLED
                 job.updated_at = _now()
-                self._save()
+                self._persist(job)
+                return True
+            token = self._tokens.get(job_id)
+            if job and job.status == RUNNING and token is not None:
+                token.cancel()
                 return True
         return False
 
-    def get_next_pending(self) -> JobRecord | None:
+    def resume(self, job_id: str) -> bool:
+        """Remet en 'pending' un job annulé ou en erreur (même job_id : son checkpoint est repris)."""
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if not job or job.status not in (CANCELLED, ERROR):
+                return False
+            job.status     = PENDING
+            job.error_msg  = None
+            job.updated_at = _now()
+            self._persist(job)
+            self._cond.notify_all()
+            return True
+
+    def start_run(self, job_id: str) -> CancellationToken:
+        """Jeton d'annulation d'un job qui démarre (rend cancel() effectif pendant l'exécution)."""
         with self._lock:
-            for job in self._jobs.values():
-                if job.status == PENDING:
-                    return job
+            token = self._tokens[job_id] = CancellationToken()
+            return token
+
+    def end_run(self, job_id: str) -> None:
+        with self._lock:
+            self._tokens.pop(job_id, None)
+
+    def _claimable(self, lanes: frozenset[str]) -> JobRecord | None:
+        """Premier job pending d'une des files, sans autre job actif ou antérieur sur son épisode (sous lock)."""
+        blocked = set(self._busy_episodes)
+        for job in self._jobs.values():
+            if job.status != PENDING:
+                continue
+            episodes = set(job_episode_ids(job.job_type, job.episode_id, job.params))
+            if not episodes & blocked and JOB_LANES.get(job.job_type, LANE_CPU) in lanes:
+                return job
+            # Ordre FIFO par épisode : un job plus récent ne double pas un job pending antérieur.
+            blocked |= episodes
         return None
 
-    def mark_running(self, job_id: str) -> None:
+    def claim_next(self, lanes: frozenset[str], timeout: float | None = None) -> JobRecord | None:
+        """
+        Réserve atomiquement le prochain job exécutable des files `lanes` (statut running +
+        verrou d'épisode). Attend au plus `timeout` secondes qu'un job devienne disponible.
+        """
+        with self._cond:
+            job = self._claimable(lanes)
+            if job is None:
+                self._cond.wait(timeout)
+                job = self._claimable(lanes)
+            if job is None:
+                return None
+            job.status     = RUNNING
+            job.updated_at = _now()
+            self._busy_episodes.update(job_episode_ids(job.job_type, job.episode_id, job.params))
+            self._persist(job)
+            return job
+
+    def wake_all(self) -> None:
+        """Réveille les workers en attente (arrêt)."""
+        with self._cond:
+            self._cond.notify_all()
+
+    def _release(self, job: JobRecord) -> None:
+        """Libère le verrou d'épisode d'un job terminé et réveille les workers (sous lock)."""
+        self._busy_episodes.difference_update(job_episode_ids(job.job_type, job.episode_id, job.params))
+        self._cond.notify_all()
+
+    def mark_done(self, job_id: str, result: dict[str, Any] | None = None) -> None:
         with self._lock:
             job = self._jobs.get(job_id)
             if job:
-                job.status     = RUNNING
+                job.status     = DONE
                 job.updated_at = _now()
-                self._save()
+                job.result     = result or {}
+                self._persist(job)
+                self._release(job)
+        discard_checkpoint(self._root, job_id)
 
-    def mark_done(self, job_id: str, result: dict[str, Any] | None = None) -> None:
+    def mark_cancelled(self, job_id: str, result: dict[str, Any] | None = None) -> None:
+        """Job running interrompu : garde le résultat partiel et le checkpoint (reprise via resume())."""
         with self._lock:
             job = self._jobs.get(job_id)
             if job:
-                job.status     = DONE
+                job.status     = CANCELLED
                 job.updated_at = _now()
                 job.result     = result or {}
-                self._save()
+                self._persist(job)
+                self._release(job)
 
     def mark_error(self, job_id: str, error_msg: str) -> None:
         with self._lock:
@@ -216,7 +499,8 @@ class JobStore:
                 job.status     = ERROR
                 job.updated_at = _now()
                 job.error_msg  = error_msg
-                self._save()
+                self._persist(job)
+                self._release(job)
 
     def mark_progress(self, job_id: str, progress: dict[str, Any]) -> None:
         """Met à jour _progress dans result pendant l'exécution (G-007 / MX-048).
@@ -225,6 +509,11 @@ class JobStore:
             job = self._jobs.get(job_id)
             if job and job.status == RUNNING:
                 job.result = {**job.result, "_progress": progress}
+                self.events.publish(EVENT_PROGRESS, {"job_id": job_id, **progress})
+
+    def publish_log(self, job_id: str, level: str, message: str) -> None:
+        """Diffuse une ligne de log d'un job en cours (non persistée)."""
+        self.events.publish(EVENT_LOG, {"job_id": job_id, "level": level, "message": message})
 
     def has_active(self) -> bool:
         """True si au moins un job est pending ou running."""
@@ -235,103 +524,211 @@ class JobStore:
 # ── Worker ─────────────────────────────────────────────────────────────────
 
 class JobWorker:
-    """Worker thread unique qui exécute les jobs pending dans l'ordre FIFO."""
+    """
+    Pool de workers par file (voir JOB_LANES) : `lane_workers[lane]` threads par file, qui
+    réservent les jobs via JobStore.claim_next(). Les types PROCESS_JOB_TYPES sont exécutés
+    dans le pool de sous-processus partagé (spawn, tous projets) si use_processes, sinon
+    dans le thread.
+    """
 
-    def __init__(self, store: JobStore, get_project_path: Any) -> None:
+    def __init__(
+        self,
+        store: JobStore,
+        get_project_path: Any,
+        *,
+        lane_workers: dict[str, int] | None = None,
+        use_processes: bool = True,
+    ) -> None:
         self._store            = store
         self._get_project_path = get_project_path
-        self._thread: threading.Thread | None = None
+        self._lane_workers     = {**DEFAULT_LANE_WORKERS, **(lane_workers or {})}
+        self._use_processes    = use_processes
+        self._threads: list[threading.Thread] = []
         self._stop_event       = threading.Event()
 
     def start(self) -> None:
-        if self._thread and self._thread.is_alive():
+        if any(t.is_alive() for t in self._threads):
             return
         self._stop_event.clear()
-        self._thread = threading.Thread(target=self._loop, daemon=True, name="himyc-job-worker")
-        self._thread.start()
-        logger.info("JobWorker démarré")
-
-    def stop(self) -> None:
+        self._threads = []
+        for lane, count in self._lane_workers.items():
+            for i in range(max(0, count)):
+                thread = threading.Thread(
+                    target=self._loop,
+                    args=(frozenset([lane]),),
+                    daemon=True,
+                    name=f"himyc-job-{lane}-{i}",
+                )
+                thread.start()
+                self._threads.append(thread)
+        logger.info("JobWorker démarré (%s)", ", ".join(f"{k}={v}" for k, v in self._lane_workers.items()))
+
+    def stop(self, wait: bool = False) -> None:
         self._stop_event.set()
+        self._store.wake_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
 
-    def _loop(self) -> None:
+    def _loop(self, lanes: frozenset[str]) -> None:
         while not self._stop_event.is_set():
-            job = self._store.get_next_pending()
+            job = self._store.claim_next(lanes, timeout=5.0)
             if job:
                 self._run_job(job)
-            else:
-                time.sleep(0.5)
 
     def _run_job(self, job: JobRecord) -> None:
         logger.info("JobWorker : démarrage %s %s/%s", job.job_type, job.episode_id, job.source_key)
-        self._store.mark_running(job.job_id)
 
         import re as _re
 
+        started = time.monotonic()
+
         def _on_progress(_step: str, pct_float: float, message: str) -> None:
             """Callback transmis à AlignEpisodeStep.run() → mise à jour _progress."""
             m = _re.search(r"(\d+)/(\d+)", message)
             segments_done  = int(m.group(1)) if m else 0
             segments_total = int(m.group(2)) if m else 0
+            elapsed = time.monotonic() - started
             self._store.mark_progress(job.job_id, {
                 "progress_pct":    round(pct_float * 100),
                 "segments_done":   segments_done,
                 "segments_total":  segments_total,
+                "segments_per_s":  round(segments_done / elapsed, 2) if elapsed > 0 else 0.0,
             })
 
+        def _on_log(level: str, message: str) -> None:
+            self._store.publish_log(job.job_id, level, message)
+
+        token = self._store.start_run(job.job_id) if job.job_type in BATCH_JOB_TYPES else None
         try:
             project_path = self._get_project_path()
-            result = _execute_job(job, project_path, on_progress=_on_progress)
+            if self._use_processes and job.job_type in PROCESS_JOB_TYPES:
+                from howimetyourcorpus.core.storage.project_store import ProjectStore
+
+                _check_preconditions(job, ProjectStore(project_path))
+                future = _process_pool().submit(_execute_job_dict, job.to_dict(), project_path)
+                result = future.result()
+            else:
+                result = _execute_job(
+                    job, project_path, on_progress=_on_progress, on_log=_on_log, cancel_token=token,
+                )
+            _record_prep_status(job, project_path)
             self._store.mark_done(job.job_id, result)
             logger.info("JobWorker : done %s %s", job.job_type, job.episode_id)
+        except JobCancelled as e:
+            logger.info("JobWorker : annulé %s %s", job.job_type, job.job_id)
+            self._store.mark_cancelled(job.job_id, e.result)
         except Exception as e:
             logger.exception("JobWorker : erreur %s %s", job.job_type, job.episode_id)
             self._store.mark_error(job.job_id, str(e))
+        finally:
+            self._store.end_run(job.job_id)
 
 
 # ── Exécution job ──────────────────────────────────────────────────────────
 
+def _execute_job_dict(job_dict: dict[str, Any], project_path: Path) -> dict[str, Any]:
+    """Point d'entrée sous-processus : reconstruit le JobRecord puis exécute le job."""
+    return _execute_job(JobRecord.from_dict(job_dict), project_path)
+
+
+def _record_prep_status(job: JobRecord, project_path: Path) -> None:
+    """
+    Statut de préparation d'un job terminé, écrit par le processus serveur (jamais par un
+    sous-processus du pool : le fichier de statuts n'est modifié que sous le verrou du store).
+    """
+    if job.job_type == "normalize_transcript":
+        source_key = "transcript"
+    elif job.job_type == "normalize_srt":
+        source_key = job.source_key
+    else:
+        return
+    from howimetyourcorpus.core.storage.project_store import ProjectStore
+
+    ProjectStore(project_path).set_episode_prep_status(job.episode_id, source_key, "normalized")
+
+
+def _srt_lang(job: JobRecord) -> str:
+    return job.source_key.removeprefix("srt_") if job.source_key.startswith("srt_") else job.source_key
+
+
+def _check_preconditions(job: JobRecord, store: Any) -> None:
+    """Pré-conditions (MX-008) d'un job ; vérifiées avant tout envoi en sous-processus."""
+    if job.job_type == "normalize_transcript" and not store.has_episode_raw(job.episode_id):
+        raise RuntimeError(
+            f"Transcript RAW introuvable pour {job.episode_id!r}. "
+            "Importez un transcript avant de normaliser."
+        )
+    if job.job_type == "segment_transcript" and not store.has_episode_clean(job.episode_id):
+        raise RuntimeError(
+            f"Transcript normalisé introuvable pour {job.episode_id!r}. "
+            "Normalisez le transcript avant de segmenter."
+        )
+    if job.job_type == "normalize_srt":
+        lang = _srt_lang(job)
+        if not store.has_episode_subs(job.episode_id, lang):
+            raise RuntimeError(
+                f"Piste SRT {lang!r} introuvable pour {job.episode_id!r}. "
+                "Importez la piste SRT avant de normaliser."
+            )
+    if job.job_type in ("normalize_srt", "align") and not store.get_db_path().exists():
+        raise RuntimeError("corpus.db introuvable — indexez d'abord le projet.")
+
+
 def _execute_job(
     job: JobRecord,
     project_path: Path,
     on_progress: Any = None,
+    on_log: Any = None,
+    cancel_token: CancellationToken | None = None,
 ) -> dict[str, Any]:
-    """Exécute un job de façon synchrone. Lève une exception en cas d'erreur."""
+    """Exécute un job de façon synchrone. Lève une exception en cas d'erreur (JobCancelled si annulé)."""
     from howimetyourcorpus.core.storage.project_store import ProjectStore
+
+    store = ProjectStore(project_path)
+    tracer = Tracer() if job.params.get("trace") else None
+    try:
+        with activate(tracer), trace_span(job.job_type, "job", episode_id=job.episode_id):
+            result = _dispatch_job(job, store, on_progress, on_log, cancel_token)
+    finally:
+        if tracer is not None:
+            tracer.export(store.root_dir, job.job_id)
+    if tracer is not None:
+        result["trace_run_id"] = job.job_id
+    return result
+
+
+def _dispatch_job(
+    job: JobRecord,
+    store: Any,
+    on_progress: Any,
+    on_log: Any,
+    cancel_token: CancellationToken | None,
+) -> dict[str, Any]:
     from howimetyourcorpus.core.pipeline.runner import PipelineRunner
     from howimetyourcorpus.core.pipeline.tasks import NormalizeEpisodeStep, SegmentEpisodeStep
 
-    store = ProjectStore(project_path)
+    if job.job_type in BATCH_JOB_TYPES:
+        return _execute_batch_job(job, store, on_progress=on_progress, on_log=on_log, cancel_token=cancel_token)
+
+    _check_preconditions(job, store)
 
     if job.job_type == "normalize_transcript":
-        # Pré-condition (MX-008) : raw.txt doit exister
-        if not store.has_episode_raw(job.episode_id):
-            raise RuntimeError(
-                f"Transcript RAW introuvable pour {job.episode_id!r}. "
-                "Importez un transcript avant de normaliser."
-            )
         extra = store.load_config_extra()
         profile_id = extra.get("normalize_profile", DEFAULT_NORMALIZE_PROFILE)
         runner = PipelineRunner()
         step   = NormalizeEpisodeStep(job.episode_id, profile_id)
         ctx: dict[str, Any] = {"store": store}
-        results = runner.run([step], ctx, force=True)
+        results = runner.run([step], ctx, force=True, on_log=on_log)
         if results and not results[0].success:
             raise RuntimeError(results[0].message)
-        store.set_episode_prep_status(job.episode_id, "transcript", "normalized")
         return {"profile": profile_id}
 
     if job.job_type == "segment_transcript":
-        # Pré-condition (MX-008) : clean.txt doit exister (normalisé)
-        if not store.has_episode_clean(job.episode_id):
-            raise RuntimeError(
-                f"Transcript normalisé introuvable pour {job.episode_id!r}. "
-                "Normalisez le transcript avant de segmenter."
-            )
         runner = PipelineRunner()
         step   = SegmentEpisodeStep(job.episode_id)
         ctx = {"store": store}
-        results = runner.run([step], ctx, force=True)
+        results = runner.run([step], ctx, force=True, on_log=on_log)
         if results and not results[0].success:
             raise RuntimeError(results[0].message)
         # L'état "segmented" est dérivé de la présence de segments.jsonl dans server.py.
@@ -339,83 +736,189 @@ def _execute_job(
         return {}
 
     if job.job_type == "normalize_srt":
-        lang = job.source_key.removeprefix("srt_") if job.source_key.startswith("srt_") else job.source_key
-        # Pré-condition (MX-008) : piste SRT doit exister
-        if not store.has_episode_subs(job.episode_id, lang):
-            raise RuntimeError(
-                f"Piste SRT {lang!r} introuvable pour {job.episode_id!r}. "
-                "Importez la piste SRT avant de normaliser."
-            )
-        db_path = store.get_db_path()
-        if not db_path.exists():
-            raise RuntimeError("corpus.db introuvable — indexez d'abord le projet.")
+        lang = _srt_lang(job)
         from howimetyourcorpus.core.storage.db import CorpusDB
-        db = CorpusDB(db_path)
+        db = CorpusDB(store.get_db_path())
         extra = store.load_config_extra()
         profile_id = extra.get("normalize_profile", DEFAULT_NORMALIZE_PROFILE)
         n = store.normalize_subtitle_track(db, job.episode_id, lang, profile_id)
-        store.set_episode_prep_status(job.episode_id, job.source_key, "normalized")
         return {"cues_updated": n}
 
     if job.job_type == "align":
-        pivot_lang           = job.params.get("pivot_lang", "en")
-        target_langs         = job.params.get("target_langs", [])
-        segment_kind         = job.params.get("segment_kind", "sentence")
-        min_confidence       = float(job.params.get("min_confidence", 0.3))
-        use_similarity       = bool(job.params.get("use_similarity_for_cues", False))
-        run_id               = job.params.get("run_id") or job.job_id[:8]
-
-        db_path = store.get_db_path()
-        if not db_path.exists():
-            raise RuntimeError("corpus.db introuvable — indexez d'abord le projet.")
+        pivot_lang   = job.params.get("pivot_lang", "en")
+        target_langs = job.params.get("target_langs", [])
+        run_id       = job.params.get("run_id") or job.job_id[:8]
 
         from howimetyourcorpus.core.storage.db import CorpusDB
-        from howimetyourcorpus.core.pipeline.tasks import AlignEpisodeStep
-        db = CorpusDB(db_path)
+        db = CorpusDB(store.get_db_path())
 
         runner = PipelineRunner()
-        step = AlignEpisodeStep(
-            job.episode_id,
-            pivot_lang=pivot_lang,
-            target_langs=target_langs,
-            segment_kind=segment_kind,
-            min_confidence=min_confidence,
-            use_similarity_for_cues=use_similarity,
-        )
+        step = _align_step(job.episode_id, job.params)
         ctx: dict[str, Any] = {"store": store, "db": db}
-        results = runner.run([step], ctx, force=True, on_progress=on_progress)
+        results = runner.run([step], ctx, force=True, on_progress=on_progress, on_log=on_log)
         if results and not results[0].success:
             raise RuntimeError(results[0].message)
 
-        # Sauvegarder un rapport minimal pour GET /alignment_runs
-        import json as _json
-        from datetime import datetime, timezone
-        align_dir = store.align_dir(job.episode_id)
-        run_dir = align_dir / run_id
-        run_dir.mkdir(parents=True, exist_ok=True)
-        report = {
-            "run_id":                 run_id,
-            "pivot_lang":             pivot_lang,
-            "target_langs":           target_langs,
-            "segment_kind":           segment_kind,
-            "min_confidence":         min_confidence,
-            "use_similarity_for_cues": use_similarity,
-            "created_at":             datetime.now(timezone.utc).isoformat(),
-        }
-        (run_dir / "report.json").write_text(
-            _json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
-        )
+        _write_align_report(store, job.episode_id, run_id, job.params)
         return {"run_id": run_id, "pivot_lang": pivot_lang, "target_langs": target_langs}
 
     raise ValueError(f"Type de job inconnu : {job.job_type!r}")
 
 
+def _align_step(episode_id: str, params: dict[str, Any]) -> Any:
+    from howimetyourcorpus.core.pipeline.tasks import AlignEpisodeStep
+
+    return AlignEpisodeStep(
+        episode_id,
+        pivot_lang=params.get("pivot_lang", "en"),
+        target_langs=params.get("target_langs", []),
+        segment_kind=params.get("segment_kind", "sentence"),
+        min_confidence=float(params.get("min_confidence", 0.3)),
+        use_similarity_for_cues=bool(params.get("use_similarity_for_cues", False)),
+    )
+
+
+def _write_align_report(store: Any, episode_id: str, run_id: str, params: dict[str, Any]) -> None:
+    """Sauvegarde un rapport minimal pour GET /alignment_runs."""
+    run_dir = store.align_dir(episode_id) / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    report = {
+        "run_id":                 run_id,
+        "pivot_lang":             params.get("pivot_lang", "en"),
+        "target_langs":           params.get("target_langs", []),
+        "segment_kind":           params.get("segment_kind", "sentence"),
+        "min_confidence":         float(params.get("min_confidence", 0.3)),
+        "use_similarity_for_cues": bool(params.get("use_similarity_for_cues", False)),
+        "created_at":             _now(),
+    }
+    (run_dir / "report.json").write_text(
+        json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+
+
+def _execute_batch_job(
+    job: JobRecord,
+    store: Any,
+    on_progress: Any = None,
+    on_log: Any = None,
+    cancel_token: CancellationToken | None = None,
+) -> dict[str, Any]:
+    """
+    Exécute un job batch : pré-conditions par épisode, puis un seul passage du pipeline
+    (une CorpusDB, profils personnalisés chargés une fois). Un épisode en échec n'interrompt
+    pas les autres ; lève une exception seulement si aucun épisode n'a réussi.
+
+    Reprise : l'alignement coche chaque épisode dans le checkpoint du job ; les batchs CPU
+    (force=False par défaut) sautent les épisodes à jour via le manifeste de build.
+    """
+    from howimetyourcorpus.core.pipeline.dag import DagPipelineRunner
+    from howimetyourcorpus.core.pipeline.steps import StepResult
+    from howimetyourcorpus.core.pipeline.tasks import NormalizeEpisodeStep, SegmentEpisodeStep
+    from howimetyourcorpus.core.storage.db import CorpusDB
+
+    item_type   = BATCH_JOB_TYPES[job.job_type]
+    episode_ids = job_episode_ids(job.job_type, job.episode_id, job.params)
+    if not episode_ids:
+        raise RuntimeError("Aucun épisode à traiter (params.episode_ids vide).")
+    force = bool(job.params.get("force", item_type == "align"))
+
+    items: dict[str, dict[str, Any]] = {}
+    runnable: list[str] = []
+    for eid in episode_ids:
+        try:
+            _check_preconditions(JobRecord(item_type, eid), store)
+            runnable.append(eid)
+        except RuntimeError as e:
+            items[eid] = {"episode_id": eid, "status": ERROR, "message": str(e)}
+
+    db_path = store.get_db_path()
+    ctx: dict[str, Any] = {
+        "store":           store,
+        "db":              CorpusDB(db_path) if db_path.exists() else None,
+        "custom_profiles": store.load_custom_profiles(),
+        "is_cancelled":    cancel_token,
+    }
+    total = len(episode_ids)
+    completed = [total - len(runnable)]
+
+    def _item_done(_step: str = "", _pct: float = 1.0, _message: str = "") -> None:
+        completed[0] += 1
+        if on_progress:
+            on_progress(job.job_type, completed[0] / total, f"{completed[0]}/{total} épisodes")
+
+    profile_id = ""
+    run_id = job.params.get("run_id") or job.job_id[:8]
+    if item_type == "align":
+        # Étapes DB-bound : exécution séquentielle sur la session partagée.
+        checkpoint = StepCheckpoint.open(store.root_dir, job.job_id)
+        results = []
+        for eid in runnable:
+            if cancel_token and cancel_token.cancelled:
+                results.append(StepResult(False, "Cancelled"))
+                continue
+            if checkpoint.is_done(job.job_type, eid):
+                results.append(StepResult(True, "Déjà aligné (reprise)"))
+            else:
+                results.append(_align_step(eid, job.params).run(ctx, force=force, on_log=on_log))
+                if results[-1].success:
+                    _write_align_report(store, eid, run_id, job.params)
+                    checkpoint.mark_done(job.job_type, eid)
+            _item_done()
+    else:
+        if item_type == "normalize_transcript":
+            extra = store.load_config_extra()
+            profile_id = job.params.get("profile_id") or extra.get("normalize_profile", DEFAULT_NORMALIZE_PROFILE)
+            steps: list[Any] = [NormalizeEpisodeStep(eid, profile_id) for eid in runnable]
+        else:
+            steps = [SegmentEpisodeStep(eid) for eid in runnable]
+        runner = DagPipelineRunner(max_cpu_workers=min(len(steps) or 1, DEFAULT_LANE_WORKERS[LANE_CPU]))
+        results = runner.run(steps, ctx, force=force, on_progress=_item_done, on_log=on_log)
+
+    for eid, result in zip(runnable, results):
+        items[eid] = {
+            "episode_id": eid,
+            "status":     DONE if result.success else CANCELLED if result.message == "Cancelled" else ERROR,
+            "message":    result.message,
+        }
+        if result.success and item_type == "normalize_transcript":
+            store.set_episode_prep_status(eid, "transcript", "normalized")
+
+    ordered = [items[eid] for eid in episode_ids]
+    n_done = sum(1 for it in ordered if it["status"] == DONE)
+    n_errors = sum(1 for it in ordered if it["status"] == ERROR)
+    if cancel_token and cancel_token.cancelled:
+        raise JobCancelled({"items": ordered, "done": n_done, "errors": n_errors})
+    if n_done == 0:
+        raise RuntimeError(f"Aucun épisode traité ({total} en erreur) : {ordered[0]['message']}")
+    out: dict[str, Any] = {"items": ordered, "done": n_done, "errors": n_errors}
+    if profile_id:
+        out["profile"] = profile_id
+    if item_type == "align":
+        out["run_id"] = run_id
+    return out
+
+
 # ── Singleton par projet ───────────────────────────────────────────────────
 
 _workers: dict[str, JobWorker] = {}
 _stores:  dict[str, JobStore]  = {}
 _stores_lock = threading.Lock()
 
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _process_pool() -> ProcessPoolExecutor:
+    """Pool de sous-processus partagé par tous les workers (créé au premier job CPU)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=DEFAULT_LANE_WORKERS[LANE_CPU],
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
 
 def get_job_store(project_path: Path) -> JobStore:
     """Retourne (et initialise si besoin) le JobStore pour ce projet."""
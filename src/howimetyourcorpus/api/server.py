@@ -14,8 +14,9 @@ import os
 from pathlib import Path
 from typing import Any
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from howimetyourcorpus.core.constants import (
@@ -42,7 +43,9 @@ from howimetyourcorpus.core.constants import (
 )
 from howimetyourcorpus.core.storage.db import CorpusDB
 from howimetyourcorpus.core.storage.project_store import ProjectStore
-from howimetyourcorpus.api.jobs import JOB_TYPES, get_job_store
+from howimetyourcorpus.core.utils.tracing import load_run_summaries
+from howimetyourcorpus.api.events import EVENT_SNAPSHOT, format_sse
+from howimetyourcorpus.api.jobs import BATCH_JOB_TYPES, JOB_TYPES, PENDING, RUNNING, get_job_store
 from howimetyourcorpus.core.adapters.tvmaze import TvmazeAdapter
 from howimetyourcorpus.core.adapters.subslikescript import SubslikescriptAdapter
 from howimetyourcorpus import __version__ as VERSION
@@ -1002,9 +1005,10 @@ def get_episode_segments(
 
 class _JobCreate(BaseModel):
     job_type: str
-    episode_id: str
+    episode_id: str = ""
     source_key: str = ""
     params: dict[str, Any] = {}
+    """Jobs batch : params.episode_ids (liste) ou params.season (filtre sur l'index série)."""
 
 
 @app.get("/jobs", summary="Liste des jobs avec statut")
@@ -1017,6 +1021,52 @@ def list_jobs(path: Path = Depends(_require_project_path)) -> dict[str, Any]:
     return {"jobs": jobs}
 
 
+# Intervalle max entre deux vérifications de déconnexion du client SSE (secondes).
+_SSE_POLL_S = 1.0
+
+
+@app.get("/jobs/events", summary="Flux SSE des jobs (transitions, progression, logs)")
+async def job_events(
+    request: Request,
+    path: Path = Depends(_require_project_path),
+    max_events: int | None = Query(None, ge=1, description="Ferme le flux après N événements"),
+    keepalive_s: float = Query(15.0, gt=0, le=300),
+) -> StreamingResponse:
+    """Remplace le polling de GET /jobs : un événement `snapshot` (jobs actifs), puis
+    `job` (transition d'état), `progress` (pourcentage, débit) et `log` au fil de l'eau."""
+    store = get_job_store(path)
+    sub = store.events.subscribe()
+
+    async def stream():
+        try:
+            active = [j.to_dict() for j in store.list_all() if j.status in (PENDING, RUNNING)]
+            yield format_sse({"event": EVENT_SNAPSHOT, "data": {"jobs": active}})
+            sent = 0
+            idle_s = 0.0
+            while max_events is None or sent < max_events:
+                if await request.is_disconnected():
+                    break
+                wait_s = min(_SSE_POLL_S, keepalive_s - idle_s)
+                event = await sub.get_async(wait_s)
+                if event is None:
+                    idle_s += wait_s
+                    if idle_s >= keepalive_s:
+                        idle_s = 0.0
+                        yield ": keepalive\n\n"
+                    continue
+                idle_s = 0.0
+                yield format_sse(event)
+                sent += 1
+        finally:
+            store.events.unsubscribe(sub)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.post("/jobs", status_code=201, summary="Creer un job")
 def create_job(
     body: _JobCreate,
@@ -1033,11 +1083,39 @@ def create_job(
                 ),
             },
         )
+    params = dict(body.params)
+    if body.job_type in BATCH_JOB_TYPES:
+        params["episode_ids"] = _resolve_batch_episodes(path, params)
+    elif not body.episode_id:
+        raise HTTPException(
+            status_code=400,
+            detail={"error": "MISSING_EPISODE_ID", "message": "episode_id requis pour ce type de job."},
+        )
     store = get_job_store(path)
-    job = store.create(body.job_type, body.episode_id, body.source_key, params=body.params)
+    job = store.create(body.job_type, body.episode_id, body.source_key, params=params)
     return job.to_dict()
 
 
+def _resolve_batch_episodes(path: Path, params: dict[str, Any]) -> list[str]:
+    """Liste d'épisodes d'un job batch : params.episode_ids, sinon params.season (index série)."""
+    episode_ids = [str(e) for e in params.get("episode_ids") or []]
+    season = params.get("season")
+    if not episode_ids and season is not None:
+        index = ProjectStore(path).load_series_index()
+        episode_ids = [
+            ep.episode_id for ep in (index.episodes if index else []) if str(ep.season) == str(season)
+        ]
+    if not episode_ids:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "EMPTY_BATCH",
+                "message": "Aucun épisode : fournir params.episode_ids ou une saison présente dans l'index.",
+            },
+        )
+    return list(dict.fromkeys(episode_ids))
+
+
 @app.get("/jobs/{job_id}", summary="Statut d un job")
 def get_job(
     job_id: str,
@@ -1056,7 +1134,7 @@ def get_job(
     return job.to_dict()
 
 
-@app.delete("/jobs/{job_id}", summary="Annuler un job pending")
+@app.delete("/jobs/{job_id}", summary="Annuler un job pending (ou un batch en cours)")
 def cancel_job(
     job_id: str,
     path: Path = Depends(_require_project_path),
@@ -1073,10 +1151,74 @@ def cancel_job(
             status_code=409,
             detail={
                 "error": "JOB_NOT_CANCELLABLE",
-                "message": "Seuls les jobs en 'pending' peuvent être annulés.",
+                "message": "Seuls les jobs en 'pending' et les batchs en cours peuvent être annulés.",
             },
         )
-    return {"job_id": job_id, "status": "cancelled"}
+    return {"job_id": job_id, "status": store.get(job_id).status}
+
+
+@app.post("/jobs/{job_id}/resume", summary="Relancer un job annulé ou en erreur (reprise au checkpoint)")
+def resume_job(
+    job_id: str,
+    path: Path = Depends(_require_project_path),
+) -> dict[str, Any]:
+    store = get_job_store(path)
+    if not store.get(job_id):
+        raise HTTPException(
+            status_code=404,
+            detail={"error": "JOB_NOT_FOUND", "message": f"Job {job_id!r} introuvable."},
+        )
+    if not store.resume(job_id):
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "error": "JOB_NOT_RESUMABLE",
+                "message": "Seuls les jobs 'cancelled' ou 'error' peuvent être relancés.",
+            },
+        )
+    return store.get(job_id).to_dict()
+
+
+class _JobPrune(BaseModel):
+    older_than_days: float | None = None
+    keep_finished:   int | None   = None
+
+
+@app.post("/jobs/prune", summary="Purger les jobs terminés (rétention)")
+def prune_jobs(
+    body: _JobPrune,
+    path: Path = Depends(_require_project_path),
+) -> dict[str, Any]:
+    if body.older_than_days is None and body.keep_finished is None:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_PRUNE",
+                "message": "Indiquez older_than_days et/ou keep_finished.",
+            },
+        )
+    store = get_job_store(path)
+    pruned = store.prune(older_than_days=body.older_than_days, keep_finished=body.keep_finished)
+    return {"pruned": pruned}
+
+
+# ─── /runs/traces (profilage pipeline) ────────────────────────────────────────
+
+@app.get("/runs/traces", summary="Résumés des traces de pipeline exportées (runs/)")
+def list_traces(path: Path = Depends(_require_project_path)) -> dict[str, Any]:
+    """Un résumé par job tracé (params.trace) : temps mur / CPU, items et octets par opération."""
+    return {"runs": load_run_summaries(path)}
+
+
+@app.get("/runs/traces/{run_id}", summary="Résumé d'une trace de pipeline")
+def get_trace(run_id: str, path: Path = Depends(_require_project_path)) -> dict[str, Any]:
+    summary = next((r for r in load_run_summaries(path) if r.get("run_id") == run_id), None)
+    if summary is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"error": "TRACE_NOT_FOUND", "message": f"Trace {run_id!r} introuvable."},
+        )
+    return summary
 
 
 # ─── /query (MX-022) ──────────────────────────────────────────────────────────
@@ -1258,6 +1400,7 @@ def save_assignments(
 
 class _TvmazeDiscoverBody(BaseModel):
     series_name: str
+    refresh: bool = False
 
 
 class _SubslikeDiscoverBody(BaseModel):
@@ -1269,6 +1412,14 @@ class _SubslikeFetchBody(BaseModel):
     episode_url: str
 
 
+def _optional_project_cache_dir() -> Path | None:
+    """Cache du projet courant si HIMYC_PROJECT_PATH est valide (les routes /web n'exigent pas de projet)."""
+    raw = os.environ.get("HIMYC_PROJECT_PATH", "").strip()
+    if not raw or not Path(raw).is_dir():
+        return None
+    return ProjectStore(Path(raw)).get_cache_dir()
+
+
 def _episode_ref_to_dict(ep) -> dict[str, Any]:
     return {
         "episode_id": ep.episode_id,
@@ -1289,8 +1440,9 @@ def web_tvmaze_discover(body: _TvmazeDiscoverBody) -> dict[str, Any]:
             detail={"error": "EMPTY_NAME", "message": "Le nom de la série est requis."},
         )
     try:
+        # Cache métadonnées partagé avec l'UI (mémoire du processus + .cache/tvmaze du projet).
         adapter = TvmazeAdapter()
-        index = adapter.discover_series(name)
+        index = adapter.discover_series(name, cache_dir=_optional_project_cache_dir(), refresh=body.refresh)
     except Exception as exc:
         raise HTTPException(
             status_code=422,
@@ -1689,7 +1841,7 @@ def auto_assign_characters(
             created += 1
 
     if new_assignments and not dry_run:
-        store.save_character_assignments(existing + new_assignments)
+        store.add_character_assignments(new_assignments)
 
     return {
         "created": created,
@@ -30,6 +30,7 @@ from PySide6.QtWidgets import (
 )
 
 from howimetyourcorpus.core.adapters.base import AdapterRegistry
+from howimetyourcorpus.core.normalize.incremental import IncrementalNormalizer
 from howimetyourcorpus.core.normalize.profiles import PROFILES, NormalizationProfile, get_all_profile_ids
 from howimetyourcorpus.core.storage.project_store import ProjectStore
 
@@ -264,6 +265,8 @@ class ProfileEditorDialog(QDialog):
         self.resize(900, 700)
         self._store = store
         self._is_editing = profile_data is not None
+        # Aperçu recalculé à chaque option / frappe : seuls les blocs modifiés sont renormalisés.
+        self._preview_normalizer = IncrementalNormalizer()
         
         main_layout = QVBoxLayout(self)
         
@@ -643,7 +646,7 @@ class ProfileEditorDialog(QDialog):
         )
         
         # Appliquer la normalisation
-        clean_text, stats, debug = temp_profile.apply(raw_text)
+        clean_text, stats, debug = self._preview_normalizer.apply(temp_profile, raw_text)
         
         # Tab 1 : Résultat
         self.preview_output.setPlainText(clean_text)
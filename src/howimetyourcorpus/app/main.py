@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import sys
 import logging
+import multiprocessing
 
 from PySide6.QtWidgets import QApplication
 
@@ -22,4 +23,5 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # workers des process pools (import sous-titres, DAG) en exécutable gelé
     sys.exit(main())
@@ -97,6 +97,7 @@ class PreparerStateController:
         return capture_assignments_scope_snapshot(
             store,
             lambda assignment, ep=episode_id: self.is_utterance_assignment(assignment, ep),
+            episode_id=episode_id,
         )
 
     def restore_utterance_assignments_scope(
@@ -111,6 +112,7 @@ class PreparerStateController:
             store,
             scoped_assignments,
             lambda assignment, ep=episode_id: self.is_utterance_assignment(assignment, ep),
+            episode_id=episode_id,
         )
 
     @staticmethod
@@ -129,6 +131,7 @@ class PreparerStateController:
         return capture_assignments_scope_snapshot(
             store,
             lambda assignment, ep=episode_id, ln=lang: self.is_cue_assignment_for_lang(assignment, ep, ln),
+            episode_id=episode_id,
         )
 
     def restore_cue_assignments_scope(
@@ -144,6 +147,7 @@ class PreparerStateController:
             store,
             scoped_assignments,
             lambda assignment, ep=episode_id, ln=lang: self.is_cue_assignment_for_lang(assignment, ep, ln),
+            episode_id=episode_id,
         )
 
     def capture_clean_file_state(self, episode_id: str, source_key: str) -> dict[str, Any]:
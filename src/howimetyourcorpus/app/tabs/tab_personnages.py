@@ -513,11 +513,8 @@ class PersonnagesTabWidget(QWidget):
                     "source_id": source_id,
                     "character_id": character_id,
                 })
-        all_assignments = store.load_character_assignments()
 
         def _assignment_belongs_to_current_source(a: dict) -> bool:
-            if a.get("episode_id") != eid:
-                return False
             if source_key == "segments":
                 return a.get("source_type") == "segment" and ":sentence:" in (a.get("source_id") or "")
             if source_key == "segments_utterance":
@@ -528,9 +525,11 @@ class PersonnagesTabWidget(QWidget):
                 return a.get("source_type") == "cue" and (a.get("source_id") or "").startswith(prefix)
             return False
 
-        all_assignments = [a for a in all_assignments if not _assignment_belongs_to_current_source(a)]
-        all_assignments.extend(new_assignments)
-        store.save_character_assignments(all_assignments)
+        store.replace_episode_character_assignments(
+            eid,
+            new_assignments,
+            keep=lambda a: not _assignment_belongs_to_current_source(a),
+        )
         self._show_status(f"Assignations enregistrées : {len(new_assignments)}.", 3000)
 
     @require_project_and_db
@@ -451,9 +451,7 @@ class PreparerTabWidget(QWidget):
         if not store or not episode_id:
             return {}
         out: dict[str, str] = {}
-        for a in store.load_character_assignments():
-            if a.get("episode_id") != episode_id:
-                continue
+        for a in store.load_character_assignments(episode_id=episode_id):
             if a.get("source_type") != source_type:
                 continue
             source_id = (a.get("source_id") or "").strip()
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import re
 from pathlib import Path
 from typing import Callable
 
@@ -24,8 +23,13 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from howimetyourcorpus.core.pipeline.tasks import DownloadOpenSubtitlesStep, ImportSubtitlesStep
+from howimetyourcorpus.core.pipeline.tasks import (
+    DownloadOpenSubtitlesBatchStep,
+    ImportSubtitlesBatchStep,
+    ImportSubtitlesStep,
+)
 from howimetyourcorpus.core.normalize.profiles import get_all_profile_ids
+from howimetyourcorpus.core.subtitles.bulk_import import SUBTITLE_SUFFIXES, SubtitleFile, discover_subtitle_files
 from howimetyourcorpus.core.subtitles.parsers import cues_to_srt
 from howimetyourcorpus.core.constants import DEFAULT_NORMALIZE_PROFILE, SUPPORTED_LANGUAGES
 from howimetyourcorpus.app.dialogs import OpenSubtitlesDownloadDialog, SubtitleBatchImportDialog
@@ -35,37 +39,6 @@ from howimetyourcorpus.app.undo_commands import DeleteSubtitleTrackCommand
 logger = logging.getLogger(__name__)
 
 
-def _normalize_episode_id(s: str) -> str | None:
-    """Normalise S01E01 ou 1x01 -> S01E01 (2 chiffres)."""
-    if not s:
-        return None
-    m = re.match(r"(?i)S(\d+)E(\d+)$", s.strip())
-    if m:
-        return f"S{int(m.group(1)):02d}E{int(m.group(2)):02d}"
-    m = re.match(r"(?i)(\d+)x(\d+)$", s.strip())
-    if m:
-        return f"S{int(m.group(1)):02d}E{int(m.group(2)):02d}"
-    return None
-
-
-def _parse_subtitle_filename(path: Path) -> tuple[str | None, str | None]:
-    """Extrait (episode_id, lang) du nom de fichier.
-    Ex. S01E01_en.srt -> (S01E01, en) ; Show - 1x01 - Title.en.srt -> (S01E01, en).
-    """
-    name = path.name
-    # S01E01 ou s01e01 + _/-/. + 2 lettres + .srt/.vtt
-    m = re.match(r"(?i)(S\d+E\d+)[_\-\.]?(\w{2})\.(srt|vtt)$", name)
-    if m:
-        return (m.group(1).upper(), m.group(2).lower())
-    # 1x01 ou 101 style + optionnel _lang + .srt/.vtt
-    m = re.match(r"(?i).*?(\d+)x(\d+).*?[_\-\.]?(\w{2})?\.(srt|vtt)$", name)
-    if m:
-        ep = f"S{int(m.group(1)):02d}E{int(m.group(2)):02d}"
-        lang = m.group(3).lower() if m.group(3) else None
-        return (ep, lang)
-    return (None, None)
-
-
 class SubtitleTabWidget(QWidget):
     """Widget de l'onglet Sous-titres : épisode, pistes, import fichier/masse, édition contenu."""
 
@@ -395,9 +368,9 @@ class SubtitleTabWidget(QWidget):
             return
         path, _ = QFileDialog.getOpenFileName(
             self,
-            "Importer sous-titres SRT/VTT",
+            "Importer sous-titres (SRT, VTT, ASS, TTML, SBV)",
             "",
-            "Sous-titres (*.srt *.vtt);;Tous (*.*)",
+            f"Sous-titres ({' '.join('*' + ext for ext in SUBTITLE_SUFFIXES)});;Tous (*.*)",
         )
         if not path:
             return
@@ -416,31 +389,13 @@ class SubtitleTabWidget(QWidget):
         folder = QFileDialog.getExistingDirectory(self, "Choisir un dossier contenant des SRT/VTT")
         if not folder:
             return
-        folder_path = Path(folder)
-        rows: list[tuple[str, str | None, str | None]] = []
-        seen: set[str] = set()
-        for p in sorted(folder_path.rglob("*.srt")) + sorted(folder_path.rglob("*.vtt")):
-            if not p.is_file():
-                continue
-            key = str(p.resolve())
-            if key in seen:
-                continue
-            seen.add(key)
-            ep, lang = _parse_subtitle_filename(p)
-            if (ep, lang) == (None, None) and p.parent != folder_path:
-                parent_ep = _normalize_episode_id(p.parent.name)
-                if parent_ep:
-                    ep = parent_ep
-                    if not lang:
-                        mm = re.search(r"(?i)(?:^|[_\-\.])(\w{2})\.(srt|vtt)$", p.name)
-                        if mm:
-                            lang = mm.group(1).lower()
-            rows.append((key, ep, lang))
+        files = discover_subtitle_files(folder)
+        rows = [(f.path, f.episode_id, f.lang) for f in files]
         if not rows:
             QMessageBox.information(
                 self,
                 "Import",
-                "Aucun fichier .srt ou .vtt trouvé dans ce dossier (racine et sous-dossiers).",
+                f"Aucun fichier de sous-titres ({', '.join(SUBTITLE_SUFFIXES)}) trouvé dans ce dossier (racine et sous-dossiers).",
             )
             return
         episode_ids = [e.episode_id for e in index.episodes]
@@ -450,11 +405,11 @@ class SubtitleTabWidget(QWidget):
         if dlg.exec() != QDialog.DialogCode.Accepted or not dlg.result:
             return
         profile_id = dlg.profile_id_for_import
-        steps = [ImportSubtitlesStep(ep, lang, path, profile_id=profile_id) for path, ep, lang in dlg.result]
-        self._run_job(steps)
+        batch = [SubtitleFile(path, "", ep, lang) for path, ep, lang in dlg.result]
+        self._run_job([ImportSubtitlesBatchStep(batch, profile_id=profile_id)])
         self.refresh()
         self._refresh_episodes()
-        self._show_status(f"Import en masse lancé : {len(steps)} fichier(s).", 5000)
+        self._show_status(f"Import en masse lancé : {len(batch)} fichier(s).", 5000)
 
     @require_project
     def _import_opensubtitles(self) -> None:
@@ -483,14 +438,11 @@ class SubtitleTabWidget(QWidget):
             "opensubtitles_api_key": api_key_val,
             "series_imdb_id": imdb_id,
         })
-        steps = [
-            DownloadOpenSubtitlesStep(ep_id, season, episode, lang, api_key_val, imdb_id)
-            for ep_id, season, episode in selected
-        ]
-        self._run_job(steps)
+        # Un seul step par lot : recherches concurrentes, cache disque et reprise après interruption.
+        self._run_job([DownloadOpenSubtitlesBatchStep(list(selected), [lang], api_key_val, imdb_id)])
         self.refresh()
         self._refresh_episodes()
-        self._show_status(f"Téléchargement OpenSubtitles lancé : {len(steps)} épisode(s).", 5000)
+        self._show_status(f"Téléchargement OpenSubtitles lancé : {len(selected)} épisode(s).", 5000)
 
     @require_project_and_db
     def _save_content(self) -> None:
@@ -0,0 +1,556 @@
+"""
+CLI headless `himyc` : pipeline (build, index, align), export et requêtes KWIC sans Qt ni serveur.
+
+    himyc -p PROJET build [--season 1] [--jobs 4] [--profile default_en_v1]
+    himyc -p PROJET normalize --profile default_fr_v1 --track en --track fr
+    himyc -p PROJET import-subs saison1_subs.zip --jobs 4
+    himyc -p PROJET retime fr --ref en --season 1
+    himyc -p PROJET index
+    himyc -p PROJET align --pivot en --target fr
+    himyc -p PROJET propagate --season 1
+    himyc -p PROJET export --scope corpus --format jsonl
+    himyc -p PROJET --json query "legendary" --scope segments
+
+Le projet vient de -p/--project, sinon HIMYC_PROJECT_PATH, sinon le répertoire courant.
+--json : une ligne JSON par événement (progress, log, hit, result) sur stdout.
+Les imports du cœur sont différés dans chaque commande : démarrage rapide, jamais de PySide6.
+Code de sortie : 0 succès, 1 échec d'au moins une étape, 2 usage / projet invalide.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, TextIO
+
+from howimetyourcorpus.core.constants import DEFAULT_PIVOT_LANG, KWIC_CONTEXT_WINDOW
+from howimetyourcorpus.core.normalize.rules import DEBUG_LEVELS
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+
+class CliError(Exception):
+    """Erreur d'usage ou de projet (code de sortie 2)."""
+
+
+# ── Sortie ─────────────────────────────────────────────────────────────────
+
+class Reporter:
+    """Progression, logs et résultat : texte lisible (stderr/stdout) ou JSON lines (stdout)."""
+
+    def __init__(self, json_mode: bool, out: TextIO | None = None, err: TextIO | None = None) -> None:
+        self.json_mode = json_mode
+        self.out = out or sys.stdout
+        self.err = err or sys.stderr
+
+    def _emit(self, event: str, **data: Any) -> None:
+        self.out.write(json.dumps({"event": event, **data}, ensure_ascii=False, default=str) + "\n")
+        self.out.flush()
+
+    def progress(self, step: str, pct: float, message: str) -> None:
+        if self.json_mode:
+            self._emit("progress", step=step, pct=round(pct, 4), message=message)
+        else:
+            self.err.write(f"[{pct * 100:5.1f}%] {message}\n")
+
+    def log(self, level: str, message: str) -> None:
+        if self.json_mode:
+            self._emit("log", level=level, message=message)
+        elif level in ("warning", "error"):
+            self.err.write(f"{level.upper()}: {message}\n")
+
+    def hit(self, hit: dict[str, Any]) -> None:
+        if self.json_mode:
+            self._emit("hit", **hit)
+        else:
+            self.out.write(f"{hit['episode_id']}\t{hit['left']}[{hit['match']}]{hit['right']}\n")
+
+    def result(self, **data: Any) -> None:
+        if self.json_mode:
+            self._emit("result", **data)
+        else:
+            for key, value in data.items():
+                if key != "items":
+                    self.out.write(f"{key}: {value}\n")
+
+
+# ── Projet ─────────────────────────────────────────────────────────────────
+
+def _project_root(args: argparse.Namespace) -> Path:
+    root = Path(args.project or os.environ.get("HIMYC_PROJECT_PATH") or Path.cwd()).expanduser()
+    if not (root / "config.toml").exists():
+        raise CliError(f"Pas de projet HIMYC (config.toml) dans {root}")
+    return root
+
+
+def _open_project(args: argparse.Namespace) -> tuple[Any, Any, Any]:
+    """(ProjectConfig, ProjectStore, CorpusDB) ; crée ou migre corpus.db comme l'application."""
+    from howimetyourcorpus.core.constants import DEFAULT_NORMALIZE_PROFILE
+    from howimetyourcorpus.core.models import ProjectConfig
+    from howimetyourcorpus.core.storage.db import CorpusDB
+    from howimetyourcorpus.core.storage.project_store import ProjectStore, load_project_config
+
+    root = _project_root(args)
+    data = load_project_config(root / "config.toml")
+    config = ProjectConfig(
+        project_name=data.get("project_name", root.name),
+        root_dir=root,
+        source_id=data.get("source_id", "subslikescript"),
+        series_url=data.get("series_url", ""),
+        rate_limit_s=float(data.get("rate_limit_s", 2)),
+        user_agent=data.get("user_agent", "HowIMetYourCorpus/0.1 (research)"),
+        normalize_profile=data.get("normalize_profile", DEFAULT_NORMALIZE_PROFILE),
+    )
+    store = ProjectStore(root)
+    db = CorpusDB(store.get_db_path())
+    if not db.db_path.exists():
+        db.init()
+    else:
+        db.ensure_migrated()
+    return config, store, db
+
+
+def _select_episodes(store: Any, args: argparse.Namespace, keep: Callable[[str], bool]) -> list[str]:
+    """Épisodes de l'index série (sinon du dossier episodes/), filtrés par --episodes / --season / `keep`."""
+    from howimetyourcorpus.core.constants import EPISODES_DIR_NAME
+
+    index = store.load_series_index()
+    if index and index.episodes:
+        refs = [(ep.episode_id, ep.season) for ep in index.episodes]
+    else:
+        ep_root = store.root_dir / EPISODES_DIR_NAME
+        refs = [(d.name, None) for d in sorted(ep_root.iterdir()) if d.is_dir()] if ep_root.is_dir() else []
+    wanted = set(getattr(args, "episodes", None) or [])
+    season = getattr(args, "season", None)
+    return [
+        eid for eid, ep_season in refs
+        if (not wanted or eid in wanted) and (season is None or ep_season == season) and keep(eid)
+    ]
+
+
+def _register_episodes(store: Any, db: Any, episode_ids: list[str]) -> None:
+    """Ajoute à la DB les épisodes de l'index encore absents (requis par les jointures KWIC)."""
+    index = store.load_series_index()
+    known = {row["episode_id"] for row in db.get_episodes_by_status(None)}
+    wanted = set(episode_ids) - known
+    db.upsert_episodes_batch([ep for ep in (index.episodes if index else []) if ep.episode_id in wanted])
+
+
+def _run_steps(steps: list[Any], context: dict[str, Any], args: argparse.Namespace, rep: Reporter) -> list[Any]:
+    """Exécute via DagPipelineRunner : --jobs processus CPU ; un épisode en échec n'arrête pas les autres."""
+    from howimetyourcorpus.core.pipeline.dag import DagPipelineRunner
+
+    jobs = max(1, args.jobs)
+    runner = DagPipelineRunner(max_cpu_workers=jobs, use_processes=jobs > 1)
+    return runner.run(steps, context, force=args.force, on_progress=rep.progress, on_log=rep.log)
+
+
+def _summarize(results: list[Any]) -> dict[str, Any]:
+    failed = [r.message for r in results if not r.success]
+    return {"steps": len(results), "ok": len(results) - len(failed), "failed": len(failed), "errors": failed}
+
+
+# ── Commandes ──────────────────────────────────────────────────────────────
+
+def cmd_build(args: argparse.Namespace, rep: Reporter) -> int:
+    """Normalise + segmente (+ indexe) les épisodes ayant un transcript RAW."""
+    from howimetyourcorpus.core.pipeline.tasks import BuildDbIndexStep, NormalizeEpisodeStep, SegmentEpisodeStep
+
+    config, store, db = _open_project(args)
+    profile_id = args.profile or config.normalize_profile
+    episodes = _select_episodes(store, args, store.has_episode_raw)
+    _register_episodes(store, db, episodes)
+    steps: list[Any] = []
+    for eid in episodes:
+        steps += [
+            NormalizeEpisodeStep(eid, profile_id, debug_level=args.debug_level),
+            SegmentEpisodeStep(eid, lang_hint=args.lang),
+        ]
+    if not args.no_index:
+        steps.append(BuildDbIndexStep(episodes))
+    context = {"config": config, "store": store, "db": db, "custom_profiles": store.load_custom_profiles()}
+    results = _run_steps(steps, context, args, rep)
+    summary = _summarize(results)
+    rep.result(command="build", episodes=len(episodes), profile=profile_id, **summary)
+    return EXIT_OK if not summary["failed"] else EXIT_FAILED
+
+
+def cmd_normalize(args: argparse.Namespace, rep: Reporter) -> int:
+    """Re-normalise transcripts et pistes de sous-titres en parallèle (ex. après changement de profil)."""
+    from howimetyourcorpus.core.normalize.batch import NormalizeItem, normalize_batch
+
+    config, store, db = _open_project(args)
+    profile_id = args.profile or config.normalize_profile
+    items: list[Any] = []
+    if not args.no_transcripts:
+        items += [NormalizeItem(eid, profile_id) for eid in _select_episodes(store, args, store.has_episode_raw)]
+    if args.track:
+        episodes = _select_episodes(store, args, lambda _eid: True)
+        tracks = db.get_tracks_for_episodes(episodes)
+        for eid in episodes:
+            langs = {t.get("lang") for t in tracks.get(eid, [])}
+            items += [NormalizeItem(eid, profile_id, lang) for lang in args.track if lang in langs]
+    report = normalize_batch(
+        store,
+        db,
+        items,
+        store.load_custom_profiles(),
+        force=args.force,
+        rewrite_srt=args.rewrite_srt,
+        debug_level=args.debug_level,
+        max_workers=max(1, args.jobs),
+        on_progress=rep.progress,
+    )
+    for key, message in report.failed.items():
+        rep.log("error", f"{key}: {message}")
+    rep.result(command="normalize", profile=profile_id, **report.to_dict())
+    return EXIT_OK if not report.failed else EXIT_FAILED
+
+
+def cmd_import_subs(args: argparse.Namespace, rep: Reporter) -> int:
+    """Importe un dossier ou une archive ZIP de sous-titres ; (épisode, langue) d'après les noms de fichiers."""
+    from howimetyourcorpus.core.subtitles.bulk_import import (
+        SUBTITLE_SUFFIXES,
+        discover_subtitle_files,
+        import_subtitles_bulk,
+    )
+
+    _config, store, db = _open_project(args)
+    source = Path(args.source)
+    if not source.exists():
+        raise CliError(f"Source introuvable : {source}")
+    files = discover_subtitle_files(source)
+    if not files:
+        raise CliError(f"Aucun fichier de sous-titres ({', '.join(SUBTITLE_SUFFIXES)}) dans {source}")
+    try:
+        report = import_subtitles_bulk(
+            store, db, files, profile_id=args.profile, max_workers=max(1, args.jobs), on_progress=rep.progress
+        )
+    except ValueError as e:
+        raise CliError(str(e)) from e
+    for path, reason in report.skipped.items():
+        rep.log("warning", f"{path}: {reason}")
+    for key, message in report.failed.items():
+        rep.log("error", f"{key}: {message}")
+    rep.result(command="import-subs", source=str(source), **report.to_dict())
+    return EXIT_OK if report.imported and not report.failed else EXIT_FAILED
+
+
+def _parse_framerate(value: str) -> tuple[float, float]:
+    try:
+        source, target = (float(x) for x in value.split(":"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Cadence attendue SOURCE:CIBLE (ex. 25:23.976), reçu {value!r}") from None
+    if source <= 0 or target <= 0:
+        raise argparse.ArgumentTypeError("Cadences strictement positives attendues")
+    return source, target
+
+
+def cmd_retime(args: argparse.Namespace, rep: Reporter) -> int:
+    """Recale une piste de sous-titres : estimée sur --ref, sinon --offset / --fps (un UPDATE par piste)."""
+    from howimetyourcorpus.core.pipeline.tasks import RetimeSubtitlesStep
+
+    if not args.ref and not args.offset and not args.fps:
+        raise CliError("Indiquer --ref LANG, --offset MS ou --fps SOURCE:CIBLE")
+    if args.ref == args.lang:
+        raise CliError("La piste de référence doit être une autre langue")
+    config, store, db = _open_project(args)
+    episodes = _select_episodes(store, args, lambda _eid: True)
+    tracks = db.get_tracks_for_episodes(episodes)
+    langs_needed = {args.lang} | ({args.ref} if args.ref else set())
+    steps = [
+        RetimeSubtitlesStep(
+            eid,
+            args.lang,
+            reference_lang=args.ref,
+            offset_ms=args.offset,
+            framerate=args.fps,
+            piecewise=not args.no_piecewise,
+        )
+        for eid in episodes
+        if langs_needed <= {t.get("lang") for t in tracks.get(eid, [])}
+    ]
+    results = _run_steps(steps, {"config": config, "store": store, "db": db}, args, rep)
+    summary = _summarize(results)
+    retimed = [r.data for r in results if r.success and r.data and r.data.get("cues_updated")]
+    rep.result(command="retime", lang=args.lang, tracks=len(steps), retimed=retimed, **summary)
+    return EXIT_OK if not summary["failed"] else EXIT_FAILED
+
+
+def cmd_index(args: argparse.Namespace, rep: Reporter) -> int:
+    """Indexe (FTS) les épisodes normalisés ; incrémental sauf --force."""
+    from howimetyourcorpus.core.pipeline.tasks import BuildDbIndexStep
+
+    config, store, db = _open_project(args)
+    episodes = _select_episodes(store, args, store.has_episode_clean)
+    results = _run_steps([BuildDbIndexStep(episodes)], {"config": config, "store": store, "db": db}, args, rep)
+    summary = _summarize(results)
+    rep.result(command="index", episodes=len(episodes), **summary)
+    return EXIT_OK if not summary["failed"] else EXIT_FAILED
+
+
+def cmd_align(args: argparse.Namespace, rep: Reporter) -> int:
+    """Aligne segments ↔ cues pivot (+ cues cibles), épisode par épisode sur la DB."""
+    from howimetyourcorpus.core.pipeline.tasks import AlignEpisodeStep
+
+    config, store, db = _open_project(args)
+    episodes = _select_episodes(store, args, lambda _eid: True)
+    steps = [
+        AlignEpisodeStep(
+            eid,
+            pivot_lang=args.pivot,
+            target_langs=args.target or [],
+            segment_kind=args.segment_kind,
+            min_confidence=args.min_confidence,
+            use_similarity_for_cues=args.similarity,
+        )
+        for eid in episodes
+    ]
+    results = _run_steps(steps, {"config": config, "store": store, "db": db}, args, rep)
+    summary = _summarize(results)
+    runs = [r.data.get("run_id") for r in results if r.success and r.data]
+    rep.result(command="align", episodes=len(episodes), runs=runs, **summary)
+    return EXIT_OK if not summary["failed"] else EXIT_FAILED
+
+
+def cmd_propagate(args: argparse.Namespace, rep: Reporter) -> int:
+    """Propagation §8 (personnages -> speaker_explicit, cues, SRT) sur la sélection, en une passe et une transaction."""
+    _config, store, db = _open_project(args)
+    episodes = _select_episodes(store, args, lambda _eid: True)
+    # Dernier run d'alignement de chaque épisode (get_align_runs_for_episodes : created_at décroissant).
+    runs = {eid: ep_runs[0]["align_run_id"] for eid, ep_runs in db.get_align_runs_for_episodes(episodes).items() if ep_runs}
+    if not runs:
+        raise CliError("Aucun run d'alignement pour la sélection (lancer d'abord `align`)")
+    rep.log("info", f"Propagation sur {len(runs)} épisode(s)")
+    counts = store.propagate_character_names_batch(db, runs, languages_to_rewrite=set(args.lang) if args.lang else None)
+    rep.result(
+        command="propagate",
+        episodes=len(runs),
+        segments_updated=sum(nb_seg for nb_seg, _ in counts.values()),
+        cues_updated=sum(nb_cue for _, nb_cue in counts.values()),
+        skipped=sorted(set(episodes) - set(runs)),
+    )
+    return EXIT_OK
+
+
+EXPORT_FORMATS = {
+    "corpus":   ("txt", "csv", "json", "jsonl", "docx"),
+    "segments": ("txt", "csv", "tsv", "docx"),
+    "characters": ("json",),
+}
+
+
+def cmd_export(args: argparse.Namespace, rep: Reporter) -> int:
+    """
+    Exporte le corpus (clean, sinon raw) ou les segments (segments.jsonl) ; mêmes formats que POST /export.
+    Scope characters : catalogue + assignations (corpus.db) au format JSON historique, dans un dossier.
+    """
+    from howimetyourcorpus.core import export_utils as ex
+    from howimetyourcorpus.core.constants import EXPORTS_DIR_NAME, SEGMENTS_JSONL_FILENAME
+
+    if args.scope == "characters":
+        _config, store, _db = _open_project(args)
+        paths = store.export_characters_json(Path(args.output) if args.output else store.root_dir / EXPORTS_DIR_NAME)
+        rep.result(command="export", scope="characters", paths=[str(p) for p in paths])
+        return EXIT_OK
+    if args.format not in EXPORT_FORMATS[args.scope]:
+        raise CliError(f"Format {args.format!r} non supporté pour {args.scope} : {EXPORT_FORMATS[args.scope]}")
+    _config, store, _db = _open_project(args)
+    out_path = Path(args.output) if args.output else store.root_dir / EXPORTS_DIR_NAME / f"{args.scope}.{args.format}"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    index = store.load_series_index()
+    refs = {ep.episode_id: ep for ep in (index.episodes if index else [])}
+    episodes = _select_episodes(store, args, lambda _eid: True)
+
+    if args.scope == "corpus":
+        pairs = []
+        for eid in episodes:
+            kind = "clean" if (not args.raw and store.has_episode_clean(eid)) else "raw"
+            text = store.load_episode_text(eid, kind=kind)
+            if eid in refs and text.strip():
+                pairs.append((refs[eid], text))
+        writer = {
+            "txt": ex.export_corpus_txt, "csv": ex.export_corpus_csv, "json": ex.export_corpus_json,
+            "jsonl": ex.export_corpus_utterances_jsonl, "docx": ex.export_corpus_docx,
+        }[args.format]
+        writer(pairs, out_path)
+        rep.result(command="export", scope="corpus", episodes=len(pairs), path=str(out_path))
+        return EXIT_OK if pairs else EXIT_FAILED
+
+    segments: list[dict[str, Any]] = []
+    for eid in episodes:
+        seg_path = store._episode_dir(eid) / SEGMENTS_JSONL_FILENAME  # noqa: SLF001 - sanitation centralisée côté store
+        if seg_path.exists():
+            segments += [json.loads(line) for line in seg_path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    writer = {
+        "txt": ex.export_segments_txt, "csv": ex.export_segments_csv,
+        "tsv": ex.export_segments_tsv, "docx": ex.export_segments_docx,
+    }[args.format]
+    writer(segments, out_path)
+    rep.result(command="export", scope="segments", segments=len(segments), path=str(out_path))
+    return EXIT_OK if segments else EXIT_FAILED
+
+
+def cmd_query(args: argparse.Namespace, rep: Reporter) -> int:
+    """Recherche KWIC (FTS) sur documents, segments ou cues."""
+    from dataclasses import asdict
+
+    _config, _store, db = _open_project(args)
+    common = {
+        "season": args.season, "episode": args.episode, "window": args.window,
+        "limit": args.limit, "case_sensitive": args.case_sensitive,
+    }
+    if args.scope == "segments":
+        hits = db.query_kwic_segments(args.term, kind=args.kind, **common)
+    elif args.scope == "cues":
+        hits = db.query_kwic_cues(args.term, lang=args.lang, **common)
+    else:
+        hits = db.query_kwic(args.term, **common)
+    for h in hits:
+        rep.hit(asdict(h))
+    rep.result(command="query", term=args.term, scope=args.scope, hits=len(hits))
+    return EXIT_OK
+
+
+# ── Parseur ────────────────────────────────────────────────────────────────
+
+def _add_selection(p: argparse.ArgumentParser) -> None:
+    p.add_argument("-e", "--episodes", nargs="+", metavar="ID", help="Épisodes (ex. S01E01 S01E02)")
+    p.add_argument("-s", "--season", type=int, help="Filtre saison")
+
+
+def _add_debug_level(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--debug-level",
+        default="counters",
+        choices=DEBUG_LEVELS,
+        help="Debug de normalisation dans transform_meta.json (défaut counters ; full : exemples + historique)",
+    )
+
+
+def _add_parallel(p: argparse.ArgumentParser, default_jobs: int) -> None:
+    p.add_argument("-j", "--jobs", type=int, default=default_jobs, help=f"Processus CPU (défaut {default_jobs})")
+    p.add_argument("--force", action="store_true", help="Recalcule même si à jour (manifeste de build)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="himyc", description="HowIMetYourCorpus — pipeline headless.")
+    parser.add_argument("-p", "--project", help="Dossier projet (défaut : $HIMYC_PROJECT_PATH ou cwd)")
+    parser.add_argument("--json", action="store_true", help="Événements JSON (une ligne par événement) sur stdout")
+    parser.add_argument("--trace", action="store_true", help="Trace Chrome / CSV / résumé dans runs/")
+    sub = parser.add_subparsers(dest="command", required=True)
+    cpu = os.cpu_count() or 1
+
+    p = sub.add_parser("build", help="Normaliser, segmenter et indexer")
+    _add_selection(p)
+    _add_parallel(p, cpu)
+    p.add_argument("--profile", help="Profil de normalisation (défaut : config du projet)")
+    p.add_argument("--lang", default="en", help="Langue pour la segmentation en phrases")
+    p.add_argument("--no-index", action="store_true", help="Ne pas mettre à jour l'index FTS")
+    _add_debug_level(p)
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("normalize", help="Re-normaliser transcripts et pistes (process pool)")
+    _add_selection(p)
+    _add_parallel(p, cpu)
+    p.add_argument("--profile", help="Profil de normalisation (défaut : config du projet)")
+    p.add_argument("--track", action="append", metavar="LANG", help="Piste de sous-titres à normaliser (répétable)")
+    p.add_argument("--no-transcripts", action="store_true", help="Pistes seulement")
+    p.add_argument("--rewrite-srt", action="store_true", help="Réécrire le fichier SRT des pistes normalisées")
+    _add_debug_level(p)
+    p.set_defaults(func=cmd_normalize)
+
+    p = sub.add_parser("import-subs", help="Importer un dossier ou un ZIP de sous-titres (process pool)")
+    p.add_argument("source", help="Dossier (récursif) ou archive .zip de sous-titres (SRT, VTT, ASS/SSA, TTML, SBV)")
+    p.add_argument("-j", "--jobs", type=int, default=cpu, help=f"Processus CPU (défaut {cpu})")
+    p.add_argument("--profile", help="Profil de normalisation appliqué aux cues à l'import")
+    p.set_defaults(func=cmd_import_subs)
+
+    p = sub.add_parser("retime", help="Recaler une piste de sous-titres (décalage, cadence, par morceaux)")
+    _add_selection(p)
+    _add_parallel(p, 1)
+    p.add_argument("lang", help="Langue de la piste à recaler")
+    p.add_argument("--ref", metavar="LANG", help="Piste de référence : transformation estimée par recouvrement")
+    p.add_argument("--offset", type=float, default=0.0, metavar="MS", help="Décalage en ms (sans --ref)")
+    p.add_argument("--fps", type=_parse_framerate, metavar="SOURCE:CIBLE", help="Conversion de cadence (sans --ref)")
+    p.add_argument("--no-piecewise", action="store_true", help="--ref : transformation linéaire seulement")
+    p.set_defaults(func=cmd_retime)
+
+    p = sub.add_parser("index", help="Indexer les textes normalisés (FTS)")
+    _add_selection(p)
+    _add_parallel(p, 1)
+    p.set_defaults(func=cmd_index)
+
+    p = sub.add_parser("align", help="Aligner segments et sous-titres")
+    _add_selection(p)
+    _add_parallel(p, 1)
+    p.add_argument("--pivot", default=DEFAULT_PIVOT_LANG, help=f"Langue pivot (défaut {DEFAULT_PIVOT_LANG})")
+    p.add_argument("--target", action="append", metavar="LANG", help="Langue cible (répétable)")
+    p.add_argument("--segment-kind", default="sentence", choices=("sentence", "utterance"))
+    p.add_argument("--min-confidence", type=float, default=0.3)
+    p.add_argument("--similarity", action="store_true", help="Cues pivot↔cible par similarité plutôt que par temps")
+    p.set_defaults(func=cmd_align)
+
+    p = sub.add_parser("propagate", help="Propager les personnages (segments, cues, SRT) sur une saison ou une sélection")
+    _add_selection(p)
+    p.add_argument("--lang", nargs="+", help="Langues dont le SRT est réécrit (défaut : toutes celles modifiées)")
+    p.set_defaults(func=cmd_propagate)
+
+    p = sub.add_parser("export", help="Exporter corpus, segments ou personnages")
+    _add_selection(p)
+    p.add_argument("--scope", default="corpus", choices=tuple(EXPORT_FORMATS))
+    p.add_argument("-f", "--format", default="txt", help="txt, csv, json, jsonl, tsv, docx")
+    p.add_argument(
+        "-o", "--output", help="Fichier de sortie (défaut : exports/<scope>.<format>) ; dossier pour characters"
+    )
+    p.add_argument("--raw", action="store_true", help="Corpus : raw.txt même si clean.txt existe")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("query", help="Recherche KWIC")
+    p.add_argument("term")
+    p.add_argument("--scope", default="documents", choices=("documents", "segments", "cues"))
+    p.add_argument("--kind", choices=("sentence", "utterance"), help="Segments : type")
+    p.add_argument("--lang", help="Cues : langue")
+    p.add_argument("--season", type=int)
+    p.add_argument("--episode", type=int)
+    p.add_argument("--window", type=int, default=KWIC_CONTEXT_WINDOW)
+    p.add_argument("--limit", type=int, default=200)
+    p.add_argument("--case-sensitive", action="store_true")
+    p.set_defaults(func=cmd_query)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    rep = Reporter(args.json)
+    tracer = None
+    try:
+        if args.trace:
+            from howimetyourcorpus.core.utils.tracing import Tracer, activate
+
+            tracer = Tracer()
+            with activate(tracer):
+                code = args.func(args, rep)
+        else:
+            code = args.func(args, rep)
+    except CliError as e:
+        rep.log("error", str(e))
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        rep.log("warning", "Interrompu")
+        return 130
+    if tracer is not None:
+        import time
+
+        paths = tracer.export(_project_root(args), f"cli-{args.command}-{time.strftime('%Y%m%dT%H%M%S')}")
+        rep.log("info", f"Trace : {paths['trace']}")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
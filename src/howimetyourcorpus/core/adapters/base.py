@@ -11,6 +11,7 @@ class SourceAdapter(Protocol):
     """Protocol pour un adapteur de source (discover, fetch, parse)."""
 
     id: str
+    # Optionnel : parse_version (str), version du parseur suivie par le manifeste de build.
 
     def discover_series(self, series_url: str) -> SeriesIndex:
         """Parse la page série et retourne l'index des épisodes."""
@@ -52,6 +52,7 @@ class SubslikescriptAdapter:
     """Adapteur pour subslikescript.com. Générique (pas de HIMYM en dur)."""
 
     id = "subslikescript"
+    parse_version = "1"  # à incrémenter si parse_episode change (invalide les builds incrémentaux)
 
     # Pattern URL épisode : /series/ShowName-123/season-X/episode-Y
     _episode_url_re = re.compile(
@@ -70,8 +71,9 @@ class SubslikescriptAdapter:
         user_agent: str | None = None,
         rate_limit_s: float | None = None,
         cache_dir: Path | None = None,
+        refresh: bool = False,
     ) -> SeriesIndex:
-        """Récupère la page série puis parse pour produire SeriesIndex."""
+        """Récupère la page série puis parse pour produire SeriesIndex (refresh : ignore le cache HTML)."""
         from howimetyourcorpus.core.utils.http import BROWSER_HEADERS, get_html
         html = get_html(
             series_url,
@@ -79,6 +81,7 @@ class SubslikescriptAdapter:
             user_agent=user_agent,
             min_interval_s=rate_limit_s,
             cache_dir=cache_dir,
+            **({"cache_ttl_s": 0.0} if refresh else {}),
         )
         return self.discover_series_from_html(html, series_url)
 
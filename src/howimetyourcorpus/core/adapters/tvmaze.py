@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import threading
+import time
 from pathlib import Path
+from typing import Any
 from urllib.parse import quote_plus
 
 from howimetyourcorpus.core.adapters.base import AdapterRegistry
@@ -11,11 +16,131 @@ from howimetyourcorpus.core.models import EpisodeRef, SeriesIndex
 
 logger = logging.getLogger(__name__)
 
+TVMAZE_API_URL = "https://api.tvmaze.com"
+TVMAZE_USER_AGENT = "HowIMetYourCorpus/1.0 (research)"
+# Les métadonnées d'une série (titres, numérotation) changent rarement : cache long.
+TVMAZE_METADATA_TTL_S = 30 * 24 * 3600
+TVMAZE_CACHE_SUBDIR = "tvmaze"
+
+
+def _query_key(series_name: str) -> str:
+    return " ".join(series_name.casefold().split())
+
+
+class TvmazeMetadataCache:
+    """
+    Cache des métadonnées série TVMaze (show + épisodes), indexé par show id.
+
+    Deux niveaux : mémoire (partagée par toutes les instances d'adapteur du processus : UI et API)
+    puis disque optionnel (<cache_dir>/tvmaze/shows/<id>.json + search_index.json nom → id).
+    """
+
+    def __init__(self, ttl_s: float = TVMAZE_METADATA_TTL_S):
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        # Sérialise le lire-modifier-écrire de search_index.json entre threads de ce processus seulement ;
+        # entre processus (UI / API), _write_json (temporaire + os.replace) évite un fichier tronqué.
+        self._disk_lock = threading.Lock()
+        self._shows: dict[int, tuple[float, dict[str, Any]]] = {}
+        self._names: dict[str, int] = {}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._shows.clear()
+            self._names.clear()
+
+    def _fresh(self, fetched_at: float) -> bool:
+        return time.time() - fetched_at < self.ttl_s
+
+    @staticmethod
+    def _disk_dir(cache_dir: Path | None) -> Path | None:
+        if not cache_dir:
+            return None
+        return Path(cache_dir) / TVMAZE_CACHE_SUBDIR
+
+    @staticmethod
+    def _write_json(path: Path, payload: Any) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def get_by_name(self, series_name: str, cache_dir: Path | None = None) -> dict[str, Any] | None:
+        """Retourne le show (avec _embedded.episodes) pour une recherche déjà résolue, ou None."""
+        key = _query_key(series_name)
+        with self._lock:
+            show_id = self._names.get(key)
+            entry = self._shows.get(show_id) if show_id is not None else None
+            if entry and self._fresh(entry[0]):
+                return entry[1]
+        disk = self._disk_dir(cache_dir)
+        if disk is None:
+            return None
+        try:
+            if show_id is None:
+                index_path = disk / "search_index.json"
+                if not index_path.exists():
+                    return None
+                show_id = json.loads(index_path.read_text(encoding="utf-8")).get(key)
+                if show_id is None:
+                    return None
+            show_path = disk / "shows" / f"{int(show_id)}.json"
+            if not show_path.exists():
+                return None
+            payload = json.loads(show_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning("TVMaze: cache disque illisible (%s): %s", disk, exc)
+            return None
+        fetched_at = float(payload.get("fetched_at") or 0)
+        show = payload.get("show")
+        if not isinstance(show, dict) or not self._fresh(fetched_at):
+            return None
+        with self._lock:
+            self._shows[int(show_id)] = (fetched_at, show)
+            self._names[key] = int(show_id)
+        return show
+
+    def put(self, series_name: str, show: dict[str, Any], cache_dir: Path | None = None) -> None:
+        """Mémorise un show résolu (mémoire + disque si cache_dir)."""
+        show_id = int(show["id"])
+        key = _query_key(series_name)
+        fetched_at = time.time()
+        with self._lock:
+            self._shows[show_id] = (fetched_at, show)
+            self._names[key] = show_id
+        disk = self._disk_dir(cache_dir)
+        if disk is None:
+            return
+        try:
+            self._write_json(disk / "shows" / f"{show_id}.json", {"fetched_at": fetched_at, "show": show})
+            index_path = disk / "search_index.json"
+            with self._disk_lock:
+                names: dict[str, int] = {}
+                if index_path.exists():
+                    try:
+                        names = json.loads(index_path.read_text(encoding="utf-8")) or {}
+                    except ValueError:
+                        names = {}
+                names[key] = show_id
+                self._write_json(index_path, names)
+        except OSError as exc:
+            logger.warning("TVMaze: écriture cache disque impossible (%s): %s", disk, exc)
+
+
+# Cache partagé par le processus (onglets Qt, endpoints API).
+_METADATA_CACHE = TvmazeMetadataCache()
+
+
+def get_metadata_cache() -> TvmazeMetadataCache:
+    """Cache de métadonnées TVMaze partagé par le processus."""
+    return _METADATA_CACHE
+
 
 class TvmazeAdapter:
     """Adapteur pour TVMaze API. Recherche par nom de série."""
 
     id = "tvmaze"
+    parse_version = "1"  # à incrémenter si parse_episode change (invalide les builds incrémentaux)
 
     def normalize_episode_id(self, season: int, episode: int) -> str:
         return f"S{season:02d}E{episode:02d}"
@@ -27,15 +152,20 @@ class TvmazeAdapter:
         user_agent: str | None = None,
         rate_limit_s: float | None = None,
         cache_dir: Path | None = None,
+        refresh: bool = False,
     ) -> SeriesIndex:
         """
         Recherche une série par nom et retourne la liste complète des épisodes.
         
+        Une seule requête (/singlesearch/shows?embed=episodes) ; le résultat est mémorisé par show id
+        (mémoire du processus + disque si cache_dir) et sert les recherches suivantes sans réseau.
+        
         Args:
             series_name: Nom de la série (ex: "Breaking Bad", "The Wire")
             user_agent: User-Agent HTTP (optionnel)
             rate_limit_s: Délai entre requêtes (optionnel, TVMaze rate limit: 20 req/10s)
-            cache_dir: Dossier cache pour les requêtes HTTP (optionnel)
+            cache_dir: Dossier cache du projet (optionnel) : métadonnées dans <cache_dir>/tvmaze/
+            refresh: True pour ignorer le cache et réinterroger l'API
         
         Returns:
             SeriesIndex avec tous les épisodes de la série
@@ -43,24 +173,43 @@ class TvmazeAdapter:
         Raises:
             ValueError: Si la série n'est pas trouvée ou si l'API retourne une erreur
         """
-        from howimetyourcorpus.core.utils.http import get_json
-        
         if not series_name or not series_name.strip():
             raise ValueError("Le nom de la série ne peut pas être vide.")
         
         series_name = series_name.strip()
+        cache = get_metadata_cache()
+        if not refresh:
+            cached = cache.get_by_name(series_name, cache_dir)
+            if cached is not None:
+                logger.debug("TVMaze: '%s' servi depuis le cache (ID=%s)", series_name, cached.get("id"))
+                return self._build_index(cached, series_name)
+
+        show_data = self._fetch_show_with_episodes(
+            series_name,
+            user_agent=user_agent or TVMAZE_USER_AGENT,
+            min_interval_s=rate_limit_s or 0.5,  # TVMaze: 20 req/10s = 0.5s minimum
+        )
+        index = self._build_index(show_data, series_name)
+        cache.put(series_name, show_data, cache_dir)
+        return index
+
+    def _fetch_show_with_episodes(
+        self,
+        series_name: str,
+        *,
+        user_agent: str,
+        min_interval_s: float,
+    ) -> dict[str, Any]:
+        """Show TVMaze avec _embedded.episodes (repli sur /shows/{id}/episodes si l'embed manque)."""
+        from howimetyourcorpus.core.utils.http import get_json
+        
         logger.info(f"TVMaze: recherche de la série '{series_name}'")
         
-        # Étape 1 : Recherche de la série via /singlesearch/shows
-        search_url = f"https://api.tvmaze.com/singlesearch/shows?q={quote_plus(series_name)}"
+        # Étape 1 : Recherche de la série via /singlesearch/shows (épisodes embarqués)
+        search_url = f"{TVMAZE_API_URL}/singlesearch/shows?q={quote_plus(series_name)}&embed=episodes"
         
         try:
-            show_data = get_json(
-                search_url,
-                user_agent=user_agent or "HowIMetYourCorpus/1.0 (research)",
-                min_interval_s=rate_limit_s or 0.5,  # TVMaze: 20 req/10s = 0.5s minimum
-                cache_dir=cache_dir,
-            )
+            show_data = get_json(search_url, user_agent=user_agent, min_interval_s=min_interval_s)
         except Exception as e:
             logger.error(f"TVMaze: erreur lors de la recherche de '{series_name}': {e}")
             raise ValueError(
@@ -79,22 +228,30 @@ class TvmazeAdapter:
         
         logger.info(f"TVMaze: série trouvée - ID={show_id}, Nom='{show_name}'")
         
-        # Étape 2 : Récupérer tous les épisodes via /shows/{id}/episodes
-        episodes_url = f"https://api.tvmaze.com/shows/{show_id}/episodes"
+        embedded = show_data.get("_embedded") or {}
+        if isinstance(embedded.get("episodes"), list):
+            return show_data
+
+        # Étape 2 (repli) : Récupérer tous les épisodes via /shows/{id}/episodes
+        episodes_url = f"{TVMAZE_API_URL}/shows/{show_id}/episodes"
         
         try:
-            episodes_data = get_json(
-                episodes_url,
-                user_agent=user_agent or "HowIMetYourCorpus/1.0 (research)",
-                min_interval_s=rate_limit_s or 0.5,
-                cache_dir=cache_dir,
-            )
+            episodes_data = get_json(episodes_url, user_agent=user_agent, min_interval_s=min_interval_s)
         except Exception as e:
             logger.error(f"TVMaze: erreur lors de la récupération des épisodes pour ID={show_id}: {e}")
             raise ValueError(
                 f"Impossible de récupérer les épisodes pour '{show_name}' (ID={show_id})"
             ) from e
         
+        if not episodes_data or not isinstance(episodes_data, list):
+            raise ValueError(f"Liste d'épisodes invalide pour '{show_name}' (ID={show_id})")
+        return {**show_data, "_embedded": {**embedded, "episodes": episodes_data}}
+
+    def _build_index(self, show_data: dict[str, Any], series_name: str) -> SeriesIndex:
+        """Construit le SeriesIndex depuis un show TVMaze avec _embedded.episodes."""
+        show_id = show_data.get("id")
+        show_name = show_data.get("name", series_name)
+        episodes_data = (show_data.get("_embedded") or {}).get("episodes")
         if not episodes_data or not isinstance(episodes_data, list):
             raise ValueError(f"Liste d'épisodes invalide pour '{show_name}' (ID={show_id})")
         
@@ -22,8 +22,11 @@ RAW_TEXT_FILENAME:       str = "raw.txt"
 CLEAN_TEXT_FILENAME:     str = "clean.txt"
 SEGMENTS_JSONL_FILENAME: str = "segments.jsonl"
 ALIGN_REPORT_FILENAME:   str = "report.json"
+BUILD_MANIFEST_FILENAME: str = "build_manifest.json"
 EXPORTS_DIR_NAME:        str = "exports"
 EPISODES_DIR_NAME:       str = "episodes"
+CHECKPOINTS_DIR_NAME:    str = "checkpoints"
+RUNS_DIR_NAME:           str = "runs"
 
 # ── Normalisation ─────────────────────────────────────────────────────────────
 
@@ -0,0 +1,231 @@
+"""
+Normalisation par lot : transcripts et pistes de sous-titres de plusieurs épisodes, en parallèle.
+
+Les profils (dataclasses simples) et les textes sont envoyés à un ProcessPoolExecutor (spawn) ;
+le processus appelant garde toutes les écritures : clean.txt + manifeste par épisode au fil des
+résultats, puis text_clean des cues et statuts d'épisodes en une transaction chacun.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable
+
+from howimetyourcorpus.core.models import EpisodeStatus, TransformStats
+from howimetyourcorpus.core.normalize.profiles import NormalizationProfile, get_profile
+from howimetyourcorpus.core.normalize.rules import DEBUG_COUNTERS, DEBUG_OFF
+from howimetyourcorpus.core.pipeline.manifest import (
+    STAGE_NORMALIZE,
+    BuildManifest,
+    profile_fingerprint,
+    text_digest,
+)
+from howimetyourcorpus.core.utils.tracing import trace_span
+
+logger = logging.getLogger(__name__)
+
+STEP_NAME = "normalize_batch"
+
+
+@dataclass(frozen=True)
+class NormalizeItem:
+    """Un transcript (lang vide) ou une piste de sous-titres à normaliser avec un profil."""
+
+    episode_id: str
+    profile_id: str
+    lang: str = ""
+
+    @property
+    def key(self) -> str:
+        return f"{self.episode_id}:{self.lang}" if self.lang else self.episode_id
+
+
+@dataclass
+class BatchNormalizeReport:
+    """Bilan d'un lot : clés (episode_id ou episode_id:lang) par issue + stats cumulées."""
+
+    done: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    stats: TransformStats = field(default_factory=TransformStats)
+    """Somme des stats de tous les items (duration_ms : temps CPU cumulé des workers)."""
+    cues_updated: int = 0
+    wall_ms: int = 0
+    cancelled: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def add_stats(total: TransformStats, stats: TransformStats) -> None:
+    """Cumule `stats` dans `total`."""
+    total.raw_lines += stats.raw_lines
+    total.clean_lines += stats.clean_lines
+    total.merges += stats.merges
+    total.kept_breaks += stats.kept_breaks
+    total.duration_ms += stats.duration_ms
+
+
+def _normalize_transcript(
+    profile: NormalizationProfile, raw: str, debug_level: str
+) -> tuple[str, TransformStats, dict]:
+    """Fonction module (exécutable dans un process pool)."""
+    return profile.apply(raw, debug_level=debug_level)
+
+
+def _normalize_cues(profile: NormalizationProfile, texts: list[str]) -> tuple[list[str], TransformStats]:
+    """Fonction module (exécutable dans un process pool) : un apply par cue (sans debug), stats cumulées."""
+    total = TransformStats()
+    cleans = []
+    for text in texts:
+        clean, stats, _debug = profile.apply(text, debug_level=DEBUG_OFF)
+        cleans.append(clean)
+        add_stats(total, stats)
+    return cleans, total
+
+
+class _InlineExecutor(Executor):
+    """Exécution synchrone (un seul worker ou un seul item : pas de coût de démarrage du pool)."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:  # noqa: BLE001 - remonté via future.result()
+            future.set_exception(e)
+        return future
+
+
+def normalize_batch(
+    store: Any,
+    db: Any,
+    items: list[NormalizeItem],
+    profiles: dict[str, NormalizationProfile] | None = None,
+    *,
+    force: bool = False,
+    rewrite_srt: bool = False,
+    debug_level: str = DEBUG_COUNTERS,
+    max_workers: int | None = None,
+    on_progress: Callable[[str, float, str], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> BatchNormalizeReport:
+    """
+    Normalise `items` (profils résolus par get_profile dans `profiles`, défaut : profils du projet).
+
+    Transcripts : skip si le manifeste de build est à jour (sauf force) ; debug_level ("counters"
+    par défaut : personne ne relit l'historique d'un lot). Pistes : text_raw des cues -> text_clean
+    (comme normalize_subtitle_track), SRT réécrit si rewrite_srt.
+    Un item en échec n'arrête pas les autres ; une annulation abandonne les items non démarrés.
+    """
+    t0 = time.perf_counter()
+    report = BatchNormalizeReport()
+    custom = profiles if profiles is not None else store.load_custom_profiles()
+
+    # Préparation (lectures) dans le processus appelant.
+    tasks: list[tuple[NormalizeItem, NormalizationProfile, Any]] = []
+    for item in items:
+        profile = get_profile(item.profile_id, custom)
+        if not profile:
+            report.failed[item.key] = f"Profile not found: {item.profile_id}"
+            continue
+        if item.lang:
+            cues = db.get_cues_for_episode_lang(item.episode_id, item.lang) if db else []
+            if not cues:
+                report.failed[item.key] = f"No cues: {item.key}"
+                continue
+            tasks.append((item, profile, cues))
+            continue
+        raw = store.load_episode_text(item.episode_id, kind="raw")
+        if not raw.strip():
+            report.failed[item.key] = f"No raw text: {item.episode_id}"
+            continue
+        manifest = BuildManifest.load(store, item.episode_id)
+        inputs = {"raw": text_digest(raw), "profile": profile_fingerprint(profile)}
+        if not force and manifest.is_fresh(
+            STAGE_NORMALIZE,
+            inputs,
+            store.has_episode_clean(item.episode_id),
+            lambda eid=item.episode_id: text_digest(store.load_episode_text(eid, kind="clean")),
+        ):
+            report.skipped.append(item.key)
+            continue
+        tasks.append((item, profile, (raw, manifest, inputs)))
+
+    total = len(tasks)
+    workers = max(1, min(total, max_workers or os.cpu_count() or 1))
+    executor: Executor = (
+        ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        if workers > 1
+        else _InlineExecutor()
+    )
+    cue_rows: list[tuple[str, str]] = []
+    normalized_episodes: list[str] = []
+    pending: dict[Future, tuple[NormalizeItem, Any]] = {}
+    try:
+        for item, profile, payload in tasks:
+            if item.lang:
+                texts = [(c.get("text_raw") or "").strip() for c in payload]
+                future = executor.submit(_normalize_cues, profile, texts)
+            else:
+                future = executor.submit(_normalize_transcript, profile, payload[0], debug_level)
+            pending[future] = (item, payload)
+
+        finished = 0
+        while pending:
+            if is_cancelled and is_cancelled():
+                report.cancelled = True
+                for future in pending:
+                    future.cancel()
+                break
+            done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            for future in done:
+                item, payload = pending.pop(future)
+                finished += 1
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.exception("Normalization failed: %s", item.key)
+                    report.failed[item.key] = str(e)
+                    continue
+                if item.lang:
+                    cleans, stats = result
+                    rows = [(c["cue_id"], clean) for c, clean in zip(payload, cleans) if c.get("cue_id")]
+                    cue_rows.extend(rows)
+                    report.cues_updated += len(rows)
+                    if rewrite_srt and rows:
+                        _rewrite_srt(store, item, payload, cleans)
+                else:
+                    clean_text, stats, debug = result
+                    _raw, manifest, inputs = payload
+                    store.save_episode_clean(item.episode_id, clean_text, stats, debug)
+                    manifest.record(STAGE_NORMALIZE, inputs, text_digest(clean_text))
+                    manifest.save()
+                    normalized_episodes.append(item.episode_id)
+                add_stats(report.stats, stats)
+                report.done.append(item.key)
+                if on_progress:
+                    on_progress(STEP_NAME, finished / total, f"Normalized {item.key}")
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    if db and (cue_rows or normalized_episodes):
+        with trace_span("db_write", "db") as sp:
+            sp.items = len(cue_rows) + len(normalized_episodes)
+            db.update_cues_text_clean_batch(cue_rows)
+            db.set_episodes_status_batch(normalized_episodes, EpisodeStatus.NORMALIZED.value)
+    report.wall_ms = int((time.perf_counter() - t0) * 1000)
+    if on_progress:
+        on_progress(STEP_NAME, 1.0, f"Normalized {len(report.done)} items ({len(report.failed)} failed)")
+    return report
+
+
+def _rewrite_srt(store: Any, item: NormalizeItem, cues: list[dict[str, Any]], cleans: list[str]) -> None:
+    from howimetyourcorpus.core.subtitles.parsers import cues_to_srt
+
+    updated = [{**c, "text_clean": clean} for c, clean in zip(cues, cleans)]
+    store.save_episode_subtitle_content(item.episode_id, item.lang, cues_to_srt(updated), "srt")
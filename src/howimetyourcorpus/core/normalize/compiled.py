@@ -0,0 +1,165 @@
+"""
+Compilation des profils de normalisation : un profil devient un programme de règles de ligne
+(regex précompilées, règles désactivées ou sans effet retirées, passes redondantes fusionnées).
+
+Le programme est mis en cache par configuration de règles : `NormalizationProfile.apply()`
+le récupère une fois par appel au lieu de réinterpréter le profil (et de recompiler les
+regex personnalisées) à chaque ligne. Les patterns invalides sont écartés à la compilation,
+avec un avertissement unique, au lieu d'être ignorés silencieusement à chaque ligne.
+Sortie identique à `NormalizationProfile._apply_line_rules` (implémentation de référence).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from howimetyourcorpus.core.normalize.profiles import NormalizationProfile
+
+logger = logging.getLogger(__name__)
+
+_MULTI_SPACE = re.compile(r" {2,}")
+_FRENCH_PUNCT = re.compile(r"(\S)([;:!?])")
+_FRENCH_PUNCT_CHARS = frozenset(";:!?")
+
+# (source, cible) du remplacement d'apostrophes du profil ; ignoré s'il est sans effet.
+APOSTROPHE_REPLACEMENT = ("'", "'")
+
+
+def _sentence_case(line: str) -> str:
+    return line[0].upper() + line[1:].lower() if len(line) > 1 else line.upper()
+
+
+_CASE_FUNCS: dict[str, Callable[[str], str]] = {
+    "lowercase": str.lower,
+    "UPPERCASE": str.upper,
+    "Title Case": str.title,
+    "Sentence case": _sentence_case,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledProfile:
+    """Programme de règles de ligne d'un profil (immuable, partagé via le cache)."""
+
+    strip: bool
+    fix_double_spaces: bool
+    fix_french_punctuation: bool
+    collapse_after_french: bool
+    """Faux si les doubles espaces ont déjà été réduits : l'insertion d'espace ne peut en créer."""
+    apostrophes: tuple[str, str] | None
+    normalize_quotes: bool
+    regex_rules: tuple[tuple[re.Pattern[str], str], ...]
+    invalid_rules: tuple[tuple[str, str], ...]
+    """Règles personnalisées écartées à la compilation (pattern invalide)."""
+    case_func: Callable[[str], str] | None
+
+    def apply_line(self, line: str) -> tuple[str, int, int]:
+        """Applique le programme ; retourne (ligne, corrections ponctuation, remplacements regex)."""
+        if not line:
+            return line, 0, 0
+        result = line
+        punctuation = 0
+        regex = 0
+
+        if self.strip:
+            result = result.strip()
+
+        if self.fix_double_spaces and "  " in result:
+            result = _MULTI_SPACE.sub(" ", result)
+            punctuation += 1
+
+        if self.fix_french_punctuation:
+            before = result
+            if not _FRENCH_PUNCT_CHARS.isdisjoint(result):
+                result = _FRENCH_PUNCT.sub(r"\1 \2", result)
+            if self.collapse_after_french and "  " in result:
+                result = _MULTI_SPACE.sub(" ", result)
+            if result != before:
+                punctuation += 1
+
+        if self.apostrophes is not None:
+            src, dst = self.apostrophes
+            if src in result:
+                result = result.replace(src, dst)
+                punctuation += 1
+
+        if self.normalize_quotes and '"' in result:
+            before = result
+            parts = result.split('"')
+            chunks = [parts[0]]
+            for i, part in enumerate(parts[1:], start=1):
+                chunks.append("« " if i % 2 == 1 else " »")
+                chunks.append(part)
+            result = _MULTI_SPACE.sub(" ", "".join(chunks))
+            if result != before:
+                punctuation += 1
+
+        if result:
+            for pattern, replacement in self.regex_rules:
+                result, count = pattern.subn(replacement, result)
+                regex += count
+
+        if self.case_func is not None and result:
+            result = self.case_func(result)
+
+        return result, punctuation, regex
+
+
+def _compile_regex_rules(
+    rules: tuple[tuple[str, str], ...],
+) -> tuple[tuple[tuple[re.Pattern[str], str], ...], tuple[tuple[str, str], ...]]:
+    compiled: list[tuple[re.Pattern[str], str]] = []
+    invalid: list[tuple[str, str]] = []
+    for pattern, replacement in rules:
+        try:
+            regex = re.compile(pattern)
+            regex.subn(replacement, "")  # valide aussi le gabarit de remplacement (\1, \g<nom>)
+            compiled.append((regex, replacement))
+        except re.error as exc:
+            logger.warning("Règle regex ignorée (pattern invalide %r) : %s", pattern, exc)
+            invalid.append((pattern, replacement))
+    return tuple(compiled), tuple(invalid)
+
+
+@lru_cache(maxsize=64)
+def _compile(
+    strip: bool,
+    fix_double_spaces: bool,
+    fix_french_punctuation: bool,
+    normalize_apostrophes: bool,
+    normalize_quotes: bool,
+    case_transform: str,
+    custom_regex_rules: tuple[tuple[str, str], ...],
+) -> CompiledProfile:
+    src, dst = APOSTROPHE_REPLACEMENT
+    regex_rules, invalid_rules = _compile_regex_rules(custom_regex_rules)
+    return CompiledProfile(
+        strip=strip,
+        fix_double_spaces=fix_double_spaces,
+        fix_french_punctuation=fix_french_punctuation,
+        collapse_after_french=not fix_double_spaces,
+        apostrophes=(src, dst) if normalize_apostrophes and src != dst else None,
+        normalize_quotes=normalize_quotes,
+        regex_rules=regex_rules,
+        invalid_rules=invalid_rules,
+        case_func=_CASE_FUNCS.get(case_transform),
+    )
+
+
+def compile_profile(profile: NormalizationProfile) -> CompiledProfile:
+    """Programme compilé (mis en cache) des règles de ligne du profil."""
+    rules = tuple((pattern, replacement) for pattern, replacement in profile.custom_regex_rules)
+    return _compile(
+        profile.strip_line_spaces,
+        profile.fix_double_spaces,
+        profile.fix_french_punctuation,
+        profile.normalize_apostrophes,
+        profile.normalize_quotes,
+        profile.case_transform,
+        rules,
+    )
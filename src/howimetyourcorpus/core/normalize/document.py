@@ -0,0 +1,192 @@
+"""
+Moteur « document » de la normalisation : fusion des césures et règles de ponctuation appliquées
+par passes regex multilignes sur le texte entier, au lieu d'une boucle Python ligne à ligne.
+
+Sortie identique octet pour octet au moteur ligne (`NormalizationProfile.apply(engine="line")`),
+y compris stats et debug : les règles de ligne ne franchissent jamais un saut de ligne, les
+compteurs « lignes modifiées » comptent les correspondances qui consomment la fin de ligne. Seules les
+règles regex personnalisées (dont `^`, `$`, `\\s`… dépendent du découpage) et la casse
+« Sentence case » restent appliquées ligne par ligne.
+"""
+
+from __future__ import annotations
+
+import re
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from howimetyourcorpus.core.models import TransformStats
+from howimetyourcorpus.core.normalize.compiled import CompiledProfile, compile_profile
+from howimetyourcorpus.core.normalize.rules import DEBUG_FULL, DEBUG_OFF, MAX_HISTORY_ENTRIES, new_debug
+from howimetyourcorpus.core.utils.text import SPEAKER_LIKE_PATTERN
+
+if TYPE_CHECKING:
+    from howimetyourcorpus.core.normalize.profiles import NormalizationProfile
+
+# Saut de ligne fusionnable entre deux lignes déjà strippées (équivalent de rules.should_merge) :
+# ligne précédente non vide ne finissant pas par .?!, ligne suivante non vide, ni locuteur,
+# ni didascalie. Motifs amorcés par un littéral / une classe : recherche rapide par le moteur re.
+_MERGE_BREAK = re.compile(
+    r"\n(?<=[^.?!\n]\n)(?=[^\n])"
+    rf"(?!{SPEAKER_LIKE_PATTERN.pattern.lstrip('^')})"
+    r"(?!\([^\n]*\)(?:\n|\Z))"
+    r"(?!\[[^\n]*\](?:\n|\Z))"
+)
+# \x1c est un séparateur pour str.splitlines() : il ne peut pas figurer dans le texte recomposé.
+_MERGE_MARK = "\x1c"
+_MERGED_LINE = re.compile(r"\x1c[^\n]*")
+
+_PUNCT = ";:!?"
+_DOUBLE_SPACE_LINE = re.compile(r"  [^\n]*")
+_FRENCH_FIX_LINE = re.compile(r"[;:!?](?<=\S[;:!?])[^\n]*")
+_FRENCH_FIX_OR_SPACES_LINE = re.compile(r"(?:[;:!?](?<=\S[;:!?])|  )[^\n]*")
+# Ponctuation isolée précédée d'un caractère non blanc : un passage par signe, remplacement littéral.
+_FRENCH_SINGLE = [
+    (re.compile(rf"{re.escape(c)}(?<=[^\s;:!?]{re.escape(c)})(?![;:!?])"), " " + c) for c in _PUNCT
+]
+_PUNCT_RUN = re.compile(r"[;:!?]{2,}")
+_QUOTE_TO_EOL = re.compile(r'"[^\n]*')
+_QUOTE_LINE = re.compile(r'^[^\n"]*"[^\n]*', re.MULTILINE)
+
+_DOCUMENT_CASE = {"lowercase": str.lower, "UPPERCASE": str.upper, "Title Case": str.title}
+
+
+def _collapse_spaces(doc: str) -> str:
+    """Équivalent de re.sub(" {2,}", " ", doc) (replace en C, log2(plus long blanc) passes)."""
+    while "  " in doc:
+        doc = doc.replace("  ", " ")
+    return doc
+
+
+def _punct_run(m: re.Match[str]) -> str:
+    # (\S)([;:!?]) consomme deux caractères : dans une suite de signes, un sur deux reçoit
+    # l'espace, en commençant par le premier si la suite suit un caractère non blanc.
+    run = m.group()
+    pos = m.start()
+    first = 0 if pos > 0 and not m.string[pos - 1].isspace() else 1
+    return "".join(" " + c if i >= first and (i - first) % 2 == 0 else c for i, c in enumerate(run))
+
+
+def _quote_line(m: re.Match[str]) -> str:
+    parts = m.group().split('"')
+    chunks = [parts[0]]
+    for i, part in enumerate(parts[1:], start=1):
+        chunks.append("« " if i % 2 == 1 else " »")
+        chunks.append(part)
+    return _collapse_spaces("".join(chunks))
+
+
+def _merge_examples(text: str, raw_lines: list[str], limit: int) -> list[dict[str, str]]:
+    examples = []
+    line_no = 0
+    pos = 0
+    for m in islice(_MERGE_BREAK.finditer(text), limit):
+        line_no += text.count("\n", pos, m.start())
+        pos = m.start()
+        examples.append({"before": raw_lines[line_no][-40:], "after": raw_lines[line_no + 1][:40]})
+    return examples
+
+
+def _apply_punctuation(program: CompiledProfile, doc: str, count: bool = True) -> tuple[str, int]:
+    """Règles espaces / ponctuation / guillemets sur tout le document ; (doc, lignes corrigées si count)."""
+    fixes = 0
+    if program.fix_double_spaces and "  " in doc:
+        if count:
+            fixes += len(_DOUBLE_SPACE_LINE.findall(doc))
+        doc = _collapse_spaces(doc)
+    if program.fix_french_punctuation:
+        if count:
+            line_pattern = _FRENCH_FIX_OR_SPACES_LINE if program.collapse_after_french else _FRENCH_FIX_LINE
+            fixes += len(line_pattern.findall(doc))
+        doc = _PUNCT_RUN.sub(_punct_run, doc)
+        for pattern, replacement in _FRENCH_SINGLE:
+            doc = pattern.sub(replacement, doc)
+        if program.collapse_after_french:
+            doc = _collapse_spaces(doc)
+    if program.apostrophes is not None:
+        src, dst = program.apostrophes
+        if count:
+            fixes += len(re.findall(rf"{re.escape(src)}[^\n]*", doc))
+        doc = doc.replace(src, dst)
+    if program.normalize_quotes and '"' in doc:
+        # Sans double espace dans le document, seule la fin de ligne à partir du premier
+        # guillemet peut changer ; sinon le repli d'espaces porte sur toute la ligne.
+        pattern = _QUOTE_TO_EOL if "  " not in doc else _QUOTE_LINE
+        doc, count = pattern.subn(_quote_line, doc)
+        fixes += count
+    return doc, fixes
+
+
+def _apply_regex_and_case(program: CompiledProfile, lines: list[str]) -> tuple[list[str], int]:
+    """Règles regex personnalisées puis casse, ligne par ligne ; (lignes, remplacements)."""
+    out = []
+    replacements = 0
+    case_func = program.case_func
+    for line in lines:
+        if line:
+            for pattern, replacement in program.regex_rules:
+                line, count = pattern.subn(replacement, line)
+                replacements += count
+            if case_func is not None and line:
+                line = case_func(line)
+        out.append(line)
+    return out, replacements
+
+
+def apply_document(
+    profile: NormalizationProfile, raw_text: str, debug_level: str = DEBUG_FULL
+) -> tuple[str, TransformStats, dict]:
+    """Équivalent de `profile.apply(raw_text, engine="line")` par passes sur le texte entier."""
+    program = compile_profile(profile)
+    raw_lines = raw_text.splitlines()
+    stats = TransformStats(raw_lines=len(raw_lines))
+    debug = new_debug(debug_level)
+    full = debug_level == DEBUG_FULL
+    counters = debug_level != DEBUG_OFF
+    if full and program.invalid_rules:
+        debug["invalid_regex_rules"] = [pattern for pattern, _ in program.invalid_rules]
+    if not raw_lines:
+        return "", stats, debug
+
+    stripped = list(map(str.strip, raw_lines))
+    before = "\n".join(stripped)
+    merged_blocks = 0
+    if profile.merge_subtitle_breaks:
+        if full and profile.max_merge_examples_in_debug > 0:
+            debug["merge_examples"] = _merge_examples(before, raw_lines, profile.max_merge_examples_in_debug)
+        before, stats.merges = _MERGE_BREAK.subn(_MERGE_MARK, before)
+        if stats.merges:
+            merged_blocks = len(_MERGED_LINE.findall(before))
+            before = before.replace(_MERGE_MARK, " ")
+    stats.kept_breaks = stripped.count("") + merged_blocks
+
+    doc, punctuation_fixes = _apply_punctuation(program, before, count=counters)
+    regex_replacements = 0
+    if program.regex_rules or profile.case_transform not in (_DOCUMENT_CASE.keys() | {"none"}):
+        after_lines, regex_replacements = _apply_regex_and_case(program, doc.split("\n"))
+        clean_text = "\n".join(after_lines)
+        stats.clean_lines = sum(1 for line in after_lines if line.strip())
+    else:
+        case_func = _DOCUMENT_CASE.get(profile.case_transform)
+        clean_text = case_func(doc) if case_func is not None else doc
+        after_lines = clean_text.split("\n")
+        stats.clean_lines = len(after_lines) - after_lines.count("")
+
+    if not counters:
+        return clean_text, stats, debug
+    debug["punctuation_fixes"] = punctuation_fixes
+    debug["regex_replacements"] = regex_replacements
+    count_case = profile.case_transform != "none"
+    if not (full or count_case):
+        return clean_text, stats, debug
+    history = debug.get("history")
+    case_transforms = 0
+    for line_before, line_after in zip(before.split("\n"), after_lines):
+        if line_before != line_after:
+            if history is not None and len(history) < MAX_HISTORY_ENTRIES:
+                history.append({"step": "line_rules", "before": line_before[:100], "after": line_after[:100]})
+            elif not count_case:
+                break
+            case_transforms += count_case
+    debug["case_transforms"] = case_transforms
+    return clean_text, stats, debug
@@ -0,0 +1,168 @@
+"""
+Normalisation incrémentale : le texte est découpé en blocs stables vis-à-vis de la fusion des
+césures, et seuls les blocs modifiés depuis le dernier appel sont renormalisés.
+
+Un bloc commence à chaque ligne de séparation forte (`rules.is_strong_break_before` : ligne vide,
+locuteur, didascalie) : aucune fusion ne franchit ce saut de ligne et les règles de ligne ne
+débordent jamais d'une ligne, donc normaliser bloc par bloc puis recoller donne exactement
+`profile.apply(texte)` (texte, stats et debug). Les blocs sont regroupés en paquets délimités par
+leur contenu (longueur du bloc), stables quand le texte change ailleurs ; le résultat de chaque
+paquet est mis en cache (LRU) par configuration de règles du profil et texte du paquet : pendant
+l'édition d'un long transcript, une frappe ne renormalise que le paquet touché.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from typing import Any
+
+from howimetyourcorpus.core.models import TransformStats
+from howimetyourcorpus.core.normalize.compiled import compile_profile
+from howimetyourcorpus.core.normalize.profiles import NormalizationProfile
+from howimetyourcorpus.core.normalize.rules import (
+    DEBUG_FULL,
+    DEBUG_LEVELS,
+    DEBUG_OFF,
+    MAX_HISTORY_ENTRIES,
+    new_debug,
+)
+from howimetyourcorpus.core.utils.text import SPEAKER_LIKE_PATTERN
+
+# Nombre max de paquets gardés en cache (tous profils confondus) : quelques épisodes × options.
+DEFAULT_MAX_CHUNKS = 5_000
+# Un bloc ferme son paquet si len(bloc) & CHUNK_MASK == 0 : ~16 blocs par paquet en moyenne
+# (moins d'entrées de cache à consulter et recoller à chaque appel qu'un bloc par locuteur).
+CHUNK_MASK = 15
+
+# Saut de ligne suivi d'une ligne de séparation forte (équivalent regex de is_strong_break_before,
+# évalué sur la ligne strippée : [^\S\n] = blanc hors saut de ligne, comme str.strip()).
+_BLOCK_BREAK = re.compile(
+    r"\n(?=[^\S\n]*(?:"
+    r"\n|\Z"
+    rf"|{SPEAKER_LIKE_PATTERN.pattern.lstrip('^')}"
+    r"|\([^\n]*\)[^\S\n]*(?:\n|\Z)"
+    r"|\[[^\n]*\][^\S\n]*(?:\n|\Z)"
+    r"))"
+)
+
+_ChunkResult = tuple[str, TransformStats, dict]
+
+
+def split_blocks(raw_text: str) -> list[str]:
+    """Blocs stables (textes joints par "\\n") ; "\\n".join(blocs) == "\\n".join(raw_text.splitlines())."""
+    lines = raw_text.splitlines()
+    if not lines:
+        return []
+    return _BLOCK_BREAK.split("\n".join(lines))
+
+
+def _chunks(blocks: list[str]) -> list[str]:
+    """Regroupe les blocs en paquets ; une coupure ne dépend que du bloc qui la précède."""
+    ends = [i for i, size in enumerate(map(len, blocks), start=1) if not size & CHUNK_MASK]
+    if not ends or ends[-1] != len(blocks):
+        ends.append(len(blocks))
+    chunks = []
+    start = 0
+    for end in ends:
+        chunks.append("\n".join(blocks[start:end]))
+        start = end
+    return chunks
+
+
+class IncrementalNormalizer:
+    """
+    Équivalent de `profile.apply()` avec cache de blocs (à garder entre deux appels).
+
+    La clé de cache porte sur les règles du profil (pas sur son id : l'aperçu du Préparer
+    bascule des options sous un même id) et sur le niveau de debug.
+    """
+
+    def __init__(self, max_chunks: int = DEFAULT_MAX_CHUNKS) -> None:
+        self.max_chunks = max_chunks
+        self._cache: OrderedDict[tuple[int, str], _ChunkResult] = OrderedDict()
+        # Configuration de règles -> petit entier (évite de rehacher le programme à chaque paquet).
+        self._rules_ids: dict[tuple[Any, ...], int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._rules_ids.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def apply(
+        self, profile: NormalizationProfile, raw_text: str, *, debug_level: str = DEBUG_FULL
+    ) -> tuple[str, TransformStats, dict]:
+        """Même contrat que `NormalizationProfile.apply()` ; seuls les blocs inconnus sont calculés."""
+        if debug_level not in DEBUG_LEVELS:
+            raise ValueError(f"Niveau de debug inconnu : {debug_level!r}")
+        t0 = time.perf_counter()
+        blocks = split_blocks(raw_text)
+        if not blocks:
+            return profile.apply(raw_text, debug_level=debug_level)
+
+        rules_key = (
+            compile_profile(profile),
+            profile.merge_subtitle_breaks,
+            profile.max_merge_examples_in_debug,
+            debug_level,
+        )
+        rules_id = self._rules_ids.setdefault(rules_key, len(self._rules_ids))
+        cache = self._cache
+        results: list[_ChunkResult] = []
+        for chunk in _chunks(blocks):
+            key = (rules_id, chunk)
+            result = cache.get(key)
+            if result is None:
+                self.misses += 1
+                result = cache[key] = self._apply_chunk(profile, chunk, debug_level)
+            else:
+                self.hits += 1
+                cache.move_to_end(key)
+            results.append(result)
+        while len(cache) > self.max_chunks:
+            cache.popitem(last=False)
+
+        clean_text, stats, debug = _combine(profile, results, debug_level)
+        stats.duration_ms = int((time.perf_counter() - t0) * 1000)
+        return clean_text, stats, debug
+
+    @staticmethod
+    def _apply_chunk(profile: NormalizationProfile, chunk: str, debug_level: str) -> _ChunkResult:
+        # "\n" final : un paquet finissant par une ligne vide (ou vide lui-même) la garde au splitlines().
+        return profile.apply(chunk + "\n", debug_level=debug_level)
+
+
+def _combine(
+    profile: NormalizationProfile, results: list[_ChunkResult], debug_level: str
+) -> tuple[str, TransformStats, dict]:
+    """Recolle les résultats de paquets : textes joints, stats sommées, debug tronqué comme apply()."""
+    stats = TransformStats()
+    for _clean, block_stats, _debug in results:
+        stats.raw_lines += block_stats.raw_lines
+        stats.clean_lines += block_stats.clean_lines
+        stats.merges += block_stats.merges
+        stats.kept_breaks += block_stats.kept_breaks
+    clean_text = "\n".join(clean for clean, _stats, _debug in results)
+
+    debug = new_debug(debug_level)
+    if debug_level == DEBUG_OFF:
+        return clean_text, stats, debug
+    full = debug_level == DEBUG_FULL
+    for _clean, _stats, chunk_debug in results:
+        for counter in ("punctuation_fixes", "regex_replacements", "case_transforms"):
+            debug[counter] += chunk_debug[counter]
+        if full:
+            debug["merge_examples"].extend(chunk_debug["merge_examples"])
+            debug["history"].extend(chunk_debug["history"])
+            if "invalid_regex_rules" in chunk_debug:
+                debug["invalid_regex_rules"] = list(chunk_debug["invalid_regex_rules"])
+    if full:
+        del debug["merge_examples"][profile.max_merge_examples_in_debug :]
+        del debug["history"][MAX_HISTORY_ENTRIES:]
+    return clean_text, stats, debug
@@ -8,8 +8,21 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from howimetyourcorpus.core.models import TransformStats
-from howimetyourcorpus.core.normalize.rules import MAX_MERGE_EXAMPLES, should_merge
+from howimetyourcorpus.core.normalize.compiled import compile_profile
+from howimetyourcorpus.core.normalize.document import apply_document
+from howimetyourcorpus.core.normalize.rules import (
+    DEBUG_FULL,
+    DEBUG_LEVELS,
+    DEBUG_OFF,
+    MAX_HISTORY_ENTRIES,
+    MAX_MERGE_EXAMPLES,
+    new_debug,
+    should_merge,
+)
 
+# Moteurs de normalisation : "document" (passes regex sur le texte entier, par défaut) et "line"
+# (boucle ligne à ligne, implémentation de référence) ; sortie identique.
+NORMALIZE_ENGINES = ("document", "line")
 
 # Schéma JSON pour validation des profils personnalisés
 PROFILE_SCHEMA = {
@@ -213,7 +226,10 @@ class NormalizationProfile:
 
     def _apply_line_rules(self, line: str) -> tuple[str, dict[str, int]]:
         """Applique les règles de ponctuation, espaces, casse et regex sur une ligne.
-        
+
+        Implémentation de référence (interprétée) : apply() exécute le programme compilé
+        équivalent (voir core.normalize.compiled).
+
         Returns:
             (ligne transformée, compteurs: {punctuation: int, regex: int})
         """
@@ -281,22 +297,38 @@ class NormalizationProfile:
         
         return result, counters
 
-    def apply(self, raw_text: str) -> tuple[str, TransformStats, dict]:
+    def apply(
+        self,
+        raw_text: str,
+        *,
+        engine: str = "document",
+        debug_level: str = DEBUG_FULL,
+    ) -> tuple[str, TransformStats, dict]:
         """
         Applique la normalisation.
+        engine : "document" ou "line" (voir NORMALIZE_ENGINES) ; même résultat.
+        debug_level : "full", "counters" (entiers seulement) ou "off" (debug vide) ; voir DEBUG_LEVELS.
         Returns:
             (clean_text, stats, debug) avec debug contenant merge_examples, history et compteurs.
         """
+        if engine not in NORMALIZE_ENGINES:
+            raise ValueError(f"Moteur de normalisation inconnu : {engine!r}")
+        if debug_level not in DEBUG_LEVELS:
+            raise ValueError(f"Niveau de debug inconnu : {debug_level!r}")
         t0 = time.perf_counter()
-        raw_lines = [ln for ln in raw_text.splitlines()]
+        if engine == "document":
+            clean_text, stats, debug = apply_document(self, raw_text, debug_level)
+            stats.duration_ms = int((time.perf_counter() - t0) * 1000)
+            return clean_text, stats, debug
+        program = compile_profile(self)
+        raw_lines = raw_text.splitlines()
         stats = TransformStats(raw_lines=len(raw_lines))
-        debug: dict = {
-            "merge_examples": [],
-            "punctuation_fixes": 0,
-            "regex_replacements": 0,
-            "case_transforms": 0,
-            "history": []  # Liste des transformations: [{"step": "...", "before": "...", "after": "..."}]
-        }
+        # history : [{"step": "...", "before": "...", "after": "..."}] (niveau "full")
+        debug = new_debug(debug_level)
+        full = debug_level == DEBUG_FULL
+        counters = debug_level != DEBUG_OFF
+        if full and program.invalid_rules:
+            debug["invalid_regex_rules"] = [pattern for pattern, _ in program.invalid_rules]
         if not raw_lines:
             return "", stats, debug
 
@@ -305,6 +337,7 @@ class NormalizationProfile:
         kept_breaks = 0
         punctuation_fixes = 0
         regex_replacements = 0
+        case_transforms = 0
         i = 0
         
         while i < len(raw_lines):
@@ -323,7 +356,7 @@ class NormalizationProfile:
                 acc[-1], raw_lines[i]
             ):
                 next_ln = raw_lines[i]
-                if len(debug["merge_examples"]) < self.max_merge_examples_in_debug:
+                if full and len(debug["merge_examples"]) < self.max_merge_examples_in_debug:
                     debug["merge_examples"].append(
                         {"before": acc[-1][-40:], "after": next_ln[:40] if len(next_ln) > 40 else next_ln}
                     )
@@ -336,12 +369,12 @@ class NormalizationProfile:
             # Appliquer les règles de ponctuation, espaces, regex et casse
             if merged:
                 before_rules = merged
-                merged, counters = self._apply_line_rules(merged)
-                punctuation_fixes += counters["punctuation"]
-                regex_replacements += counters["regex"]
+                merged, punct_count, regex_count = program.apply_line(merged)
+                punctuation_fixes += punct_count
+                regex_replacements += regex_count
                 
                 # Historique : enregistrer si changement
-                if merged != before_rules and len(debug["history"]) < 50:  # Limite à 50 exemples
+                if full and merged != before_rules and len(debug["history"]) < MAX_HISTORY_ENTRIES:
                     debug["history"].append({
                         "step": "line_rules",
                         "before": before_rules[:100],  # Tronquer pour éviter debug trop lourd
@@ -349,8 +382,8 @@ class NormalizationProfile:
                     })
                 
                 # Détecter transformation de casse
-                if self.case_transform != "none" and before_rules != merged:
-                    debug["case_transforms"] = debug.get("case_transforms", 0) + 1
+                if counters and self.case_transform != "none" and before_rules != merged:
+                    case_transforms += 1
                 
                 output.append(merged)
                 if len(acc) > 1:
@@ -361,8 +394,10 @@ class NormalizationProfile:
         stats.merges = merges
         stats.kept_breaks = kept_breaks
         stats.duration_ms = int((time.perf_counter() - t0) * 1000)
-        debug["punctuation_fixes"] = punctuation_fixes
-        debug["regex_replacements"] = regex_replacements
+        if counters:
+            debug["punctuation_fixes"] = punctuation_fixes
+            debug["regex_replacements"] = regex_replacements
+            debug["case_transforms"] = case_transforms
         return clean_text, stats, debug
 
 
@@ -8,6 +8,25 @@ from howimetyourcorpus.core.utils.text import (
 
 # Nombre max d'exemples de merges à garder pour le debug
 MAX_MERGE_EXAMPLES = 20
+# Nombre max d'entrées d'historique (avant/après) gardées pour le debug
+MAX_HISTORY_ENTRIES = 50
+
+# Niveaux de debug de la normalisation : "full" (exemples de fusion, historique, compteurs),
+# "counters" (compteurs entiers seulement), "off" (debug vide, aucune capture).
+DEBUG_OFF = "off"
+DEBUG_COUNTERS = "counters"
+DEBUG_FULL = "full"
+DEBUG_LEVELS = (DEBUG_OFF, DEBUG_COUNTERS, DEBUG_FULL)
+
+
+def new_debug(level: str) -> dict:
+    """Dictionnaire debug initial pour un niveau (vide pour "off")."""
+    if level == DEBUG_OFF:
+        return {}
+    debug: dict = {"punctuation_fixes": 0, "regex_replacements": 0, "case_transforms": 0}
+    if level == DEBUG_FULL:
+        debug = {"merge_examples": [], **debug, "history": []}
+    return debug
 
 
 def is_strong_break_before(line: str) -> bool:
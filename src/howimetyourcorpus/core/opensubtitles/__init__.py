@@ -1,9 +1,23 @@
 """Client OpenSubtitles (api.opensubtitles.com) : recherche et téléchargement de sous-titres."""
 
+from howimetyourcorpus.core.opensubtitles.batch import (
+    BatchItem,
+    BatchReport,
+    OpenSubtitlesBatchCache,
+    OpenSubtitlesBatchDownloader,
+)
 from howimetyourcorpus.core.opensubtitles.client import (
     OpenSubtitlesClient,
     OpenSubtitlesError,
     OpenSubtitlesSearchHit,
 )
 
-__all__ = ["OpenSubtitlesClient", "OpenSubtitlesError", "OpenSubtitlesSearchHit"]
+__all__ = [
+    "BatchItem",
+    "BatchReport",
+    "OpenSubtitlesBatchCache",
+    "OpenSubtitlesBatchDownloader",
+    "OpenSubtitlesClient",
+    "OpenSubtitlesError",
+    "OpenSubtitlesSearchHit",
+]
@@ -0,0 +1,346 @@
+"""Téléchargement OpenSubtitles par lot : recherches concurrentes, quota, cache disque et reprise."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+
+from howimetyourcorpus.core.opensubtitles.client import (
+    BASE_URL,
+    USER_AGENT,
+    OpenSubtitlesError,
+    OpenSubtitlesSearchHit,
+    build_search_params,
+    normalize_imdb_id,
+    parse_search_hits,
+)
+
+logger = logging.getLogger(__name__)
+
+# API OpenSubtitles : ~5 requêtes/s par IP ; on reste en dessous par défaut.
+DEFAULT_MIN_INTERVAL_S = 0.25
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 3
+
+# États persistés par (épisode, langue)
+STATE_NOT_FOUND = "not_found"
+STATE_DOWNLOADED = "downloaded"
+STATE_IMPORTED = "imported"
+STATE_ERROR = "error"
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """Une paire (épisode, langue) à télécharger."""
+
+    episode_id: str
+    season: int
+    episode: int
+    lang: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.episode_id}:{self.lang}"
+
+
+@dataclass
+class BatchReport:
+    """Bilan d'un lot : listes de clés episode_id:lang par issue."""
+
+    downloaded: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    not_found: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+    pending_quota: list[str] = field(default_factory=list)
+    search_requests: int = 0
+    download_requests: int = 0
+    quota_remaining: int | None = None
+
+
+class OpenSubtitlesBatchCache:
+    """
+    Cache disque d'un lot : résultats de recherche (jamais re-demandés) et état par (épisode, langue).
+
+    Format JSON : {"searches": {clé recherche: [hits]}, "items": {episode_id:lang: {status, file_id, ...}}}.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._searches: dict[str, list[dict[str, Any]]] = {}
+        self._items: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning("Cache OpenSubtitles illisible %s: %s", self.path, exc)
+                data = {}
+            if isinstance(data, dict):
+                self._searches = data.get("searches") or {}
+                self._items = data.get("items") or {}
+
+    @staticmethod
+    def search_key(imdb_id: str, item: BatchItem) -> str:
+        params = build_search_params(imdb_id, item.season, item.episode, item.lang)
+        return f"{params['imdb_id']}:{item.season}:{item.episode}:{params['languages']}"
+
+    def get_hits(self, key: str) -> list[OpenSubtitlesSearchHit] | None:
+        raw = self._searches.get(key)
+        if raw is None:
+            return None
+        return [OpenSubtitlesSearchHit(**h) for h in raw]
+
+    def set_hits(self, key: str, hits: list[OpenSubtitlesSearchHit]) -> None:
+        self._searches[key] = [asdict(h) for h in hits]
+
+    def get_state(self, item_key: str) -> dict[str, Any]:
+        return dict(self._items.get(item_key) or {})
+
+    def set_state(self, item_key: str, status: str, **fields: Any) -> None:
+        state = dict(self._items.get(item_key) or {})
+        state.update(fields)
+        state["status"] = status
+        self._items[item_key] = state
+
+    def keys_with_status(self, status: str) -> list[str]:
+        return [k for k, v in self._items.items() if v.get("status") == status]
+
+    def save(self) -> None:
+        """Écriture atomique (fichier temporaire + replace) : un arrêt brutal ne corrompt pas le cache."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(
+            json.dumps({"searches": self._searches, "items": self._items}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+
+
+class AsyncRateLimiter:
+    """Intervalle minimal entre le début de deux requêtes (partagé par toutes les coroutines)."""
+
+    def __init__(self, min_interval_s: float):
+        self.min_interval_s = max(0.0, min_interval_s)
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+                now = time.monotonic()
+            self._next_at = now + self.min_interval_s
+
+
+class _QuotaExceeded(OpenSubtitlesError):
+    """Quota de téléchargement épuisé (406/429 sur /download ou remaining <= 0)."""
+
+
+class OpenSubtitlesBatchDownloader:
+    """
+    Recherche et télécharge un lot de paires (épisode, langue) de façon concurrente.
+
+    - concurrence bornée (sémaphore) + intervalle minimal global entre requêtes ;
+    - 429 sur la recherche : attente (Retry-After) puis nouvel essai ;
+    - quota de téléchargement épuisé : les paires restantes sont laissées en attente (reprise au prochain lancement) ;
+    - recherches et états persistés dans OpenSubtitlesBatchCache.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        imdb_id: str,
+        cache: OpenSubtitlesBatchCache,
+        *,
+        base_url: str = BASE_URL,
+        user_agent: str = USER_AGENT,
+        timeout_s: float = 30.0,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        min_interval_s: float = DEFAULT_MIN_INTERVAL_S,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ):
+        self.api_key = api_key.strip()
+        self.imdb_id = normalize_imdb_id(imdb_id)
+        self.cache = cache
+        self.base_url = base_url.rstrip("/")
+        self.user_agent = user_agent
+        self.timeout_s = timeout_s
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_interval_s = min_interval_s
+        self.max_retries = max(1, max_retries)
+        self._quota_exhausted = False
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Api-Key": self.api_key,
+            "User-Agent": self.user_agent,
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+
+    async def _request(
+        self,
+        client: httpx.AsyncClient,
+        limiter: AsyncRateLimiter,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Requête rate-limitée ; 429 hors /download → attente Retry-After puis nouvel essai."""
+        for attempt in range(self.max_retries):
+            await limiter.wait()
+            try:
+                r = await client.request(method, url, **kwargs)
+            except (httpx.HTTPError, httpx.TimeoutException) as e:
+                if attempt + 1 >= self.max_retries:
+                    raise OpenSubtitlesError(f"Réseau OpenSubtitles: {e!s}") from e
+                await asyncio.sleep(self.min_interval_s * (2**attempt))
+                continue
+            if r.status_code == 429 and not url.endswith("/download") and attempt + 1 < self.max_retries:
+                try:
+                    retry_after = float(r.headers.get("Retry-After") or 1.0)
+                except ValueError:
+                    retry_after = 1.0
+                await asyncio.sleep(min(retry_after, 30.0))
+                continue
+            return r
+
+    async def _search(
+        self,
+        client: httpx.AsyncClient,
+        limiter: AsyncRateLimiter,
+        item: BatchItem,
+        report: BatchReport,
+    ) -> list[OpenSubtitlesSearchHit]:
+        key = self.cache.search_key(self.imdb_id, item)
+        cached = self.cache.get_hits(key)
+        if cached is not None:
+            return cached
+        params = build_search_params(self.imdb_id, item.season, item.episode, item.lang)
+        report.search_requests += 1
+        r = await self._request(client, limiter, "GET", f"{self.base_url}/subtitles", params=params)
+        if r.status_code == 401:
+            raise OpenSubtitlesError("Clé API OpenSubtitles invalide ou expirée.")
+        if r.status_code >= 400:
+            raise OpenSubtitlesError(f"API OpenSubtitles: {r.status_code}")
+        hits = parse_search_hits(r.json(), params["languages"])
+        self.cache.set_hits(key, hits)
+        return hits
+
+    async def _download(
+        self,
+        client: httpx.AsyncClient,
+        limiter: AsyncRateLimiter,
+        file_id: int,
+        report: BatchReport,
+    ) -> str:
+        if self._quota_exhausted:
+            raise _QuotaExceeded("Quota téléchargement dépassé.")
+        report.download_requests += 1
+        r = await self._request(client, limiter, "POST", f"{self.base_url}/download", json={"file_id": file_id})
+        if r.status_code in (406, 429):
+            self._quota_exhausted = True
+            raise _QuotaExceeded("Quota téléchargement dépassé.")
+        if r.status_code == 401:
+            raise OpenSubtitlesError("Clé API OpenSubtitles invalide ou expirée.")
+        if r.status_code >= 400:
+            raise OpenSubtitlesError(f"API OpenSubtitles download: {r.status_code}")
+        info = r.json()
+        remaining = info.get("remaining")
+        if isinstance(remaining, int):
+            report.quota_remaining = remaining
+            if remaining <= 0:
+                self._quota_exhausted = True
+        link = info.get("link")
+        if not link:
+            raise OpenSubtitlesError("Réponse OpenSubtitles sans lien de téléchargement.")
+        r2 = await self._request(client, limiter, "GET", link)
+        if r2.status_code >= 400:
+            raise OpenSubtitlesError(f"Téléchargement fichier: {r2.status_code}")
+        return r2.text
+
+    async def run(
+        self,
+        items: list[BatchItem],
+        on_downloaded: Callable[[BatchItem, str, OpenSubtitlesSearchHit], None],
+        *,
+        on_item_done: Callable[[BatchItem, str], None] | None = None,
+    ) -> BatchReport:
+        """
+        Traite le lot. on_downloaded(item, contenu, hit) est appelé dans la boucle d'événements
+        dès qu'un fichier est reçu ; on_item_done(item, issue) après chaque paire.
+        """
+        if not self.api_key:
+            raise OpenSubtitlesError("Clé API OpenSubtitles manquante.")
+        report = BatchReport()
+        limiter = AsyncRateLimiter(self.min_interval_s)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def process(client: httpx.AsyncClient, item: BatchItem) -> None:
+            state = self.cache.get_state(item.key)
+            if state.get("status") in (STATE_DOWNLOADED, STATE_IMPORTED):
+                report.skipped.append(item.key)
+                outcome = "skipped"
+            else:
+                async with semaphore:
+                    outcome = await self._process_item(client, limiter, item, report, on_downloaded)
+            if on_item_done:
+                on_item_done(item, outcome)
+
+        async with httpx.AsyncClient(
+            timeout=self.timeout_s,
+            headers=self._headers(),
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.max_concurrency),
+        ) as client:
+            await asyncio.gather(*(process(client, item) for item in items))
+        self.cache.save()
+        return report
+
+    async def _process_item(
+        self,
+        client: httpx.AsyncClient,
+        limiter: AsyncRateLimiter,
+        item: BatchItem,
+        report: BatchReport,
+        on_downloaded: Callable[[BatchItem, str, OpenSubtitlesSearchHit], None],
+    ) -> str:
+        try:
+            hits = await self._search(client, limiter, item, report)
+            if not hits:
+                self.cache.set_state(item.key, STATE_NOT_FOUND)
+                report.not_found.append(item.key)
+                return STATE_NOT_FOUND
+            hit = hits[0]
+            content = await self._download(client, limiter, hit.file_id, report)
+        except _QuotaExceeded:
+            report.pending_quota.append(item.key)
+            return "pending_quota"
+        except OpenSubtitlesError as e:
+            self.cache.set_state(item.key, STATE_ERROR, error=str(e))
+            report.failed[item.key] = str(e)
+            return STATE_ERROR
+        # État persisté avant l'écriture du fichier par on_downloaded : après un arrêt brutal, la paire
+        # est reprise (fichier présent -> import, absent -> nouveau téléchargement, recherche en cache).
+        self.cache.set_state(item.key, STATE_DOWNLOADED, file_id=hit.file_id, release_name=hit.release_name)
+        self.cache.save()
+        try:
+            # Peut déclencher un import par paquet qui passe déjà la paire à STATE_IMPORTED.
+            on_downloaded(item, content, hit)
+        except Exception as e:
+            logger.exception("OpenSubtitles batch: traitement de %s", item.key)
+            if self.cache.get_state(item.key).get("status") != STATE_IMPORTED:
+                self.cache.set_state(item.key, STATE_ERROR, error=str(e))
+            report.failed[item.key] = str(e)
+            return STATE_ERROR
+        report.downloaded.append(item.key)
+        return STATE_DOWNLOADED
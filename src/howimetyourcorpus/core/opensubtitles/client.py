@@ -31,6 +31,46 @@ class OpenSubtitlesSearchHit:
     download_count: int = 0
 
 
+def normalize_imdb_id(imdb_id: str) -> str:
+    """IMDb ID normalisé (minuscules, préfixe « tt »)."""
+    imdb_clean = imdb_id.strip().lower()
+    return imdb_clean if imdb_clean.startswith("tt") else f"tt{imdb_clean}"
+
+
+def build_search_params(imdb_id: str, season: int, episode: int, language: str) -> dict[str, Any]:
+    """Paramètres de /subtitles pour un épisode de série (langue : code ISO tronqué à 3 caractères)."""
+    return {
+        "imdb_id": normalize_imdb_id(imdb_id),
+        "type": "episode",
+        "season_number": season,
+        "episode_number": episode,
+        "languages": language.strip().lower()[:3],
+    }
+
+
+def parse_search_hits(data: dict[str, Any], lang_clean: str) -> list[OpenSubtitlesSearchHit]:
+    """Convertit la réponse JSON de /subtitles en résultats téléchargeables (1er fichier de chaque sous-titre)."""
+    hits: list[OpenSubtitlesSearchHit] = []
+    for item in data.get("data") or []:
+        attrs = item.get("attributes") or {}
+        files = attrs.get("files") or []
+        if not files:
+            continue
+        fid = files[0].get("file_id")
+        if fid is None:
+            continue
+        hits.append(
+            OpenSubtitlesSearchHit(
+                file_id=int(fid),
+                subtitle_id=str(item.get("id", "")),
+                release_name=files[0].get("file_name") or "",
+                language=attrs.get("language") or lang_clean,
+                download_count=int(attrs.get("download_count") or 0),
+            )
+        )
+    return hits
+
+
 class OpenSubtitlesClient:
     """
     Client pour recherche et téléchargement de sous-titres.
@@ -71,20 +111,8 @@ class OpenSubtitlesClient:
         """
         if not self.api_key:
             raise OpenSubtitlesError("Clé API OpenSubtitles manquante.")
-        imdb_clean = imdb_id.strip().lower()
-        if imdb_clean.startswith("tt"):
-            pass
-        else:
-            imdb_clean = f"tt{imdb_clean}"
-        lang_clean = language.strip().lower()[:3]
         url = f"{self.base_url}/subtitles"
-        params: dict[str, Any] = {
-            "imdb_id": imdb_clean,
-            "type": "episode",
-            "season_number": season,
-            "episode_number": episode,
-            "languages": lang_clean,
-        }
+        params = build_search_params(imdb_id, season, episode, language)
         try:
             with httpx.Client(timeout=self.timeout_s) as client:
                 r = client.get(url, params=params, headers=self._headers())
@@ -98,26 +126,7 @@ class OpenSubtitlesClient:
         except (httpx.HTTPError, httpx.TimeoutException) as e:
             raise OpenSubtitlesError(f"Réseau OpenSubtitles: {e!s}") from e
 
-        data = r.json()
-        hits: list[OpenSubtitlesSearchHit] = []
-        for item in data.get("data") or []:
-            attrs = item.get("attributes") or {}
-            files = attrs.get("files") or []
-            if not files:
-                continue
-            fid = files[0].get("file_id")
-            if fid is None:
-                continue
-            hits.append(
-                OpenSubtitlesSearchHit(
-                    file_id=int(fid),
-                    subtitle_id=str(item.get("id", "")),
-                    release_name=files[0].get("file_name") or "",
-                    language=attrs.get("language") or lang_clean,
-                    download_count=int(attrs.get("download_count") or 0),
-                )
-            )
-        return hits
+        return parse_search_hits(r.json(), params["languages"])
 
     def download(self, file_id: int) -> str:
         """
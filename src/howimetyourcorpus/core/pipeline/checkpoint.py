@@ -0,0 +1,100 @@
+"""
+Points de reprise des étapes longues (checkpoints/<clé>.json) et jeton d'annulation.
+
+Un travail long (job align_batch, voir api.jobs) enregistre chaque sous-unité terminée
+(épisode) dans un checkpoint durable, sous une portée (type de job). Relancé avec le même
+checkpoint — job repris après un arrêt du serveur ou une annulation —, il saute les unités
+déjà faites. Le checkpoint est supprimé quand le travail
+qui le porte se termine.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from howimetyourcorpus.core.constants import CHECKPOINTS_DIR_NAME
+
+logger = logging.getLogger(__name__)
+
+
+class CancellationToken:
+    """Jeton d'annulation partagé entre threads ; appelable, donc utilisable comme context["is_cancelled"]."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def __call__(self) -> bool:
+        return self._event.is_set()
+
+
+class StepCheckpoint:
+    """Unités terminées par portée, réécrites atomiquement à chaque mark_done()."""
+
+    def __init__(self, path: Path, done: dict[str, list[str]] | None = None) -> None:
+        self.path = path
+        self._done: dict[str, set[str]] = {scope: set(units) for scope, units in (done or {}).items()}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, root_dir: Path, key: str) -> "StepCheckpoint":
+        """Charge (ou crée vide) le checkpoint `key` d'un projet ; un fichier illisible est ignoré."""
+        path = checkpoint_path(root_dir, key)
+        done: dict[str, list[str]] = {}
+        if path.exists():
+            try:
+                data: Any = json.loads(path.read_text(encoding="utf-8"))
+                done = {str(k): [str(u) for u in v] for k, v in (data.get("done") or {}).items()}
+            except (OSError, ValueError, AttributeError):
+                logger.warning("Checkpoint illisible ignoré : %s", path)
+        return cls(path, done)
+
+    def is_done(self, scope: str, unit: str) -> bool:
+        with self._lock:
+            return unit in self._done.get(scope, ())
+
+    def done_units(self, scope: str) -> set[str]:
+        with self._lock:
+            return set(self._done.get(scope, ()))
+
+    def mark_done(self, scope: str, unit: str) -> None:
+        """Enregistre une unité terminée ; durable dès le retour (écriture atomique)."""
+        with self._lock:
+            units = self._done.setdefault(scope, set())
+            if unit in units:
+                return
+            units.add(unit)
+            self._save()
+
+    def clear(self) -> None:
+        """Oublie toutes les unités et supprime le fichier."""
+        with self._lock:
+            self._done.clear()
+            self.path.unlink(missing_ok=True)
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+        data = {"done": {scope: sorted(units) for scope, units in self._done.items()}}
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def checkpoint_path(root_dir: Path, key: str) -> Path:
+    return root_dir / CHECKPOINTS_DIR_NAME / f"{key}.json"
+
+
+def discard_checkpoint(root_dir: Path, key: str) -> None:
+    """Supprime le checkpoint `key` s'il existe."""
+    checkpoint_path(root_dir, key).unlink(missing_ok=True)
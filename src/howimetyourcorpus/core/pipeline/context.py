@@ -32,6 +32,7 @@ class PipelineContext(_PipelineContextOptional):
         db : base SQLite du corpus (segments, subtitle_tracks, align_runs). Absente si projet SRT only.
         custom_profiles : dictionnaire de profils de normalisation personnalisés (nom → profil).
         is_cancelled : callable sans argument retournant True si l'utilisateur a annulé (pour sortie anticipée dans les boucles).
+            Les runners le combinent avec leur propre cancel() (ex. CancellationToken d'un job API).
     """
 
     config: ProjectConfig
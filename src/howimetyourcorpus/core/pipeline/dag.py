@@ -0,0 +1,315 @@
+"""Exécuteur DAG du pipeline : dépendances par épisode, pools par classe de ressource, writer DB unique."""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from howimetyourcorpus.core.pipeline.context import PipelineContext
+from howimetyourcorpus.core.pipeline.steps import (
+    RESOURCE_CPU,
+    RESOURCE_NETWORK,
+    ErrorCallback,
+    LogCallback,
+    ProgressCallback,
+    Step,
+    StepResult,
+)
+from howimetyourcorpus.core.utils.tracing import Tracer, activate, current_tracer, trace_span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NETWORK_WORKERS = 4
+
+
+@dataclass
+class DagNode:
+    """Nœud du DAG : une étape, l'épisode concerné et ses prédécesseurs."""
+
+    index: int
+    step: Step
+    episode_id: str | None
+    requires: set[int] = field(default_factory=set)
+    """Prédécesseurs qui doivent réussir (même épisode)."""
+    after: set[int] = field(default_factory=set)
+    """Prédécesseurs à attendre sans condition de succès (barrières globales)."""
+
+
+def step_episode_id(step: Step) -> str | None:
+    """Épisode traité par une étape (attribut episode_id str), None pour une étape globale."""
+    episode_id = getattr(step, "episode_id", None)
+    return episode_id if isinstance(episode_id, str) and episode_id else None
+
+
+def build_dag(steps: list[Step]) -> list[DagNode]:
+    """
+    Déduit le DAG d'une liste d'étapes ordonnée (même liste que pour PipelineRunner).
+
+    - une étape d'épisode dépend de l'étape précédente du même épisode (succès requis) ;
+    - une étape globale (sans episode_id, ex. BuildDbIndexStep) est une barrière : elle attend
+      toutes les étapes précédentes, et toutes les étapes suivantes l'attendent.
+    """
+    nodes: list[DagNode] = []
+    last_for_episode: dict[str, int] = {}
+    since_barrier: list[int] = []
+    barrier: int | None = None
+    for i, step in enumerate(steps):
+        episode_id = step_episode_id(step)
+        node = DagNode(index=i, step=step, episode_id=episode_id)
+        if episode_id is None:
+            node.after.update(since_barrier)
+            if barrier is not None:
+                node.after.add(barrier)
+            barrier = i
+            since_barrier = []
+        else:
+            prev = last_for_episode.get(episode_id)
+            if prev is not None:
+                node.requires.add(prev)
+            if barrier is not None:
+                node.after.add(barrier)
+            last_for_episode[episode_id] = i
+            since_barrier.append(i)
+        nodes.append(node)
+    return nodes
+
+
+class DeferredDbWrites:
+    """
+    Substitut de CorpusDB pour les étapes exécutées hors du writer : enregistre les appels d'écriture
+    pour les rejouer dans l'ordre sur le writer DB unique. Les lectures sont refusées (AttributeError).
+    """
+
+    _READ_PREFIXES = ("get_", "query_", "count_", "search_", "connection", "transaction")
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        if name.startswith("_") or name.startswith(self._READ_PREFIXES):
+            raise AttributeError(f"DeferredDbWrites: lecture DB non disponible hors writer ({name})")
+
+        def record(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args, kwargs))
+
+        return record
+
+    @staticmethod
+    def replay(db: Any, calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]]) -> None:
+        with trace_span("db_write", "db") as sp:
+            sp.items = len(calls)
+            for name, args, kwargs in calls:
+                getattr(db, name)(*args, **kwargs)
+
+
+def _run_step_deferred(
+    step: Step,
+    context: dict[str, Any],
+    has_db: bool,
+    force: bool,
+    on_progress: ProgressCallback | None = None,
+    on_log: LogCallback | None = None,
+    trace: bool = False,
+) -> tuple[StepResult, list[tuple[str, tuple[Any, ...], dict[str, Any]]], list[dict[str, Any]]]:
+    """
+    Exécute une étape avec écritures DB différées (fonction module : exécutable dans un process pool).
+    Si `trace`, les spans sont collectés localement et renvoyés (le traceur ne traverse pas les processus).
+    """
+    recorder = DeferredDbWrites()
+    ctx = dict(context)
+    ctx["db"] = recorder if has_db else None
+    tracer = Tracer() if trace else None
+    with activate(tracer):
+        try:
+            with trace_span(step.name, "step", episode_id=step_episode_id(step) or ""):
+                result = step.run(ctx, force=force, on_progress=on_progress, on_log=on_log)
+        except Exception as e:
+            logger.exception("Step %s failed", step.name)
+            result = StepResult(False, str(e))
+    return result, recorder.calls, tracer.export_spans() if tracer else []
+
+
+class DagPipelineRunner:
+    """
+    Exécute les étapes selon leur DAG (voir build_dag), en parallèle par classe de ressource :
+
+    - RESOURCE_CPU (par épisode) : pool de processus ; les écritures DB sont différées ;
+    - RESOURCE_NETWORK (par épisode) : pool de threads ; écritures DB différées ;
+    - RESOURCE_DB_WRITE et étapes globales : writer unique (un thread) avec la vraie DB.
+
+    Les écritures différées sont rejouées sur le writer avant de débloquer les dépendants. Un échec
+    n'arrête que la suite de son épisode (étapes dépendantes marquées « Skipped ») ; les barrières
+    globales s'exécutent quand même. Même interface que PipelineRunner (run / cancel).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_cpu_workers: int | None = None,
+        max_network_workers: int = DEFAULT_NETWORK_WORKERS,
+        use_processes: bool = True,
+        mp_start_method: str = "spawn",
+    ) -> None:
+        self.max_cpu_workers = max(1, max_cpu_workers or os.cpu_count() or 1)
+        self.max_network_workers = max(1, max_network_workers)
+        self.use_processes = use_processes
+        self.mp_start_method = mp_start_method
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def _make_cpu_pool(self) -> Executor:
+        if self.use_processes and self.max_cpu_workers > 1:
+            return ProcessPoolExecutor(
+                max_workers=self.max_cpu_workers,
+                mp_context=multiprocessing.get_context(self.mp_start_method),
+            )
+        return ThreadPoolExecutor(max_workers=self.max_cpu_workers, thread_name_prefix="himyc-cpu")
+
+    def run(
+        self,
+        steps: list[Step],
+        context: PipelineContext,
+        *,
+        force: bool = False,
+        on_progress: ProgressCallback | None = None,
+        on_log: LogCallback | None = None,
+        on_error: ErrorCallback | None = None,
+        on_cancelled: Callable[[], None] | None = None,
+    ) -> list[StepResult]:
+        """Exécute le DAG ; retourne un StepResult par étape, dans l'ordre de `steps`."""
+        self._cancelled = False
+        external = context.get("is_cancelled")
+
+        def is_cancelled() -> bool:
+            return self._cancelled or bool(external and external())
+
+        def log(level: str, msg: str) -> None:
+            if on_log:
+                on_log(level, msg)
+            getattr(logger, level.lower(), logger.info)(msg)
+
+        nodes = build_dag(steps)
+        results: list[StepResult | None] = [None] * len(nodes)
+        db = context.get("db")
+        has_db = db is not None
+        writer_ctx: dict[str, Any] = dict(context)
+        writer_ctx["is_cancelled"] = is_cancelled
+        # Contexte transmissible aux processus : ni DB, ni callables.
+        portable_ctx: dict[str, Any] = {k: v for k, v in context.items() if k not in ("db", "is_cancelled")}
+        thread_ctx: dict[str, Any] = dict(portable_ctx)
+        thread_ctx["is_cancelled"] = is_cancelled
+
+        dependents: dict[int, list[int]] = {node.index: [] for node in nodes}
+        waiting: dict[int, int] = {}
+        for node in nodes:
+            deps = node.requires | node.after
+            waiting[node.index] = len(deps)
+            for dep in deps:
+                dependents[dep].append(node.index)
+        ready: deque[int] = deque(node.index for node in nodes if waiting[node.index] == 0)
+        failed_or_skipped: set[int] = set()
+        pending: dict[Future, tuple[DagNode, str]] = {}
+        tracer = current_tracer()
+
+        def submit(pool: Executor, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+            # Propage le traceur actif (ContextVar) aux threads des pools.
+            return pool.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+        def run_traced(step: Step, episode_id: str | None) -> StepResult:
+            with trace_span(step.name, "step", episode_id=episode_id or ""):
+                return step.run(writer_ctx, force=force, on_progress=on_progress, on_log=on_log)
+
+        def finish(node: DagNode, result: StepResult) -> None:
+            results[node.index] = result
+            if not result.success:
+                failed_or_skipped.add(node.index)
+                if not result.message.startswith("Skipped") and result.message != "Cancelled":
+                    if on_error:
+                        on_error(node.step.name, RuntimeError(result.message))
+                    log("error", f"{node.step.name} [{node.episode_id or '*'}]: {result.message}")
+            for dep in dependents[node.index]:
+                waiting[dep] -= 1
+                if waiting[dep] == 0:
+                    ready.append(dep)
+
+        def dispatch(node: DagNode) -> None:
+            if node.requires & failed_or_skipped:
+                finish(node, StepResult(False, "Skipped: dependency failed"))
+                return
+            step = node.step
+            log("info", f"Running step: {step.name} [{node.episode_id or '*'}]")
+            if node.episode_id is not None and step.resource == RESOURCE_CPU:
+                fut = cpu_pool.submit(
+                    _run_step_deferred, step, portable_ctx, has_db, force, trace=tracer is not None,
+                )
+                pending[fut] = (node, "deferred")
+            elif node.episode_id is not None and step.resource == RESOURCE_NETWORK:
+                fut = submit(
+                    network_pool, _run_step_deferred, step, thread_ctx, has_db, force, on_progress, on_log,
+                    trace=tracer is not None,
+                )
+                pending[fut] = (node, "deferred")
+            else:
+                fut = submit(writer, run_traced, step, node.episode_id)
+                pending[fut] = (node, "writer")
+
+        cpu_pool = self._make_cpu_pool()
+        network_pool = ThreadPoolExecutor(max_workers=self.max_network_workers, thread_name_prefix="himyc-net")
+        writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="himyc-db-writer")
+        try:
+            while True:
+                while ready and not is_cancelled():
+                    dispatch(nodes[ready.popleft()])
+                if is_cancelled():
+                    # Les rejeux ("commit") ne sont jamais annulés : l'étape a déjà écrit ses fichiers
+                    # (et son manifeste), le writer doit vider sa file pour que la DB suive.
+                    queued = [f for f, (_node, phase) in pending.items() if phase != "commit"]
+                    for fut in [f for f in queued if f.cancel()]:
+                        pending.pop(fut)
+                if not pending:
+                    break
+                completed, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for fut in completed:
+                    node, phase = pending.pop(fut)
+                    try:
+                        outcome = fut.result()
+                    except Exception as e:
+                        logger.exception("Step %s failed", node.step.name)
+                        finish(node, StepResult(False, str(e)))
+                        continue
+                    if phase == "deferred":
+                        result, calls, spans = outcome
+                        if tracer is not None and spans:
+                            tracer.add_spans(spans)
+                        if result.success and calls and has_db:
+                            # Les dépendants ne démarrent qu'une fois les écritures rejouées par le writer.
+                            results[node.index] = result
+                            pending[submit(writer, DeferredDbWrites.replay, db, calls)] = (node, "commit")
+                            continue
+                        if on_progress and node.step.resource == RESOURCE_CPU:
+                            on_progress(node.step.name, 1.0, result.message)
+                        finish(node, result)
+                    elif phase == "commit":
+                        result = results[node.index] or StepResult(True)
+                        if on_progress and node.step.resource == RESOURCE_CPU:
+                            on_progress(node.step.name, 1.0, result.message)
+                        finish(node, result)
+                    else:
+                        finish(node, outcome)
+        finally:
+            cpu_pool.shutdown(wait=True, cancel_futures=True)
+            network_pool.shutdown(wait=True, cancel_futures=True)
+            writer.shutdown(wait=True)
+        if is_cancelled():
+            if on_cancelled:
+                on_cancelled()
+            log("warning", "Pipeline cancelled")
+        return [r if r is not None else StepResult(False, "Cancelled") for r in results]
@@ -0,0 +1,134 @@
+"""
+Manifeste de build par épisode (build_manifest.json) : builds incrémentaux par empreintes de contenu.
+
+Pour chaque étape (parse, normalize, segment, index), le manifeste enregistre les empreintes
+des entrées (texte amont, définition du profil, options de segmentation, version d'adapteur)
+et l'empreinte de la sortie. Une étape n'est recalculée que si ses entrées ont changé ou si
+sa sortie a disparu ; comme les entrées aval sont les empreintes des sorties amont, une
+re-normalisation qui produit le même clean.txt ne relance ni la segmentation ni l'indexation.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict
+from typing import Any, Callable
+
+from howimetyourcorpus.core.constants import BUILD_MANIFEST_FILENAME
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+"""Incrémenter pour invalider tous les manifestes (changement de format ou de moteur)."""
+
+STAGE_PARSE = "parse"
+STAGE_NORMALIZE = "normalize"
+STAGE_SEGMENT = "segment"
+STAGE_INDEX = "index"
+
+DOWNSTREAM_STAGES: dict[str, tuple[str, ...]] = {
+    STAGE_PARSE: (STAGE_NORMALIZE, STAGE_SEGMENT, STAGE_INDEX),
+    STAGE_NORMALIZE: (STAGE_SEGMENT, STAGE_INDEX),
+    STAGE_SEGMENT: (),
+    STAGE_INDEX: (),
+}
+
+
+def text_digest(text: str) -> str:
+    """Empreinte sha256 d'un texte."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _json_digest(data: Any) -> str:
+    return text_digest(json.dumps(data, ensure_ascii=False, sort_keys=True, default=str))
+
+
+def profile_fingerprint(profile: Any) -> str:
+    """Empreinte de la définition complète d'un profil de normalisation (toutes ses règles)."""
+    return _json_digest(asdict(profile))
+
+
+def adapter_version(adapter: Any) -> str:
+    """Identifiant versionné d'un adapteur (id@parse_version) ; parse_version est optionnel."""
+    return f"{getattr(adapter, 'id', '?')}@{getattr(adapter, 'parse_version', '0')}"
+
+
+class BuildManifest:
+    """
+    Manifeste d'un épisode : {stage: {"inputs": {...}, "output": digest, "built_at": iso}}.
+
+    Les entrées d'une étape sont un dict de valeurs str (empreintes, options) comparé tel quel.
+    """
+
+    def __init__(self, path: Any, stages: dict[str, dict[str, Any]] | None = None) -> None:
+        self.path = path
+        self.stages: dict[str, dict[str, Any]] = stages or {}
+
+    @classmethod
+    def load(cls, store: Any, episode_id: str) -> "BuildManifest":
+        """Charge le manifeste d'un épisode (vide si absent, illisible ou d'une autre version)."""
+        path = store._episode_dir(episode_id) / BUILD_MANIFEST_FILENAME  # noqa: SLF001
+        if not path.exists():
+            return cls(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable build manifest %s: %s", path, e)
+            return cls(path)
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return cls(path)
+        stages = data.get("stages")
+        return cls(path, stages if isinstance(stages, dict) else {})
+
+    def is_up_to_date(self, stage: str, inputs: dict[str, str]) -> bool:
+        """True si l'étape a été construite avec exactement ces entrées."""
+        entry = self.stages.get(stage)
+        return entry is not None and entry.get("inputs") == inputs
+
+    def is_fresh(
+        self,
+        stage: str,
+        inputs: dict[str, str],
+        output_exists: bool,
+        current_output: Callable[[], str],
+    ) -> bool:
+        """
+        True si l'étape peut être sautée : sortie présente et construite avec ces entrées.
+
+        Une sortie antérieure au manifeste (projet existant, aucune entrée pour l'étape) est
+        adoptée avec les entrées courantes et considérée à jour, comme avant (skip par existence).
+        """
+        if not output_exists:
+            return False
+        if stage not in self.stages:
+            self.record(stage, inputs, current_output())
+            self.save()
+            return True
+        return self.is_up_to_date(stage, inputs)
+
+    def record(self, stage: str, inputs: dict[str, str], output: str) -> None:
+        """Enregistre une construction (ne sauvegarde pas : appeler save())."""
+        self.stages[stage] = {
+            "inputs": dict(inputs),
+            "output": output,
+            "built_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        }
+
+    def invalidate_downstream(self, stage: str) -> None:
+        """Oublie les étapes dérivées de `stage` (ex. après suppression des artefacts)."""
+        for name in DOWNSTREAM_STAGES.get(stage, ()):
+            self.stages.pop(name, None)
+
+    def save(self) -> None:
+        """Écriture atomique (fichier temporaire + replace)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "stages": self.stages}, ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
@@ -13,6 +13,7 @@ from howimetyourcorpus.core.pipeline.steps import (
     Step,
     StepResult,
 )
+from howimetyourcorpus.core.utils.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,10 @@ class PipelineRunner:
         """
         self._cancelled = False
         results: list[StepResult] = []
+        external = context.get("is_cancelled")
+
+        def is_cancelled() -> bool:
+            return self._cancelled or bool(external and external())
 
         def log(level: str, msg: str) -> None:
             if on_log:
@@ -53,21 +58,22 @@ class PipelineRunner:
             getattr(logger, level.lower(), logger.info)(msg)
 
         for i, step in enumerate(steps):
-            if self._cancelled:
+            if is_cancelled():
                 if on_cancelled:
                     on_cancelled()
                 log("warning", "Pipeline cancelled")
                 break
             log("info", f"Running step: {step.name}")
             ctx = dict(context)
-            ctx["is_cancelled"] = lambda: self._cancelled
+            ctx["is_cancelled"] = is_cancelled
             try:
-                result = step.run(
-                    ctx,
-                    force=force,
-                    on_progress=on_progress,
-                    on_log=on_log,
-                )
+                with trace_span(step.name, "step", episode_id=getattr(step, "episode_id", "") or ""):
+                    result = step.run(
+                        ctx,
+                        force=force,
+                        on_progress=on_progress,
+                        on_log=on_log,
+                    )
                 results.append(result)
                 if not result.success:
                     if result.message == "Cancelled":
@@ -9,6 +9,12 @@ from typing import Any, Callable
 from howimetyourcorpus.core.pipeline.context import PipelineContext
 
 
+# Classes de ressources (exécuteur DAG) : pool réseau, pool de processus, writer DB unique.
+RESOURCE_NETWORK = "network"
+RESOURCE_CPU = "cpu"
+RESOURCE_DB_WRITE = "db-write"
+
+
 @dataclass
 class StepResult:
     """Résultat d'une étape (succès, message, données optionnelles)."""
@@ -22,6 +28,8 @@ class Step(ABC):
     """Étape du pipeline, relançable de façon idempotente (skip si déjà fait sauf force=True)."""
 
     name: str = ""
+    resource: str = RESOURCE_DB_WRITE
+    """Classe de ressource pour l'exécuteur DAG (par défaut : sérialisée sur le writer DB)."""
 
     @abstractmethod
     def run(
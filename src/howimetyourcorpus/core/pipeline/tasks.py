@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Callable
 
@@ -17,14 +19,41 @@ from howimetyourcorpus.core.constants import (
 from howimetyourcorpus.core.adapters.base import AdapterRegistry
 from howimetyourcorpus.core.models import EpisodeRef, EpisodeStatus, ProjectConfig, SeriesIndex
 from howimetyourcorpus.core.normalize.profiles import get_profile
+from howimetyourcorpus.core.normalize.rules import DEBUG_FULL
 from howimetyourcorpus.core.pipeline.context import PipelineContext
-from howimetyourcorpus.core.pipeline.steps import Step, StepResult
-from howimetyourcorpus.core.segment import segmenter_sentences, segmenter_utterances
+from howimetyourcorpus.core.pipeline.manifest import (
+    STAGE_INDEX,
+    STAGE_NORMALIZE,
+    STAGE_PARSE,
+    STAGE_SEGMENT,
+    BuildManifest,
+    adapter_version,
+    profile_fingerprint,
+    text_digest,
+)
+from howimetyourcorpus.core.pipeline.steps import (
+    RESOURCE_CPU,
+    RESOURCE_DB_WRITE,
+    RESOURCE_NETWORK,
+    Step,
+    StepResult,
+)
+from howimetyourcorpus.core.segment import segment_text
 from howimetyourcorpus.core.storage.db import CorpusDB
 from howimetyourcorpus.core.storage.project_store import ProjectStore
-from howimetyourcorpus.core.opensubtitles import OpenSubtitlesClient, OpenSubtitlesError
-from howimetyourcorpus.core.subtitles import cues_to_audit_rows, parse_subtitle_content
+from howimetyourcorpus.core.opensubtitles import (
+    BatchItem,
+    OpenSubtitlesBatchCache,
+    OpenSubtitlesBatchDownloader,
+    OpenSubtitlesClient,
+    OpenSubtitlesError,
+)
+from howimetyourcorpus.core.opensubtitles.batch import STATE_DOWNLOADED, STATE_IMPORTED
+from howimetyourcorpus.core.subtitles import cues_to_audit_rows, parse_subtitle_content, to_project_subtitles
+from howimetyourcorpus.core.subtitles.bulk_import import SubtitleFile, import_subtitles_bulk
 from howimetyourcorpus.core.subtitles.parsers import read_subtitle_file_content
+from howimetyourcorpus.core.subtitles.retiming import Retiming, estimate_retiming, retime_subtitle_track
+from howimetyourcorpus.core.utils.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +62,7 @@ class FetchSeriesIndexStep(Step):
     """Récupère la page série, parse, sauvegarde series_index.json."""
 
     name = "fetch_series_index"
+    resource = RESOURCE_NETWORK
 
     def __init__(self, series_url: str, user_agent: str | None = None) -> None:
         self.series_url = series_url
@@ -82,6 +112,7 @@ class FetchSeriesIndexStep(Step):
                     user_agent=self.user_agent or config.user_agent,
                     rate_limit_s=rate_limit,
                     cache_dir=cache_dir,
+                    refresh=force,
                 )
             except Exception as e:
                 log("error", str(e))
@@ -102,6 +133,7 @@ class FetchAndMergeSeriesIndexStep(Step):
     """Découvre une série depuis une autre source/URL et fusionne avec l'index existant (sans écraser)."""
 
     name = "fetch_and_merge_series_index"
+    resource = RESOURCE_NETWORK
 
     def __init__(self, series_url: str, source_id: str, user_agent: str | None = None) -> None:
         self.series_url = series_url
@@ -137,6 +169,7 @@ class FetchAndMergeSeriesIndexStep(Step):
                 user_agent=self.user_agent or config.user_agent,
                 rate_limit_s=rate_limit,
                 cache_dir=cache_dir,
+                refresh=force,
             )
         except Exception as e:
             log("error", str(e))
@@ -183,6 +216,7 @@ class FetchEpisodeStep(Step):
     """Télécharge une page épisode, extrait raw, sauvegarde (skip si déjà présent sauf force)."""
 
     name = "fetch_episode"
+    resource = RESOURCE_NETWORK
 
     def __init__(self, episode_id: str, episode_url: str) -> None:
         self.episode_id = episode_id
@@ -232,8 +266,11 @@ class FetchEpisodeStep(Step):
                 cache_dir=cache_dir,
             )
             store.save_episode_html(self.episode_id, html)
-            raw_text, meta = adapter.parse_episode(html, self.episode_url)
+            with trace_span("parse", "parse", episode_id=self.episode_id) as sp:
+                raw_text, meta = adapter.parse_episode(html, self.episode_url)
+                sp.bytes = len(html)
             store.save_episode_raw(self.episode_id, raw_text, meta)
+            _record_parse(store, self.episode_id, html, adapter, raw_text).save()
             if db:
                 db.set_episode_status(self.episode_id, EpisodeStatus.FETCHED.value)
             if on_progress:
@@ -246,14 +283,174 @@ class FetchEpisodeStep(Step):
             return StepResult(False, str(e))
 
 
+def _record_parse(store: ProjectStore, episode_id: str, html: str, adapter, raw_text: str) -> BuildManifest:
+    """Enregistre l'étape parse (HTML + version d'adapteur -> raw) dans le manifeste de l'épisode."""
+    manifest = BuildManifest.load(store, episode_id)
+    manifest.record(
+        STAGE_PARSE,
+        {"html": text_digest(html), "adapter": adapter_version(adapter)},
+        text_digest(raw_text),
+    )
+    return manifest
+
+
+def _reparse_episode_html(source_id: str, html: str, episode_url: str) -> tuple[str, dict]:
+    """Re-parse un HTML sauvegardé (fonction module : exécutable dans un process pool)."""
+    adapter = AdapterRegistry.get_or_raise(source_id)
+    return adapter.parse_episode(html, episode_url)
+
+
+class ReparseEpisodesStep(Step):
+    """
+    Reconstruit raw.txt depuis les page.html sauvegardés (sans réseau), en parallèle.
+
+    Les épisodes dont le HTML et la version d'adapteur n'ont pas changé depuis le dernier parse
+    (manifeste de build) ne sont pas re-parsés. Seuls les épisodes dont le texte extrait change
+    sont réécrits ; pour ceux-ci, les artefacts dérivés (clean, segments, index DB, runs
+    d'alignement) sont invalidés.
+    """
+
+    name = "reparse_episodes"
+
+    def __init__(self, episode_ids: list[str] | None = None, max_workers: int | None = None) -> None:
+        """Si episode_ids is None, re-parse tous les épisodes ayant page.html. max_workers=1 : pas de process pool."""
+        self.episode_ids = episode_ids
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        context: PipelineContext,
+        *,
+        force: bool = False,
+        on_progress: Callable[[str, float, str], None] | None = None,
+        on_log: Callable[[str, str], None] | None = None,
+    ) -> StepResult:
+        store: ProjectStore = context["store"]
+        config: ProjectConfig = context["config"]
+        db: CorpusDB | None = context.get("db")
+        is_cancelled = context.get("is_cancelled")
+
+        def log(level: str, msg: str) -> None:
+            if on_log:
+                on_log(level, msg)
+            getattr(logger, level.lower(), logger.info)(msg)
+
+        index = store.load_series_index()
+        refs = {e.episode_id: e for e in (index.episodes if index else [])}
+        if self.episode_ids is not None:
+            candidates = list(self.episode_ids)
+        elif refs:
+            candidates = list(refs)
+        else:
+            episodes_dir = store.root_dir / EPISODES_DIR_NAME
+            candidates = sorted(d.name for d in episodes_dir.iterdir() if d.is_dir()) if episodes_dir.exists() else []
+        jobs: list[tuple[str, str, str, str]] = []
+        unchanged = 0
+        for eid in candidates:
+            html = store.load_episode_html(eid)
+            if not html:
+                continue
+            ref = refs.get(eid)
+            source_id = (ref.source_id if ref and ref.source_id else None) or config.source_id
+            adapter = AdapterRegistry.get(source_id)
+            if not adapter:
+                log("warning", f"Adapter not found for {eid}: {source_id}")
+                continue
+            parse_inputs = {"html": text_digest(html), "adapter": adapter_version(adapter)}
+            if (
+                not force
+                and store.has_episode_raw(eid)
+                and BuildManifest.load(store, eid).is_up_to_date(STAGE_PARSE, parse_inputs)
+            ):
+                unchanged += 1
+                continue
+            jobs.append((eid, source_id, html, ref.url if ref else ""))
+        n = len(jobs)
+        if not n:
+            message = "No stored HTML to re-parse" if not unchanged else f"Re-parse skipped: {unchanged} episode(s) up to date"
+            return StepResult(True, message, {"changed": [], "unchanged": unchanged, "failed": []})
+        if on_progress:
+            on_progress(self.name, 0.0, f"Re-parsing {n} episode(s) from stored HTML...")
+
+        changed: list[str] = []
+        failed: list[str] = []
+
+        def apply_result(eid: str, source_id: str, html: str, raw_text: str, meta: dict) -> None:
+            nonlocal unchanged
+            manifest = _record_parse(store, eid, html, AdapterRegistry.get_or_raise(source_id), raw_text)
+            if not force and store.has_episode_raw(eid):
+                if store.load_episode_text(eid, kind="raw") == raw_text:
+                    manifest.save()
+                    unchanged += 1
+                    return
+            store.save_episode_raw(eid, raw_text, meta)
+            removed = store.invalidate_episode_derived(eid)
+            manifest.invalidate_downstream(STAGE_PARSE)
+            manifest.save()
+            if db:
+                db.invalidate_episode_derived(eid)
+            changed.append(eid)
+            log("info", f"Re-parsed {eid}: raw text changed (invalidated: {', '.join(removed) or 'none'})")
+
+        workers = self.max_workers
+        if workers == 1 or n == 1:
+            for i, (eid, source_id, html, url) in enumerate(jobs):
+                if is_cancelled and is_cancelled():
+                    return StepResult(False, "Cancelled")
+                try:
+                    raw_text, meta = _reparse_episode_html(source_id, html, url)
+                except Exception as e:
+                    log("error", f"Re-parse failed for {eid}: {e}")
+                    failed.append(eid)
+                else:
+                    apply_result(eid, source_id, html, raw_text, meta)
+                if on_progress:
+                    on_progress(self.name, (i + 1) / n, f"Re-parsed {eid}")
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    (eid, source_id, html, pool.submit(_reparse_episode_html, source_id, html, url))
+                    for eid, source_id, html, url in jobs
+                ]
+                for i, (eid, source_id, html, future) in enumerate(futures):
+                    if is_cancelled and is_cancelled():
+                        for *_, pending in futures[i:]:
+                            pending.cancel()
+                        return StepResult(False, "Cancelled")
+                    try:
+                        raw_text, meta = future.result()
+                    except Exception as e:
+                        log("error", f"Re-parse failed for {eid}: {e}")
+                        failed.append(eid)
+                    else:
+                        apply_result(eid, source_id, html, raw_text, meta)
+                    if on_progress:
+                        on_progress(self.name, (i + 1) / n, f"Re-parsed {eid}")
+        message = f"Re-parsed {n} episode(s): {len(changed)} changed, {unchanged} unchanged, {len(failed)} failed"
+        if failed:
+            message += f" ({', '.join(failed)})"
+            log("warning", f"Re-parse failed for: {', '.join(failed)}")
+        if on_progress:
+            on_progress(self.name, 1.0, message)
+        return StepResult(not failed, message, {"changed": changed, "unchanged": unchanged, "failed": failed})
+
+
 class NormalizeEpisodeStep(Step):
-    """Normalise un épisode (raw -> clean), sauvegarde (skip si clean existe sauf force)."""
+    """
+    Normalise un épisode (raw -> clean), sauvegarde.
+
+    Skip (sauf force) si clean.txt existe et a été produit depuis le même raw et la même
+    définition de profil (manifeste de build) : modifier une règle du profil re-normalise.
+    debug_level ("full", "counters", "off") : debug enregistré dans transform_meta.json.
+    """
 
     name = "normalize_episode"
+    resource = RESOURCE_CPU
 
-    def __init__(self, episode_id: str, profile_id: str) -> None:
+    def __init__(self, episode_id: str, profile_id: str, debug_level: str = DEBUG_FULL) -> None:
         self.episode_id = episode_id
         self.profile_id = profile_id
+        self.debug_level = debug_level
 
     def run(
         self,
@@ -269,19 +466,31 @@ class NormalizeEpisodeStep(Step):
         profile = get_profile(self.profile_id, custom)
         if not profile:
             return StepResult(False, f"Profile not found: {self.profile_id}")
-        if not force and store.has_episode_clean(self.episode_id):
+        raw = store.load_episode_text(self.episode_id, kind="raw")
+        manifest = BuildManifest.load(store, self.episode_id)
+        inputs = {"raw": text_digest(raw), "profile": profile_fingerprint(profile)}
+        if not force and manifest.is_fresh(
+            STAGE_NORMALIZE,
+            inputs,
+            store.has_episode_clean(self.episode_id),
+            lambda: text_digest(store.load_episode_text(self.episode_id, kind="clean")),
+        ):
             if on_progress:
                 on_progress(self.name, 1.0, f"Skip (already normalized): {self.episode_id}")
             if db:
                 db.set_episode_status(self.episode_id, EpisodeStatus.NORMALIZED.value)
             return StepResult(True, f"Already normalized: {self.episode_id}")
-        raw = store.load_episode_text(self.episode_id, kind="raw")
         if not raw.strip():
             return StepResult(False, f"No raw text: {self.episode_id}")
         if on_progress:
             on_progress(self.name, 0.5, f"Normalizing {self.episode_id}...")
-        clean_text, stats, debug = profile.apply(raw)
+        with trace_span("normalize", "normalize", episode_id=self.episode_id, profile=self.profile_id) as sp:
+            clean_text, stats, debug = profile.apply(raw, debug_level=self.debug_level)
+            sp.items = stats.raw_lines
+            sp.bytes = len(raw)
         store.save_episode_clean(self.episode_id, clean_text, stats, debug)
+        manifest.record(STAGE_NORMALIZE, inputs, text_digest(clean_text))
+        manifest.save()
         if db:
             db.set_episode_status(self.episode_id, EpisodeStatus.NORMALIZED.value)
         if on_progress:
@@ -290,7 +499,7 @@ class NormalizeEpisodeStep(Step):
 
 
 class BuildDbIndexStep(Step):
-    """Indexe les épisodes normalisés dans la DB (FTS). Skip si déjà indexé sauf force."""
+    """Indexe les épisodes normalisés dans la DB (FTS). Skip si déjà indexé avec le même clean.txt sauf force."""
 
     name = "build_db_index"
 
@@ -328,11 +537,17 @@ class BuildDbIndexStep(Step):
         for i, eid in enumerate(to_index):
             if is_cancelled and is_cancelled():
                 return StepResult(False, "Cancelled")
-            if not force and eid in indexed:
-                continue
             clean = store.load_episode_text(eid, kind="clean")
+            manifest = BuildManifest.load(store, eid)
+            inputs = {"clean": text_digest(clean)}
+            if not force and manifest.is_fresh(STAGE_INDEX, inputs, eid in indexed, lambda: inputs["clean"]):
+                continue
             if clean:
-                db.index_episode_text(eid, clean)
+                with trace_span("fts_update", "db", episode_id=eid) as sp:
+                    db.index_episode_text(eid, clean)
+                    sp.bytes = len(clean)
+                manifest.record(STAGE_INDEX, inputs, inputs["clean"])
+                manifest.save()
             if on_progress and n:
                 on_progress(self.name, (i + 1) / n, f"Indexed {eid}")
         if on_progress:
@@ -341,9 +556,14 @@ class BuildDbIndexStep(Step):
 
 
 class SegmentEpisodeStep(Step):
-    """Phase 2 : segmente un épisode (phrases + tours), écrit segments.jsonl, upsert DB."""
+    """
+    Phase 2 : segmente un épisode (phrases + tours), écrit segments.jsonl, upsert DB.
+
+    Skip (sauf force) si segments.jsonl a été produit depuis le même clean.txt et la même langue.
+    """
 
     name = "segment_episode"
+    resource = RESOURCE_CPU
 
     def __init__(self, episode_id: str, lang_hint: str = "en") -> None:
         self.episode_id = episode_id
@@ -361,40 +581,51 @@ class SegmentEpisodeStep(Step):
         db: CorpusDB | None = context.get("db")
         ep_dir = store._episode_dir(self.episode_id)  # noqa: SLF001 - sanitation centralisée côté store
         segments_path = ep_dir / SEGMENTS_JSONL_FILENAME
-        if not force and segments_path.exists():
+        clean = store.load_episode_text(self.episode_id, kind="clean")
+        manifest = BuildManifest.load(store, self.episode_id)
+        inputs = {"clean": text_digest(clean), "lang_hint": self.lang_hint}
+        if not force and manifest.is_fresh(
+            STAGE_SEGMENT,
+            inputs,
+            segments_path.exists(),
+            lambda: text_digest(segments_path.read_text(encoding="utf-8")),
+        ):
             if on_progress:
                 on_progress(self.name, 1.0, f"Skip (already segmented): {self.episode_id}")
             return StepResult(True, f"Already segmented: {self.episode_id}")
-        clean = store.load_episode_text(self.episode_id, kind="clean")
         if not clean.strip():
             return StepResult(False, f"No clean text: {self.episode_id}")
         if on_progress:
             on_progress(self.name, 0.0, f"Segmenting {self.episode_id}...")
-        sentences = segmenter_sentences(clean, self.lang_hint)
-        utterances = segmenter_utterances(clean)
-        for s in sentences:
-            s.episode_id = self.episode_id
-        for u in utterances:
-            u.episode_id = self.episode_id
+        with trace_span("segment", "segment", episode_id=self.episode_id) as sp:
+            sentences, utterances = segment_text(clean, self.lang_hint, episode_id=self.episode_id)
+            sp.items = len(sentences) + len(utterances)
+            sp.bytes = len(clean)
         ep_dir.mkdir(parents=True, exist_ok=True)
-        with segments_path.open("w", encoding="utf-8") as f:
-            for seg in sentences + utterances:
-                obj = {
-                    "segment_id": seg.segment_id,
-                    "episode_id": seg.episode_id,
-                    "kind": seg.kind,
-                    "n": seg.n,
-                    "start_char": seg.start_char,
-                    "end_char": seg.end_char,
-                    "text": seg.text,
-                    "speaker_explicit": seg.speaker_explicit,
-                    "meta": seg.meta,
-                }
-                f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+        lines: list[str] = []
+        for seg in sentences + utterances:
+            obj = {
+                "segment_id": seg.segment_id,
+                "episode_id": seg.episode_id,
+                "kind": seg.kind,
+                "n": seg.n,
+                "start_char": seg.start_char,
+                "end_char": seg.end_char,
+                "text": seg.text,
+                "speaker_explicit": seg.speaker_explicit,
+                "meta": seg.meta,
+            }
+            lines.append(json.dumps(obj, ensure_ascii=False) + "\n")
+        content = "".join(lines)
+        segments_path.write_text(content, encoding="utf-8")
+        manifest.record(STAGE_SEGMENT, inputs, text_digest(content))
+        manifest.save()
         if db:
-            db.upsert_segments(self.episode_id, "sentence", sentences)
-            db.upsert_segments(self.episode_id, "utterance", utterances)
-            db.delete_align_runs_for_episode(self.episode_id)
+            with trace_span("db_write", "db", episode_id=self.episode_id) as sp:
+                db.upsert_segments(self.episode_id, "sentence", sentences)
+                db.upsert_segments(self.episode_id, "utterance", utterances)
+                db.delete_align_runs_for_episode(self.episode_id)
+                sp.items = len(sentences) + len(utterances)
         if on_progress:
             on_progress(self.name, 1.0, f"Segmented: {self.episode_id} ({len(sentences)} sentences, {len(utterances)} utterances)")
         return StepResult(
@@ -445,7 +676,7 @@ class RebuildSegmentsIndexStep(Step):
 
 
 class ImportSubtitlesStep(Step):
-    """Phase 3 : importe un fichier SRT/VTT pour un épisode et une langue. §11 : option profile_id pour normaliser à l'import."""
+    """Phase 3 : importe un fichier de sous-titres (SRT/VTT/ASS/TTML/SBV) pour un épisode et une langue. §11 : option profile_id pour normaliser à l'import."""
 
     name = "import_subtitles"
 
@@ -477,10 +708,15 @@ class ImportSubtitlesStep(Step):
             on_progress(self.name, 0.0, f"Parsing {self.file_path.name}...")
         try:
             content = read_subtitle_file_content(self.file_path)
-            cues, fmt = parse_subtitle_content(content, str(self.file_path))
+            cues, source_fmt = parse_subtitle_content(content, str(self.file_path))
         except Exception as e:
             logger.exception("Parse subtitles")
             return StepResult(False, str(e))
+        # ASS / TTML / SBV : stockés en SRT dans le projet (format d'origine dans meta_json).
+        content, fmt = to_project_subtitles(content, source_fmt, cues)
+        meta = {"source": self.file_path.name}
+        if source_fmt != fmt:
+            meta["source_format"] = source_fmt
         for c in cues:
             c.episode_id = self.episode_id
             c.lang = self.lang
@@ -496,7 +732,7 @@ class ImportSubtitlesStep(Step):
                 fmt=fmt,
                 source_path=str(self.file_path),
                 imported_at=imported_at,
-                meta_json=json.dumps({"source": self.file_path.name}),
+                meta_json=json.dumps(meta),
             )
             db.upsert_cues(track_id, self.episode_id, self.lang, cues)
             if self.profile_id:
@@ -510,13 +746,140 @@ class ImportSubtitlesStep(Step):
                         on_log("warn", f"Profil non appliqué: {e}")
         if on_progress:
             on_progress(self.name, 1.0, f"Imported {len(cues)} cues for {self.episode_id} ({self.lang})")
-        return StepResult(True, f"Imported {len(cues)} cues", {"cues_count": len(cues), "format": fmt})
+        return StepResult(
+            True,
+            f"Imported {len(cues)} cues",
+            {"cues_count": len(cues), "format": fmt, "source_format": source_fmt},
+        )
+
+
+class ImportSubtitlesBatchStep(Step):
+    """
+    Import en masse (dossier ou ZIP) : parsing en process pool, pistes + cues en une transaction
+    avec FTS différé (voir core.subtitles.bulk_import). profile_id : normalisation à l'import.
+    """
+
+    name = "import_subtitles_batch"
+    # Parsing dans son propre process pool ; pistes et cues écrites en DB : sur le writer du DAG.
+    resource = RESOURCE_DB_WRITE
+
+    def __init__(
+        self,
+        files: list[SubtitleFile],
+        profile_id: str | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        self.files = list(files)
+        self.profile_id = profile_id
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        context: PipelineContext,
+        *,
+        force: bool = False,
+        on_progress: Callable[[str, float, str], None] | None = None,
+        on_log: Callable[[str, str], None] | None = None,
+    ) -> StepResult:
+        store: ProjectStore = context["store"]
+        db: CorpusDB | None = context.get("db")
+        if on_progress:
+            on_progress(self.name, 0.0, f"Import de {len(self.files)} fichier(s) de sous-titres...")
+        try:
+            report = import_subtitles_bulk(
+                store,
+                db,
+                self.files,
+                profile_id=self.profile_id,
+                max_workers=self.max_workers,
+                on_progress=on_progress,
+                is_cancelled=context.get("is_cancelled"),
+            )
+        except ValueError as e:
+            return StepResult(False, str(e))
+        if on_log:
+            for source, reason in report.skipped.items():
+                on_log("warning", f"{source} : {reason}")
+            for key, err in report.failed.items():
+                on_log("error", f"Import {key} : {err}")
+        message = (
+            f"Imported {len(report.imported)} tracks ({report.cues_imported} cues), "
+            f"{len(report.skipped)} skipped, {len(report.failed)} failed"
+        )
+        return StepResult(not report.failed and not report.cancelled, message, report.to_dict())
+
+
+class RetimeSubtitlesStep(Step):
+    """
+    Recale une piste de sous-titres (voir core.subtitles.retiming) : transformation estimée sur la
+    piste reference_lang du même épisode, sinon décalage offset_ms et/ou conversion de cadence
+    framerate=(source, cible). Timecodes mis à jour en un UPDATE, SRT réécrit, transformation
+    enregistrée dans meta_json de la piste.
+    """
+
+    name = "retime_subtitles"
+
+    def __init__(
+        self,
+        episode_id: str,
+        lang: str,
+        reference_lang: str | None = None,
+        offset_ms: float = 0.0,
+        framerate: tuple[float, float] | None = None,
+        piecewise: bool = True,
+    ) -> None:
+        self.episode_id = episode_id
+        self.lang = lang
+        self.reference_lang = reference_lang
+        self.offset_ms = offset_ms
+        self.framerate = framerate
+        self.piecewise = piecewise
+
+    def run(
+        self,
+        context: PipelineContext,
+        *,
+        force: bool = False,
+        on_progress: Callable[[str, float, str], None] | None = None,
+        on_log: Callable[[str, str], None] | None = None,
+    ) -> StepResult:
+        store: ProjectStore = context["store"]
+        db: CorpusDB | None = context.get("db")
+        if not db:
+            return StepResult(False, "Base de données requise pour le recalage")
+        cues = db.get_cues_for_episode_lang(self.episode_id, self.lang)
+        if not cues:
+            return StepResult(False, f"Aucune cue {self.episode_id} ({self.lang})")
+        if self.reference_lang:
+            reference = db.get_cues_for_episode_lang(self.episode_id, self.reference_lang)
+            if not reference:
+                return StepResult(False, f"Aucune cue de référence {self.episode_id} ({self.reference_lang})")
+            if on_progress:
+                on_progress(self.name, 0.0, f"Estimation {self.lang} -> {self.reference_lang} ({self.episode_id})...")
+            retiming = estimate_retiming(
+                reference, cues, reference_lang=self.reference_lang, piecewise=self.piecewise
+            )
+        elif self.framerate:
+            retiming = Retiming.from_framerate(*self.framerate, offset_ms=self.offset_ms)
+        else:
+            retiming = Retiming.shift(self.offset_ms)
+        data = {"episode_id": self.episode_id, "lang": self.lang, "cues_updated": 0, **retiming.to_dict()}
+        if retiming.is_identity:
+            return StepResult(True, f"{self.episode_id} ({self.lang}) : déjà synchrone", data)
+        data["cues_updated"] = retime_subtitle_track(store, db, self.episode_id, self.lang, retiming)
+        message = f"Retimed {data['cues_updated']} cues for {self.episode_id} ({self.lang}, {retiming.kind})"
+        if self.reference_lang and on_log:
+            on_log("info", f"{message} : recouvrement {retiming.score_before:.0%} -> {retiming.score_after:.0%}")
+        if on_progress:
+            on_progress(self.name, 1.0, message)
+        return StepResult(True, message, data)
 
 
 class DownloadOpenSubtitlesStep(Step):
     """P2 §6.2 : télécharge un sous-titre depuis OpenSubtitles puis l'importe (store + DB)."""
 
     name = "download_opensubtitles"
+    resource = RESOURCE_NETWORK
 
     def __init__(
         self,
@@ -592,6 +955,172 @@ class DownloadOpenSubtitlesStep(Step):
         return StepResult(True, f"Downloaded {len(cues)} cues", {"cues_count": len(cues)})
 
 
+class DownloadOpenSubtitlesBatchStep(Step):
+    """
+    Télécharge en lot les sous-titres OpenSubtitles manquants (épisodes × langues).
+
+    Recherches et téléchargements concurrents (quota/rate limit respectés), résultats de recherche
+    et état par paire mis en cache dans .cache/opensubtitles/ : un lot interrompu (arrêt, quota)
+    reprend là où il s'était arrêté. Les cues sont écrites en DB par paquets (une transaction par paquet).
+    """
+
+    name = "download_opensubtitles_batch"
+    resource = RESOURCE_NETWORK
+
+    def __init__(
+        self,
+        episodes: list[tuple[str, int, int]],
+        langs: list[str],
+        api_key: str,
+        imdb_id: str,
+        *,
+        max_concurrency: int = 4,
+        flush_every: int = 20,
+        base_url: str | None = None,
+        min_interval_s: float | None = None,
+    ) -> None:
+        """episodes : liste (episode_id, saison, épisode)."""
+        self.episodes = list(episodes)
+        self.langs = [lang for lang in langs if lang]
+        self.api_key = api_key
+        self.imdb_id = imdb_id
+        self.max_concurrency = max_concurrency
+        self.flush_every = max(1, flush_every)
+        self.base_url = base_url
+        self.min_interval_s = min_interval_s
+
+    def run(
+        self,
+        context: PipelineContext,
+        *,
+        force: bool = False,
+        on_progress: Callable[[str, float, str], None] | None = None,
+        on_log: Callable[[str, str], None] | None = None,
+    ) -> StepResult:
+        store: ProjectStore = context["store"]
+        db: CorpusDB | None = context.get("db")
+        cache = OpenSubtitlesBatchCache(
+            store.get_cache_dir() / "opensubtitles" / f"batch_{self.imdb_id.strip().lower()}.json"
+        )
+        # Paires manquantes + paires téléchargées lors d'un lancement interrompu avant l'écriture DB.
+        items = [
+            item
+            for item in (
+                BatchItem(episode_id, season, episode, lang)
+                for episode_id, season, episode in self.episodes
+                for lang in self.langs
+            )
+            if force
+            or not store.has_episode_subs(item.episode_id, item.lang)
+            or cache.get_state(item.key).get("status") == STATE_DOWNLOADED
+        ]
+        if not items:
+            return StepResult(True, "Aucun sous-titre manquant", {"imported": []})
+        if force:
+            for item in items:
+                if cache.get_state(item.key).get("status") in (STATE_DOWNLOADED, STATE_IMPORTED):
+                    cache.set_state(item.key, "pending")
+        pending_tracks: list[dict] = []
+        imported: list[str] = []
+
+        def flush() -> None:
+            if not pending_tracks:
+                return
+            if db:
+                db.import_tracks_bulk(pending_tracks)
+            for track in pending_tracks:
+                cache.set_state(f"{track['episode_id']}:{track['lang']}", STATE_IMPORTED)
+                imported.append(track["track_id"])
+            pending_tracks.clear()
+            cache.save()
+
+        def queue_track(item: BatchItem, content: str, source: str) -> None:
+            cues, _fmt = parse_subtitle_content(content)
+            for c in cues:
+                c.episode_id = item.episode_id
+                c.lang = item.lang
+            # Une seule écriture de <lang>.srt (avec l'audit des cues).
+            store.save_episode_subtitles(item.episode_id, item.lang, content, "srt", cues_to_audit_rows(cues))
+            path, _ext = store.get_episode_subtitle_path(item.episode_id, item.lang)
+            pending_tracks.append({
+                "track_id": f"{item.episode_id}:{item.lang}",
+                "episode_id": item.episode_id,
+                "lang": item.lang,
+                "fmt": "srt",
+                "source_path": str(path),
+                "imported_at": datetime.datetime.now(datetime.UTC).isoformat().replace("+00:00", "Z"),
+                "meta_json": json.dumps({"source": source}),
+                "cues": cues,
+            })
+            if len(pending_tracks) >= self.flush_every:
+                flush()
+
+        # Reprise : fichiers téléchargés lors d'un lancement précédent mais pas encore importés en DB.
+        for item in items:
+            if cache.get_state(item.key).get("status") != STATE_DOWNLOADED:
+                continue
+            loaded = store.load_episode_subtitle_content(item.episode_id, item.lang)
+            if loaded:
+                queue_track(item, loaded[0], "OpenSubtitles")
+            else:
+                cache.set_state(item.key, "pending")
+        flush()
+
+        done = 0
+        n = len(items)
+
+        def on_item_done(item: BatchItem, outcome: str) -> None:
+            nonlocal done
+            done += 1
+            if on_progress:
+                on_progress(self.name, done / n, f"{item.episode_id} ({item.lang}) : {outcome}")
+
+        kwargs = {"max_concurrency": self.max_concurrency}
+        if self.base_url:
+            kwargs["base_url"] = self.base_url
+        if self.min_interval_s is not None:
+            kwargs["min_interval_s"] = self.min_interval_s
+        downloader = OpenSubtitlesBatchDownloader(self.api_key, self.imdb_id, cache, **kwargs)
+        if on_progress:
+            on_progress(self.name, 0.0, f"OpenSubtitles : {n} paire(s) épisode/langue...")
+        try:
+            report = asyncio.run(
+                downloader.run(
+                    items,
+                    lambda item, content, _hit: queue_track(item, content, "OpenSubtitles"),
+                    on_item_done=on_item_done,
+                )
+            )
+        except OpenSubtitlesError as e:
+            flush()
+            return StepResult(False, str(e))
+        flush()
+        if on_log:
+            for key, err in report.failed.items():
+                on_log("error", f"OpenSubtitles {key}: {err}")
+            if report.pending_quota:
+                on_log("warning", f"Quota épuisé : {len(report.pending_quota)} paire(s) en attente (relancer plus tard).")
+        message = (
+            f"OpenSubtitles : {len(imported)} importé(s), {len(report.not_found)} introuvable(s), "
+            f"{len(report.failed)} erreur(s), {len(report.pending_quota)} en attente (quota)"
+        )
+        if on_progress:
+            on_progress(self.name, 1.0, message)
+        return StepResult(
+            not report.failed,
+            message,
+            {
+                "imported": imported,
+                "not_found": report.not_found,
+                "failed": report.failed,
+                "pending_quota": report.pending_quota,
+                "search_requests": report.search_requests,
+                "download_requests": report.download_requests,
+                "quota_remaining": report.quota_remaining,
+            },
+        )
+
+
 class AlignEpisodeStep(Step):
     """Phase 4 : aligne segments (phrases ou tours de parole) ↔ cues pivot puis cues pivot ↔ cues target."""
 
@@ -674,12 +1203,14 @@ class AlignEpisodeStep(Step):
                     progress = 0.1 + 0.3 * (current / total)  # 10% → 40%
                     on_progress(self.name, progress, f"Aligning segments {current}/{total}...")
 
-            pivot_links = align_segments_to_cues(
-                segments,
-                cues_en,
-                min_confidence=self.min_confidence,
-                on_progress=on_align_progress,
-            )
+            with trace_span("similarity", "align", episode_id=self.episode_id, pair="segments-cues") as sp:
+                pivot_links = align_segments_to_cues(
+                    segments,
+                    cues_en,
+                    min_confidence=self.min_confidence,
+                    on_progress=on_align_progress,
+                )
+                sp.items = len(segments) * len(cues_en)
             all_links = list(pivot_links)
             # Mettre à jour la langue des liens pivot si pivot effectif != EN (ex. segment↔FR direct)
             if effective_pivot_lang != self.pivot_lang:
@@ -719,9 +1250,11 @@ class AlignEpisodeStep(Step):
                                 cues_en, cues_target, min_confidence=self.min_confidence
                             )
                     else:
-                        target_links = align_cues_by_similarity(
-                            cues_en, cues_target, min_confidence=self.min_confidence
-                        )
+                        with trace_span("similarity", "align", episode_id=self.episode_id, pair=f"cues-{tl}") as sp:
+                            target_links = align_cues_by_similarity(
+                                cues_en, cues_target, min_confidence=self.min_confidence
+                            )
+                            sp.items = len(cues_en) * len(cues_target)
                         if not target_links and cues_target:
                             target_links = align_cues_by_order(cues_en, cues_target)
                 all_links.extend(target_links)
@@ -747,9 +1280,11 @@ class AlignEpisodeStep(Step):
             "cues_pivot_count": len(cues_en),
             "segment_kind": self.segment_kind,
         }
-        db.create_align_run(run_id, self.episode_id, effective_pivot_lang, json.dumps(params), created_at, json.dumps(summary))
         links_dicts = [link.to_dict(link_id=f"{run_id}:{i}") for i, link in enumerate(all_links)]
-        db.upsert_align_links(run_id, self.episode_id, links_dicts)
+        with trace_span("db_write", "db", episode_id=self.episode_id) as sp:
+            db.create_align_run(run_id, self.episode_id, effective_pivot_lang, json.dumps(params), created_at, json.dumps(summary))
+            db.upsert_align_links(run_id, self.episode_id, links_dicts)
+            sp.items = len(links_dicts)
         links_audit = [{"link_id": d.get("link_id"), "segment_id": d.get("segment_id"), "cue_id": d.get("cue_id"), "cue_id_target": d.get("cue_id_target"), "lang": d.get("lang"), "role": d.get("role"), "confidence": d.get("confidence"), "status": d.get("status")} for d in links_dicts]
         store.save_align_audit(self.episode_id, run_id, links_audit, {"run_id": run_id, "summary": summary, "params": params})
         if on_progress:
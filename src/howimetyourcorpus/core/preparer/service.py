@@ -6,6 +6,7 @@ import logging
 from typing import Any
 
 from howimetyourcorpus.core.constants import DEFAULT_NORMALIZE_PROFILE
+from howimetyourcorpus.core.normalize.incremental import IncrementalNormalizer
 from howimetyourcorpus.core.normalize.profiles import NormalizationProfile, get_profile
 from howimetyourcorpus.core.segment import Segment, segmenter_utterances
 from howimetyourcorpus.core.storage import db_segments, db_subtitles
@@ -17,6 +18,10 @@ logger = logging.getLogger(__name__)
 class PreparerService:
     """Logique métier de préparation, indépendante de l'UI."""
 
+    # Partagé entre instances (l'onglet reconstruit le service à chaque action) : une nouvelle
+    # normalisation de l'épisode en cours d'édition ne recalcule que les blocs modifiés.
+    _normalizer = IncrementalNormalizer()
+
     def __init__(self, store: Any, db: Any):
         self.store = store
         self.db = db
@@ -63,6 +68,7 @@ class PreparerService:
         Notes:
         - En transcript, l'appelant peut passer `input_text` pour normaliser l'édition en mémoire.
         - Si `persist=True`, le texte clean est enregistré avec stats+debug.
+        - Normalisation incrémentale : seuls les blocs modifiés depuis l'appel précédent sont recalculés.
         """
         source = (source_key or "transcript").strip().lower()
         if source != "transcript":
@@ -75,7 +81,7 @@ class PreparerService:
             )
 
         profile = self._profile_from_options(options)
-        clean_text, stats, debug = profile.apply(text)
+        clean_text, stats, debug = self._normalizer.apply(profile, text)
 
         if options.get("persist"):
             self.store.save_episode_clean(episode_id, clean_text, stats, debug)
@@ -299,16 +305,7 @@ class PreparerService:
 
     def _sync_utterance_assignments(self, episode_id: str, rows: list[dict[str, Any]]) -> None:
         """Réécrit les assignations `segment` de type utterance pour l'épisode."""
-        assignments = self.store.load_character_assignments()
-        assignments = [
-            a
-            for a in assignments
-            if not (
-                a.get("episode_id") == episode_id
-                and a.get("source_type") == "segment"
-                and ":utterance:" in (a.get("source_id") or "")
-            )
-        ]
+        assignments: list[dict[str, Any]] = []
         for row in rows:
             segment_id = (row.get("segment_id") or "").strip()
             character_id = (row.get("character_id") or "").strip()
@@ -321,21 +318,16 @@ class PreparerService:
                         "character_id": character_id,
                     }
                 )
-        self.store.save_character_assignments(assignments)
+        self.store.replace_episode_character_assignments(
+            episode_id,
+            assignments,
+            keep=lambda a: not (a.get("source_type") == "segment" and ":utterance:" in (a.get("source_id") or "")),
+        )
 
     def _sync_cue_assignments(self, episode_id: str, lang: str, rows: list[dict[str, Any]]) -> None:
         """Réécrit les assignations `cue` pour (épisode, langue)."""
         prefix = f"{episode_id}:{lang}:"
-        assignments = self.store.load_character_assignments()
-        assignments = [
-            a
-            for a in assignments
-            if not (
-                a.get("episode_id") == episode_id
-                and a.get("source_type") == "cue"
-                and (a.get("source_id") or "").startswith(prefix)
-            )
-        ]
+        assignments: list[dict[str, Any]] = []
         for row in rows:
             cue_id = (row.get("cue_id") or "").strip()
             character_id = (row.get("character_id") or "").strip()
@@ -348,4 +340,8 @@ class PreparerService:
                         "character_id": character_id,
                     }
                 )
-        self.store.save_character_assignments(assignments)
+        self.store.replace_episode_character_assignments(
+            episode_id,
+            assignments,
+            keep=lambda a: not (a.get("source_type") == "cue" and (a.get("source_id") or "").startswith(prefix)),
+        )
@@ -58,18 +58,33 @@ def restore_prep_status_scope(
 def capture_assignments_scope(
     store: Any,
     include_predicate: Callable[[dict[str, Any]], bool],
+    *,
+    episode_id: str | None = None,
 ) -> list[dict[str, Any]]:
-    """Capture un sous-ensemble d'assignations selon un prédicat."""
-    return [dict(a) for a in store.load_character_assignments() if include_predicate(a)]
+    """Capture un sous-ensemble d'assignations selon un prédicat (lecture limitée à episode_id si fourni)."""
+    assignments = (
+        store.load_character_assignments(episode_id=episode_id)
+        if episode_id is not None
+        else store.load_character_assignments()
+    )
+    return [dict(a) for a in assignments if include_predicate(a)]
 
 
 def restore_assignments_scope(
     store: Any,
     scoped_assignments: list[dict[str, Any]],
     scoped_predicate: Callable[[dict[str, Any]], bool],
+    *,
+    episode_id: str | None = None,
 ) -> None:
-    """Restaure un sous-ensemble d'assignations selon un prédicat."""
+    """Restaure un sous-ensemble d'assignations selon un prédicat (réécriture limitée à episode_id si fourni)."""
+    restored = [dict(a) for a in (scoped_assignments or [])]
+    if episode_id is not None:
+        store.replace_episode_character_assignments(
+            episode_id, restored, keep=lambda a: not scoped_predicate(a)
+        )
+        return
     current = store.load_character_assignments()
     kept = [a for a in current if not scoped_predicate(a)]
-    store.save_character_assignments(kept + [dict(a) for a in (scoped_assignments or [])])
+    store.save_character_assignments(kept + restored)
 
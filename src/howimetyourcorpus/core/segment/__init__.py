@@ -2,6 +2,7 @@
 
 from howimetyourcorpus.core.segment.segmenters import (
     Segment,
+    segment_text,
     segmenter_sentences,
     segmenter_utterances,
 )
@@ -15,6 +16,7 @@ from howimetyourcorpus.core.segment.legacy import (
 
 __all__ = [
     "Segment",
+    "segment_text",
     "segmenter_sentences",
     "segmenter_utterances",
     "Utterance",
@@ -1,6 +1,7 @@
 """
 Segmentation phrases / utterances (Phase 2 post-MVP).
-Segment dataclass + segmenter_sentences / segmenter_utterances avec start_char, end_char.
+Segment dataclass + segment_text (phrases et tours en un seul parcours, offsets exacts issus des
+spans regex) ; segmenter_sentences / segmenter_utterances en sont des vues.
 Ne jamais inventer de speaker ; speaker_explicit uniquement si détecté (ex. "Marshall:", "TED:").
 """
 
@@ -8,21 +9,28 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
-from howimetyourcorpus.core.utils.text import (
-    looks_like_didascalia,
-    looks_like_speaker_line,
-)
-
 # Pattern pour extraire "Name:" du début d'une ligne (majuscule + lettres/nom, ex. Marshall:, Ted:)
 SPEAKER_PREFIX = re.compile(r"^([A-Z][A-Za-z0-9_ '\-]{0,24}):\s*(.*)$", re.DOTALL)
 
 # Découpage en phrases : . ? ! suivis d'un espace ou fin
 SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[A-Z]|\Z)")
 
+# Abréviations (sans le point) qui ne terminent pas une phrase, par langue (lang_hint).
+ABBREVIATIONS: dict[str, tuple[str, ...]] = {
+    "en": ("Mr", "Mrs", "Ms", "Dr", "Prof", "St", "Jr", "Sr", "Mt", "vs"),
+    "fr": ("M", "MM", "Mme", "Mmes", "Mlle", "Mlles", "Dr", "Pr", "Me", "St", "Ste", "cf"),
+}
+# Majuscules ouvrant une phrase, par langue (défaut : ASCII, comme SENTENCE_BOUNDARY).
+_SENTENCE_START = {"fr": "A-ZÀ-ÖØ-ÞŒ"}
+
+# Contenu d'une ligne sans les blancs de bord (span = offsets exacts dans le texte).
+_LINE_CONTENT = re.compile(r"\S(?:[^\n]*\S)?")
+
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """
     Un segment (phrase ou tour de parole) avec positions et métadonnées.
@@ -46,39 +54,80 @@ class Segment:
         return f":{self.kind}:{self.n}"
 
 
+@lru_cache(maxsize=16)
+def sentence_boundary(lang_hint: str = "en") -> re.Pattern[str]:
+    """SENTENCE_BOUNDARY adapté à la langue : pas de coupure après une abréviation connue."""
+    lang = (lang_hint or "en").split("-")[0].split("_")[0].lower()
+    guards = "".join(rf"(?<!\b(?i:{re.escape(abbr)})\.)" for abbr in ABBREVIATIONS.get(lang, ()))
+    # Amorcé par la ponctuation (recherche rapide) ; le groupe 1 est le blanc séparateur.
+    return re.compile(rf"[.!?]{guards}(\s+)(?=[{_SENTENCE_START.get(lang, 'A-Z')}]|\Z)")
+
+
+def segment_text(
+    text: str,
+    lang_hint: str = "en",
+    *,
+    episode_id: str = "",
+) -> tuple[list[Segment], list[Segment]]:
+    """
+    Segmente le texte en phrases et en tours de parole en un seul parcours des lignes.
+    Retourne (sentences, utterances) ; start_char / end_char sont des offsets exacts dans `text`
+    (spans des correspondances regex, jamais de recherche du texte : phrases répétées comprises).
+    Une phrase peut couvrir plusieurs lignes (coupure sur . ? ! suivis d'une majuscule) ;
+    lang_hint : abréviations et majuscules de la langue (voir sentence_boundary).
+    Les dicts meta sont partagés entre les segments d'un même appel (lecture seule).
+    """
+    boundary = sentence_boundary(lang_hint)
+    sentence_meta: dict[str, Any] = {"lang_hint": lang_hint}
+    didascalia_meta: dict[str, Any] = {"didascalia": True}
+    no_meta: dict[str, Any] = {}
+    sentences: list[Segment] = []
+    utterances: list[Segment] = []
+
+    def close_sentence(start: int, end: int) -> None:
+        sentences.append(
+            Segment(episode_id, "sentence", len(sentences), start, end, text[start:end], None, None, sentence_meta)
+        )
+
+    sentence_start = -1
+    prev_end = 0
+    for line in _LINE_CONTENT.finditer(text):
+        start, end = line.span()
+        if sentence_start < 0:
+            sentence_start = start
+        elif boundary.match(text, prev_end - 1, start + 1):
+            # Blancs entre deux lignes : même test que dans la ligne (lookahead sur le 1er caractère).
+            close_sentence(sentence_start, prev_end)
+            sentence_start = start
+        for gap in boundary.finditer(text, start, end):
+            close_sentence(sentence_start, gap.start(1))
+            sentence_start = gap.end(1)
+        prev_end = end
+
+        s = line.group()
+        speaker = SPEAKER_PREFIX.match(s)
+        if speaker:
+            inner = start + speaker.start(2)
+            seg = Segment(
+                episode_id, "utterance", len(utterances), inner, end, speaker.group(2),
+                speaker.group(1).strip(), None, no_meta,
+            )
+        elif (s[0] == "(" and s[-1] == ")") or (s[0] == "[" and s[-1] == "]"):
+            seg = Segment(episode_id, "utterance", len(utterances), start, end, s, None, None, didascalia_meta)
+        else:
+            seg = Segment(episode_id, "utterance", len(utterances), start, end, s, None, None, no_meta)
+        utterances.append(seg)
+    if sentence_start >= 0:
+        close_sentence(sentence_start, prev_end)
+    return sentences, utterances
+
+
 def segmenter_sentences(text: str, lang_hint: str = "en") -> list[Segment]:
     """
-    Segmente le texte en phrases (séparation sur . ? !).
+    Segmente le texte en phrases (séparation sur . ? !, hors abréviations de lang_hint).
     Retourne des Segment avec kind="sentence", start_char, end_char.
-    lang_hint réservé pour règles locales (abréviations, etc.).
     """
-    text = text.strip()
-    if not text:
-        return []
-    segments: list[Segment] = []
-    parts = SENTENCE_BOUNDARY.split(text)
-    pos = 0
-    for n, part in enumerate(parts):
-        p = part.strip()
-        if not p:
-            continue
-        start = text.find(p, pos)
-        if start == -1:
-            start = pos
-        end = start + len(p)
-        pos = end
-        segments.append(
-            Segment(
-                kind="sentence",
-                n=n,
-                start_char=start,
-                end_char=end,
-                text=p,
-                speaker_explicit=None,
-                meta={"lang_hint": lang_hint},
-            )
-        )
-    return segments
+    return segment_text(text, lang_hint)[0]
 
 
 def segmenter_utterances(text: str) -> list[Segment]:
@@ -87,80 +136,4 @@ def segmenter_utterances(text: str) -> list[Segment]:
     Découpage structurel : lignes, séparateurs, speaker markers si présents.
     Ne PAS inventer de speaker ; si pattern "Name:" détecté => speaker_explicit=nom (ex. "Marshall", "Ted").
     """
-    segments: list[Segment] = []
-    lines = text.splitlines()
-    pos = 0
-    n = 0
-    for line in lines:
-        s = line.strip()
-        if not s:
-            pos += len(line) + 1
-            continue
-        start = text.find(s, pos)
-        if start == -1:
-            start = pos
-        end = start + len(s)
-        next_nl = text.find("\n", end)
-        pos = (next_nl + 1) if next_nl != -1 else len(text)
-        if start > len(text):
-            break
-
-        speaker_explicit = None
-        if looks_like_speaker_line(line):
-            m = SPEAKER_PREFIX.match(s)
-            if m:
-                speaker_explicit = m.group(1).strip()
-                seg_text = m.group(2).strip()
-                # Position du texte seul dans le document (après "SPEAKER:")
-                prefix_len = len(m.group(0)) - len(seg_text)
-                start_inner = start + prefix_len
-                end_inner = start_inner + len(seg_text)
-                segments.append(
-                    Segment(
-                        kind="utterance",
-                        n=n,
-                        start_char=start_inner,
-                        end_char=end_inner,
-                        text=seg_text,
-                        speaker_explicit=speaker_explicit,
-                        meta={},
-                    )
-                )
-            else:
-                segments.append(
-                    Segment(
-                        kind="utterance",
-                        n=n,
-                        start_char=start,
-                        end_char=end,
-                        text=s,
-                        speaker_explicit=None,
-                        meta={},
-                    )
-                )
-        elif looks_like_didascalia(line):
-            segments.append(
-                Segment(
-                    kind="utterance",
-                    n=n,
-                    start_char=start,
-                    end_char=end,
-                    text=s,
-                    speaker_explicit=None,
-                    meta={"didascalia": True},
-                )
-            )
-        else:
-            segments.append(
-                Segment(
-                    kind="utterance",
-                    n=n,
-                    start_char=start,
-                    end_char=end,
-                    text=s,
-                    speaker_explicit=None,
-                    meta={},
-                )
-            )
-        n += 1
-    return segments
+    return segment_text(text)[1]
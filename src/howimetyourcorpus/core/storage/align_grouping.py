@@ -41,11 +41,7 @@ def generate_align_grouping(
         store.save_align_grouping(episode_id, run_id, grouping)
         return grouping
 
-    assignments = [
-        dict(a)
-        for a in store.load_character_assignments()
-        if (a.get("episode_id") or "").strip() == episode_id
-    ]
+    assignments = [dict(a) for a in store.load_character_assignments(episode_id=episode_id)]
     assign_segment: dict[str, str] = {}
     assign_cue: dict[str, str] = {}
     for a in assignments:
@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Any
 
 
+@dataclass
+class _EpisodePropagation:
+    """Changements calculés en mémoire pour un épisode (appliqués ensuite en lot)."""
+
+    segment_speakers: dict[str, str] = field(default_factory=dict)
+    cue_texts: dict[str, str] = field(default_factory=dict)
+    cues_by_lang: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    langs_updated: set[str] = field(default_factory=set)
+    nb_cue: int = 0
+
+
 def propagate_character_names(
     store: Any,
     db: Any,
@@ -19,12 +31,57 @@ def propagate_character_names(
     (par défaut toutes les langues modifiées sont réécrites).
     Retourne (nb_segments_updated, nb_cues_updated).
     """
+    return propagate_character_names_batch(
+        store, db, {episode_id: run_id}, languages_to_rewrite=languages_to_rewrite
+    )[episode_id]
+
+
+def propagate_character_names_batch(
+    store: Any,
+    db: Any,
+    runs: dict[str, str],
+    languages_to_rewrite: set[str] | None = None,
+) -> dict[str, tuple[int, int]]:
+    """
+    Propagation §8 sur plusieurs épisodes (ex. une saison) en une passe : runs = {episode_id: run_id}.
+    Les changements sont calculés en mémoire, appliqués en une transaction (un UPDATE … FROM par
+    table, voir CorpusDB.apply_character_propagation), puis les SRT modifiés sont réécrits.
+    Retourne {episode_id: (nb_segments_updated, nb_cues_updated)}.
+    """
     from howimetyourcorpus.core.subtitles.parsers import cues_to_srt
 
-    assignments = store.load_character_assignments()
     characters = store.load_character_names()
     char_by_id = {ch.get("id") or ch.get("canonical") or "": ch for ch in characters}
-    episode_assignments = [a for a in assignments if a.get("episode_id") == episode_id]
+    plans = {
+        episode_id: _plan_episode(store, db, char_by_id, episode_id, run_id)
+        for episode_id, run_id in runs.items()
+    }
+    db.apply_character_propagation(
+        [pair for plan in plans.values() for pair in plan.segment_speakers.items()],
+        [pair for plan in plans.values() for pair in plan.cue_texts.items()],
+    )
+
+    for episode_id, plan in plans.items():
+        for lang in sorted(plan.langs_updated):
+            if languages_to_rewrite is not None and lang not in languages_to_rewrite:
+                continue
+            cues = plan.cues_by_lang.get(lang)
+            if cues:
+                store.save_episode_subtitle_content(episode_id, lang, cues_to_srt(cues), "srt")
+
+    return {episode_id: (len(plan.segment_speakers), plan.nb_cue) for episode_id, plan in plans.items()}
+
+
+def _plan_episode(
+    store: Any,
+    db: Any,
+    char_by_id: dict[str, dict[str, Any]],
+    episode_id: str,
+    run_id: str,
+) -> _EpisodePropagation:
+    """Calcule (sans écrire) les speaker_explicit et text_clean à appliquer pour un épisode."""
+    plan = _EpisodePropagation()
+    episode_assignments = store.load_character_assignments(episode_id=episode_id)
     assign_segment: dict[str, str] = {}
     assign_cue: dict[str, str] = {}
     for assignment in episode_assignments:
@@ -57,48 +114,45 @@ def propagate_character_names(
     run = db.get_align_run(run_id)
     pivot_lang = (run.get("pivot_lang") or "en").strip().lower() if run else "en"
 
-    nb_seg = 0
     for segment_id, character_id in assign_segment.items():
         # Écrire le nom canonique (G-003), pas l'ID opaque
         ch = char_by_id.get(character_id) or {}
-        canonical_name = ch.get("canonical") or character_id
-        db.update_segment_speaker(segment_id, canonical_name)
-        nb_seg += 1
+        plan.segment_speakers[segment_id] = ch.get("canonical") or character_id
 
     def name_for_lang(character_id: str, lang: str) -> str:
         character = char_by_id.get(character_id) or {}
         names = character.get("names_by_lang") or {}
         return names.get(lang) or character.get("canonical") or character_id
 
-    cues_by_lang: dict[str, list[dict[str, Any]]] = {}
     cues_index_by_lang: dict[str, dict[str, dict[str, Any]]] = {}
 
-    def _load_cues_lang(lang: str) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]:
+    def _load_cues_lang(lang: str) -> dict[str, dict[str, Any]]:
         lang_key = (lang or "").strip().lower() or "en"
-        if lang_key not in cues_by_lang:
+        if lang_key not in plan.cues_by_lang:
             cues = db.get_cues_for_episode_lang(episode_id, lang_key) or []
-            cues_by_lang[lang_key] = cues
+            plan.cues_by_lang[lang_key] = cues
             cues_index_by_lang[lang_key] = {
                 str(cue.get("cue_id") or ""): cue
                 for cue in cues
                 if cue.get("cue_id")
             }
-        return cues_by_lang[lang_key], cues_index_by_lang[lang_key]
+        return cues_index_by_lang[lang_key]
 
-    langs_updated: set[str] = set()
-    nb_cue = 0
-    _, cues_pivot_by_id = _load_cues_lang(pivot_lang)
+    def _prefix_cue(cue_row: dict[str, Any], cue_id: str, name: str, lang: str) -> None:
+        text = (cue_row.get("text_clean") or cue_row.get("text_raw") or "").strip()
+        prefix = name + ": "
+        if not text.startswith(prefix):
+            new_text = prefix + text
+            plan.cue_texts[cue_id] = new_text
+            cue_row["text_clean"] = new_text
+            plan.nb_cue += 1
+            plan.langs_updated.add(lang)
+
+    cues_pivot_by_id = _load_cues_lang(pivot_lang)
     for cue_id, character_id in assign_cue.items():
         cue_row = cues_pivot_by_id.get(cue_id)
         if cue_row:
-            text = (cue_row.get("text_clean") or cue_row.get("text_raw") or "").strip()
-            prefix = name_for_lang(character_id, pivot_lang) + ": "
-            if not text.startswith(prefix):
-                new_text = prefix + text
-                db.update_cue_text_clean(cue_id, new_text)
-                cue_row["text_clean"] = new_text
-                nb_cue += 1
-                langs_updated.add(pivot_lang)
+            _prefix_cue(cue_row, cue_id, name_for_lang(character_id, pivot_lang), pivot_lang)
 
     for link in links:
         if link.get("role") != "target" or not link.get("cue_id") or not link.get("cue_id_target"):
@@ -108,26 +162,8 @@ def propagate_character_names(
         lang = (link.get("lang") or "fr").strip().lower()
         if cue_en not in assign_cue:
             continue
-        character_id = assign_cue[cue_en]
-        name = name_for_lang(character_id, lang)
-        _, cues_lang_by_id = _load_cues_lang(lang)
-        cue_row = cues_lang_by_id.get(cue_target)
+        cue_row = _load_cues_lang(lang).get(cue_target)
         if cue_row:
-            text = (cue_row.get("text_clean") or cue_row.get("text_raw") or "").strip()
-            prefix = name + ": "
-            if not text.startswith(prefix):
-                new_text = prefix + text
-                db.update_cue_text_clean(cue_target, new_text)
-                cue_row["text_clean"] = new_text
-                nb_cue += 1
-                langs_updated.add(lang)
-
-    for lang in sorted(langs_updated):
-        if languages_to_rewrite is not None and lang not in languages_to_rewrite:
-            continue
-        cues, _ = _load_cues_lang(lang)
-        if cues:
-            srt_content = cues_to_srt(cues)
-            store.save_episode_subtitle_content(episode_id, lang, srt_content, "srt")
+            _prefix_cue(cue_row, cue_target, name_for_lang(assign_cue[cue_en], lang), lang)
 
-    return nb_seg, nb_cue
+    return plan
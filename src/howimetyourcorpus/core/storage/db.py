@@ -12,6 +12,7 @@ from howimetyourcorpus.core.constants import KWIC_CONTEXT_WINDOW, SQLITE_CACHE_S
 from howimetyourcorpus.core.models import EpisodeRef, EpisodeStatus
 
 from howimetyourcorpus.core.storage import db_align
+from howimetyourcorpus.core.storage import db_characters
 from howimetyourcorpus.core.storage import db_segments
 from howimetyourcorpus.core.storage import db_subtitles
 from howimetyourcorpus.core.storage.db_kwic import (
@@ -224,6 +225,24 @@ class CorpusDB:
         finally:
             conn.close()
 
+    def set_episodes_status_batch(self, episode_ids: list[str], status: str) -> None:
+        """Met à jour le statut de plusieurs épisodes en une transaction (comme set_episode_status)."""
+        if not episode_ids:
+            return
+        ts = datetime.datetime.now(datetime.UTC).isoformat().replace("+00:00", "Z")
+        if status == EpisodeStatus.FETCHED.value:
+            sql, rows = "UPDATE episodes SET status=?, fetched_at=? WHERE episode_id=?", [
+                (status, ts, eid) for eid in episode_ids
+            ]
+        elif status == EpisodeStatus.NORMALIZED.value:
+            sql, rows = "UPDATE episodes SET status=?, normalized_at=? WHERE episode_id=?", [
+                (status, ts, eid) for eid in episode_ids
+            ]
+        else:
+            sql, rows = "UPDATE episodes SET status=? WHERE episode_id=?", [(status, eid) for eid in episode_ids]
+        with self.transaction() as conn:
+            conn.executemany(sql, rows)
+
     def index_episode_text(self, episode_id: str, clean_text: str) -> None:
         """Indexe le texte normalisé d'un épisode (documents + FTS)."""
         conn = self._conn()
@@ -415,6 +434,17 @@ class CorpusDB:
         finally:
             conn.close()
 
+    def import_tracks_bulk(self, tracks: list[dict], *, defer_fts: bool = False) -> int:
+        """Enregistre plusieurs pistes + cues en une transaction (import par lot). Retourne le nombre de cues.
+
+        defer_fts : index FTS des cues mis à jour une fois pour tout le lot (gros imports).
+        """
+        conn = self._conn()
+        try:
+            return db_subtitles.import_tracks_bulk(conn, tracks, defer_fts=defer_fts)
+        finally:
+            conn.close()
+
     def update_cue_text_clean(self, cue_id: str, text_clean: str) -> None:
         """Met à jour le champ text_clean d'une cue (propagation §8)."""
         conn = self._conn()
@@ -424,6 +454,13 @@ class CorpusDB:
         finally:
             conn.close()
 
+    def update_cues_text_clean_batch(self, rows: list[tuple[str, str]]) -> None:
+        """Met à jour text_clean pour des paires (cue_id, text_clean), en une transaction."""
+        if not rows:
+            return
+        with self.transaction() as conn:
+            db_subtitles.update_cues_text_clean(conn, rows)
+
     def update_cue_timecodes(self, cue_id: str, start_ms: int, end_ms: int) -> None:
         """Met à jour les timecodes d'une cue."""
         conn = self._conn()
@@ -433,6 +470,19 @@ class CorpusDB:
         finally:
             conn.close()
 
+    def retime_track(
+        self,
+        track_id: str,
+        segments: list[tuple[int, float, float]],
+        record: dict | None = None,
+    ) -> int:
+        """Recale toutes les cues d'une piste [(start_ms, scale, offset_ms)] en un UPDATE ; record -> meta_json."""
+        conn = self._conn()
+        try:
+            return db_subtitles.retime_track(conn, track_id, segments, record)
+        finally:
+            conn.close()
+
     def query_kwic_cues(
         self,
         term: str,
@@ -487,6 +537,19 @@ class CorpusDB:
         finally:
             conn.close()
 
+    def invalidate_episode_derived(self, episode_id: str) -> None:
+        """Texte brut modifié : supprime document indexé, segments et runs d'alignement, statut → fetched."""
+        ts = datetime.datetime.now(datetime.UTC).isoformat().replace("+00:00", "Z")
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM documents WHERE episode_id = ?", (episode_id,))
+            conn.execute("DELETE FROM segments WHERE episode_id = ?", (episode_id,))
+            conn.execute("DELETE FROM align_links WHERE episode_id = ?", (episode_id,))
+            conn.execute("DELETE FROM align_runs WHERE episode_id = ?", (episode_id,))
+            conn.execute(
+                "UPDATE episodes SET status=?, fetched_at=?, normalized_at=NULL WHERE episode_id=?",
+                (EpisodeStatus.FETCHED.value, ts, episode_id),
+            )
+
     def get_cues_for_episode_lang(self, episode_id: str, lang: str) -> list[dict]:
         """Retourne les cues d'un épisode pour une langue (pour l'Inspecteur). meta = dict si meta_json présent."""
         conn = self._conn()
@@ -731,3 +794,79 @@ class CorpusDB:
             return db_align.get_collisions_for_run(conn, episode_id, run_id)
         finally:
             conn.close()
+
+    # ----- Personnages (migration 009) -----
+
+    def get_characters(self) -> list[dict]:
+        """Catalogue personnages (id, canonical, names_by_lang, aliases)."""
+        conn = self._conn()
+        try:
+            return db_characters.get_characters(conn)
+        finally:
+            conn.close()
+
+    def replace_characters(self, characters: list[dict]) -> None:
+        """Remplace le catalogue personnages (entrées déjà validées)."""
+        with self.transaction() as conn:
+            db_characters.replace_characters(conn, characters)
+
+    def get_character_assignments(self, episode_id: str | None = None) -> list[dict]:
+        """Assignations personnage, toutes ou d'un épisode (index episode_id)."""
+        conn = self._conn()
+        try:
+            return db_characters.get_character_assignments(conn, episode_id)
+        finally:
+            conn.close()
+
+    def replace_character_assignments(self, assignments: list[dict], episode_id: str | None = None) -> None:
+        """Remplace toutes les assignations, ou seulement celles de episode_id, en une transaction."""
+        with self.transaction() as conn:
+            db_characters.replace_character_assignments(conn, assignments, episode_id)
+
+    def add_character_assignments(self, assignments: list[dict]) -> None:
+        """Ajoute des assignations (sans relire ni réécrire les existantes)."""
+        if not assignments:
+            return
+        with self.transaction() as conn:
+            db_characters.insert_character_assignments(conn, assignments)
+
+    def get_assignment_character_ids(self) -> set[str]:
+        """character_id distincts référencés par les assignations."""
+        conn = self._conn()
+        try:
+            return db_characters.get_assignment_character_ids(conn)
+        finally:
+            conn.close()
+
+    def apply_character_propagation(
+        self,
+        segment_speakers: list[tuple[str, str]],
+        cue_texts: list[tuple[str, str]],
+    ) -> tuple[int, int]:
+        """Propagation §8 en lot : speaker_explicit et text_clean en une transaction (voir db_characters)."""
+        conn = self._conn()
+        try:
+            return db_characters.apply_character_propagation(conn, segment_speakers, cue_texts)
+        finally:
+            conn.close()
+
+    def get_project_meta(self, key: str) -> str | None:
+        """Valeur d'un marqueur projet (table project_meta) ; None si absent ou base pas encore migrée."""
+        conn = self._conn()
+        try:
+            return db_characters.get_project_meta(conn, key)
+        except sqlite3.OperationalError:
+            return None
+        finally:
+            conn.close()
+
+    def import_legacy_characters(
+        self, marker: str, characters: list[dict], assignments: list[dict]
+    ) -> bool:
+        """Import unique des JSON personnages (voir db_characters.import_legacy_characters)."""
+        imported_at = datetime.datetime.now(datetime.UTC).isoformat().replace("+00:00", "Z")
+        conn = self._conn()
+        try:
+            return db_characters.import_legacy_characters(conn, marker, characters, assignments, imported_at)
+        finally:
+            conn.close()
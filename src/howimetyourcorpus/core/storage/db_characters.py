@@ -0,0 +1,226 @@
+"""Opérations DB sur le catalogue personnages et les assignations (migration 009)."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import Any, Iterable
+
+# Clés d'assignation stockées en colonnes (valeurs str) ; le reste va dans extra_json.
+ASSIGNMENT_COLUMNS = ("episode_id", "character_id", "source_type", "source_id", "segment_id", "cue_id")
+_CHARACTER_KEYS = ("id", "canonical", "names_by_lang", "aliases")
+
+_INSERT_ASSIGNMENT_SQL = f"""
+    INSERT INTO character_assignments ({", ".join(ASSIGNMENT_COLUMNS)}, extra_json)
+    VALUES ({", ".join("?" * (len(ASSIGNMENT_COLUMNS) + 1))})
+"""
+_SELECT_ASSIGNMENTS_SQL = f"SELECT {', '.join(ASSIGNMENT_COLUMNS)}, extra_json FROM character_assignments"
+
+
+def _assignment_row(assignment: dict[str, Any]) -> tuple[Any, ...]:
+    values = [assignment.get(key) if isinstance(assignment.get(key), str) else None for key in ASSIGNMENT_COLUMNS]
+    extra = {
+        key: value
+        for key, value in assignment.items()
+        if key not in ASSIGNMENT_COLUMNS or not isinstance(value, str)
+    }
+    return (*values, json.dumps(extra, ensure_ascii=False) if extra else None)
+
+
+def _assignment_dict(row: tuple[Any, ...]) -> dict[str, Any]:
+    out = {key: value for key, value in zip(ASSIGNMENT_COLUMNS, row) if value is not None}
+    if row[-1]:
+        out.update(json.loads(row[-1]))
+    return out
+
+
+def get_character_assignments(conn: sqlite3.Connection, episode_id: str | None = None) -> list[dict[str, Any]]:
+    """Assignations dans l'ordre d'enregistrement ; episode_id : celles d'un épisode (index)."""
+    if episode_id is None:
+        rows = conn.execute(f"{_SELECT_ASSIGNMENTS_SQL} ORDER BY assignment_id").fetchall()
+    else:
+        rows = conn.execute(
+            f"{_SELECT_ASSIGNMENTS_SQL} WHERE episode_id = ? ORDER BY assignment_id", (episode_id,)
+        ).fetchall()
+    return [_assignment_dict(r) for r in rows]
+
+
+def insert_character_assignments(conn: sqlite3.Connection, assignments: Iterable[dict[str, Any]]) -> None:
+    conn.executemany(_INSERT_ASSIGNMENT_SQL, [_assignment_row(a) for a in assignments])
+
+
+def replace_character_assignments(
+    conn: sqlite3.Connection,
+    assignments: list[dict[str, Any]],
+    episode_id: str | None = None,
+) -> None:
+    """Remplace toutes les assignations (ou celles de episode_id) par `assignments`."""
+    if episode_id is None:
+        conn.execute("DELETE FROM character_assignments")
+    else:
+        conn.execute("DELETE FROM character_assignments WHERE episode_id = ?", (episode_id,))
+    insert_character_assignments(conn, assignments)
+
+
+def get_assignment_character_ids(conn: sqlite3.Connection) -> set[str]:
+    """character_id distincts référencés par les assignations (validation du catalogue)."""
+    rows = conn.execute(
+        "SELECT DISTINCT character_id FROM character_assignments WHERE character_id IS NOT NULL"
+    ).fetchall()
+    return {r[0] for r in rows}
+
+
+def get_characters(conn: sqlite3.Connection) -> list[dict[str, Any]]:
+    """Catalogue personnages (dicts id/canonical/names_by_lang/aliases) dans l'ordre d'enregistrement."""
+    rows = conn.execute(
+        """SELECT character_id, canonical, names_by_lang_json, aliases_json, extra_json
+           FROM characters ORDER BY position"""
+    ).fetchall()
+    out = []
+    for character_id, canonical, names_json, aliases_json, extra_json in rows:
+        entry = {
+            "id": character_id,
+            "canonical": canonical,
+            "names_by_lang": json.loads(names_json) if names_json else {},
+            "aliases": json.loads(aliases_json) if aliases_json else [],
+        }
+        if extra_json:
+            entry.update(json.loads(extra_json))
+        out.append(entry)
+    return out
+
+
+def replace_characters(conn: sqlite3.Connection, characters: list[dict[str, Any]]) -> None:
+    """Remplace le catalogue (entrées normalisées, id uniques)."""
+    conn.execute("DELETE FROM characters")
+    conn.executemany(
+        """INSERT INTO characters (character_id, canonical, names_by_lang_json, aliases_json, extra_json)
+           VALUES (?, ?, ?, ?, ?)""",
+        [
+            (
+                ch["id"],
+                ch.get("canonical") or ch["id"],
+                json.dumps(ch.get("names_by_lang") or {}, ensure_ascii=False),
+                json.dumps(ch.get("aliases") or [], ensure_ascii=False),
+                json.dumps(extra, ensure_ascii=False)
+                if (extra := {k: v for k, v in ch.items() if k not in _CHARACTER_KEYS})
+                else None,
+            )
+            for ch in characters
+        ],
+    )
+
+
+def get_project_meta(conn: sqlite3.Connection, key: str) -> str | None:
+    row = conn.execute("SELECT value FROM project_meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def import_legacy_characters(
+    conn: sqlite3.Connection,
+    marker: str,
+    characters: list[dict[str, Any]],
+    assignments: list[dict[str, Any]],
+    imported_at: str,
+) -> bool:
+    """
+    Import unique des fichiers JSON (catalogue + assignations) dans des tables vides, marqué par
+    project_meta[marker] dans la même transaction (BEGIN IMMEDIATE : un seul processus importe).
+    Retourne False si l'import était déjà fait.
+    """
+    with conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        if get_project_meta(conn, marker) is not None:
+            return False
+        if conn.execute("SELECT 1 FROM characters LIMIT 1").fetchone() is None:
+            replace_characters(conn, characters)
+        if conn.execute("SELECT 1 FROM character_assignments LIMIT 1").fetchone() is None:
+            insert_character_assignments(conn, assignments)
+        conn.execute("INSERT OR REPLACE INTO project_meta (key, value) VALUES (?, ?)", (marker, imported_at))
+    return True
+
+
+# ── Propagation §8 en lot : table temporaire + UPDATE … FROM (SQLite ≥ 3.33) ──
+# Triggers FTS « au » suspendus pendant l'UPDATE ; l'index est mis à jour en deux requêtes
+# ensemblistes sur les seules lignes modifiées (comme import_tracks_bulk(defer_fts=True)).
+
+_SEGMENTS_FTS_COLUMNS = ("segment_id", "episode_id", "kind", "text", "speaker_explicit")
+_CUES_FTS_COLUMNS = ("cue_id", "episode_id", "lang", "text_clean")
+
+
+def _bulk_update_column(
+    conn: sqlite3.Connection,
+    *,
+    table: str,
+    key: str,
+    column: str,
+    fts_table: str,
+    fts_columns: tuple[str, ...],
+    trigger: str,
+    rows: list[tuple[str, str]],
+) -> int:
+    """UPDATE table SET column = valeur pour les paires (clé, valeur) qui changent ; retourne le nombre de lignes."""
+    if not rows:
+        return 0
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS propagation_updates (key TEXT PRIMARY KEY, value TEXT)")
+    conn.execute("DELETE FROM temp.propagation_updates")
+    conn.executemany("INSERT OR REPLACE INTO temp.propagation_updates (key, value) VALUES (?, ?)", rows)
+    # Ne garder que les lignes existantes dont la valeur change (pas de réécriture FTS inutile).
+    conn.execute(
+        f"""DELETE FROM temp.propagation_updates
+            WHERE NOT EXISTS (
+              SELECT 1 FROM {table} t
+              WHERE t.{key} = propagation_updates.key AND t.{column} IS NOT propagation_updates.value
+            )"""
+    )
+    trigger_sql = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (trigger,)).fetchone()
+    fts_cols = ", ".join(fts_columns)
+    t_cols = ", ".join(f"t.{c}" for c in fts_columns)
+    changed = f"FROM {table} t JOIN temp.propagation_updates u ON u.key = t.{key}"
+    if trigger_sql:
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        conn.execute(f"INSERT INTO {fts_table}({fts_table}, rowid, {fts_cols}) SELECT 'delete', t.rowid, {t_cols} {changed}")
+    count = conn.execute(
+        f"UPDATE {table} SET {column} = u.value FROM temp.propagation_updates u WHERE {table}.{key} = u.key"
+    ).rowcount
+    if trigger_sql:
+        conn.execute(f"INSERT INTO {fts_table}(rowid, {fts_cols}) SELECT t.rowid, {t_cols} {changed}")
+        conn.execute(trigger_sql[0])
+    conn.execute("DELETE FROM temp.propagation_updates")
+    return count
+
+
+def apply_character_propagation(
+    conn: sqlite3.Connection,
+    segment_speakers: list[tuple[str, str]],
+    cue_texts: list[tuple[str, str]],
+) -> tuple[int, int]:
+    """
+    Applique en une transaction les paires (segment_id, speaker_explicit) et (cue_id, text_clean)
+    calculées par la propagation : un UPDATE … FROM par table. Retourne (segments, cues) modifiés.
+    """
+    with conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN")  # le DDL (DROP TRIGGER) n'ouvre pas de transaction implicite
+        nb_seg = _bulk_update_column(
+            conn,
+            table="segments",
+            key="segment_id",
+            column="speaker_explicit",
+            fts_table="segments_fts",
+            fts_columns=_SEGMENTS_FTS_COLUMNS,
+            trigger="segments_au",
+            rows=segment_speakers,
+        )
+        nb_cue = _bulk_update_column(
+            conn,
+            table="subtitle_cues",
+            key="cue_id",
+            column="text_clean",
+            fts_table="cues_fts",
+            fts_columns=_CUES_FTS_COLUMNS,
+            trigger="subtitle_cues_au",
+            rows=cue_texts,
+        )
+    return nb_seg, nb_cue
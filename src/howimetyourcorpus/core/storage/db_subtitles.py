@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from typing import Callable
+from typing import Callable, Iterator
 
 
 def _normalize_cue_text(raw: str) -> str:
@@ -38,6 +38,46 @@ def add_track(
     )
 
 
+def _cue_rows(
+    track_id: str,
+    episode_id: str,
+    lang: str,
+    cues: list,
+    normalize_text: Callable[[str], str],
+) -> Iterator[tuple]:
+    """Lignes subtitle_cues (tuples executemany) pour les cues d'une piste."""
+    from howimetyourcorpus.core.subtitles import Cue
+
+    # meta_json sérialisé une fois par dict (les parseurs partagent le meta de piste entre cues).
+    meta_json_by_id: dict[int, str | None] = {}
+    for c in cues:
+        if not isinstance(c, Cue):
+            continue
+        cid = f"{episode_id}:{lang}:{c.n}" if episode_id and lang else f":{c.lang}:{c.n}"
+        if id(c.meta) not in meta_json_by_id:
+            meta_json_by_id[id(c.meta)] = json.dumps(c.meta) if c.meta else None
+        meta_json_str = meta_json_by_id[id(c.meta)]
+        text_clean = c.text_clean or normalize_text(c.text_raw)
+        yield (
+            cid,
+            track_id,
+            episode_id,
+            lang,
+            c.n,
+            c.start_ms,
+            c.end_ms,
+            c.text_raw,
+            text_clean,
+            meta_json_str,
+        )
+
+
+_INSERT_CUE_SQL = """
+    INSERT INTO subtitle_cues (cue_id, track_id, episode_id, lang, n, start_ms, end_ms, text_raw, text_clean, meta_json)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def upsert_cues(
     conn: sqlite3.Connection,
     track_id: str,
@@ -47,35 +87,85 @@ def upsert_cues(
     normalize_text: Callable[[str], str] = _normalize_cue_text,
 ) -> None:
     """Remplace les cues d'une piste (supprime anciennes, insère les nouvelles)."""
-    from howimetyourcorpus.core.subtitles import Cue
-
     # Transaction explicite pour éviter 1000 commits et garantir l'atomicité
     with conn:
         conn.execute("DELETE FROM subtitle_cues WHERE track_id = ?", (track_id,))
-        for c in cues:
-            if not isinstance(c, Cue):
-                continue
-            cid = f"{episode_id}:{lang}:{c.n}" if episode_id and lang else f":{c.lang}:{c.n}"
-            meta_json_str = json.dumps(c.meta) if c.meta else None
-            text_clean = c.text_clean or normalize_text(c.text_raw)
+        conn.executemany(_INSERT_CUE_SQL, _cue_rows(track_id, episode_id, lang, cues, normalize_text))
+
+
+# Triggers de synchronisation subtitle_cues -> cues_fts (migration 003), suspendus par import_tracks_bulk.
+_CUES_FTS_TRIGGERS = ("subtitle_cues_ai", "subtitle_cues_ad", "subtitle_cues_au")
+_CUES_FTS_COLUMNS = "cue_id, episode_id, lang, text_clean"
+_TRACK_IDS_SQL = "SELECT value FROM json_each(?)"
+
+
+def import_tracks_bulk(
+    conn: sqlite3.Connection,
+    tracks: list[dict],
+    normalize_text: Callable[[str], str] = _normalize_cue_text,
+    *,
+    defer_fts: bool = False,
+) -> int:
+    """
+    Enregistre plusieurs pistes et remplace leurs cues en une seule transaction.
+
+    Chaque piste : {track_id, episode_id, lang, fmt, source_path, imported_at, meta_json, cues}.
+    defer_fts : triggers FTS des cues suspendus pendant l'écriture, puis cues_fts mis à jour en
+    deux requêtes ensemblistes (retrait des anciennes cues, ajout des nouvelles) au lieu d'un
+    trigger par ligne ; triggers recréés dans la même transaction (rien ne change en cas d'échec).
+    Retourne le nombre de cues insérées.
+    """
+    n_cues = 0
+    with conn:
+        triggers: list[str] = []
+        track_ids = json.dumps([t["track_id"] for t in tracks])
+        if defer_fts:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")  # le DDL (DROP TRIGGER) n'ouvre pas de transaction implicite
+            triggers = [
+                row[0]
+                for row in conn.execute(
+                    f"SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name IN ({', '.join('?' * len(_CUES_FTS_TRIGGERS))})",
+                    _CUES_FTS_TRIGGERS,
+                )
+            ]
+            for name in _CUES_FTS_TRIGGERS:
+                conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            conn.execute(
+                f"""
+                INSERT INTO cues_fts(cues_fts, rowid, {_CUES_FTS_COLUMNS})
+                SELECT 'delete', rowid, {_CUES_FTS_COLUMNS} FROM subtitle_cues
+                WHERE track_id IN ({_TRACK_IDS_SQL})
+                """,
+                (track_ids,),
+            )
+        for t in tracks:
+            add_track(
+                conn,
+                t["track_id"],
+                t["episode_id"],
+                t["lang"],
+                t["fmt"],
+                t.get("source_path"),
+                t.get("imported_at"),
+                t.get("meta_json"),
+            )
+            conn.execute("DELETE FROM subtitle_cues WHERE track_id = ?", (t["track_id"],))
+            rows = list(_cue_rows(t["track_id"], t["episode_id"], t["lang"], t["cues"], normalize_text))
+            conn.executemany(_INSERT_CUE_SQL, rows)
+            n_cues += len(rows)
+        if defer_fts:
             conn.execute(
-                """
-                INSERT INTO subtitle_cues (cue_id, track_id, episode_id, lang, n, start_ms, end_ms, text_raw, text_clean, meta_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                f"""
+                INSERT INTO cues_fts(rowid, {_CUES_FTS_COLUMNS})
+                SELECT rowid, {_CUES_FTS_COLUMNS} FROM subtitle_cues
+                WHERE track_id IN ({_TRACK_IDS_SQL})
                 """,
-                (
-                    cid,
-                    track_id,
-                    episode_id,
-                    lang,
-                    c.n,
-                    c.start_ms,
-                    c.end_ms,
-                    c.text_raw,
-                    text_clean,
-                    meta_json_str,
-                ),
+                (track_ids,),
             )
+            for sql in triggers:
+                conn.execute(sql)
+    return n_cues
 
 
 def update_cue_text_clean(conn: sqlite3.Connection, cue_id: str, text_clean: str) -> None:
@@ -86,6 +176,14 @@ def update_cue_text_clean(conn: sqlite3.Connection, cue_id: str, text_clean: str
     )
 
 
+def update_cues_text_clean(conn: sqlite3.Connection, rows: list[tuple[str, str]]) -> None:
+    """Met à jour text_clean pour des paires (cue_id, text_clean) en un seul executemany."""
+    conn.executemany(
+        "UPDATE subtitle_cues SET text_clean = ? WHERE cue_id = ?",
+        [(text_clean, cue_id) for cue_id, text_clean in rows],
+    )
+
+
 def update_cue_timecodes(
     conn: sqlite3.Connection,
     cue_id: str,
@@ -99,6 +197,60 @@ def update_cue_timecodes(
     )
 
 
+def _retime_expr(column: str, segments: list[tuple[int, float, float]]) -> tuple[str, list[float]]:
+    """CASE sur start_ms (segments décroissants) : column·scale + offset arrondi au ms, borné à 0."""
+    ordered = sorted(segments, key=lambda s: s[0], reverse=True)
+    params: list[float] = []
+    branches = []
+    for start_ms, scale, offset_ms in ordered[:-1]:
+        branches.append(f"WHEN start_ms >= ? THEN {column} * ? + ?")
+        params += [start_ms, scale, offset_ms]
+    _, scale, offset_ms = ordered[-1]
+    params += [scale, offset_ms]
+    expr = f"CASE {' '.join(branches)} ELSE {column} * ? + ? END" if branches else f"{column} * ? + ?"
+    return f"MAX(0, CAST(({expr}) + 0.5 AS INTEGER))", params
+
+
+def retime_track(
+    conn: sqlite3.Connection,
+    track_id: str,
+    segments: list[tuple[int, float, float]],
+    record: dict | None = None,
+) -> int:
+    """
+    Applique une transformation affine par morceaux [(start_ms, scale, offset_ms)] aux timecodes de
+    toutes les cues d'une piste en un seul UPDATE (segment choisi d'après start_ms, pour start et end).
+    Le trigger FTS de mise à jour est suspendu (le texte ne change pas) ; record est ajouté à
+    meta_json["retiming"] de la piste, dans la même transaction. Retourne le nombre de cues modifiées.
+    """
+    if not segments or any(scale <= 0 for _, scale, _ in segments):
+        raise ValueError("Segments de retiming invalides")
+    start_expr, start_params = _retime_expr("start_ms", segments)
+    end_expr, end_params = _retime_expr("end_ms", segments)
+    with conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN")  # le DDL (DROP TRIGGER) n'ouvre pas de transaction implicite
+        trigger = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'subtitle_cues_au'"
+        ).fetchone()
+        conn.execute("DROP TRIGGER IF EXISTS subtitle_cues_au")
+        count = conn.execute(
+            f"UPDATE subtitle_cues SET start_ms = {start_expr}, end_ms = {end_expr} WHERE track_id = ?",
+            (*start_params, *end_params, track_id),
+        ).rowcount
+        if trigger:
+            conn.execute(trigger[0])
+        if record is not None and count:
+            row = conn.execute("SELECT meta_json FROM subtitle_tracks WHERE track_id = ?", (track_id,)).fetchone()
+            meta = json.loads(row[0]) if row and row[0] and row[0].strip() else {}
+            meta.setdefault("retiming", []).append(record)
+            conn.execute(
+                "UPDATE subtitle_tracks SET meta_json = ? WHERE track_id = ?",
+                (json.dumps(meta, ensure_ascii=False), track_id),
+            )
+    return count
+
+
 def get_tracks_for_episode(conn: sqlite3.Connection, episode_id: str) -> list[dict]:
     """Retourne les pistes sous-titres d'un épisode avec nb_cues (pour l'UI)."""
     conn.row_factory = sqlite3.Row
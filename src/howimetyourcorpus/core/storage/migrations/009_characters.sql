@@ -0,0 +1,38 @@
+-- Migration 009 : catalogue personnages et assignations en base
+-- (auparavant character_names.json / character_assignments.json, importés au premier accès
+-- par le ProjectStore ; l'export JSON reste disponible pour la portabilité).
+
+CREATE TABLE IF NOT EXISTS characters (
+  position INTEGER PRIMARY KEY,
+  character_id TEXT NOT NULL UNIQUE COLLATE NOCASE,
+  canonical TEXT NOT NULL,
+  names_by_lang_json TEXT,
+  aliases_json TEXT,
+  extra_json TEXT
+);
+
+-- Une ligne par assignation ; ancien format (source_type/source_id) ou B-002 (segment_id/cue_id).
+-- extra_json : autres clés du dict d'origine (speaker_label…), restituées telles quelles.
+CREATE TABLE IF NOT EXISTS character_assignments (
+  assignment_id INTEGER PRIMARY KEY,
+  episode_id TEXT,
+  character_id TEXT,
+  source_type TEXT,
+  source_id TEXT,
+  segment_id TEXT,
+  cue_id TEXT,
+  extra_json TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_character_assignments_segment ON character_assignments(episode_id, segment_id);
+CREATE INDEX IF NOT EXISTS idx_character_assignments_cue ON character_assignments(episode_id, cue_id);
+CREATE INDEX IF NOT EXISTS idx_character_assignments_source ON character_assignments(episode_id, source_type, source_id);
+CREATE INDEX IF NOT EXISTS idx_character_assignments_character ON character_assignments(character_id);
+
+-- Marqueurs du projet (ex. import des fichiers JSON personnages déjà fait).
+CREATE TABLE IF NOT EXISTS project_meta (
+  key TEXT PRIMARY KEY,
+  value TEXT
+);
+
+UPDATE schema_version SET version = 9;
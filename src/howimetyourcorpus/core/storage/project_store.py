@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from howimetyourcorpus.core.constants import CORPUS_DB_FILENAME, SUPPORTED_LANGUAGES
 from howimetyourcorpus.core.models import ProjectConfig, SeriesIndex, TransformStats
@@ -15,12 +15,16 @@ from howimetyourcorpus.core.storage.align_grouping import (
 )
 from howimetyourcorpus.core.storage.character_propagation import (
     propagate_character_names as _propagate_character_names,
+    propagate_character_names_batch as _propagate_character_names_batch,
 )
 from howimetyourcorpus.core.storage.project_store_characters import (
+    add_character_assignments as _add_character_assignments,
+    export_characters_json as _export_characters_json,
     load_character_assignments as _load_character_assignments,
     load_character_names as _load_character_names,
     normalize_character_entry as _normalize_character_entry,
     save_character_assignments as _save_character_assignments,
+    replace_episode_character_assignments as _replace_episode_character_assignments,
     save_character_names as _save_character_names,
     validate_assignment_references as _validate_assignment_references,
     validate_character_catalog as _validate_character_catalog,
@@ -59,6 +63,8 @@ from howimetyourcorpus.core.storage.project_store_episode_io import (
     has_episode_clean as _has_episode_clean,
     has_episode_html as _has_episode_html,
     has_episode_raw as _has_episode_raw,
+    invalidate_episode_derived as _invalidate_episode_derived,
+    load_episode_html as _load_episode_html,
     load_episode_notes as _load_episode_notes,
     load_episode_text as _load_episode_text,
     load_episode_transform_meta as _load_episode_transform_meta,
@@ -219,9 +225,27 @@ class ProjectStore:
 
     CHARACTER_ASSIGNMENTS_JSON = "character_assignments.json"
 
-    def load_character_assignments(self) -> list[dict[str, Any]]:
-        """Charge les assignations personnage (segment_id ou cue_id -> character_id)."""
-        return _load_character_assignments(self, logger_obj=logger)
+    def load_character_assignments(self, episode_id: str | None = None) -> list[dict[str, Any]]:
+        """Charge les assignations personnage (segment_id ou cue_id -> character_id), d'un épisode si episode_id."""
+        return _load_character_assignments(self, logger_obj=logger, episode_id=episode_id)
+
+    def replace_episode_character_assignments(
+        self,
+        episode_id: str,
+        assignments: list[dict[str, Any]],
+        *,
+        keep: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> None:
+        """Remplace les assignations d'un épisode (keep : existantes de l'épisode à conserver)."""
+        _replace_episode_character_assignments(self, episode_id, assignments, keep=keep)
+
+    def add_character_assignments(self, assignments: list[dict[str, Any]]) -> None:
+        """Ajoute des assignations sans réécrire les existantes."""
+        _add_character_assignments(self, assignments)
+
+    def export_characters_json(self, directory: Path | None = None) -> list[Path]:
+        """Exporte catalogue et assignations au format JSON historique (portabilité)."""
+        return _export_characters_json(self, directory)
 
     def save_character_assignments(self, assignments: list[dict[str, Any]]) -> None:
         """Sauvegarde les assignations personnage."""
@@ -352,6 +376,14 @@ class ProjectStore:
         """Charge le texte d'un épisode (kind = 'raw' ou 'clean')."""
         return _load_episode_text(self, episode_id, kind=kind)
 
+    def load_episode_html(self, episode_id: str) -> str:
+        """Charge le HTML brut sauvegardé de la page épisode ('' si absent)."""
+        return _load_episode_html(self, episode_id)
+
+    def invalidate_episode_derived(self, episode_id: str) -> list[str]:
+        """Supprime clean.txt, transform_meta.json et segments.jsonl d'un épisode (texte brut modifié)."""
+        return _invalidate_episode_derived(self, episode_id)
+
     def has_episode_html(self, episode_id: str) -> bool:
         return _has_episode_html(self, episode_id)
 
@@ -523,3 +555,15 @@ class ProjectStore:
             run_id,
             languages_to_rewrite=languages_to_rewrite,
         )
+
+    def propagate_character_names_batch(
+        self,
+        db: Any,
+        runs: dict[str, str],
+        languages_to_rewrite: set[str] | None = None,
+    ) -> dict[str, tuple[int, int]]:
+        """
+        Propagation §8 sur plusieurs épisodes (ex. une saison) : runs = {episode_id: run_id}.
+        Une seule transaction pour toutes les mises à jour DB. Retourne {episode_id: (nb_seg, nb_cue)}.
+        """
+        return _propagate_character_names_batch(self, db, runs, languages_to_rewrite=languages_to_rewrite)
@@ -0,0 +1,91 @@
+"""
+Cache mémoire des fichiers annexes du projet (JSON/TOML à la racine : statuts, options,
+personnages, index série, profils, config).
+
+Chaque fichier est relu et reparsé seulement si sa signature (mtime_ns, taille) a changé : une
+boucle de get_episode_prep_status sur 200 épisodes coûte un parse. Cache partagé par processus et
+indexé par chemin (l'API crée un ProjectStore par requête). Les écritures du store passent par
+`put` (valeur écrite reprise telle quelle avec la nouvelle signature) ou `invalidate`.
+Les valeurs en cache sont partagées et ne doivent pas être modifiées : les accesseurs en lecture
+(get_*) les lisent directement ; les load_* rendent des objets neufs fabriqués à partir de la valeur
+en cache en ne copiant que les niveaux modifiables (index série gardé en tuples, statuts et
+assignations recopiés par dict), un `copy.deepcopy` coûtant plus cher que de reparser le JSON.
+Seuls les petits fichiers (options de segmentation, profils) passent encore par `copy.deepcopy`.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+# Fichiers gardés (tous projets confondus) : une dizaine par projet.
+DEFAULT_MAX_ENTRIES = 256
+
+_Signature = tuple[int, int] | None
+
+
+def _signature(path: str) -> _Signature:
+    """(mtime_ns, taille) ou None si le fichier n'existe pas."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class SidecarCache:
+    """Mémoïsation (chemin -> valeur chargée) validée par la signature du fichier ; thread-safe."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[_Signature, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path, load: Callable[[Path], Any]) -> Any:
+        """
+        Valeur de `load(path)` (appelé aussi si le fichier est absent), recalculée si le fichier a
+        changé depuis. Une exception de `load` est propagée et rien n'est mis en cache.
+        """
+        key = os.path.abspath(path)
+        # Signature prise avant la lecture : un fichier modifié pendant load sera relu au prochain appel.
+        sig = _signature(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == sig:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        value = load(path)
+        with self._lock:
+            self.misses += 1
+            self._store(key, sig, value)
+        return value
+
+    def put(self, path: Path, value: Any) -> None:
+        """Écriture traversante : `value` (ce que load rendrait pour le fichier juste écrit) est gardée."""
+        key = os.path.abspath(path)
+        sig = _signature(key)
+        with self._lock:
+            self._store(key, sig, value)
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Oublie un fichier (ou tout le cache)."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+    def _store(self, key: str, sig: _Signature, value: Any) -> None:
+        self._entries[key] = (sig, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+SIDECAR_CACHE = SidecarCache()
@@ -5,7 +5,61 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, NamedTuple
+
+from howimetyourcorpus.core.storage.project_store_cache import SIDECAR_CACHE
+
+
+class _CachedEntries(NamedTuple):
+    """Liste en cache (partagée) ; flat : aucune entrée ne contient de dict/liste imbriqué."""
+
+    entries: tuple[Any, ...]
+    flat: bool
+
+
+def _cached_entries(entries: list[Any]) -> _CachedEntries:
+    flat = all(
+        not isinstance(value, (dict, list))
+        for entry in entries
+        if isinstance(entry, dict)
+        for value in entry.values()
+    )
+    return _CachedEntries(tuple(entries), flat)
+
+
+def _read_sidecar_list(path: Path, key: str, logger_obj: logging.Logger) -> _CachedEntries:
+    """Liste `key` d'un fichier JSON {key: [...]} ; vide si absent ou illisible."""
+    if not path.exists():
+        return _cached_entries([])
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception as exc:
+        logger_obj.warning("Impossible de charger %s: %s", path, exc)
+        return _cached_entries([])
+    return _cached_entries(data.get(key, []))
+
+
+def _copy_entry(entry: Any) -> Any:
+    """Copie d'une entrée JSON : dict neuf, listes/dicts imbriqués recopiés (un niveau)."""
+    if not isinstance(entry, dict):
+        return entry
+    return {
+        key: dict(value) if isinstance(value, dict) else list(value) if isinstance(value, list) else value
+        for key, value in entry.items()
+    }
+
+
+def _copy_entries(cached: _CachedEntries, episode_id: str | None = None) -> list[Any]:
+    """
+    Liste neuve à partir du cache (moins cher que copy.deepcopy, et que reparser le JSON) : un
+    dict(...) par entrée quand elles sont plates (cas des assignations), sinon _copy_entry.
+    """
+    entries = cached.entries
+    if episode_id is not None:
+        entries = [e for e in entries if isinstance(e, dict) and e.get("episode_id") == episode_id]
+    if cached.flat:
+        return [dict(e) if isinstance(e, dict) else e for e in entries]
+    return [_copy_entry(e) for e in entries]
 
 
 def normalize_character_entry(raw: dict[str, Any]) -> dict[str, Any] | None:
@@ -153,20 +207,64 @@ def validate_assignment_references(
         )
 
 
+# ── Persistance : corpus.db (tables characters / character_assignments) ou JSON ──
+#
+# Dès que corpus.db existe, catalogue et assignations sont en base (migration 009) : les fichiers
+# character_names.json / character_assignments.json éventuels y sont importés une fois (marqueur
+# project_meta), puis ne servent plus qu'à l'export (export_characters_json). Sans base (projet
+# pas encore indexé), les fichiers JSON restent le stockage.
+
+_LEGACY_IMPORT_MARKER = "characters_json_imported"
+_STORE_LOGGER = logging.getLogger("howimetyourcorpus.core.storage.project_store")
+
+
+def _characters_db(store: Any) -> Any | None:
+    """CorpusDB du projet (migrée, JSON importés) ou None si corpus.db n'existe pas encore."""
+    from howimetyourcorpus.core.storage.db import CorpusDB
+
+    path = Path(store.get_db_path())
+    if not path.exists():
+        return None
+    db = CorpusDB(path)
+    # Une requête indexée par accès ; migration + import seulement tant que le marqueur manque.
+    if db.get_project_meta(_LEGACY_IMPORT_MARKER) is None:
+        db.ensure_migrated()
+        _import_legacy_json(store, db)
+    return db
+
+
+def _import_legacy_json(store: Any, db: Any) -> None:
+    root = Path(store.root_dir)
+    characters: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for raw in _read_sidecar_list(root / store.CHARACTER_NAMES_JSON, "characters", _STORE_LOGGER).entries:
+        entry = normalize_character_entry(raw)
+        if entry is not None and entry["id"].lower() not in seen:
+            seen.add(entry["id"].lower())
+            characters.append(entry)
+    assignments = [
+        a
+        for a in _read_sidecar_list(root / store.CHARACTER_ASSIGNMENTS_JSON, "assignments", _STORE_LOGGER).entries
+        if isinstance(a, dict)
+    ]
+    if db.import_legacy_characters(_LEGACY_IMPORT_MARKER, characters, assignments) and (characters or assignments):
+        _STORE_LOGGER.info(
+            "Personnages importés en base depuis JSON : %d personnages, %d assignations",
+            len(characters),
+            len(assignments),
+        )
+
+
 def load_character_names(store: Any, *, logger_obj: logging.Logger) -> list[dict[str, Any]]:
     """
     Charge la liste des personnages du projet (noms canoniques + par langue).
-    Format : {"characters": [{"id": "...", "canonical": "...", "names_by_lang": {"en": "...", "fr": "..."}}]}
+    Format : [{"id": "...", "canonical": "...", "names_by_lang": {"en": "...", "fr": "..."}, "aliases": [...]}]
     """
+    db = _characters_db(store)
+    if db is not None:
+        return db.get_characters()
     path = Path(store.root_dir) / store.CHARACTER_NAMES_JSON
-    if not path.exists():
-        return []
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except Exception as exc:
-        logger_obj.warning("Impossible de charger %s: %s", path, exc)
-        return []
-    return data.get("characters", [])
+    return _copy_entries(SIDECAR_CACHE.get(path, lambda p: _read_sidecar_list(p, "characters", logger_obj)))
 
 
 def save_character_names(store: Any, characters: list[dict[str, Any]]) -> None:
@@ -178,38 +276,98 @@ def save_character_names(store: Any, characters: list[dict[str, Any]]) -> None:
     - pas d'assignations référencant un character_id absent
     """
     normalized = validate_character_catalog(characters)
-    assignments = load_character_assignments(
-        store,
-        logger_obj=logging.getLogger("howimetyourcorpus.core.storage.project_store"),
-    )
-    validate_assignment_references(
-        assignments,
-        {(character.get("id") or "").strip() for character in normalized},
-    )
-    path = Path(store.root_dir) / store.CHARACTER_NAMES_JSON
-    path.write_text(
-        json.dumps({"characters": normalized}, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    valid_ids = {(character.get("id") or "").strip() for character in normalized}
+    db = _characters_db(store)
+    if db is not None:
+        referenced = [{"character_id": character_id} for character_id in db.get_assignment_character_ids()]
+        validate_assignment_references(referenced, valid_ids)
+        db.replace_characters(normalized)
+        return
+    validate_assignment_references(load_character_assignments(store, logger_obj=_STORE_LOGGER), valid_ids)
+    _write_characters_json(Path(store.root_dir) / store.CHARACTER_NAMES_JSON, normalized)
 
 
-def load_character_assignments(store: Any, *, logger_obj: logging.Logger) -> list[dict[str, Any]]:
-    """Charge les assignations personnage (segment_id ou cue_id -> character_id)."""
+def load_character_assignments(
+    store: Any,
+    *,
+    logger_obj: logging.Logger,
+    episode_id: str | None = None,
+) -> list[dict[str, Any]]:
+    """Charge les assignations personnage (segment_id ou cue_id -> character_id), d'un épisode si episode_id."""
+    db = _characters_db(store)
+    if db is not None:
+        return db.get_character_assignments(episode_id)
     path = Path(store.root_dir) / store.CHARACTER_ASSIGNMENTS_JSON
-    if not path.exists():
-        return []
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except Exception as exc:
-        logger_obj.warning("Impossible de charger %s: %s", path, exc)
-        return []
-    return data.get("assignments", [])
+    cached = SIDECAR_CACHE.get(path, lambda p: _read_sidecar_list(p, "assignments", logger_obj))
+    return _copy_entries(cached, episode_id)
 
 
 def save_character_assignments(store: Any, assignments: list[dict[str, Any]]) -> None:
-    """Sauvegarde les assignations personnage."""
-    path = Path(store.root_dir) / store.CHARACTER_ASSIGNMENTS_JSON
+    """Sauvegarde (remplace) toutes les assignations personnage."""
+    db = _characters_db(store)
+    if db is not None:
+        db.replace_character_assignments(assignments)
+        return
+    _write_assignments_json(Path(store.root_dir) / store.CHARACTER_ASSIGNMENTS_JSON, assignments)
+
+
+def replace_episode_character_assignments(
+    store: Any,
+    episode_id: str,
+    assignments: list[dict[str, Any]],
+    *,
+    keep: Callable[[dict[str, Any]], bool] | None = None,
+) -> None:
+    """
+    Remplace les assignations de episode_id par `assignments` ; keep : assignations existantes de
+    l'épisode à conserver (ex. celles d'une autre source). Les autres épisodes ne sont pas relus.
+    """
+    db = _characters_db(store)
+    if db is None:
+        all_assignments = load_character_assignments(store, logger_obj=_STORE_LOGGER)
+        kept = [a for a in all_assignments if a.get("episode_id") != episode_id or (keep is not None and keep(a))]
+        save_character_assignments(store, kept + list(assignments))
+        return
+    kept = [a for a in db.get_character_assignments(episode_id) if keep is not None and keep(a)]
+    db.replace_character_assignments(kept + list(assignments), episode_id)
+
+
+def add_character_assignments(store: Any, assignments: list[dict[str, Any]]) -> None:
+    """Ajoute des assignations sans réécrire les existantes (en base)."""
+    if not assignments:
+        return
+    db = _characters_db(store)
+    if db is not None:
+        db.add_character_assignments(assignments)
+        return
+    save_character_assignments(store, load_character_assignments(store, logger_obj=_STORE_LOGGER) + list(assignments))
+
+
+def export_characters_json(store: Any, directory: Path | None = None) -> list[Path]:
+    """
+    Exporte catalogue et assignations au format JSON historique (character_names.json,
+    character_assignments.json) dans `directory` (défaut : racine du projet). Retourne les chemins.
+    """
+    directory = Path(directory) if directory is not None else Path(store.root_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    names_path = directory / store.CHARACTER_NAMES_JSON
+    assignments_path = directory / store.CHARACTER_ASSIGNMENTS_JSON
+    _write_characters_json(names_path, load_character_names(store, logger_obj=_STORE_LOGGER))
+    _write_assignments_json(assignments_path, load_character_assignments(store, logger_obj=_STORE_LOGGER))
+    return [names_path, assignments_path]
+
+
+def _write_characters_json(path: Path, characters: list[dict[str, Any]]) -> None:
+    path.write_text(
+        json.dumps({"characters": characters}, ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+    SIDECAR_CACHE.put(path, _cached_entries([_copy_entry(c) for c in characters]))
+
+
+def _write_assignments_json(path: Path, assignments: list[dict[str, Any]]) -> None:
     path.write_text(
         json.dumps({"assignments": assignments}, ensure_ascii=False, indent=2),
         encoding="utf-8",
     )
+    SIDECAR_CACHE.put(path, _cached_entries([_copy_entry(a) for a in assignments]))
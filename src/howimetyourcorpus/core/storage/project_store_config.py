@@ -7,6 +7,7 @@ from typing import Any
 
 from howimetyourcorpus.core.constants import EPISODES_DIR_NAME
 from howimetyourcorpus.core.models import ProjectConfig
+from howimetyourcorpus.core.storage.project_store_cache import SIDECAR_CACHE
 
 
 def read_toml(path: Path) -> dict[str, Any]:
@@ -34,6 +35,7 @@ def write_toml(path: Path, data: dict[str, Any]) -> None:
             lines.append(f'{key} = "{value!s}"')
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text("\n".join(lines), encoding="utf-8")
+    SIDECAR_CACHE.invalidate(path)
 
 
 def load_project_config(path: Path) -> dict[str, Any]:
@@ -63,9 +65,7 @@ def init_project(config: ProjectConfig) -> None:
 def load_config_extra(store: Any) -> dict[str, Any]:
     """Charge config.toml en dict (clés optionnelles : opensubtitles_api_key, series_imdb_id, etc.)."""
     path = Path(store.root_dir) / "config.toml"
-    if not path.exists():
-        return {}
-    return read_toml(path)
+    return dict(SIDECAR_CACHE.get(path, lambda p: read_toml(p) if p.exists() else {}))
 
 
 def save_config_extra(store: Any, updates: dict[str, str | int | float | bool]) -> None:
@@ -92,7 +92,7 @@ def save_config_main(
     path = Path(store.root_dir) / "config.toml"
     if not path.exists():
         return
-    data = dict(read_toml(path))
+    data = load_config_extra(store)
     if series_url is not None:
         data["series_url"] = series_url
     if source_id is not None:
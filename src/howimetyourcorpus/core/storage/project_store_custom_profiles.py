@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
+import copy
 import json
 from pathlib import Path
 from typing import Any
 
 from howimetyourcorpus.core.normalize.profiles import NormalizationProfile
+from howimetyourcorpus.core.storage.project_store_cache import SIDECAR_CACHE
 
 
 def load_custom_profiles(store: Any) -> dict[str, NormalizationProfile]:
     """
     Charge les profils personnalisés du projet (fichier profiles.json à la racine).
-    Lève ValueError si le JSON ou son schéma est invalide.
+    Lève ValueError si le JSON ou son schéma est invalide (rien n'est alors mis en cache).
     """
+    path = Path(store.root_dir) / store.PROFILES_JSON
+    return copy.deepcopy(SIDECAR_CACHE.get(path, _read_custom_profiles))
+
+
+def _read_custom_profiles(path: Path) -> dict[str, NormalizationProfile]:
     from howimetyourcorpus.core.normalize.profiles import ProfileValidationError, validate_profiles_json
 
-    path = Path(store.root_dir) / store.PROFILES_JSON
     if not path.exists():
         return {}
     try:
@@ -63,3 +69,4 @@ def save_custom_profiles(store: Any, profiles: list[dict[str, Any]]) -> None:
         json.dumps({"profiles": profiles}, ensure_ascii=False, indent=2),
         encoding="utf-8",
     )
+    SIDECAR_CACHE.invalidate(path)
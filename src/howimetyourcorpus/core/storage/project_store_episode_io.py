@@ -7,7 +7,12 @@ import logging
 from pathlib import Path
 from typing import Any
 
-from howimetyourcorpus.core.constants import CLEAN_TEXT_FILENAME, EPISODES_DIR_NAME, RAW_TEXT_FILENAME
+from howimetyourcorpus.core.constants import (
+    CLEAN_TEXT_FILENAME,
+    EPISODES_DIR_NAME,
+    RAW_TEXT_FILENAME,
+    SEGMENTS_JSONL_FILENAME,
+)
 from howimetyourcorpus.core.models import TransformStats
 
 logger = logging.getLogger(__name__)
@@ -75,6 +80,30 @@ def load_episode_text(store: Any, episode_id: str, kind: str = "raw") -> str:
     return path.read_text(encoding="utf-8")
 
 
+def load_episode_html(store: Any, episode_id: str) -> str:
+    """Charge le HTML brut sauvegardé de la page épisode ('' si absent)."""
+    path = episode_dir(store, episode_id) / "page.html"
+    if not path.exists():
+        return ""
+    return path.read_text(encoding="utf-8")
+
+
+def invalidate_episode_derived(store: Any, episode_id: str) -> list[str]:
+    """
+    Supprime les artefacts dérivés du texte brut (clean.txt, transform_meta.json, segments.jsonl).
+
+    Retourne les noms des fichiers effectivement supprimés.
+    """
+    directory = episode_dir(store, episode_id)
+    removed: list[str] = []
+    for name in (CLEAN_TEXT_FILENAME, "transform_meta.json", SEGMENTS_JSONL_FILENAME):
+        path = directory / name
+        if path.exists():
+            path.unlink()
+            removed.append(name)
+    return removed
+
+
 def has_episode_html(store: Any, episode_id: str) -> bool:
     """True si le HTML brut de l'épisode existe."""
     return (episode_dir(store, episode_id) / "page.html").exists()
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -12,15 +15,23 @@ from howimetyourcorpus.core.preparer import (
     normalize_segmentation_options,
     validate_segmentation_options,
 )
+from howimetyourcorpus.core.storage.project_store_cache import SIDECAR_CACHE
 
+_STORE_LOGGER = logging.getLogger("howimetyourcorpus.core.storage.project_store")
 
-def load_episode_prep_status(
-    store: Any,
-    *,
-    logger_obj: logging.Logger,
-) -> dict[str, dict[str, str]]:
-    """Charge les statuts de préparation par fichier."""
-    path = Path(store.root_dir) / store.EPISODE_PREP_STATUS_JSON
+# Un verrou par fichier de statuts : set_episode_prep_status (lire-modifier-écrire) est appelé
+# depuis les threads de l'API et des workers de jobs.
+_PREP_STATUS_LOCKS: dict[str, threading.Lock] = {}
+_PREP_STATUS_LOCKS_GUARD = threading.Lock()
+
+
+def _prep_status_lock(path: Path) -> threading.Lock:
+    key = os.path.abspath(path)
+    with _PREP_STATUS_LOCKS_GUARD:
+        return _PREP_STATUS_LOCKS.setdefault(key, threading.Lock())
+
+
+def _read_episode_prep_status(store: Any, path: Path, logger_obj: logging.Logger) -> dict[str, dict[str, str]]:
     if not path.exists():
         return {}
     try:
@@ -31,6 +42,10 @@ def load_episode_prep_status(
     raw_statuses = data.get("statuses", data if isinstance(data, dict) else {})
     if not isinstance(raw_statuses, dict):
         return {}
+    return _clean_prep_statuses(store, raw_statuses)
+
+
+def _clean_prep_statuses(store: Any, raw_statuses: dict[str, Any]) -> dict[str, dict[str, str]]:
     statuses: dict[str, dict[str, str]] = {}
     for episode_id, by_source in raw_statuses.items():
         if not isinstance(episode_id, str) or not isinstance(by_source, dict):
@@ -47,31 +62,37 @@ def load_episode_prep_status(
     return statuses
 
 
+def _cached_episode_prep_status(store: Any, logger_obj: logging.Logger = _STORE_LOGGER) -> dict[str, dict[str, str]]:
+    """Statuts en cache (valeur partagée : ne pas modifier)."""
+    path = Path(store.root_dir) / store.EPISODE_PREP_STATUS_JSON
+    return SIDECAR_CACHE.get(path, lambda p: _read_episode_prep_status(store, p, logger_obj))
+
+
+def load_episode_prep_status(
+    store: Any,
+    *,
+    logger_obj: logging.Logger,
+) -> dict[str, dict[str, str]]:
+    """Charge les statuts de préparation par fichier (dicts neufs, valeurs str partagées avec le cache)."""
+    return {episode: dict(by_source) for episode, by_source in _cached_episode_prep_status(store, logger_obj).items()}
+
+
 def save_episode_prep_status(store: Any, statuses: dict[str, dict[str, str]]) -> None:
-    """Sauvegarde les statuts de préparation par fichier."""
-    clean: dict[str, dict[str, str]] = {}
-    for episode_id, by_source in (statuses or {}).items():
-        if not isinstance(episode_id, str) or not isinstance(by_source, dict):
-            continue
-        clean_by_source: dict[str, str] = {}
-        for source_key, status in by_source.items():
-            if not isinstance(source_key, str) or not isinstance(status, str):
-                continue
-            normalized_status = status.strip().lower()
-            if normalized_status in store.PREP_STATUS_VALUES:
-                clean_by_source[source_key.strip()] = normalized_status
-        if clean_by_source:
-            clean[episode_id.strip()] = clean_by_source
+    """Sauvegarde les statuts de préparation par fichier (écriture atomique : temporaire + replace)."""
+    clean = _clean_prep_statuses(store, statuses or {})
     path = Path(store.root_dir) / store.EPISODE_PREP_STATUS_JSON
-    path.write_text(
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    tmp.write_text(
         json.dumps({"statuses": clean}, ensure_ascii=False, indent=2),
         encoding="utf-8",
     )
+    os.replace(tmp, path)
+    SIDECAR_CACHE.put(path, clean)
 
 
 def get_episode_prep_status(store: Any, episode_id: str, source_key: str, default: str = "raw") -> str:
     """Retourne le statut de préparation pour (épisode, source)."""
-    statuses = load_episode_prep_status(store, logger_obj=logging.getLogger("howimetyourcorpus.core.storage.project_store"))
+    statuses = _cached_episode_prep_status(store)
     status = (
         statuses.get((episode_id or "").strip(), {})
         .get((source_key or "").strip(), "")
@@ -91,31 +112,25 @@ def set_episode_prep_status(store: Any, episode_id: str, source_key: str, status
     normalized_status = (status or "").strip().lower()
     if not episode or not source:
         return
-    if normalized_status == "absent":
-        # "absent" = supprimer la clé du dict (source supprimée)
-        statuses = load_episode_prep_status(store, logger_obj=logging.getLogger("howimetyourcorpus.core.storage.project_store"))
-        if episode in statuses and source in statuses[episode]:
-            del statuses[episode][source]
-            if not statuses[episode]:
-                del statuses[episode]
-            save_episode_prep_status(store, statuses)
-        return
-    if normalized_status not in store.PREP_STATUS_VALUES:
+    if normalized_status != "absent" and normalized_status not in store.PREP_STATUS_VALUES:
         raise ValueError(f"Statut de préparation invalide: {status!r}")
-    statuses = load_episode_prep_status(store, logger_obj=logging.getLogger("howimetyourcorpus.core.storage.project_store"))
-    if episode not in statuses:
-        statuses[episode] = {}
-    statuses[episode][source] = normalized_status
-    save_episode_prep_status(store, statuses)
+    with _prep_status_lock(Path(store.root_dir) / store.EPISODE_PREP_STATUS_JSON):
+        statuses = load_episode_prep_status(store, logger_obj=_STORE_LOGGER)
+        if normalized_status == "absent":
+            # "absent" = supprimer la clé du dict (source supprimée)
+            if episode in statuses and source in statuses[episode]:
+                del statuses[episode][source]
+                if not statuses[episode]:
+                    del statuses[episode]
+                save_episode_prep_status(store, statuses)
+            return
+        statuses.setdefault(episode, {})[source] = normalized_status
+        save_episode_prep_status(store, statuses)
 
 
-def load_episode_segmentation_options(
-    store: Any,
-    *,
-    logger_obj: logging.Logger,
+def _read_episode_segmentation_options(
+    path: Path, logger_obj: logging.Logger
 ) -> dict[str, dict[str, dict[str, Any]]]:
-    """Charge les options de segmentation par (épisode, source)."""
-    path = Path(store.root_dir) / store.EPISODE_SEGMENTATION_OPTIONS_JSON
     if not path.exists():
         return {}
     try:
@@ -145,6 +160,23 @@ def load_episode_segmentation_options(
     return out
 
 
+def _cached_episode_segmentation_options(
+    store: Any, logger_obj: logging.Logger = _STORE_LOGGER
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Options en cache (valeur partagée : ne pas modifier)."""
+    path = Path(store.root_dir) / store.EPISODE_SEGMENTATION_OPTIONS_JSON
+    return SIDECAR_CACHE.get(path, lambda p: _read_episode_segmentation_options(p, logger_obj))
+
+
+def load_episode_segmentation_options(
+    store: Any,
+    *,
+    logger_obj: logging.Logger,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Charge les options de segmentation par (épisode, source) (copie de la valeur en cache)."""
+    return copy.deepcopy(_cached_episode_segmentation_options(store, logger_obj))
+
+
 def save_episode_segmentation_options(
     store: Any,
     options_map: dict[str, dict[str, dict[str, Any]]],
@@ -168,6 +200,7 @@ def save_episode_segmentation_options(
         json.dumps({"options": clean}, ensure_ascii=False, indent=2),
         encoding="utf-8",
     )
+    SIDECAR_CACHE.put(path, clean)
 
 
 def get_episode_segmentation_options(
@@ -179,10 +212,7 @@ def get_episode_segmentation_options(
     """Retourne les options de segmentation pour (épisode, source), normalisées."""
     episode = (episode_id or "").strip()
     source = (source_key or "").strip()
-    options_map = load_episode_segmentation_options(
-        store,
-        logger_obj=logging.getLogger("howimetyourcorpus.core.storage.project_store"),
-    )
+    options_map = _cached_episode_segmentation_options(store)
     source_options = options_map.get(episode, {}).get(source, {})
     merged = dict(DEFAULT_SEGMENTATION_OPTIONS)
     merged.update(normalize_segmentation_options(default))
@@ -204,21 +234,12 @@ def set_episode_segmentation_options(
         return
     normalized = normalize_segmentation_options(options)
     validate_segmentation_options(normalized)
-    options_map = load_episode_segmentation_options(
-        store,
-        logger_obj=logging.getLogger("howimetyourcorpus.core.storage.project_store"),
-    )
+    options_map = load_episode_segmentation_options(store, logger_obj=_STORE_LOGGER)
     options_map.setdefault(episode, {})[source] = normalized
     save_episode_segmentation_options(store, options_map)
 
 
-def load_project_languages(
-    store: Any,
-    *,
-    logger_obj: logging.Logger,
-) -> list[str]:
-    """Charge la liste des langues du projet."""
-    path = Path(store.root_dir) / store.LANGUAGES_JSON
+def _read_project_languages(store: Any, path: Path, logger_obj: logging.Logger) -> list[str]:
     if not path.exists():
         return list(store.DEFAULT_LANGUAGES)
     try:
@@ -230,14 +251,22 @@ def load_project_languages(
         return list(store.DEFAULT_LANGUAGES)
 
 
+def load_project_languages(
+    store: Any,
+    *,
+    logger_obj: logging.Logger,
+) -> list[str]:
+    """Charge la liste des langues du projet."""
+    path = Path(store.root_dir) / store.LANGUAGES_JSON
+    return list(SIDECAR_CACHE.get(path, lambda p: _read_project_languages(store, p, logger_obj)))
+
+
 def save_project_languages(store: Any, languages: list[str]) -> None:
     """Sauvegarde la liste des langues du projet."""
+    clean = [str(value).strip().lower() for value in languages if str(value).strip()]
     path = Path(store.root_dir) / store.LANGUAGES_JSON
     path.write_text(
-        json.dumps(
-            {"languages": [str(value).strip().lower() for value in languages if str(value).strip()]},
-            ensure_ascii=False,
-            indent=2,
-        ),
+        json.dumps({"languages": clean}, ensure_ascii=False, indent=2),
         encoding="utf-8",
     )
+    SIDECAR_CACHE.put(path, clean)
@@ -7,14 +7,10 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from howimetyourcorpus.core.storage.project_store_cache import SIDECAR_CACHE
 
-def load_source_profile_defaults(
-    store: Any,
-    *,
-    logger_obj: logging.Logger,
-) -> dict[str, str]:
-    """Charge le mapping source_id -> profile_id."""
-    path = Path(store.root_dir) / store.SOURCE_PROFILE_DEFAULTS_JSON
+
+def _read_mapping(path: Path, logger_obj: logging.Logger) -> dict[str, str]:
     if not path.exists():
         return {}
     try:
@@ -25,10 +21,21 @@ def load_source_profile_defaults(
         return {}
 
 
+def load_source_profile_defaults(
+    store: Any,
+    *,
+    logger_obj: logging.Logger,
+) -> dict[str, str]:
+    """Charge le mapping source_id -> profile_id."""
+    path = Path(store.root_dir) / store.SOURCE_PROFILE_DEFAULTS_JSON
+    return dict(SIDECAR_CACHE.get(path, lambda p: _read_mapping(p, logger_obj)))
+
+
 def save_source_profile_defaults(store: Any, defaults: dict[str, str]) -> None:
     """Sauvegarde le mapping source_id -> profile_id."""
     path = Path(store.root_dir) / store.SOURCE_PROFILE_DEFAULTS_JSON
     path.write_text(json.dumps(defaults, ensure_ascii=False, indent=2), encoding="utf-8")
+    SIDECAR_CACHE.put(path, dict(defaults))
 
 
 def load_episode_preferred_profiles(
@@ -38,17 +45,11 @@ def load_episode_preferred_profiles(
 ) -> dict[str, str]:
     """Charge le mapping episode_id -> profile_id."""
     path = Path(store.root_dir) / store.EPISODE_PREFERRED_PROFILES_JSON
-    if not path.exists():
-        return {}
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return dict(data) if isinstance(data, dict) else {}
-    except Exception as exc:
-        logger_obj.warning("Impossible de charger %s: %s", path, exc)
-        return {}
+    return dict(SIDECAR_CACHE.get(path, lambda p: _read_mapping(p, logger_obj)))
 
 
 def save_episode_preferred_profiles(store: Any, preferred: dict[str, str]) -> None:
     """Sauvegarde le mapping episode_id -> profile_id."""
     path = Path(store.root_dir) / store.EPISODE_PREFERRED_PROFILES_JSON
     path.write_text(json.dumps(preferred, ensure_ascii=False, indent=2), encoding="utf-8")
+    SIDECAR_CACHE.put(path, dict(preferred))
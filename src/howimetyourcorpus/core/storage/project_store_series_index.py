@@ -8,9 +8,14 @@ from pathlib import Path
 from typing import Any
 
 from howimetyourcorpus.core.models import EpisodeRef, SeriesIndex
+from howimetyourcorpus.core.storage.project_store_cache import SIDECAR_CACHE
 
 logger = logging.getLogger(__name__)
 
+# Valeur en cache, immuable : (series_title, series_url, lignes dans l'ordre des champs d'EpisodeRef).
+_EpisodeRow = tuple[str, int, int, str, str, "str | None"]
+_SeriesIndexPayload = tuple[str, str, tuple[_EpisodeRow, ...]]
+
 
 def save_series_index(store: Any, series_index: SeriesIndex) -> None:
     """Sauvegarde l'index série en JSON."""
@@ -31,11 +36,24 @@ def save_series_index(store: Any, series_index: SeriesIndex) -> None:
         ],
     }
     path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    SIDECAR_CACHE.put(path, _series_index_from_payload(payload, path))
 
 
 def load_series_index(store: Any) -> SeriesIndex | None:
     """Charge l'index série depuis JSON. Retourne None si absent."""
     path = Path(store.root_dir) / "series_index.json"
+    cached = SIDECAR_CACHE.get(path, _read_series_index)
+    if cached is None:
+        return None
+    series_title, series_url, rows = cached
+    return SeriesIndex(
+        series_title=series_title,
+        series_url=series_url,
+        episodes=[EpisodeRef(*row) for row in rows],
+    )
+
+
+def _read_series_index(path: Path) -> _SeriesIndexPayload | None:
     if not path.exists():
         return None
     try:
@@ -43,10 +61,14 @@ def load_series_index(store: Any) -> SeriesIndex | None:
     except (OSError, ValueError) as exc:
         logger.warning("Impossible de charger %s: %s", path, exc)
         return None
+    return _series_index_from_payload(payload, path)
+
+
+def _series_index_from_payload(payload: Any, path: Path) -> _SeriesIndexPayload | None:
     if not isinstance(payload, dict):
         logger.warning("Impossible de charger %s: structure inattendue (%s)", path, type(payload).__name__)
         return None
-    episodes: list[EpisodeRef] = []
+    episodes: list[_EpisodeRow] = []
     raw_episodes = payload.get("episodes", [])
     if not isinstance(raw_episodes, list):
         logger.warning("Impossible de charger %s: clé 'episodes' invalide", path)
@@ -63,17 +85,6 @@ def load_series_index(store: Any) -> SeriesIndex | None:
         except (TypeError, ValueError):
             continue
         episodes.append(
-            EpisodeRef(
-                episode_id=episode_id,
-                season=season,
-                episode=episode_num,
-                title=row.get("title", "") or "",
-                url=row.get("url", "") or "",
-                source_id=row.get("source_id"),
-            )
+            (episode_id, season, episode_num, row.get("title", "") or "", row.get("url", "") or "", row.get("source_id"))
         )
-    return SeriesIndex(
-        series_title=payload.get("series_title", ""),
-        series_url=payload.get("series_url", ""),
-        episodes=episodes,
-    )
+    return payload.get("series_title", ""), payload.get("series_url", ""), tuple(episodes)
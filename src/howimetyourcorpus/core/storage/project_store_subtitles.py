@@ -97,6 +97,7 @@ def normalize_subtitle_track(
     Retourne le nombre de cues mises à jour.
     """
     from howimetyourcorpus.core.normalize.profiles import get_profile
+    from howimetyourcorpus.core.normalize.rules import DEBUG_OFF
     from howimetyourcorpus.core.subtitles.parsers import cues_to_srt
 
     custom_profiles = store.load_custom_profiles()
@@ -106,14 +107,15 @@ def normalize_subtitle_track(
     cues = db.get_cues_for_episode_lang(episode_id, lang)
     if not cues:
         return 0
-    count = 0
+    rows: list[tuple[str, str]] = []
     for cue in cues:
         raw_text = (cue.get("text_raw") or "").strip()
-        clean_text, _, _ = profile.apply(raw_text)
+        clean_text, _, _ = profile.apply(raw_text, debug_level=DEBUG_OFF)
         cue_id = cue.get("cue_id")
         if cue_id:
-            db.update_cue_text_clean(cue_id, clean_text)
-            count += 1
+            rows.append((cue_id, clean_text))
+    db.update_cues_text_clean_batch(rows)
+    count = len(rows)
     if rewrite_srt and count > 0:
         cues = db.get_cues_for_episode_lang(episode_id, lang)
         if cues:
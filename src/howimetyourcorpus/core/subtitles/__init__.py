@@ -1,21 +1,41 @@
-"""Import sous-titres SRT/VTT (Phase 3)."""
+"""Import sous-titres SRT/VTT (Phase 3), ASS/SSA, TTML et SBV (registre de formats), recalage temporel."""
 
 from howimetyourcorpus.core.subtitles.parsers import (
     Cue,
     cues_to_audit_rows,
+    iter_subtitle_stream,
     parse_srt,
     parse_vtt,
     parse_subtitle_content,
     parse_subtitle_file,
     cues_to_srt,
 )
+from howimetyourcorpus.core.subtitles.formats import (
+    SubtitleFormat,
+    SubtitleFormatRegistry,
+    detect_subtitle_format,
+    to_project_subtitles,
+)
+from howimetyourcorpus.core.subtitles.retiming import (
+    RetimeSegment,
+    Retiming,
+    estimate_retiming,
+)
 
 __all__ = [
     "Cue",
     "cues_to_audit_rows",
+    "iter_subtitle_stream",
     "parse_srt",
     "parse_vtt",
     "parse_subtitle_content",
     "parse_subtitle_file",
     "cues_to_srt",
+    "SubtitleFormat",
+    "SubtitleFormatRegistry",
+    "detect_subtitle_format",
+    "to_project_subtitles",
+    "RetimeSegment",
+    "Retiming",
+    "estimate_retiming",
 ]
@@ -0,0 +1,284 @@
+"""
+Import en masse de sous-titres : dossier ou archive ZIP de fichiers SRT/VTT/ASS/TTML/SBV.
+
+Les fichiers sont associés à (épisode, langue) par leur nom (S01E01_en.srt, Show - 1x01.en.srt,
+dossier S01E01/en.srt…). Lecture, décodage et parsing (+ profil optionnel) tournent dans un
+ProcessPoolExecutor (spawn) ; le processus appelant écrit les fichiers du projet au fil des
+résultats, puis toutes les pistes et cues en une transaction, index FTS des cues mis à jour une
+seule fois pour les pistes importées (triggers suspendus pendant l'écriture).
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import multiprocessing
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path, PurePath, PurePosixPath
+from typing import Any, Callable
+
+from howimetyourcorpus.core.normalize.batch import _InlineExecutor
+from howimetyourcorpus.core.normalize.profiles import NormalizationProfile, get_profile
+from howimetyourcorpus.core.normalize.rules import DEBUG_OFF
+from howimetyourcorpus.core.subtitles.formats import SubtitleFormatRegistry, to_project_subtitles
+from howimetyourcorpus.core.subtitles.parsers import (
+    Cue,
+    cues_to_audit_rows,
+    decode_subtitle_bytes,
+    parse_subtitle_content,
+)
+from howimetyourcorpus.core.utils.tracing import trace_span
+
+logger = logging.getLogger(__name__)
+
+STEP_NAME = "import_subtitles_batch"
+SUBTITLE_SUFFIXES = SubtitleFormatRegistry.extensions()
+# Alternative des extensions (sans le point) pour les motifs de noms de fichiers
+_EXT = "|".join(re.escape(suffix[1:]) for suffix in SUBTITLE_SUFFIXES)
+
+
+def normalize_episode_id(s: str) -> str | None:
+    """Normalise S01E01 ou 1x01 -> S01E01 (2 chiffres)."""
+    if not s:
+        return None
+    m = re.match(r"(?i)S(\d+)E(\d+)$", s.strip())
+    if m:
+        return f"S{int(m.group(1)):02d}E{int(m.group(2)):02d}"
+    m = re.match(r"(?i)(\d+)x(\d+)$", s.strip())
+    if m:
+        return f"S{int(m.group(1)):02d}E{int(m.group(2)):02d}"
+    return None
+
+
+def parse_subtitle_filename(path: PurePath) -> tuple[str | None, str | None]:
+    """Extrait (episode_id, lang) du nom de fichier.
+    Ex. S01E01_en.srt -> (S01E01, en) ; Show - 1x01 - Title.en.srt -> (S01E01, en).
+    """
+    name = path.name
+    # S01E01 ou s01e01 + _/-/. + 2 lettres + .srt/.vtt/.ass…
+    m = re.match(rf"(?i)(S\d+E\d+)[_\-\.]?(\w{{2}})\.({_EXT})$", name)
+    if m:
+        return (m.group(1).upper(), m.group(2).lower())
+    # 1x01 ou 101 style + optionnel _lang + extension
+    m = re.match(rf"(?i).*?(\d+)x(\d+).*?[_\-\.]?(\w{{2}})?\.({_EXT})$", name)
+    if m:
+        ep = f"S{int(m.group(1)):02d}E{int(m.group(2)):02d}"
+        lang = m.group(3).lower() if m.group(3) else None
+        return (ep, lang)
+    return (None, None)
+
+
+def match_subtitle_path(path: PurePath, root: PurePath) -> tuple[str | None, str | None]:
+    """(episode_id, lang) d'un fichier sous `root` : nom du fichier, sinon dossier parent (S01E01/en.srt)."""
+    ep, lang = parse_subtitle_filename(path)
+    if (ep, lang) == (None, None) and path.parent != root:
+        parent_ep = normalize_episode_id(path.parent.name)
+        if parent_ep:
+            ep = parent_ep
+            mm = re.search(rf"(?i)(?:^|[_\-\.])(\w{{2}})\.({_EXT})$", path.name)
+            if mm:
+                lang = mm.group(1).lower()
+    return ep, lang
+
+
+@dataclass(frozen=True)
+class SubtitleFile:
+    """Fichier trouvé : chemin (ou archive ZIP + membre) et (épisode, langue), None si non reconnus."""
+
+    path: str
+    member: str = ""
+    episode_id: str | None = None
+    lang: str | None = None
+
+    @property
+    def source(self) -> str:
+        """Chemin lisible (archive.zip/membre pour un ZIP), enregistré comme source_path."""
+        return f"{self.path}/{self.member}" if self.member else self.path
+
+    @property
+    def key(self) -> str:
+        return f"{self.episode_id}:{self.lang}"
+
+
+def discover_subtitle_files(source: Path | str) -> list[SubtitleFile]:
+    """Sous-titres (extensions du registre de formats) d'un dossier (récursif) ou d'une archive .zip, triés."""
+    source = Path(source)
+    files: list[SubtitleFile] = []
+    if source.is_file() and zipfile.is_zipfile(source):
+        root = PurePosixPath(".")
+        with zipfile.ZipFile(source) as archive:
+            names = sorted(info.filename for info in archive.infolist() if not info.is_dir())
+        for name in names:
+            member = PurePosixPath(name)
+            if member.suffix.lower() in SUBTITLE_SUFFIXES and not member.name.startswith("."):
+                ep, lang = match_subtitle_path(member, root)
+                files.append(SubtitleFile(str(source), name, ep, lang))
+        return files
+    seen: set[str] = set()
+    for suffix in SUBTITLE_SUFFIXES:
+        for p in sorted(source.rglob(f"*{suffix}")):
+            if not p.is_file():
+                continue
+            key = str(p.resolve())
+            if key in seen:
+                continue
+            seen.add(key)
+            ep, lang = match_subtitle_path(p, source)
+            files.append(SubtitleFile(key, "", ep, lang))
+    return files
+
+
+@dataclass
+class BulkImportReport:
+    """Bilan d'un import en masse : clés episode_id:lang par issue."""
+
+    imported: list[str] = field(default_factory=list)
+    skipped: dict[str, str] = field(default_factory=dict)
+    """Fichier (source) -> raison : épisode/langue non reconnus, piste en double dans le lot."""
+    failed: dict[str, str] = field(default_factory=dict)
+    cues_imported: int = 0
+    wall_ms: int = 0
+    cancelled: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _read_subtitle_file(path: str, member: str) -> bytes:
+    if member:
+        with zipfile.ZipFile(path) as archive:
+            return archive.read(member)
+    return Path(path).read_bytes()
+
+
+def _parse_file(
+    file: SubtitleFile, profile: NormalizationProfile | None
+) -> tuple[str, str, str, list[Cue], list[dict[str, Any]]]:
+    """
+    Fonction module (exécutable dans un process pool) : (contenu à stocker, son format, format
+    source, cues, audit). ASS/TTML/SBV convertis en SRT ici (voir formats.to_project_subtitles).
+    """
+    content = decode_subtitle_bytes(_read_subtitle_file(file.path, file.member))
+    cues, source_fmt = parse_subtitle_content(content, file.source)
+    content, fmt = to_project_subtitles(content, source_fmt, cues)
+    for c in cues:
+        c.episode_id = file.episode_id or ""
+        c.lang = file.lang or ""
+    # Audit avant profil (comme ImportSubtitlesStep, qui normalise après l'écriture).
+    audit = cues_to_audit_rows(cues)
+    if profile is not None:
+        for c in cues:
+            c.text_clean = profile.apply((c.text_raw or "").strip(), debug_level=DEBUG_OFF)[0]
+    return content, fmt, source_fmt, cues, audit
+
+
+def _source_meta(file: SubtitleFile, fmt: str, source_fmt: str) -> dict[str, str]:
+    meta = {"source": PurePosixPath(file.source).name}
+    if source_fmt != fmt:
+        meta["source_format"] = source_fmt
+    return meta
+
+
+def import_subtitles_bulk(
+    store: Any,
+    db: Any,
+    files: list[SubtitleFile],
+    *,
+    profile_id: str | None = None,
+    max_workers: int | None = None,
+    on_progress: Callable[[str, float, str], None] | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> BulkImportReport:
+    """
+    Importe `files` (fichiers sans épisode ou langue ignorés ; première occurrence d'une piste gardée).
+
+    Fichiers SRT/VTT (autres formats convertis en SRT, format d'origine dans meta_json) + audit
+    écrits dans le projet au fil des résultats ; pistes et cues écrites en une transaction à la fin
+    (FTS différé). profile_id : text_clean normalisé dans les workers.
+    Un fichier en échec n'arrête pas les autres ; une annulation abandonne les fichiers non démarrés
+    (les pistes déjà parsées sont tout de même écrites).
+    """
+    t0 = time.perf_counter()
+    report = BulkImportReport()
+    profile = None
+    if profile_id:
+        profile = get_profile(profile_id, store.load_custom_profiles())
+        if profile is None:
+            raise ValueError(f"Profile not found: {profile_id}")
+
+    tasks: list[SubtitleFile] = []
+    keys: set[str] = set()
+    for file in files:
+        if not file.episode_id or not file.lang:
+            report.skipped[file.source] = "Épisode ou langue non reconnus"
+        elif file.key in keys:
+            report.skipped[file.source] = f"Piste {file.key} déjà présente dans le lot"
+        else:
+            keys.add(file.key)
+            tasks.append(file)
+
+    total = len(tasks)
+    workers = max(1, min(total, max_workers or os.cpu_count() or 1))
+    executor: Executor = (
+        ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        if workers > 1
+        else _InlineExecutor()
+    )
+    tracks: list[dict[str, Any]] = []
+    imported_at = datetime.datetime.now(datetime.UTC).isoformat().replace("+00:00", "Z")
+    pending: dict[Future, SubtitleFile] = {}
+    try:
+        for file in tasks:
+            pending[executor.submit(_parse_file, file, profile)] = file
+        finished = 0
+        while pending:
+            if is_cancelled and is_cancelled():
+                report.cancelled = True
+                for future in pending:
+                    future.cancel()
+                break
+            done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            for future in done:
+                file = pending.pop(future)
+                finished += 1
+                try:
+                    content, fmt, source_fmt, cues, audit = future.result()
+                except Exception as e:
+                    logger.exception("Subtitle import failed: %s", file.source)
+                    report.failed[file.key] = str(e)
+                    continue
+                store.save_episode_subtitles(file.episode_id, file.lang, content, fmt, audit)
+                tracks.append({
+                    "track_id": file.key,
+                    "episode_id": file.episode_id,
+                    "lang": file.lang,
+                    "fmt": fmt,
+                    "source_path": file.source,
+                    "imported_at": imported_at,
+                    "meta_json": json.dumps(_source_meta(file, fmt, source_fmt)),
+                    "cues": cues,
+                })
+                if on_progress:
+                    on_progress(STEP_NAME, 0.9 * finished / total, f"Parsed {file.key} ({len(cues)} cues)")
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    if db and tracks:
+        with trace_span("db_write", "db") as sp:
+            sp.items = len(tracks)
+            report.cues_imported = db.import_tracks_bulk(tracks, defer_fts=True)
+    report.imported = [t["track_id"] for t in tracks]
+    report.wall_ms = int((time.perf_counter() - t0) * 1000)
+    if on_progress:
+        on_progress(
+            STEP_NAME,
+            1.0,
+            f"Imported {len(report.imported)} tracks, {report.cues_imported} cues ({len(report.failed)} failed)",
+        )
+    return report
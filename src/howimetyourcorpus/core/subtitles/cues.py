@@ -0,0 +1,200 @@
+"""
+Modèle Cue et briques communes aux parseurs de sous-titres : normalisation du texte des cues,
+lecture ligne à ligne, parseurs en flux des formats natifs (iter_srt / iter_vtt), en-tête soumis
+à la détection de format, sérialisation SRT. Importé par parsers.py et formats.py, ne dépend
+d'aucun des deux : le registre des formats est complet dès l'import de formats.py.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator
+
+# Caractères d'en-tête examinés pour détecter le format (prologue XML / [Script Info] compris)
+SUBTITLE_SNIFF_CHARS = 4096
+
+# SRT: HH:MM:SS,MMM --> HH:MM:SS,MMM
+SRT_TIMECODE = re.compile(
+    r"(\d{2}):(\d{2}):(\d{2})[,](\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})[,](\d{3})"
+)
+# VTT: HH:MM:SS.MMM --> HH:MM:SS.MMM (ou MM:SS.MMM)
+VTT_TIMECODE = re.compile(
+    r"(\d{2}):(\d{2}):(\d{2})[.](\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})[.](\d{3})"
+)
+VTT_TIMECODE_SHORT = re.compile(
+    r"(\d{2}):(\d{2})[.](\d{3})\s*-->\s*(\d{2}):(\d{2})[.](\d{3})"
+)
+# Tags VTT à supprimer : <v Name>, </v>, <i>, </i>, <b>, </b>, <u>, </u>, <c>, </c>
+VTT_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+# Espaces multiples
+MULTI_SPACE = re.compile(r"\s+")
+
+
+def _timecode_to_ms(h: int, m: int, s: int, ms: int) -> int:
+    return ((h * 60 + m) * 60 + s) * 1000 + ms
+
+
+def _normalize_cue_text(raw: str) -> str:
+    """Normalisation minimaliste : suppression tags, espaces, sauts de ligne."""
+    if not raw:
+        return ""
+    t = VTT_TAG.sub(" ", raw)
+    t = t.replace("\n", " ").replace("\r", " ")
+    t = MULTI_SPACE.sub(" ", t).strip()
+    return t
+
+
+@dataclass(slots=True)
+class Cue:
+    """
+    Une cue sous-titre (timecodée).
+    cue_id = "{episode_id}:{lang}:{n}" (à définir côté appelant si episode_id/lang connu).
+    """
+
+    episode_id: str = ""
+    lang: str = "en"
+    n: int = 0
+    start_ms: int = 0
+    end_ms: int = 0
+    text_raw: str = ""
+    text_clean: str = ""
+    meta: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def cue_id(self) -> str:
+        if self.episode_id and self.lang:
+            return f"{self.episode_id}:{self.lang}:{self.n}"
+        return f":{self.lang}:{self.n}"
+
+
+def _track_meta(source_path: str) -> dict[str, Any]:
+    """Métadonnées de piste, partagées (lecture seule) par toutes les cues d'un même parse."""
+    return {"source_path": source_path} if source_path else {}
+
+
+def _text_lines(content: str) -> Iterator[str]:
+    """Lignes d'un contenu déjà décodé, sauts de ligne universels (\\r\\n, \\r), sans copie du texte."""
+    return io.StringIO(content, newline=None)
+
+
+def iter_srt(lines: Iterable[str], source_path: str = "") -> Iterator[Cue]:
+    """
+    Parse SRT en flux : consomme `lines` (fichier texte, StringIO…) et produit les Cue au fil de l'eau.
+    Les cues partagent le même dict meta (source_path).
+    """
+    meta = _track_meta(source_path)
+    n = 0
+    start_ms = end_ms = 0
+    text_lines: list[str] | None = None
+    for raw_line in lines:
+        line = raw_line.strip()
+        if text_lines is not None:
+            if line and not (SRT_TIMECODE.match(line) or line.isdigit()):
+                text_lines.append(line)
+                continue
+            text_raw = "\n".join(text_lines)
+            yield Cue("", "en", n, start_ms, end_ms, text_raw, _normalize_cue_text(text_raw), meta)
+            n += 1
+            text_lines = None
+            if not line:
+                continue
+        m = SRT_TIMECODE.match(line) if line else None
+        if m:
+            h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, m.groups())
+            start_ms = _timecode_to_ms(h1, m1, s1, ms1)
+            end_ms = _timecode_to_ms(h2, m2, s2, ms2)
+            text_lines = []
+    if text_lines is not None:
+        text_raw = "\n".join(text_lines)
+        yield Cue("", "en", n, start_ms, end_ms, text_raw, _normalize_cue_text(text_raw), meta)
+
+
+def iter_vtt(lines: Iterable[str], source_path: str = "") -> Iterator[Cue]:
+    """
+    Parse VTT (WEBVTT) en flux. Ignore NOTE/STYLE/REGION. Les cues partagent le même dict meta.
+    """
+    meta = _track_meta(source_path)
+    n = 0
+    start_ms = end_ms = 0
+    header_seen = False
+    skipping_block = False
+    text_lines: list[str] | None = None
+    for i, raw_line in enumerate(lines):
+        if not header_seen:
+            line = (raw_line[1:] if i == 0 and raw_line.startswith("\ufeff") else raw_line).strip()
+            header_seen = line.upper().startswith("WEBVTT")
+            continue
+        line = raw_line.strip()
+        if text_lines is not None:
+            if line:
+                text_lines.append(line)
+                continue
+            text_raw = "\n".join(text_lines)
+            yield Cue("", "en", n, start_ms, end_ms, text_raw, _normalize_cue_text(text_raw), meta)
+            n += 1
+            text_lines = None
+            continue
+        if skipping_block:
+            skipping_block = bool(line)
+            continue
+        if not line:
+            continue
+        if line.upper().startswith(("NOTE", "STYLE", "REGION")):
+            skipping_block = True
+            continue
+        m = VTT_TIMECODE.match(line)
+        if m:
+            h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, m.groups())
+            start_ms = _timecode_to_ms(h1, m1, s1, ms1)
+            end_ms = _timecode_to_ms(h2, m2, s2, ms2)
+        else:
+            m = VTT_TIMECODE_SHORT.match(line)
+            if not m:
+                continue
+            m1, s1, ms1, m2, s2, ms2 = map(int, m.groups())
+            start_ms = (m1 * 60 + s1) * 1000 + ms1
+            end_ms = (m2 * 60 + s2) * 1000 + ms2
+        text_lines = []
+    if text_lines is not None:
+        text_raw = "\n".join(text_lines)
+        yield Cue("", "en", n, start_ms, end_ms, text_raw, _normalize_cue_text(text_raw), meta)
+
+
+def _normalize_newlines(text: str) -> str:
+    """Sauts de ligne \\r\\n et \\r -> \\n (comme les flux texte à sauts de ligne universels)."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def subtitle_head(content: str) -> str:
+    """
+    En-tête soumis à la détection de format : SUBTITLE_SNIFF_CHARS caractères après normalisation des
+    sauts de ligne, soit le même texte que lit iter_subtitle_stream (flux à sauts de ligne universels).
+    """
+    return _normalize_newlines(content[: 2 * SUBTITLE_SNIFF_CHARS])[:SUBTITLE_SNIFF_CHARS]
+
+
+def _ms_to_srt_time(ms: int) -> str:
+    """Convertit des millisecondes en timecode SRT HH:MM:SS,mmm."""
+    s, ms_rem = divmod(ms, 1000)
+    m, s_rem = divmod(s, 60)
+    h, m_rem = divmod(m, 60)
+    return f"{h:02d}:{m_rem:02d}:{s_rem:02d},{ms_rem:03d}"
+
+
+def cues_to_srt(cues: list[dict]) -> str:
+    """
+    Sérialise une liste de cues (dict avec start_ms, end_ms, text_clean, n) en contenu SRT.
+    Utilisé pour réécrire les fichiers SRT après propagation des noms de personnages (§8).
+    """
+    blocks: list[str] = []
+    for c in sorted(cues, key=lambda x: (x.get("n", 0), x.get("start_ms", 0))):
+        n = c.get("n", 0)
+        start_ms = int(c.get("start_ms", 0))
+        end_ms = int(c.get("end_ms", 0))
+        text = (c.get("text_clean") or c.get("text_raw") or "").strip()
+        blocks.append(f"{n}\n{_ms_to_srt_time(start_ms)} --> {_ms_to_srt_time(end_ms)}\n{text}")
+    return "\n\n".join(blocks) + "\n" if blocks else ""
@@ -0,0 +1,341 @@
+"""
+Registre des formats de sous-titres : SRT, WebVTT, ASS/SSA, TTML (DFXP), SBV.
+
+Chaque format déclare ses extensions, une détection sur l'en-tête du contenu et un parseur en flux
+(lignes -> Cue, même contrat que iter_srt / iter_vtt). parse_subtitle_content, iter_subtitle_stream
+et parse_subtitle_file passent par ce registre ; un nouveau format s'ajoute par
+SubtitleFormatRegistry.register. Seuls SRT et VTT sont stockés tels quels dans le projet
+(<lang>.srt / <lang>.vtt) : les autres sont convertis en SRT à l'import (to_project_subtitles),
+sans passe de conversion externe.
+"""
+
+from __future__ import annotations
+
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+from howimetyourcorpus.core.subtitles.cues import (
+    SUBTITLE_SNIFF_CHARS,  # noqa: F401 - ré-export
+    Cue,
+    _normalize_cue_text,
+    _track_meta,
+    cues_to_srt,
+    iter_srt,
+    iter_vtt,
+    subtitle_head,
+)
+
+
+@dataclass(frozen=True)
+class SubtitleFormat:
+    """Format de sous-titres : id, extensions (".ass"…), détection sur l'en-tête, parseur en flux."""
+
+    id: str
+    extensions: tuple[str, ...]
+    iter_cues: Callable[[Iterable[str], str], Iterator[Cue]]
+    sniff: Callable[[str], bool] | None = None
+    native: bool = False
+    """Stocké tel quel dans le projet ; sinon converti en SRT à l'import."""
+
+
+class SubtitleFormatRegistry:
+    """Registre des formats (ordre d'enregistrement = ordre de détection ; SRT par défaut)."""
+
+    _formats: dict[str, SubtitleFormat] = {}
+
+    @classmethod
+    def register(cls, fmt: SubtitleFormat) -> None:
+        cls._formats[fmt.id] = fmt
+
+    @classmethod
+    def get(cls, fmt_id: str) -> SubtitleFormat | None:
+        return cls._formats.get(fmt_id)
+
+    @classmethod
+    def get_or_raise(cls, fmt_id: str) -> SubtitleFormat:
+        fmt = cls._formats.get(fmt_id)
+        if not fmt:
+            raise ValueError(f"Format de sous-titres '{fmt_id}' inconnu. Formats disponibles : {', '.join(cls._formats)}")
+        return fmt
+
+    @classmethod
+    def list_ids(cls) -> list[str]:
+        return list(cls._formats.keys())
+
+    @classmethod
+    def extensions(cls) -> tuple[str, ...]:
+        return tuple(ext for fmt in cls._formats.values() for ext in fmt.extensions)
+
+    @classmethod
+    def for_suffix(cls, suffix: str) -> SubtitleFormat | None:
+        suffix = suffix.lower()
+        return next((fmt for fmt in cls._formats.values() if suffix in fmt.extensions), None)
+
+    @classmethod
+    def detect(cls, head: str) -> SubtitleFormat:
+        """
+        Format d'après l'en-tête, SRT par défaut. Pas de repli sur l'extension : chaque format autre
+        que SRT se reconnaît à son en-tête, et son parseur ne produirait rien sans lui.
+        """
+        for fmt in cls._formats.values():
+            if fmt.sniff is not None and fmt.sniff(head):
+                return fmt
+        return cls._formats["srt"]
+
+
+def detect_subtitle_format(head: str) -> str:
+    """Id du format ("srt", "vtt", "ass", "ttml", "sbv") d'après l'en-tête du contenu."""
+    return SubtitleFormatRegistry.detect(subtitle_head(head)).id
+
+
+def to_project_subtitles(content: str, fmt: str, cues: list[Cue]) -> tuple[str, str]:
+    """(contenu, format) à stocker dans le projet : SRT/VTT tels quels, autres formats convertis en SRT."""
+    if SubtitleFormatRegistry.get_or_raise(fmt).native:
+        return content, fmt
+    rows = [{"n": c.n, "start_ms": c.start_ms, "end_ms": c.end_ms, "text_raw": c.text_raw} for c in cues]
+    return cues_to_srt(rows), "srt"
+
+
+def _first_line(head: str) -> str:
+    for line in head.lstrip("\ufeff").splitlines():
+        if line.strip():
+            return line.strip()
+    return ""
+
+
+def _clean_lines(text: str) -> str:
+    """Lignes strippées non vides, jointes par "\\n" (text_raw)."""
+    return "\n".join(line for line in map(str.strip, text.split("\n")) if line)
+
+
+# ── ASS / SSA ────────────────────────────────────────────────────────────────
+
+# H:MM:SS.cc (centièmes ; on tolère 1 à 3 chiffres de fraction)
+ASS_TIME = re.compile(r"(\d+):(\d{1,2}):(\d{1,2})(?:[.,](\d{1,3}))?")
+# Blocs d'override {\i1\pos(…)} ; \pN (N > 0) ouvre un dessin vectoriel, \p0 le ferme
+ASS_OVERRIDE = re.compile(r"\{[^}]*\}")
+ASS_DRAWING = re.compile(r"\\p(\d+)")
+_ASS_SECTION = re.compile(r"^\s*\[(?:Script Info|V4\+? Styles|Events)\]", re.IGNORECASE | re.MULTILINE)
+_ASS_DEFAULT_FIELDS = ["layer", "start", "end", "style", "name", "marginl", "marginr", "marginv", "effect", "text"]
+
+
+def _ass_time_to_ms(value: str) -> int | None:
+    m = ASS_TIME.fullmatch(value.strip())
+    if not m:
+        return None
+    h, mi, s = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    return ((h * 60 + mi) * 60 + s) * 1000 + int((m.group(4) or "0").ljust(3, "0"))
+
+
+def _ass_text(text: str) -> str:
+    """Texte d'un événement : overrides {…} retirés, dessins ignorés, \\N \\n -> saut de ligne, \\h -> espace."""
+    if "{" in text:
+        parts = []
+        drawing = False
+        pos = 0
+        for m in ASS_OVERRIDE.finditer(text):
+            if not drawing:
+                parts.append(text[pos : m.start()])
+            for level in ASS_DRAWING.findall(m.group()):
+                drawing = level != "0"
+            pos = m.end()
+        if not drawing:
+            parts.append(text[pos:])
+        text = "".join(parts)
+    return _clean_lines(text.replace("\\N", "\n").replace("\\n", "\n").replace("\\h", " "))
+
+
+def iter_ass(lines: Iterable[str], source_path: str = "") -> Iterator[Cue]:
+    """
+    Parse ASS / SSA en flux : lignes Dialogue de la section [Events] (champs selon la ligne Format),
+    dans l'ordre du fichier. Commentaires et événements sans texte (dessins, effets) ignorés.
+    """
+    meta = _track_meta(source_path)
+    n = 0
+    in_events = False
+    fields = _ASS_DEFAULT_FIELDS
+    for raw_line in lines:
+        line = raw_line.strip().lstrip("\ufeff")
+        if line.startswith("["):
+            in_events = line.lower() == "[events]"
+            continue
+        if not in_events:
+            continue
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key = key.strip().lower()
+        if key == "format":
+            fields = [f.strip().lower() for f in value.split(",")]
+            continue
+        if key != "dialogue":
+            continue
+        values = value.lstrip().split(",", len(fields) - 1)
+        if len(values) < len(fields):
+            continue
+        event = dict(zip(fields, values))
+        start_ms = _ass_time_to_ms(event.get("start", ""))
+        end_ms = _ass_time_to_ms(event.get("end", ""))
+        text_raw = _ass_text(event.get("text", ""))
+        if start_ms is None or end_ms is None or not text_raw:
+            continue
+        yield Cue("", "en", n, start_ms, end_ms, text_raw, _normalize_cue_text(text_raw), meta)
+        n += 1
+
+
+# ── TTML / DFXP ──────────────────────────────────────────────────────────────
+
+# Horloge HH:MM:SS(.fraction | :images(.sous-images)) ; décalage 1.5s, 1500ms, 90f, 900000t…
+TTML_CLOCK = re.compile(r"(\d+):(\d{2}):(\d{2})(?:\.(\d+)|:(\d+)(?:\.\d+)?)?")
+TTML_OFFSET = re.compile(r"(\d+(?:\.\d+)?)(h|m|s|ms|f|t)")
+_TTML_UNIT_MS = {"h": 3_600_000, "m": 60_000, "s": 1000, "ms": 1}
+_TTML_ROOT = re.compile(r"<(?:[\w.-]+:)?tt[\s>]")
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _ttml_attr(elem: ET.Element, name: str) -> str | None:
+    """Attribut par nom local (begin, ttp:frameRate…), quel que soit l'espace de noms."""
+    for key, value in elem.attrib.items():
+        if _local(key) == name:
+            return value
+    return None
+
+
+def _ttml_time_to_ms(value: str | None, frame_rate: float, tick_rate: float) -> int | None:
+    if value is None:
+        return None
+    value = value.strip()
+    m = TTML_CLOCK.fullmatch(value)
+    if m:
+        h, mi, s, fraction, frames = m.groups()
+        ms = ((int(h) * 60 + int(mi)) * 60 + int(s)) * 1000
+        if fraction:
+            ms += round(float(f"0.{fraction}") * 1000)
+        elif frames:
+            ms += round(int(frames) * 1000 / frame_rate)
+        return ms
+    m = TTML_OFFSET.fullmatch(value)
+    if not m:
+        return None
+    amount, unit = float(m.group(1)), m.group(2)
+    if unit == "f":
+        return round(amount * 1000 / frame_rate)
+    if unit == "t":
+        return round(amount * 1000 / tick_rate)
+    return round(amount * _TTML_UNIT_MS[unit])
+
+
+def _ttml_text(elem: ET.Element) -> str:
+    """Texte d'un <p> : blancs XML repliés, <br/> -> saut de ligne, texte des <span> conservé."""
+    parts = [re.sub(r"\s+", " ", elem.text or "")]
+    for child in elem:
+        parts.append("\n" if _local(child.tag) == "br" else _ttml_text(child))
+        parts.append(re.sub(r"\s+", " ", child.tail or ""))
+    return "".join(parts)
+
+
+def iter_ttml(lines: Iterable[str], source_path: str = "") -> Iterator[Cue]:
+    """
+    Parse TTML / DFXP en flux (XMLPullParser alimenté ligne à ligne) : une cue par <p> minuté.
+    Temps relatifs au parent (body/div minutés), end ou dur ; ttp:frameRate / tickRate respectés.
+    Les éléments terminés sont vidés au fil de l'eau.
+    """
+    meta = _track_meta(source_path)
+    n = 0
+    frame_rate, tick_rate = 30.0, 1.0
+    stack: list[tuple[int, int | None]] = []
+    parser = ET.XMLPullParser(events=("start", "end"))
+
+    def events() -> Iterator[Cue]:
+        nonlocal n, frame_rate, tick_rate
+        for event, elem in parser.read_events():
+            tag = _local(elem.tag)
+            if event == "start":
+                if tag == "tt":
+                    rate = _ttml_attr(elem, "frameRate")
+                    multiplier = (_ttml_attr(elem, "frameRateMultiplier") or "1 1").split()
+                    frame_rate = float(rate or 30) * float(multiplier[0]) / float(multiplier[-1])
+                    ticks = _ttml_attr(elem, "tickRate")
+                    tick_rate = float(ticks) if ticks else (frame_rate if rate else 1.0)
+                parent_begin, parent_end = stack[-1] if stack else (0, None)
+                offset = _ttml_time_to_ms(_ttml_attr(elem, "begin"), frame_rate, tick_rate)
+                begin = parent_begin + (offset or 0)
+                end = _ttml_time_to_ms(_ttml_attr(elem, "end"), frame_rate, tick_rate)
+                dur = _ttml_time_to_ms(_ttml_attr(elem, "dur"), frame_rate, tick_rate)
+                if end is not None:
+                    end += parent_begin
+                elif dur is not None:
+                    end = begin + dur
+                else:
+                    end = parent_end
+                stack.append((begin, end))
+                continue
+            begin, end = stack.pop()
+            if tag == "p":
+                text_raw = _clean_lines(_ttml_text(elem))
+                if text_raw and end is not None:
+                    yield Cue("", "en", n, begin, end, text_raw, _normalize_cue_text(text_raw), meta)
+                    n += 1
+                elem.clear()
+            elif tag == "div":
+                elem.clear()
+
+    for line in lines:
+        parser.feed(line)
+        yield from events()
+    parser.close()
+    yield from events()
+
+
+# ── SBV (YouTube) ────────────────────────────────────────────────────────────
+
+# H:MM:SS.mmm,H:MM:SS.mmm
+SBV_TIMECODE = re.compile(r"(\d+):(\d{2}):(\d{2})\.(\d{3}),(\d+):(\d{2}):(\d{2})\.(\d{3})$")
+
+
+def iter_sbv(lines: Iterable[str], source_path: str = "") -> Iterator[Cue]:
+    """Parse SBV en flux : ligne de temps « début,fin » puis texte jusqu'à la ligne vide."""
+    meta = _track_meta(source_path)
+    n = 0
+    start_ms = end_ms = 0
+    text_lines: list[str] | None = None
+    for raw_line in lines:
+        line = raw_line.strip().lstrip("\ufeff")
+        if text_lines is not None:
+            if line:
+                text_lines.append(line)
+                continue
+            text_raw = "\n".join(text_lines)
+            yield Cue("", "en", n, start_ms, end_ms, text_raw, _normalize_cue_text(text_raw), meta)
+            n += 1
+            text_lines = None
+            continue
+        m = SBV_TIMECODE.match(line)
+        if m:
+            h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, m.groups())
+            start_ms = ((h1 * 60 + m1) * 60 + s1) * 1000 + ms1
+            end_ms = ((h2 * 60 + m2) * 60 + s2) * 1000 + ms2
+            text_lines = []
+    if text_lines is not None:
+        text_raw = "\n".join(text_lines)
+        yield Cue("", "en", n, start_ms, end_ms, text_raw, _normalize_cue_text(text_raw), meta)
+
+
+SubtitleFormatRegistry.register(SubtitleFormat("srt", (".srt",), iter_srt, native=True))
+SubtitleFormatRegistry.register(
+    SubtitleFormat("vtt", (".vtt",), iter_vtt, lambda head: "WEBVTT" in head[:20], native=True)
+)
+SubtitleFormatRegistry.register(
+    SubtitleFormat("ass", (".ass", ".ssa"), iter_ass, lambda head: bool(_ASS_SECTION.search(head)))
+)
+SubtitleFormatRegistry.register(
+    SubtitleFormat("ttml", (".ttml", ".dfxp"), iter_ttml, lambda head: bool(_TTML_ROOT.search(head)))
+)
+SubtitleFormatRegistry.register(
+    SubtitleFormat("sbv", (".sbv",), iter_sbv, lambda head: bool(SBV_TIMECODE.match(_first_line(head))))
+)
@@ -0,0 +1,395 @@
+"""
+Recalage temporel d'une piste de sous-titres sur une piste de référence (autre langue, autre release).
+
+Transformation affine par morceaux du temps source : chaque segment (à partir de start_ms) applique
+t' = scale·t + offset_ms ; une cue relève du segment de son start_ms (end_ms suit le même segment,
+la durée est seulement mise à l'échelle). Cas usuels : décalage constant, conversion de cadence
+(25 ↔ 23,976 i/s), décalages différents de part et d'autre d'une coupure (générique, recap).
+
+Estimation à partir des statistiques de recouvrement : pour chaque échelle candidate (1 et rapports
+de cadences usuels), vote des écarts entre débuts de cues proches (histogramme, pas de
+VOTE_BIN_MS) ; l'échelle dont le décalage donne le meilleur recouvrement avec la référence est
+gardée puis affinée par moindres carrés sur les paires appariées. Le découpage par morceaux compare
+les décalages locaux de fenêtres de cues et n'est retenu que s'il améliore nettement le recouvrement.
+Application en base : un seul UPDATE (voir db_subtitles.retime_track), puis SRT réécrit.
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+import math
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from statistics import median
+from typing import Any
+
+from howimetyourcorpus.core.subtitles.parsers import cues_to_srt
+
+# Cadences usuelles (i/s) : les rapports deux à deux sont les échelles candidates.
+FRAMERATES = (23.976, 24.0, 25.0, 29.97)
+# Écart max (ms) entre une cue et sa correspondante dans la référence pris en compte au vote.
+DEFAULT_MAX_OFFSET_MS = 60_000
+# Largeur des classes de l'histogramme des écarts.
+VOTE_BIN_MS = 100
+# Écart résiduel (ms) sous lequel deux débuts de cues sont considérés appariés.
+MATCH_TOLERANCE_MS = 400
+# Nombre de cues par fenêtre pour l'estimation des décalages locaux (découpage par morceaux).
+PIECE_CUES = 24
+# Gain de recouvrement minimal pour retenir une transformation plutôt que l'identité (bruit des
+# timecodes), puis un découpage par morceaux plutôt que la transformation globale.
+MIN_GAIN = 0.005
+MIN_PIECEWISE_GAIN = 0.02
+# Recouvrement minimal (ms) pour qu'une cue compte comme alignée (cf. align_cues_by_time).
+OVERLAP_MS_THRESHOLD = 100
+
+
+def _round_ms(value: float) -> int:
+    """Arrondi au ms (demi vers le haut), borné à 0 : même résultat que l'expression SQL de retime_track."""
+    return max(0, math.floor(value + 0.5))
+
+
+@dataclass
+class RetimeSegment:
+    """Morceau de la transformation : t' = scale·t + offset_ms pour les cues commençant à partir de start_ms."""
+
+    start_ms: int = 0
+    scale: float = 1.0
+    offset_ms: float = 0.0
+
+    def map_ms(self, ms: int) -> int:
+        return _round_ms(ms * self.scale + self.offset_ms)
+
+
+@dataclass
+class Retiming:
+    """
+    Transformation d'une piste : segments triés par start_ms (le premier couvre aussi tout ce qui
+    précède le second). reference_lang et les scores (recouvrement avant/après, voir overlap_stats)
+    renseignés par estimate_retiming.
+    """
+
+    segments: list[RetimeSegment] = field(default_factory=lambda: [RetimeSegment()])
+    reference_lang: str = ""
+    score_before: float = 0.0
+    score_after: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.segments:
+            raise ValueError("Retiming sans segment")
+        if any(s.scale <= 0 for s in self.segments):
+            raise ValueError("Échelle de retiming non positive")
+        self.segments.sort(key=lambda s: s.start_ms)
+        self.segments[0].start_ms = 0
+        self._starts = [s.start_ms for s in self.segments]
+
+    @classmethod
+    def shift(cls, offset_ms: float) -> Retiming:
+        """Décalage constant (ms, négatif = plus tôt)."""
+        return cls([RetimeSegment(0, 1.0, float(offset_ms))])
+
+    @classmethod
+    def from_framerate(cls, source_fps: float, target_fps: float, offset_ms: float = 0.0) -> Retiming:
+        """Conversion de cadence : cues minutées à source_fps, vidéo de référence à target_fps."""
+        if source_fps <= 0 or target_fps <= 0:
+            raise ValueError("Cadence non positive")
+        return cls([RetimeSegment(0, source_fps / target_fps, float(offset_ms))])
+
+    @property
+    def kind(self) -> str:
+        """offset | linear | piecewise."""
+        if len(self.segments) > 1:
+            return "piecewise"
+        return "offset" if self.segments[0].scale == 1.0 else "linear"
+
+    @property
+    def is_identity(self) -> bool:
+        return all(s.scale == 1.0 and s.offset_ms == 0 for s in self.segments)
+
+    def segment_for(self, start_ms: int) -> RetimeSegment:
+        return self.segments[max(0, bisect.bisect_right(self._starts, start_ms) - 1)]
+
+    def apply_cue(self, start_ms: int, end_ms: int) -> tuple[int, int]:
+        segment = self.segment_for(start_ms)
+        return segment.map_ms(start_ms), segment.map_ms(end_ms)
+
+    def apply(self, cues: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Copies des cues avec start_ms/end_ms transformés."""
+        result = []
+        for c in cues:
+            start, end = self.apply_cue(int(c.get("start_ms") or 0), int(c.get("end_ms") or 0))
+            result.append({**c, "start_ms": start, "end_ms": end})
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "segments": [asdict(s) for s in self.segments],
+            "reference_lang": self.reference_lang,
+            "score_before": self.score_before,
+            "score_after": self.score_after,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Retiming:
+        return cls(
+            segments=[
+                RetimeSegment(int(s.get("start_ms", 0)), float(s.get("scale", 1.0)), float(s.get("offset_ms", 0.0)))
+                for s in data.get("segments") or [{}]
+            ],
+            reference_lang=data.get("reference_lang", ""),
+            score_before=float(data.get("score_before", 0.0)),
+            score_after=float(data.get("score_after", 0.0)),
+        )
+
+
+# ── Statistiques de recouvrement ────────────────────────────────────────────
+
+
+def _intervals(cues: list[dict[str, Any]]) -> list[tuple[int, int]]:
+    return sorted((int(c.get("start_ms") or 0), int(c.get("end_ms") or 0)) for c in cues)
+
+
+def overlap_stats(
+    reference: list[tuple[int, int]], intervals: list[tuple[int, int]]
+) -> tuple[float, float]:
+    """
+    (part du temps des cues recouverte par leur meilleure cue de référence, part des cues alignées
+    au sens de align_cues_by_time). reference triée par début.
+    """
+    if not reference or not intervals:
+        return 0.0, 0.0
+    ref_starts = [s for s, _ in reference]
+    max_len = max(e - s for s, e in reference)
+    covered = total = aligned = 0
+    for start, end in intervals:
+        best = 0
+        lo = bisect.bisect_left(ref_starts, start - max_len)
+        hi = bisect.bisect_left(ref_starts, end)
+        for r_start, r_end in reference[lo:hi]:
+            overlap = min(end, r_end) - max(start, r_start)
+            if overlap > best:
+                best = overlap
+        covered += best
+        total += max(1, end - start)
+        aligned += best >= OVERLAP_MS_THRESHOLD
+    return covered / total, aligned / len(intervals)
+
+
+# ── Estimation ─────────────────────────────────────────────────────────────
+
+
+def _vote_offset(
+    ref_starts: list[int], starts: list[int], scale: float, max_offset_ms: int
+) -> tuple[float, int] | None:
+    """Décalage le plus voté (médiane des écarts de la classe gagnante et voisines) et son support."""
+    votes: Counter[int] = Counter()
+    deltas: list[float] = []
+    for t in starts:
+        mapped = t * scale
+        lo = bisect.bisect_left(ref_starts, mapped - max_offset_ms)
+        hi = bisect.bisect_right(ref_starts, mapped + max_offset_ms)
+        for r in ref_starts[lo:hi]:
+            delta = r - mapped
+            deltas.append(delta)
+            votes[round(delta / VOTE_BIN_MS)] += 1
+    if not votes:
+        return None
+    peak = max(votes, key=lambda b: (votes[b - 1] + votes[b] + votes[b + 1], votes[b]))
+    near = [d for d in deltas if abs(d - peak * VOTE_BIN_MS) <= 1.5 * VOTE_BIN_MS]
+    return median(near), len(near)
+
+
+def _matched_pairs(
+    ref_starts: list[int], starts: list[int], scale: float, offset: float
+) -> list[tuple[int, int]]:
+    """(début source, début référence) des cues dont le début transformé tombe près d'un début de référence."""
+    pairs = []
+    for t in starts:
+        mapped = t * scale + offset
+        i = bisect.bisect_left(ref_starts, mapped)
+        candidates = ref_starts[max(0, i - 1) : i + 1]
+        if not candidates:
+            continue
+        r = min(candidates, key=lambda x: abs(x - mapped))
+        if abs(r - mapped) <= MATCH_TOLERANCE_MS:
+            pairs.append((t, r))
+    return pairs
+
+
+def _least_squares(pairs: list[tuple[int, int]]) -> tuple[float, float] | None:
+    n = len(pairs)
+    if n < 2:
+        return None
+    mean_t = sum(t for t, _ in pairs) / n
+    mean_r = sum(r for _, r in pairs) / n
+    var = sum((t - mean_t) ** 2 for t, _ in pairs)
+    if var <= 0:
+        return None
+    scale = sum((t - mean_t) * (r - mean_r) for t, r in pairs) / var
+    if scale <= 0:
+        return None
+    return scale, mean_r - scale * mean_t
+
+
+def _candidate_scales() -> list[float]:
+    scales = {1.0}
+    for a in FRAMERATES:
+        for b in FRAMERATES:
+            if a != b:
+                scales.add(a / b)
+    return sorted(scales)
+
+
+def _score(reference: list[tuple[int, int]], intervals: list[tuple[int, int]], retiming: Retiming) -> float:
+    return overlap_stats(reference, [retiming.apply_cue(s, e) for s, e in intervals])[0]
+
+
+def _estimate_linear(
+    reference: list[tuple[int, int]], intervals: list[tuple[int, int]], max_offset_ms: int
+) -> Retiming:
+    ref_starts = [s for s, _ in reference]
+    starts = [s for s, _ in intervals]
+    best: tuple[float, Retiming] | None = None
+    for scale in _candidate_scales():
+        voted = _vote_offset(ref_starts, starts, scale, max_offset_ms)
+        if voted is None:
+            continue
+        candidate = Retiming([RetimeSegment(0, scale, voted[0])])
+        score = _score(reference, intervals, candidate)
+        if best is None or score > best[0]:
+            best = (score, candidate)
+    if best is None:
+        return Retiming()
+    score, retiming = best
+    segment = retiming.segments[0]
+    fitted = _least_squares(_matched_pairs(ref_starts, starts, segment.scale, segment.offset_ms))
+    if fitted is not None:
+        refined = Retiming([RetimeSegment(0, fitted[0], fitted[1])])
+        if _score(reference, intervals, refined) > score + MIN_GAIN / 10:
+            retiming = refined
+    return retiming
+
+
+def _estimate_piecewise(
+    reference: list[tuple[int, int]],
+    intervals: list[tuple[int, int]],
+    linear: Retiming,
+    max_offset_ms: int,
+) -> Retiming | None:
+    """Décalages locaux par fenêtres de PIECE_CUES cues (échelle globale), fenêtres voisines d'écart
+    < MATCH_TOLERANCE_MS regroupées ; coupure placée à la cue qui sépare le mieux les deux décalages."""
+    scale = linear.segments[0].scale
+    ref_starts = [s for s, _ in reference]
+    starts = [s for s, _ in intervals]
+    runs: list[tuple[int, float]] = []  # (indice de la première cue, décalage du morceau)
+    for i in range(0, len(starts), PIECE_CUES):
+        window = starts[i : i + PIECE_CUES]
+        voted = _vote_offset(ref_starts, window, scale, max_offset_ms)
+        if voted is None or voted[1] < len(window) / 3:
+            continue
+        if runs and abs(voted[0] - runs[-1][1]) <= MATCH_TOLERANCE_MS:
+            continue
+        runs.append((i, voted[0]))
+    if len(runs) < 2:
+        return None
+
+    bounds = [0]
+    for (prev_i, prev_off), (i, off) in zip(runs, runs[1:]):
+        lo, hi = max(bounds[-1] + 1, prev_i), min(len(starts), i + PIECE_CUES)
+        fits_prev = [bool(_matched_pairs(ref_starts, [t], scale, prev_off)) for t in starts[lo:hi]]
+        fits_next = [bool(_matched_pairs(ref_starts, [t], scale, off)) for t in starts[lo:hi]]
+        # Coupure c (lo ≤ c ≤ hi) : cues [lo, c) au morceau précédent, [c, hi) au suivant.
+        best_cut, best_misses = lo, None
+        misses = sum(not f for f in fits_next)
+        for c in range(lo, hi + 1):
+            if best_misses is None or misses < best_misses:
+                best_cut, best_misses = c, misses
+            if c < hi:
+                misses += (not fits_prev[c - lo]) - (not fits_next[c - lo])
+        bounds.append(best_cut)
+    bounds.append(len(starts))
+
+    segments = []
+    for (_, voted_offset), lo, hi in zip(runs, bounds, bounds[1:]):
+        if lo >= hi:
+            continue
+        pairs = _matched_pairs(ref_starts, starts[lo:hi], scale, voted_offset)
+        offset = median(r - t * scale for t, r in pairs) if pairs else voted_offset
+        if segments and abs(offset - segments[-1].offset_ms) <= MATCH_TOLERANCE_MS:
+            continue
+        segments.append(RetimeSegment(starts[lo], scale, offset))
+    if len(segments) < 2:
+        return None
+    return Retiming(segments)
+
+
+def estimate_retiming(
+    reference_cues: list[dict[str, Any]],
+    cues: list[dict[str, Any]],
+    *,
+    reference_lang: str = "",
+    piecewise: bool = True,
+    max_offset_ms: int = DEFAULT_MAX_OFFSET_MS,
+) -> Retiming:
+    """
+    Meilleure transformation de `cues` vers le temps de `reference_cues` (dicts start_ms/end_ms) :
+    linéaire (décalage + cadence), ou par morceaux si piecewise et gain ≥ MIN_PIECEWISE_GAIN.
+    Identité si rien ne gagne au moins MIN_GAIN de recouvrement (pistes déjà synchrones).
+    """
+    reference = _intervals(reference_cues)
+    intervals = _intervals(cues)
+    identity = Retiming(reference_lang=reference_lang)
+    before = overlap_stats(reference, intervals)[0]
+    identity.score_before = identity.score_after = round(before, 4)
+    if not reference or not intervals:
+        return identity
+
+    best, best_score = identity, before
+    linear = _estimate_linear(reference, intervals, max_offset_ms)
+    linear_score = _score(reference, intervals, linear)
+    if linear_score >= best_score + MIN_GAIN:
+        best, best_score = linear, linear_score
+    if piecewise and not linear.is_identity:
+        pieces = _estimate_piecewise(reference, intervals, linear, max_offset_ms)
+        if pieces is not None:
+            pieces_score = _score(reference, intervals, pieces)
+            if pieces_score >= best_score + MIN_PIECEWISE_GAIN:
+                best, best_score = pieces, pieces_score
+    best.reference_lang = reference_lang
+    best.score_before = round(before, 4)
+    best.score_after = round(best_score, 4)
+    return best
+
+
+# ── Application à une piste du projet ───────────────────────────────────────
+
+
+def retime_subtitle_track(
+    store: Any,
+    db: Any,
+    episode_id: str,
+    lang: str,
+    retiming: Retiming,
+    *,
+    rewrite_srt: bool = True,
+) -> int:
+    """
+    Applique `retiming` à la piste episode_id:lang : timecodes mis à jour en un UPDATE et
+    transformation ajoutée à l'historique meta_json["retiming"] de la piste (même transaction),
+    puis fichier SRT réécrit depuis la DB. Retourne le nombre de cues modifiées.
+    """
+    record = {
+        **retiming.to_dict(),
+        "applied_at": datetime.datetime.now(datetime.UTC).isoformat().replace("+00:00", "Z"),
+    }
+    count = db.retime_track(
+        f"{episode_id}:{lang}",
+        [(s.start_ms, s.scale, s.offset_ms) for s in retiming.segments],
+        record,
+    )
+    if rewrite_srt and count > 0:
+        cues = db.get_cues_for_episode_lang(episode_id, lang)
+        if cues:
+            store.save_episode_subtitle_content(episode_id, lang, cues_to_srt(cues), "srt")
+    return count
@@ -9,6 +9,8 @@ from typing import Any, Optional
 
 import httpx
 
+from howimetyourcorpus.core.utils.tracing import trace_span
+
 logger = logging.getLogger(__name__)
 
 # Dernière requête (monotonic) pour rate limit global entre appels get_html
@@ -106,7 +108,9 @@ def get_html(
         try:
             _last_get_html_time = time.monotonic()
             with httpx.Client(timeout=timeout_s, follow_redirects=True) as client:
-                resp = client.get(url, headers=headers or None)
+                with trace_span("http_fetch", "http", url=url) as sp:
+                    resp = client.get(url, headers=headers or None)
+                    sp.bytes = len(resp.content)
                 
                 # Gestion spécifique 429 (Too Many Requests)
                 if resp.status_code == 429:
@@ -203,7 +207,9 @@ def get_json(
         try:
             _last_get_html_time = time.monotonic()
             with httpx.Client(timeout=timeout_s, follow_redirects=True) as client:
-                resp = client.get(url, headers=headers or None)
+                with trace_span("http_fetch", "http", url=url) as sp:
+                    resp = client.get(url, headers=headers or None)
+                    sp.bytes = len(resp.content)
                 
                 # Gestion spécifique 429 (Too Many Requests)
                 if resp.status_code == 429:
@@ -0,0 +1,203 @@
+"""
+Traçage du pipeline : spans (temps mur, temps CPU, nombre d'items, octets) par étape et
+sous-opération (fetch HTTP, parse, normalize, écriture DB, mise à jour FTS, similarité).
+
+Le traceur actif est porté par une ContextVar : `trace_span()` ne coûte presque rien quand
+aucun traceur n'est actif. Export vers le répertoire runs/ du projet : trace Chrome
+(chrome://tracing, Perfetto), CSV à plat et résumé JSON (servi par GET /runs/traces).
+"""
+
+from __future__ import annotations
+
+import contextvars
+import csv
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+from howimetyourcorpus.core.constants import RUNS_DIR_NAME
+
+TRACE_SUFFIX   = ".trace.json"
+CSV_SUFFIX     = ".spans.csv"
+SUMMARY_SUFFIX = ".summary.json"
+
+CSV_FIELDS = ["name", "category", "episode_id", "start_us", "wall_ms", "cpu_ms", "items", "bytes", "pid", "tid"]
+
+
+@dataclass
+class Span:
+    """Une mesure ; `items` et `bytes` sont renseignés par le code instrumenté."""
+
+    name: str
+    category: str
+    episode_id: str = ""
+    start_us: int = 0
+    """Début (epoch, µs) : comparable entre processus."""
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    """Temps CPU du thread courant (hors attente réseau / disque)."""
+    items: int = 0
+    bytes: int = 0
+    pid: int = 0
+    tid: int = 0
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """Collecteur thread-safe de spans."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.spans: list[Span] = []
+
+    @contextmanager
+    def span(self, name: str, category: str = "step", *, episode_id: str = "", **args: Any) -> Iterator[Span]:
+        sp = Span(name, category, episode_id, args=dict(args))
+        sp.start_us = time.time_ns() // 1000
+        wall0 = time.perf_counter_ns()
+        cpu0 = time.thread_time_ns()
+        try:
+            yield sp
+        finally:
+            sp.wall_ms = (time.perf_counter_ns() - wall0) / 1e6
+            sp.cpu_ms = (time.thread_time_ns() - cpu0) / 1e6
+            sp.pid = os.getpid()
+            sp.tid = threading.get_ident()
+            with self._lock:
+                self.spans.append(sp)
+
+    def add_spans(self, spans: list[dict[str, Any]]) -> None:
+        """Fusionne des spans sérialisés (ex. collectés dans un sous-processus)."""
+        with self._lock:
+            self.spans.extend(Span(**s) for s in spans)
+
+    def export_spans(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [asdict(s) for s in self.spans]
+
+    def summary(self) -> dict[str, Any]:
+        """Agrégat par (catégorie, nom), trié par temps mur décroissant."""
+        rows: dict[tuple[str, str], dict[str, Any]] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for s in spans:
+            row = rows.setdefault((s.category, s.name), {
+                "category": s.category, "name": s.name, "count": 0,
+                "wall_ms": 0.0, "cpu_ms": 0.0, "items": 0, "bytes": 0,
+            })
+            row["count"] += 1
+            row["wall_ms"] += s.wall_ms
+            row["cpu_ms"] += s.cpu_ms
+            row["items"] += s.items
+            row["bytes"] += s.bytes
+        ordered = sorted(rows.values(), key=lambda r: r["wall_ms"], reverse=True)
+        for row in ordered:
+            row["wall_ms"] = round(row["wall_ms"], 3)
+            row["cpu_ms"] = round(row["cpu_ms"], 3)
+        total_wall = 0.0
+        if spans:
+            start = min(s.start_us for s in spans)
+            end = max(s.start_us + s.wall_ms * 1000 for s in spans)
+            total_wall = (end - start) / 1000
+        return {"spans": len(spans), "wall_ms": round(total_wall, 3), "operations": ordered}
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Format trace-event (événements complets « X », durées en µs)."""
+        with self._lock:
+            spans = list(self.spans)
+        events = [
+            {
+                "name": s.name,
+                "cat": s.category,
+                "ph": "X",
+                "ts": s.start_us,
+                "dur": round(s.wall_ms * 1000),
+                "pid": s.pid,
+                "tid": s.tid,
+                "args": {
+                    "episode_id": s.episode_id, "cpu_ms": round(s.cpu_ms, 3),
+                    "items": s.items, "bytes": s.bytes, **s.args,
+                },
+            }
+            for s in spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, root_dir: Path, run_id: str) -> dict[str, Path]:
+        """Écrit trace Chrome, CSV et résumé dans runs/ ; retourne les chemins."""
+        runs_dir = root_dir / RUNS_DIR_NAME
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        paths = {
+            "trace":   runs_dir / f"{run_id}{TRACE_SUFFIX}",
+            "csv":     runs_dir / f"{run_id}{CSV_SUFFIX}",
+            "summary": runs_dir / f"{run_id}{SUMMARY_SUFFIX}",
+        }
+        paths["trace"].write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        with paths["csv"].open("w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for row in self.export_spans():
+                writer.writerow({**row, "wall_ms": round(row["wall_ms"], 3), "cpu_ms": round(row["cpu_ms"], 3)})
+        paths["summary"].write_text(
+            json.dumps({"run_id": run_id, **self.summary()}, ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        return paths
+
+
+_current: contextvars.ContextVar[Tracer | None] = contextvars.ContextVar("himyc_tracer", default=None)
+
+
+def current_tracer() -> Tracer | None:
+    return _current.get()
+
+
+@contextmanager
+def activate(tracer: Tracer | None) -> Iterator[Tracer | None]:
+    """Rend `tracer` actif dans le contexte courant (None : désactive)."""
+    token = _current.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current.reset(token)
+
+
+class _NullSpan:
+    """Span factice quand aucun traceur n'est actif (les affectations sont ignorées)."""
+
+    __slots__ = ("items", "bytes", "args")
+
+    def __init__(self) -> None:
+        self.items = 0
+        self.bytes = 0
+        self.args: dict[str, Any] = {}
+
+
+@contextmanager
+def trace_span(name: str, category: str = "step", *, episode_id: str = "", **args: Any) -> Iterator[Any]:
+    """Span sur le traceur actif ; no-op si aucun."""
+    tracer = _current.get()
+    if tracer is None:
+        yield _NullSpan()
+        return
+    with tracer.span(name, category, episode_id=episode_id, **args) as sp:
+        yield sp
+
+
+def load_run_summaries(root_dir: Path) -> list[dict[str, Any]]:
+    """Résumés des traces exportées dans runs/ (plus récentes d'abord)."""
+    runs_dir = root_dir / RUNS_DIR_NAME
+    if not runs_dir.is_dir():
+        return []
+    out = []
+    for path in sorted(runs_dir.glob(f"*{SUMMARY_SUFFIX}"), key=lambda p: p.stat().st_mtime, reverse=True):
+        try:
+            out.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            continue
+    return out
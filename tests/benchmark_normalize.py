@@ -0,0 +1,125 @@
+"""Benchmark de la normalisation : règles interprétées, programme compilé, moteur document.
+
+Simule une saison complète (22 épisodes de transcript brut avec césures, doubles espaces,
+guillemets et règles regex personnalisées) et compare le temps par épisode
+(TransformStats.duration_ms) : moteur ligne avec règles réinterprétées à chaque ligne,
+moteur ligne avec profil compilé, moteur document (passes regex sur le texte entier).
+Compare ensuite les niveaux de debug (full / counters / off) sur un lot de 200 épisodes :
+temps total et pic mémoire (tracemalloc) des résultats conservés comme par un lot.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+from unittest import mock
+
+from howimetyourcorpus.core.normalize.profiles import NormalizationProfile
+from howimetyourcorpus.core.normalize.rules import DEBUG_LEVELS
+
+EPISODES = 22
+BATCH_EPISODES = 200
+LINES_PER_EPISODE = 1200
+
+WORDS = ["kids", "dude", "legendary", "wait", "for", "it", "Ted", "Robin", "the", "bar", "suit", "up"]
+
+
+def build_season(seed: int = 42) -> list[str]:
+    """Transcripts bruts synthétiques d'une saison."""
+    rng = random.Random(seed)
+    episodes = []
+    for _ in range(EPISODES):
+        lines = []
+        for i in range(LINES_PER_EPISODE):
+            if i % 9 == 8:
+                lines.append("")
+                continue
+            words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 12)))
+            speaker = rng.choice(["Ted", "Marshall", "Lily", "Barney"])
+            tail = rng.choice(["!", "?", ".", "", ",", ' "yes"'])
+            lines.append(f"  {speaker}:  {words}{tail} ")
+        episodes.append("\n".join(lines))
+    return episodes
+
+
+def _profile() -> NormalizationProfile:
+    return NormalizationProfile(
+        id="bench_fr_v1",
+        fix_french_punctuation=True,
+        normalize_quotes=True,
+        case_transform="Sentence case",
+        custom_regex_rules=[(r"\bdude\b", "mec"), (r"\blegendary\b", "légendaire"), (r"\bsuit up\b", "costard")],
+    )
+
+
+def _interpreted_program(profile: NormalizationProfile):
+    """Programme équivalent qui réinterprète le profil à chaque ligne (comportement historique)."""
+
+    class _Interpreted:
+        invalid_rules = ()
+
+        @staticmethod
+        def apply_line(line: str) -> tuple[str, int, int]:
+            result, counters = profile._apply_line_rules(line)
+            return result, counters["punctuation"], counters["regex"]
+
+    return _Interpreted()
+
+
+def run_season(profile: NormalizationProfile, season: list[str], engine: str) -> tuple[float, int]:
+    """Retourne (durée totale en s, somme des TransformStats.duration_ms)."""
+    start = time.perf_counter()
+    total_ms = 0
+    for raw in season:
+        _clean, stats, _debug = profile.apply(raw, engine=engine)
+        total_ms += stats.duration_ms
+    return time.perf_counter() - start, total_ms
+
+
+def _report(label: str, seconds: float, total_ms: int, reference: float) -> None:
+    gain = reference / seconds if seconds > 0 else 0
+    print(f"  {label:<22}: {seconds * 1000:7.1f} ms ({total_ms / EPISODES:5.1f} ms/episode)  x{gain:.2f}")
+
+
+def run_debug_levels(profile: NormalizationProfile, batch: list[str]) -> None:
+    """Lot de BATCH_EPISODES épisodes par niveau de debug : temps et pic mémoire des résultats gardés."""
+    for level in reversed(DEBUG_LEVELS):
+        tracemalloc.start()
+        start = time.perf_counter()
+        results = [profile.apply(raw, debug_level=level) for raw in batch]
+        seconds = time.perf_counter() - start
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        debug_keys = sum(len(debug) for _clean, _stats, debug in results)
+        print(f"  debug={level:<9}: {seconds * 1000:7.1f} ms  pic {peak / 1e6:6.1f} Mo  ({debug_keys} cles debug)")
+        del results
+
+
+def run_benchmarks() -> None:
+    season = build_season()
+    print("=" * 60)
+    print(f"BENCHMARK NORMALISATION - {EPISODES} episodes x {LINES_PER_EPISODE} lignes")
+    print("=" * 60)
+    for profile in (NormalizationProfile(id="bench_en_v1"), _profile()):
+        print(f"Profil {profile.id}")
+        print("-" * 60)
+        with mock.patch(
+            "howimetyourcorpus.core.normalize.profiles.compile_profile", side_effect=_interpreted_program
+        ):
+            t_ref, ms_ref = run_season(profile, season, "line")
+        _report("Regles interpretees", t_ref, ms_ref, t_ref)
+        t_line, ms_line = run_season(profile, season, "line")
+        _report("Programme compile", t_line, ms_line, t_ref)
+        t_doc, ms_doc = run_season(profile, season, "document")
+        _report("Moteur document", t_doc, ms_doc, t_ref)
+        print()
+    print(f"NIVEAUX DE DEBUG - lot de {BATCH_EPISODES} episodes (moteur document)")
+    print("-" * 60)
+    batch = (season * (BATCH_EPISODES // EPISODES + 1))[:BATCH_EPISODES]
+    run_debug_levels(_profile(), batch)
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_benchmarks()
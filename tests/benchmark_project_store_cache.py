@@ -0,0 +1,87 @@
+"""Benchmark du cache des fichiers annexes : lecture sans cache vs load_* / get_* servis par le cache.
+
+Projet sans corpus.db (personnages en JSON) : index série de EPISODES épisodes, statuts de
+préparation (3 sources par épisode), ASSIGNMENTS assignations personnage. « Sans cache » oublie le
+fichier avant chaque appel (relecture + parse, comportement d'avant le cache) ; les load_* servis par
+le cache doivent rester plus rapides, y compris la fabrication des objets neufs rendus à l'appelant.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable
+
+from howimetyourcorpus.core.storage.project_store import ProjectStore
+from howimetyourcorpus.core.storage.project_store_cache import SIDECAR_CACHE
+
+from conftest import create_project
+
+EPISODES = 1000
+ASSIGNMENTS = 20_000
+REPEAT = 20
+
+
+def _episode_ids() -> list[str]:
+    return [f"S{1 + i // 25:02d}E{1 + i % 25:02d}" for i in range(EPISODES)]
+
+
+def build_project(root: Path) -> ProjectStore:
+    episode_ids = _episode_ids()
+    store, _ = create_project(root, episode_ids, with_db=False)
+    store.save_episode_prep_status(
+        {eid: {"transcript": "edited", "srt_en": "verified", "srt_fr": "raw"} for eid in episode_ids}
+    )
+    store.save_character_assignments(
+        [
+            {
+                "episode_id": episode_ids[i % EPISODES],
+                "source_type": "cue",
+                "source_id": f"{episode_ids[i % EPISODES]}:en:{i}",
+                "character_id": ("ted", "robin", "barney", "lily", "marshall")[i % 5],
+            }
+            for i in range(ASSIGNMENTS)
+        ]
+    )
+    return store
+
+
+def _best_ms(fn: Callable[[], object], *, forget: Path | None = None) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        if forget is not None:
+            SIDECAR_CACHE.invalidate(forget)
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run_benchmarks() -> None:
+    print("=" * 60)
+    print(f"BENCHMARK CACHE ANNEXES - {EPISODES} épisodes, {ASSIGNMENTS} assignations")
+    print("=" * 60)
+    with TemporaryDirectory() as tmp:
+        store = build_project(Path(tmp) / "project")
+        root = Path(store.root_dir)
+        cases = [
+            ("load_series_index", "series_index.json", store.load_series_index),
+            ("load_episode_prep_status", store.EPISODE_PREP_STATUS_JSON, store.load_episode_prep_status),
+            ("load_character_assignments", store.CHARACTER_ASSIGNMENTS_JSON, store.load_character_assignments),
+            (
+                "get_episode_prep_status",
+                store.EPISODE_PREP_STATUS_JSON,
+                lambda: store.get_episode_prep_status("S01E01", "transcript"),
+            ),
+        ]
+        for label, filename, call in cases:
+            t_before = _best_ms(call, forget=root / filename)
+            call()  # remplit le cache
+            t_after = _best_ms(call)
+            print(f"  {label:<28}: sans cache {t_before:8.3f} ms | cache {t_after:8.3f} ms  x{t_before / t_after:.2f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_benchmarks()
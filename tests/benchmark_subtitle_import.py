@@ -0,0 +1,98 @@
+"""Benchmark de l'import en masse de sous-titres : fichier par fichier vs lot (process pool, FTS différé).
+
+Reprend le scénario de test_subtitle_batch_parse à l'échelle : un dossier de saisons complètes
+(22 épisodes × 3 langues, noms S01E01_en.srt, Show - 1x01 - Title.fr.srt, S01E01/it.vtt) importé
+dans un projet vierge. Compare ImportSubtitlesStep en séquence (un aller-retour DB par piste,
+triggers FTS ligne à ligne) et import_subtitles_bulk avec 1 puis N processus.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from howimetyourcorpus.core.pipeline.tasks import ImportSubtitlesStep
+from howimetyourcorpus.core.subtitles.bulk_import import discover_subtitle_files, import_subtitles_bulk
+
+from conftest import create_project
+
+SEASONS = 3
+EPISODES = 22
+CUES_PER_TRACK = 700
+
+WORDS = ["kids", "dude", "legendary", "wait", "for", "it", "Ted", "Robin", "the", "bar", "suit", "up"]
+
+
+def _timecode(ms: int, sep: str) -> str:
+    return f"{ms // 3_600_000:02d}:{ms // 60_000 % 60:02d}:{ms // 1000 % 60:02d}{sep}{ms % 1000:03d}"
+
+
+def _track(rng: random.Random, vtt: bool) -> str:
+    sep = "." if vtt else ","
+    blocks = ["WEBVTT\n"] if vtt else []
+    for n in range(1, CUES_PER_TRACK + 1):
+        start = n * 2500
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 10)))
+        head = "" if vtt else f"{n}\n"
+        blocks.append(f"{head}{_timecode(start, sep)} --> {_timecode(start + 2000, sep)}\n{text}\n")
+    return "\n".join(blocks)
+
+
+def build_folder(folder: Path, seed: int = 42) -> None:
+    """Sous-titres synthétiques : SEASONS saisons, trois conventions de nommage."""
+    rng = random.Random(seed)
+    for season in range(1, SEASONS + 1):
+        for episode in range(1, EPISODES + 1):
+            eid = f"S{season:02d}E{episode:02d}"
+            (folder / f"{eid}_en.srt").write_text(_track(rng, False), encoding="utf-8")
+            (folder / f"Show - {season}x{episode:02d} - Title.fr.srt").write_bytes(_track(rng, False).encode("cp1252"))
+            (folder / eid).mkdir()
+            (folder / eid / "it.vtt").write_text(_track(rng, True), encoding="utf-8")
+
+
+def _episode_ids() -> list[str]:
+    return [f"S{s:02d}E{e:02d}" for s in range(1, SEASONS + 1) for e in range(1, EPISODES + 1)]
+
+
+def run_sequential(root: Path, folder: Path) -> float:
+    store, db = create_project(root, _episode_ids())
+    start = time.perf_counter()
+    for f in discover_subtitle_files(folder):
+        result = ImportSubtitlesStep(f.episode_id, f.lang, f.path).run({"store": store, "db": db})
+        assert result.success, result.message
+    return time.perf_counter() - start
+
+
+def run_bulk(root: Path, folder: Path, workers: int) -> float:
+    store, db = create_project(root, _episode_ids())
+    start = time.perf_counter()
+    report = import_subtitles_bulk(store, db, discover_subtitle_files(folder), max_workers=workers)
+    assert len(report.imported) == SEASONS * EPISODES * 3 and not report.failed
+    return time.perf_counter() - start
+
+
+def run_benchmarks() -> None:
+    workers = os.cpu_count() or 1
+    tracks = SEASONS * EPISODES * 3
+    print("=" * 60)
+    print(f"BENCHMARK IMPORT SOUS-TITRES - {tracks} pistes x {CUES_PER_TRACK} cues")
+    print("=" * 60)
+    with TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        folder = tmp_path / "subs"
+        folder.mkdir()
+        build_folder(folder)
+        t_ref = run_sequential(tmp_path / "sequential", folder)
+        print(f"  {'ImportSubtitlesStep x' + str(tracks):<26}: {t_ref * 1000:8.1f} ms")
+        runs = [("Lot, 1 processus", 1)] + ([(f"Lot, {workers} processus", workers)] if workers > 1 else [])
+        for label, n in runs:
+            seconds = run_bulk(tmp_path / f"bulk_{n}", folder, n)
+            print(f"  {label:<26}: {seconds * 1000:8.1f} ms  x{t_ref / seconds:.2f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_benchmarks()
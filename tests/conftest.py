@@ -1,6 +1,13 @@
 """Fixtures pytest communes."""
-import pytest
+import re
 from pathlib import Path
+from typing import Callable, Iterable
+
+import pytest
+
+from howimetyourcorpus.core.models import EpisodeRef, ProjectConfig, SeriesIndex
+from howimetyourcorpus.core.storage.db import CorpusDB
+from howimetyourcorpus.core.storage.project_store import ProjectStore
 
 # Répertoire des fixtures
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
@@ -9,3 +16,41 @@ FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
 @pytest.fixture
 def fixtures_dir():
     return FIXTURES_DIR
+
+
+def create_project(
+    root: Path,
+    episode_ids: Iterable[str] = (),
+    *,
+    with_db: bool = True,
+) -> tuple[ProjectStore, CorpusDB | None]:
+    """
+    Projet vierge dans `root` : init_project + ProjectStore (+ corpus.db initialisée si with_db).
+    Les épisodes "SxxEyy" de episode_ids sont inscrits dans l'index série (et en base).
+    Utilisable hors pytest (benchmarks).
+    """
+    ProjectStore.init_project(ProjectConfig(project_name="test", root_dir=root, source_id="subslikescript", series_url=""))
+    store = ProjectStore(root)
+    refs = []
+    for eid in episode_ids:
+        m = re.fullmatch(r"S(\d+)E(\d+)", eid)
+        refs.append(EpisodeRef(episode_id=eid, season=int(m.group(1)), episode=int(m.group(2)), title="", url=""))
+    if refs:
+        store.save_series_index(SeriesIndex(series_title="Show", series_url="", episodes=refs))
+    db = None
+    if with_db:
+        db = CorpusDB(store.get_db_path())
+        db.init()
+        if refs:
+            db.upsert_episodes_batch(refs)
+    return store, db
+
+
+@pytest.fixture
+def make_project(tmp_path: Path) -> Callable[..., tuple[ProjectStore, CorpusDB | None]]:
+    """Fabrique de projets de test dans tmp_path / "project" (voir create_project)."""
+
+    def _make(episode_ids: Iterable[str] = (), *, with_db: bool = True) -> tuple[ProjectStore, CorpusDB | None]:
+        return create_project(tmp_path / "project", episode_ids, with_db=with_db)
+
+    return _make
@@ -25,3 +25,155 @@ def test_tvmaze_fetch_episode_html_accepts_pipeline_kwargs() -> None:
             rate_limit_s=1.0,
             cache_dir=Path("."),
         )
+
+
+SHOW_WITH_EPISODES = {
+    "id": 171,
+    "name": "How I Met Your Mother",
+    "_embedded": {
+        "episodes": [
+            {"season": 1, "number": 1, "name": "Pilot", "url": "https://www.tvmaze.com/episodes/1"},
+            {"season": 1, "number": 2, "name": "Purple Giraffe", "url": "https://www.tvmaze.com/episodes/2"},
+            {"season": 1, "number": None, "name": "Special"},
+        ]
+    },
+}
+
+
+@pytest.fixture
+def fake_get_json(monkeypatch):
+    """Remplace get_json (réseau) et enregistre les URLs demandées ; vide le cache mémoire partagé."""
+    from howimetyourcorpus.core.adapters.tvmaze import get_metadata_cache
+
+    get_metadata_cache().clear()
+    calls: list[str] = []
+    responses: dict[str, object] = {}
+
+    def _get_json(url: str, **_kwargs):
+        calls.append(url)
+        for prefix, payload in responses.items():
+            if prefix in url:
+                return payload
+        raise AssertionError(f"URL inattendue: {url}")
+
+    monkeypatch.setattr("howimetyourcorpus.core.utils.http.get_json", _get_json)
+    yield calls, responses
+    get_metadata_cache().clear()
+
+
+def test_tvmaze_discover_uses_embedded_episodes_in_one_request(fake_get_json) -> None:
+    calls, responses = fake_get_json
+    responses["/singlesearch/shows"] = SHOW_WITH_EPISODES
+
+    index = TvmazeAdapter().discover_series("How I Met Your Mother")
+
+    assert len(calls) == 1
+    assert "embed=episodes" in calls[0]
+    assert [e.episode_id for e in index.episodes] == ["S01E01", "S01E02"]
+    assert index.series_url == "https://www.tvmaze.com/shows/171"
+
+
+def test_tvmaze_discover_falls_back_to_episodes_endpoint(fake_get_json) -> None:
+    calls, responses = fake_get_json
+    responses["/singlesearch/shows"] = {"id": 171, "name": "HIMYM"}
+    responses["/shows/171/episodes"] = SHOW_WITH_EPISODES["_embedded"]["episodes"]
+
+    index = TvmazeAdapter().discover_series("HIMYM")
+
+    assert len(calls) == 2
+    assert len(index.episodes) == 2
+
+
+def test_tvmaze_repeated_discover_served_from_memory(fake_get_json) -> None:
+    import time
+
+    calls, responses = fake_get_json
+    responses["/singlesearch/shows"] = SHOW_WITH_EPISODES
+    TvmazeAdapter().discover_series("How I Met Your Mother")
+
+    t0 = time.perf_counter()
+    index = TvmazeAdapter().discover_series("  how i met your MOTHER ")
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+
+    assert len(calls) == 1
+    assert elapsed_ms < 50
+    assert index.series_title == "How I Met Your Mother"
+
+
+def test_tvmaze_disk_cache_survives_process_memory(fake_get_json, tmp_path: Path) -> None:
+    from howimetyourcorpus.core.adapters.tvmaze import get_metadata_cache
+
+    calls, responses = fake_get_json
+    responses["/singlesearch/shows"] = SHOW_WITH_EPISODES
+    TvmazeAdapter().discover_series("How I Met Your Mother", cache_dir=tmp_path)
+    assert (tmp_path / "tvmaze" / "shows" / "171.json").exists()
+    get_metadata_cache().clear()
+
+    index = TvmazeAdapter().discover_series("How I Met Your Mother", cache_dir=tmp_path)
+
+    assert len(calls) == 1
+    assert len(index.episodes) == 2
+
+    TvmazeAdapter().discover_series("How I Met Your Mother", cache_dir=tmp_path, refresh=True)
+    assert len(calls) == 2
+
+
+def test_fetch_series_index_step_force_refreshes_tvmaze(fake_get_json, make_project) -> None:
+    from howimetyourcorpus.core.models import ProjectConfig
+    from howimetyourcorpus.core.pipeline.tasks import FetchSeriesIndexStep
+
+    calls, responses = fake_get_json
+    responses["/singlesearch/shows"] = SHOW_WITH_EPISODES
+    store, db = make_project()
+    config = ProjectConfig(
+        project_name="test", root_dir=store.root_dir, source_id="tvmaze", series_url="How I Met Your Mother", rate_limit_s=0
+    )
+    context = {"config": config, "store": store, "db": db}
+
+    assert FetchSeriesIndexStep("How I Met Your Mother").run(context).success
+    assert FetchSeriesIndexStep("How I Met Your Mother").run(context).success
+    assert len(calls) == 1
+
+    assert FetchSeriesIndexStep("How I Met Your Mother").run(context, force=True).success
+    assert len(calls) == 2
+
+
+def test_tvmaze_concurrent_puts_keep_every_search_name(tmp_path: Path) -> None:
+    import json
+    import threading
+
+    from howimetyourcorpus.core.adapters.tvmaze import TvmazeMetadataCache
+
+    cache = TvmazeMetadataCache()
+    threads = [
+        threading.Thread(target=cache.put, args=(f"Show {i}", {"id": i, "name": f"Show {i}"}, tmp_path))
+        for i in range(16)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    disk = tmp_path / "tvmaze"
+    names = json.loads((disk / "search_index.json").read_text(encoding="utf-8"))
+    assert names == {f"show {i}": i for i in range(16)}
+    assert not list(disk.rglob("*.tmp"))
+
+
+def test_api_tvmaze_discover_shares_cache(fake_get_json, monkeypatch, tmp_path: Path) -> None:
+    from fastapi.testclient import TestClient
+
+    from howimetyourcorpus.api.server import app
+
+    calls, responses = fake_get_json
+    responses["/singlesearch/shows"] = SHOW_WITH_EPISODES
+    monkeypatch.setenv("HIMYC_PROJECT_PATH", str(tmp_path))
+    client = TestClient(app)
+
+    first = client.post("/web/tvmaze/discover", json={"series_name": "How I Met Your Mother"})
+    second = client.post("/web/tvmaze/discover", json={"series_name": "How I Met Your Mother"})
+
+    assert first.status_code == 200 and second.status_code == 200
+    assert second.json()["episode_count"] == 2
+    assert len(calls) == 1
+    assert (tmp_path / ".cache" / "tvmaze" / "search_index.json").exists()
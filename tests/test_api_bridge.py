@@ -401,13 +401,13 @@ def test_alignment_runs_empty(tmp_path):
 
 
 def test_jobs_persistence(tmp_path):
-    """Les jobs sont persistés dans jobs.json après création."""
+    """Les jobs sont persistés dans jobs.db après création."""
     os.environ["HIMYC_PROJECT_PATH"] = str(tmp_path)
     try:
         client.post(
             "/jobs",
             json={"job_type": "normalize_srt", "episode_id": "S01E01", "source_key": "srt_en"},
         )
-        assert (tmp_path / "jobs.json").exists()
+        assert (tmp_path / "jobs.db").exists()
     finally:
         del os.environ["HIMYC_PROJECT_PATH"]
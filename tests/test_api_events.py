@@ -0,0 +1,127 @@
+"""Tests du flux d'événements des jobs (diffuseur borné + endpoint SSE GET /jobs/events)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from howimetyourcorpus.api.events import EVENT_JOB, EVENT_PROGRESS, EventBroadcaster
+from howimetyourcorpus.api.jobs import LANE_ALIGN, RUNNING, JobStore, get_job_store
+from howimetyourcorpus.api.server import app, job_events
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.split("\n\n"):
+        lines = [line for line in block.splitlines() if line and not line.startswith(":")]
+        if not lines:
+            continue
+        name = next(line[len("event: "):] for line in lines if line.startswith("event: "))
+        data = next(line[len("data: "):] for line in lines if line.startswith("data: "))
+        events.append((name, json.loads(data)))
+    return events
+
+
+def test_slow_subscriber_drops_oldest_without_blocking():
+    broadcaster = EventBroadcaster()
+    sub = broadcaster.subscribe(maxsize=2)
+
+    for i in range(5):
+        broadcaster.publish(EVENT_PROGRESS, {"i": i})
+
+    assert sub.dropped == 3
+    assert [sub.get(0)["data"]["i"], sub.get(0)["data"]["i"]] == [3, 4]
+    assert sub.get(0) is None
+    broadcaster.unsubscribe(sub)
+    assert broadcaster.subscriber_count() == 0
+
+
+def test_get_async_is_woken_by_publisher_thread():
+    broadcaster = EventBroadcaster()
+    sub = broadcaster.subscribe()
+
+    async def scenario() -> tuple[dict | None, float]:
+        assert await sub.get_async(0.05) is None
+        threading.Timer(0.1, broadcaster.publish, args=(EVENT_JOB, {"status": "done"})).start()
+        t0 = time.monotonic()
+        event = await sub.get_async(10)
+        return event, time.monotonic() - t0
+
+    event, elapsed = asyncio.run(scenario())
+
+    assert event == {"event": EVENT_JOB, "data": {"status": "done"}}
+    assert elapsed < 5
+
+
+def test_sse_stream_stops_when_client_disconnects(tmp_path: Path):
+    class _Request:
+        def __init__(self) -> None:
+            self.checks = 0
+
+        async def is_disconnected(self) -> bool:
+            self.checks += 1
+            return self.checks > 1
+
+    store = get_job_store(tmp_path)
+    request = _Request()
+
+    async def consume() -> list[str]:
+        response = await job_events(request, path=tmp_path, max_events=None, keepalive_s=0.05)
+        return [chunk async for chunk in response.body_iterator]
+
+    chunks = asyncio.run(consume())
+
+    assert chunks[0].startswith("event: snapshot")
+    assert chunks[1:] == [": keepalive\n\n"]
+    assert request.checks == 2
+    assert store.events.subscriber_count() == 0
+
+
+def test_job_store_publishes_transitions_and_progress(tmp_path: Path):
+    store = JobStore(tmp_path)
+    sub = store.events.subscribe()
+    job = store.create("align", "S01E01")
+    store.claim_next(frozenset([LANE_ALIGN]), timeout=0)
+    store.mark_progress(job.job_id, {"progress_pct": 50})
+    store.publish_log(job.job_id, "info", "aligning")
+    store.mark_done(job.job_id, {"run_id": "r"})
+
+    events = [sub.get(0) for _ in range(5)]
+
+    assert [e["event"] for e in events] == ["job", "job", "progress", "log", "job"]
+    assert [e["data"].get("status") for e in events if e["event"] == EVENT_JOB] == ["pending", RUNNING, "done"]
+    assert events[2]["data"] == {"job_id": job.job_id, "progress_pct": 50}
+    store.close()
+
+
+def test_sse_endpoint_streams_snapshot_then_job_transitions(tmp_path: Path):
+    os.environ["HIMYC_PROJECT_PATH"] = str(tmp_path)
+    try:
+        store = get_job_store(tmp_path)
+
+        def submit_when_subscribed() -> None:
+            deadline = time.monotonic() + 10
+            while store.events.subscriber_count() == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            # Pas de raw.txt : le job échoue en pré-condition (pending -> running -> error).
+            store.create("normalize_transcript", "S01E01")
+
+        threading.Thread(target=submit_when_subscribed, daemon=True).start()
+        client = TestClient(app)
+        r = client.get("/jobs/events", params={"max_events": 3, "keepalive_s": 1})
+
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(r.text)
+        assert events[0] == ("snapshot", {"jobs": []})
+        assert [name for name, _ in events[1:]] == ["job", "job", "job"]
+        assert [data["status"] for _, data in events[1:]] == ["pending", "running", "error"]
+        assert store.events.subscriber_count() == 0
+    finally:
+        del os.environ["HIMYC_PROJECT_PATH"]
@@ -0,0 +1,83 @@
+"""Tests des jobs batch (liste d'épisodes / filtre de saison, verrou multi-épisodes, résultat par item)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from howimetyourcorpus.api.jobs import DONE, ERROR, LANE_CPU, JobRecord, JobStore, _execute_job
+from howimetyourcorpus.api.server import app
+from howimetyourcorpus.core.models import EpisodeRef, ProjectConfig, SeriesIndex
+from howimetyourcorpus.core.storage.project_store import ProjectStore
+
+CPU = frozenset([LANE_CPU])
+
+
+def _project(tmp_path: Path) -> ProjectStore:
+    config = ProjectConfig(project_name="batch", root_dir=tmp_path, source_id="subslikescript", series_url="")
+    ProjectStore.init_project(config)
+    store = ProjectStore(tmp_path)
+    refs = [
+        EpisodeRef(episode_id=f"S0{s}E0{e}", season=s, episode=e, title=f"Ep {e}", url="")
+        for s in (1, 2) for e in (1, 2)
+    ]
+    store.save_series_index(SeriesIndex(series_title="Show", series_url="", episodes=refs))
+    return store
+
+
+def test_batch_job_locks_all_its_episodes(tmp_path: Path):
+    store = JobStore(tmp_path)
+    batch = store.create("segment_batch", "", params={"episode_ids": ["S01E01", "S01E02"]})
+    single = store.create("normalize_transcript", "S01E02")
+    other = store.create("normalize_transcript", "S01E03")
+
+    assert store.claim_next(CPU, timeout=0).job_id == batch.job_id
+    assert store.claim_next(CPU, timeout=0).job_id == other.job_id
+    assert store.claim_next(CPU, timeout=0) is None
+
+    store.mark_done(batch.job_id)
+    assert store.claim_next(CPU, timeout=0).job_id == single.job_id
+    store.close()
+
+
+def test_normalize_batch_reports_per_item_results(tmp_path: Path):
+    project = _project(tmp_path)
+    project.save_episode_raw("S01E01", "Ted: Hello\nthere.\n", {})
+    project.save_episode_raw("S01E02", "Marshall: Lily!\n", {})
+    progress: list[float] = []
+    job = JobRecord(
+        "normalize_transcript_batch", "",
+        params={"episode_ids": ["S01E01", "S01E02", "S02E01"]},
+    )
+
+    result = _execute_job(job, tmp_path, on_progress=lambda _s, pct, _m: progress.append(pct))
+
+    assert [(it["episode_id"], it["status"]) for it in result["items"]] == [
+        ("S01E01", DONE), ("S01E02", DONE), ("S02E01", ERROR),
+    ]
+    assert (result["done"], result["errors"]) == (2, 1)
+    assert "RAW introuvable" in result["items"][2]["message"]
+    assert progress[-1] == 1.0
+    assert project.has_episode_clean("S01E02")
+    assert project.get_episode_prep_status("S01E01", "transcript") == "normalized"
+
+
+def test_create_batch_job_from_season_filter(tmp_path: Path):
+    _project(tmp_path)
+    os.environ["HIMYC_PROJECT_PATH"] = str(tmp_path)
+    try:
+        client = TestClient(app)
+        r = client.post("/jobs", json={"job_type": "segment_batch", "params": {"season": 2}})
+        assert r.status_code == 201
+        assert r.json()["params"]["episode_ids"] == ["S02E01", "S02E02"]
+
+        r = client.post("/jobs", json={"job_type": "align_batch", "params": {"season": 9}})
+        assert r.status_code == 400
+        assert r.json()["detail"]["error"] == "EMPTY_BATCH"
+
+        r = client.post("/jobs", json={"job_type": "align"})
+        assert r.json()["detail"]["error"] == "MISSING_EPISODE_ID"
+    finally:
+        del os.environ["HIMYC_PROJECT_PATH"]
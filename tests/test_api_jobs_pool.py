@@ -0,0 +1,127 @@
+"""Tests du pool de workers de jobs (files typées, verrou d'épisode, sous-processus CPU)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from howimetyourcorpus.api import jobs as jobs_mod
+from howimetyourcorpus.api.jobs import (
+    DONE,
+    LANE_ALIGN,
+    LANE_CPU,
+    RUNNING,
+    JobStore,
+    JobWorker,
+)
+
+CPU = frozenset([LANE_CPU])
+ALIGN = frozenset([LANE_ALIGN])
+
+
+def _wait_for(predicate, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return
+        time.sleep(0.02)
+    raise AssertionError("condition non atteinte avant timeout")
+
+
+def test_claim_respects_lanes_and_episode_lock(tmp_path: Path):
+    store = JobStore(tmp_path)
+    align = store.create("align", "S01E01")
+    norm_same_ep = store.create("normalize_transcript", "S01E01")
+    norm_other_ep = store.create("normalize_transcript", "S01E02")
+
+    assert store.claim_next(ALIGN, timeout=0).job_id == align.job_id
+    # S01E01 est occupé par l'align : la file CPU prend l'épisode suivant.
+    assert store.claim_next(CPU, timeout=0).job_id == norm_other_ep.job_id
+    assert store.claim_next(CPU, timeout=0) is None
+
+    store.mark_done(align.job_id)
+    claimed = store.claim_next(CPU, timeout=0)
+    assert claimed.job_id == norm_same_ep.job_id
+    assert store.get(claimed.job_id).status == RUNNING
+
+
+def test_claim_keeps_fifo_order_per_episode_across_lanes(tmp_path: Path):
+    store = JobStore(tmp_path)
+    store.create("normalize_transcript", "S01E01")
+    store.create("align", "S01E01")
+
+    # L'align ne double pas la normalisation pending du même épisode.
+    assert store.claim_next(ALIGN, timeout=0) is None
+
+
+def test_claim_wakes_up_on_create(tmp_path: Path):
+    store = JobStore(tmp_path)
+    claimed: list = []
+    waiter = threading.Thread(target=lambda: claimed.append(store.claim_next(CPU, timeout=10)))
+    waiter.start()
+    time.sleep(0.05)
+    job = store.create("segment_transcript", "S01E01")
+    waiter.join(timeout=5)
+
+    assert not waiter.is_alive()
+    assert claimed[0].job_id == job.job_id
+
+
+def test_align_job_does_not_block_cpu_lane(tmp_path: Path, monkeypatch):
+    release_align = threading.Event()
+    finished: list[str] = []
+
+    def fake_execute(job, project_path, on_progress=None, on_log=None, cancel_token=None):
+        if job.job_type == "align":
+            assert release_align.wait(10)
+        finished.append(job.episode_id)
+        return {}
+
+    monkeypatch.setattr(jobs_mod, "_execute_job", fake_execute)
+    store = JobStore(tmp_path)
+    worker = JobWorker(store, lambda: tmp_path, lane_workers={LANE_CPU: 2, LANE_ALIGN: 1}, use_processes=False)
+    align = store.create("align", "S01E01")
+    norms = [store.create("normalize_transcript", f"S01E0{i}") for i in (2, 3, 4)]
+    worker.start()
+    try:
+        _wait_for(lambda: store.get(align.job_id).status == RUNNING)
+        _wait_for(lambda: all(store.get(j.job_id).status == DONE for j in norms))
+        assert store.get(align.job_id).status == RUNNING
+        release_align.set()
+        _wait_for(lambda: store.get(align.job_id).status == DONE)
+    finally:
+        release_align.set()
+        worker.stop(wait=True)
+    assert finished[-1] == "S01E01"
+
+
+def test_normalize_job_runs_in_subprocess(make_project):
+    project, _db = make_project(with_db=False)
+    project.save_episode_raw("S01E01", "Ted: Hello\nthere.\n", {})
+    store = JobStore(project.root_dir)
+    worker = JobWorker(store, lambda: project.root_dir, lane_workers={LANE_CPU: 1, LANE_ALIGN: 0})
+    job = store.create("normalize_transcript", "S01E01")
+    worker.start()
+    try:
+        _wait_for(lambda: store.get(job.job_id).status not in ("pending", "running"), timeout=60)
+    finally:
+        worker.stop(wait=True)
+
+    assert store.get(job.job_id).status == DONE, store.get(job.job_id).error_msg
+    assert project.has_episode_clean("S01E01")
+    assert project.get_episode_prep_status("S01E01", "transcript") == "normalized"
+
+
+
+def test_subprocess_job_leaves_prep_status_to_parent(make_project):
+    project, _db = make_project(with_db=False)
+    project.save_episode_raw("S01E01", "Ted: Hello\nthere.\n", {})
+    job = jobs_mod.JobRecord("normalize_transcript", "S01E01")
+
+    jobs_mod._execute_job_dict(job.to_dict(), project.root_dir)
+
+    assert project.has_episode_clean("S01E01")
+    assert project.get_episode_prep_status("S01E01", "transcript") == "raw"
+    jobs_mod._record_prep_status(job, project.root_dir)
+    assert project.get_episode_prep_status("S01E01", "transcript") == "normalized"
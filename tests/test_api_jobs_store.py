@@ -0,0 +1,125 @@
+"""Tests du journal de jobs SQLite (jobs.db) : reprise, import jobs.json, progression, rétention."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from howimetyourcorpus.api.jobs import CANCELLED, DONE, ERROR, LANE_ALIGN, LANE_CPU, PENDING, JobStore
+from howimetyourcorpus.api.server import app
+
+LANES = frozenset([LANE_CPU, LANE_ALIGN])
+
+
+def _rows(path: Path) -> dict[str, tuple]:
+    conn = sqlite3.connect(str(path / "jobs.db"))
+    try:
+        return {r[0]: r[1:] for r in conn.execute("SELECT job_id, status, result FROM jobs")}
+    finally:
+        conn.close()
+
+
+def test_state_transitions_survive_restart(tmp_path: Path):
+    store = JobStore(tmp_path)
+    done = store.create("normalize_transcript", "S01E01")
+    running = store.create("align", "S01E02", params={"pivot_lang": "en"})
+    pending = store.create("segment_transcript", "S01E03")
+    assert store.claim_next(LANES, timeout=0).job_id == done.job_id
+    store.mark_done(done.job_id, {"profile": "default_en_v1"})
+    assert store.claim_next(LANES, timeout=0).job_id == running.job_id
+    store.close()
+
+    reopened = JobStore(tmp_path)
+
+    assert [j.job_id for j in reopened.list_all()] == [done.job_id, running.job_id, pending.job_id]
+    assert reopened.get(done.job_id).status == DONE
+    assert reopened.get(done.job_id).result == {"profile": "default_en_v1"}
+    assert reopened.get(running.job_id).status == PENDING  # running interrompu -> reprise
+    assert reopened.get(running.job_id).params == {"pivot_lang": "en"}
+    reopened.close()
+
+
+def test_progress_stays_in_memory(tmp_path: Path):
+    store = JobStore(tmp_path)
+    job = store.create("align", "S01E01")
+    assert store.claim_next(LANES, timeout=0).job_id == job.job_id
+
+    store.mark_progress(job.job_id, {"progress_pct": 40})
+
+    assert store.get(job.job_id).result["_progress"] == {"progress_pct": 40}
+    assert json.loads(_rows(tmp_path)[job.job_id][1]) == {}
+    store.mark_done(job.job_id, {"run_id": "r1"})
+    assert json.loads(_rows(tmp_path)[job.job_id][1]) == {"run_id": "r1"}
+    store.close()
+
+
+def test_resume_clears_error_message(tmp_path: Path):
+    store = JobStore(tmp_path)
+    job = store.create("align", "S01E01")
+    store.claim_next(LANES, timeout=0)
+    store.mark_error(job.job_id, "boom")
+
+    assert store.resume(job.job_id)
+    assert store.get(job.job_id).error_msg is None
+    store.close()
+
+    reopened = JobStore(tmp_path)
+    assert reopened.get(job.job_id).status == PENDING
+    assert reopened.get(job.job_id).error_msg is None
+    reopened.close()
+
+
+def test_legacy_jobs_json_is_imported_once(tmp_path: Path):
+    legacy = {"jobs": [
+        {"job_id": "a", "job_type": "normalize_srt", "episode_id": "S01E01", "status": "done"},
+        {"job_id": "b", "job_type": "align", "episode_id": "S01E02", "status": "running"},
+    ]}
+    (tmp_path / "jobs.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    store = JobStore(tmp_path)
+
+    assert [j.job_id for j in store.list_all()] == ["a", "b"]
+    assert store.get("b").status == PENDING
+    assert not (tmp_path / "jobs.json").exists()
+    assert (tmp_path / "jobs.json.bak").exists()
+    store.close()
+
+
+def test_prune_keeps_active_and_most_recent_finished(tmp_path: Path):
+    store = JobStore(tmp_path)
+    finished = []
+    for i in range(4):
+        job = store.create("normalize_transcript", f"S01E0{i}")
+        assert store.claim_next(LANES, timeout=0).job_id == job.job_id
+        if i % 2:
+            store.mark_error(job.job_id, "boom")
+        else:
+            store.mark_done(job.job_id)
+        finished.append(job.job_id)
+    cancelled = store.create("segment_transcript", "S02E01")
+    store.cancel(cancelled.job_id)
+    active = store.create("align", "S02E02")
+
+    assert store.prune(keep_finished=2) == 3
+    remaining = {j.job_id: j.status for j in store.list_all()}
+    assert remaining == {finished[3]: ERROR, cancelled.job_id: CANCELLED, active.job_id: PENDING}
+    assert set(_rows(tmp_path)) == set(remaining)
+    assert store.prune(older_than_days=0) == 2
+    assert [j.job_id for j in store.list_all()] == [active.job_id]
+    store.close()
+
+
+def test_prune_endpoint(tmp_path: Path):
+    os.environ["HIMYC_PROJECT_PATH"] = str(tmp_path)
+    try:
+        client = TestClient(app)
+        assert client.post("/jobs/prune", json={}).status_code == 400
+        r = client.post("/jobs/prune", json={"keep_finished": 10})
+        assert r.status_code == 200
+        assert r.json() == {"pruned": 0}
+    finally:
+        del os.environ["HIMYC_PROJECT_PATH"]
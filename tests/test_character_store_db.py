@@ -0,0 +1,101 @@
+"""Tests du stockage personnages en base (migration 009) : import JSON, filtre par épisode, export."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from howimetyourcorpus.core.storage.project_store import ProjectStore
+
+CHARACTERS = [
+    {"id": "ted", "canonical": "Ted", "names_by_lang": {"en": "Ted", "fr": "Ted"}, "aliases": ["Teddy"]},
+    {"id": "marshall", "canonical": "Marshall", "names_by_lang": {"en": "Marshall"}, "aliases": []},
+]
+
+
+def _assignments() -> list[dict]:
+    return [
+        {"episode_id": "S01E01", "source_type": "segment", "source_id": "S01E01:sentence:1", "character_id": "ted"},
+        {"episode_id": "S01E01", "segment_id": "S01E01:utterance:2", "character_id": "marshall", "speaker_label": "MARSHALL"},
+        {"episode_id": "S01E02", "source_type": "cue", "source_id": "S01E02:en:3", "character_id": "ted"},
+    ]
+
+
+def _write_legacy_json(store: ProjectStore) -> None:
+    (store.root_dir / store.CHARACTER_NAMES_JSON).write_text(
+        json.dumps({"characters": CHARACTERS}), encoding="utf-8"
+    )
+    (store.root_dir / store.CHARACTER_ASSIGNMENTS_JSON).write_text(
+        json.dumps({"assignments": _assignments()}), encoding="utf-8"
+    )
+
+
+def test_legacy_json_is_imported_once(make_project):
+    store, _db = make_project()
+    _write_legacy_json(store)
+
+    assert store.load_character_names() == CHARACTERS
+    assert store.load_character_assignments() == _assignments()
+
+    # Après l'import, les fichiers ne sont plus lus : la base fait foi.
+    store.save_character_assignments([])
+    (store.root_dir / store.CHARACTER_ASSIGNMENTS_JSON).write_text(
+        json.dumps({"assignments": _assignments()}), encoding="utf-8"
+    )
+    assert ProjectStore(store.root_dir).load_character_assignments() == []
+
+
+def test_episode_filter_and_replace(make_project):
+    store, _db = make_project()
+    store.save_character_names(CHARACTERS)
+    store.save_character_assignments(_assignments())
+
+    assert [a["source_id"] for a in store.load_character_assignments(episode_id="S01E02")] == ["S01E02:en:3"]
+
+    store.replace_episode_character_assignments(
+        "S01E01",
+        [{"episode_id": "S01E01", "source_type": "segment", "source_id": "S01E01:sentence:9", "character_id": "marshall"}],
+        keep=lambda a: "utterance" in (a.get("segment_id") or ""),
+    )
+    ep1 = store.load_character_assignments(episode_id="S01E01")
+    assert [a.get("segment_id") or a.get("source_id") for a in ep1] == ["S01E01:utterance:2", "S01E01:sentence:9"]
+    assert ep1[0]["speaker_label"] == "MARSHALL"
+    assert len(store.load_character_assignments(episode_id="S01E02")) == 1
+
+    store.add_character_assignments([{"episode_id": "S01E03", "cue_id": "S01E03:en:1", "character_id": "ted"}])
+    assert len(store.load_character_assignments()) == 4
+
+
+def test_catalog_validation_uses_db_references(make_project):
+    store, _db = make_project()
+    store.save_character_names(CHARACTERS)
+    store.save_character_assignments(_assignments())
+
+    with pytest.raises(ValueError):
+        store.save_character_names(CHARACTERS[1:])
+    assert store.load_character_names() == CHARACTERS
+
+
+def test_export_json_roundtrip(make_project, tmp_path: Path):
+    store, _db = make_project()
+    store.save_character_names(CHARACTERS)
+    store.save_character_assignments(_assignments())
+
+    paths = store.export_characters_json(tmp_path / "export")
+
+    assert [p.name for p in paths] == [store.CHARACTER_NAMES_JSON, store.CHARACTER_ASSIGNMENTS_JSON]
+    assert json.loads(paths[0].read_text(encoding="utf-8")) == {"characters": CHARACTERS}
+    assert json.loads(paths[1].read_text(encoding="utf-8")) == {"assignments": _assignments()}
+
+
+def test_without_db_json_is_used(make_project):
+    store, _db = make_project(with_db=False)
+    store.save_character_names(CHARACTERS)
+    store.save_character_assignments(_assignments())
+
+    assert not store.get_db_path().exists()
+    on_disk = json.loads((store.root_dir / store.CHARACTER_ASSIGNMENTS_JSON).read_text(encoding="utf-8"))
+    assert on_disk["assignments"] == _assignments()
+    assert len(store.load_character_assignments(episode_id="S01E01")) == 2
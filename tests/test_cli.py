@@ -0,0 +1,75 @@
+"""Tests de la CLI headless himyc (build / index / query / export, sortie JSON, sans Qt)."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from howimetyourcorpus.cli import EXIT_OK, EXIT_USAGE, main
+from howimetyourcorpus.core.models import EpisodeRef, ProjectConfig, SeriesIndex
+from howimetyourcorpus.core.storage.project_store import ProjectStore
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _project(tmp_path: Path) -> Path:
+    config = ProjectConfig(project_name="cli", root_dir=tmp_path, source_id="subslikescript", series_url="")
+    ProjectStore.init_project(config)
+    store = ProjectStore(tmp_path)
+    refs = [EpisodeRef(episode_id=f"S0{s}E01", season=s, episode=1, title=f"Ep {s}", url="") for s in (1, 2)]
+    store.save_series_index(SeriesIndex(series_title="Show", series_url="", episodes=refs))
+    store.save_episode_raw("S01E01", "Ted: It's going to be legendary.\nMarshall: Sure.\n", {})
+    store.save_episode_raw("S02E01", "Barney: Suit up!\n", {})
+    return tmp_path
+
+
+def _events(out: str) -> list[dict]:
+    return [json.loads(line) for line in out.splitlines() if line.strip()]
+
+
+def test_build_then_query_emits_json_events(tmp_path: Path, capsys):
+    root = str(_project(tmp_path))
+
+    assert main(["-p", root, "--json", "build", "--season", "1", "--jobs", "1"]) == EXIT_OK
+    events = _events(capsys.readouterr().out)
+    assert {"progress", "log", "result"} <= {e["event"] for e in events}
+    result = events[-1]
+    assert (result["command"], result["episodes"], result["failed"]) == ("build", 1, 0)
+    assert not ProjectStore(tmp_path).has_episode_clean("S02E01")
+
+    assert main(["-p", root, "--json", "query", "legendary", "--scope", "segments", "--kind", "sentence"]) == EXIT_OK
+    events = _events(capsys.readouterr().out)
+    hits = [e for e in events if e["event"] == "hit"]
+    assert [h["episode_id"] for h in hits] == ["S01E01"]
+    assert events[-1] == {"event": "result", "command": "query", "term": "legendary", "scope": "segments", "hits": 1}
+
+
+def test_export_corpus_to_explicit_path(tmp_path: Path, capsys):
+    root = str(_project(tmp_path))
+    out = tmp_path / "out" / "corpus.jsonl"
+
+    assert main(["-p", root, "export", "--format", "jsonl", "-o", str(out)]) == EXIT_OK
+    assert "episodes: 2" in capsys.readouterr().out
+    assert out.exists()
+
+
+def test_missing_project_is_usage_error(tmp_path: Path, capsys):
+    assert main(["-p", str(tmp_path), "index"]) == EXIT_USAGE
+    assert "config.toml" in capsys.readouterr().err
+
+
+def test_cli_never_imports_qt(tmp_path: Path):
+    root = str(_project(tmp_path))
+    code = (
+        "import sys\n"
+        "from howimetyourcorpus.cli import main\n"
+        f"rc = main(['-p', {root!r}, '--json', 'build', '--jobs', '1'])\n"
+        "assert rc == 0, rc\n"
+        "assert not [m for m in sys.modules if m.startswith('PySide6')]\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    proc = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,80 @@
+"""Tests de la normalisation par lot (process pool, écritures groupées, stats cumulées)."""
+
+from __future__ import annotations
+
+import pytest
+
+from howimetyourcorpus.cli import EXIT_OK, main
+from howimetyourcorpus.core.normalize.batch import NormalizeItem, normalize_batch
+from howimetyourcorpus.core.normalize.profiles import PROFILES, NormalizationProfile
+from howimetyourcorpus.core.storage.db import CorpusDB
+from howimetyourcorpus.core.storage.project_store import ProjectStore
+from howimetyourcorpus.core.subtitles import Cue
+
+RAW = {
+    "S01E01": "Ted: Kids, this is\nthe story.\nMarshall:  Sure!\n",
+    "S01E02": "Lily: Hi  there\nyou two.\n",
+}
+CUES = ["Salut  toi!", "Ça va?"]
+
+
+@pytest.fixture
+def project(make_project) -> tuple[ProjectStore, CorpusDB]:
+    store, db = make_project(RAW)
+    for eid, raw in RAW.items():
+        store.save_episode_raw(eid, raw, {})
+    db.add_track("S01E01:fr", "S01E01", "fr", "srt")
+    db.upsert_cues("S01E01:fr", "S01E01", "fr", [
+        Cue(episode_id="S01E01", lang="fr", n=i, start_ms=i * 1000, end_ms=i * 1000 + 900, text_raw=t, text_clean=t)
+        for i, t in enumerate(CUES)
+    ])
+    return store, db
+
+
+def test_batch_normalizes_transcripts_and_tracks_in_process_pool(project):
+    store, db = project
+    fr = PROFILES["default_fr_v1"]
+    items = [NormalizeItem(eid, "default_en_v1") for eid in RAW] + [NormalizeItem("S01E01", fr.id, "fr")]
+
+    report = normalize_batch(store, db, items, {}, max_workers=2, rewrite_srt=True)
+
+    assert sorted(report.done) == ["S01E01", "S01E01:fr", "S01E02"]
+    assert report.cues_updated == 2 and not report.failed
+    expected = {eid: PROFILES["default_en_v1"].apply(raw) for eid, raw in RAW.items()}
+    for eid, (clean, _stats, _debug) in expected.items():
+        assert store.load_episode_text(eid, kind="clean") == clean
+    assert report.stats.raw_lines == sum(s.raw_lines for _, s, _ in expected.values()) + len(CUES)
+    assert report.stats.merges == sum(s.merges for _, s, _ in expected.values())
+    cues = db.get_cues_for_episode_lang("S01E01", "fr")
+    assert [c["text_clean"] for c in cues] == [fr.apply(t)[0] for t in CUES]
+    assert fr.apply(CUES[0])[0] in store.load_episode_subtitle_content("S01E01", "fr")[0]
+    assert {r["status"] for r in db.get_episodes_by_status(None)} == {"normalized"}
+
+
+def test_batch_skips_fresh_transcripts_and_reports_failures(project):
+    store, db = project
+    items = [NormalizeItem("S01E01", "default_en_v1")]
+    normalize_batch(store, db, items, {}, max_workers=1)
+
+    custom = {"mine": NormalizationProfile(id="mine", case_transform="UPPERCASE")}
+    report = normalize_batch(store, db, items + [
+        NormalizeItem("S01E02", "mine"),
+        NormalizeItem("S01E02", "nope"),
+        NormalizeItem("S01E02", "mine", "de"),
+    ], custom, max_workers=1)
+
+    assert report.skipped == ["S01E01"]
+    assert report.done == ["S01E02"]
+    assert store.load_episode_text("S01E02", kind="clean").startswith("LILY:")
+    assert set(report.failed) == {"S01E02", "S01E02:de"}
+    assert "Profile not found" in report.failed["S01E02"]
+
+
+def test_cli_normalize_command(project, capsys):
+    store, _db = project
+
+    code = main(["-p", str(store.root_dir), "normalize", "--track", "fr", "--jobs", "1", "--profile", "default_fr_v1"])
+
+    assert code == EXIT_OK
+    assert store.has_episode_clean("S01E02")
+    assert "normalize" in capsys.readouterr().out
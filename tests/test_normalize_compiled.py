@@ -0,0 +1,68 @@
+"""Tests des profils compilés (équivalence avec l'implémentation de référence, cache, regex invalides)."""
+
+from __future__ import annotations
+
+import logging
+import random
+
+from howimetyourcorpus.core.normalize.compiled import compile_profile
+from howimetyourcorpus.core.normalize.profiles import PROFILES, NormalizationProfile
+
+ALPHABET = ['a', 'B', 'é', ' ', ' ', '  ', ';', ':', '!', '?', '"', "'", '.', ',', 'dude', 'Ted', '\t']
+CUSTOM_RULES = [(r"\bdude\b", "man"), (r"(\w+)!", r"\1 !"), (r"^\s+", "")]
+
+
+def _random_lines(seed: int, n: int = 300) -> list[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 25))) for _ in range(n)]
+
+
+def _variants() -> list[NormalizationProfile]:
+    out = list(PROFILES.values())
+    rng = random.Random(7)
+    for i in range(40):
+        out.append(NormalizationProfile(
+            id=f"fuzz_{i}",
+            fix_double_spaces=rng.random() < 0.5,
+            fix_french_punctuation=rng.random() < 0.5,
+            normalize_apostrophes=rng.random() < 0.5,
+            normalize_quotes=rng.random() < 0.5,
+            strip_line_spaces=rng.random() < 0.5,
+            case_transform=rng.choice(["none", "lowercase", "UPPERCASE", "Title Case", "Sentence case"]),
+            custom_regex_rules=rng.sample(CUSTOM_RULES, rng.randint(0, len(CUSTOM_RULES))),
+        ))
+    return out
+
+
+def test_compiled_program_matches_reference_line_rules():
+    lines = _random_lines(1)
+    for profile in _variants():
+        program = compile_profile(profile)
+        for line in lines:
+            expected, counters = profile._apply_line_rules(line)
+            assert program.apply_line(line) == (expected, counters["punctuation"], counters["regex"]), (
+                profile, line,
+            )
+
+
+def test_compiled_program_is_cached_per_rule_configuration():
+    a = NormalizationProfile(id="a", custom_regex_rules=[(r"\bdude\b", "man")])
+    b = NormalizationProfile(id="b", custom_regex_rules=[[r"\bdude\b", "man"]])
+    assert compile_profile(a) is compile_profile(b)
+    assert compile_profile(a) is not compile_profile(NormalizationProfile(id="c"))
+    # Règle désactivée ou sans effet : retirée du programme.
+    assert compile_profile(NormalizationProfile(id="d", normalize_apostrophes=True)).apostrophes is None
+
+
+def test_invalid_regex_rules_are_dropped_once_with_warning(caplog):
+    profile = NormalizationProfile(
+        id="broken_v1",
+        custom_regex_rules=[(r"([a-z", "x"), (r"dude", r"\9"), (r"\bdude\b", "man")],
+    )
+    with caplog.at_level(logging.WARNING, logger="howimetyourcorpus.core.normalize.compiled"):
+        clean, _stats, debug = profile.apply("Hey dude.\n\nSo, dude.")
+        profile.apply("dude")
+    assert clean == "Hey man.\n\nSo, man."
+    assert debug["regex_replacements"] == 2
+    assert debug["invalid_regex_rules"] == [r"([a-z", "dude"]
+    assert len(caplog.records) == 2
@@ -0,0 +1,91 @@
+"""Tests du moteur document : sortie identique (texte, stats, debug) au moteur ligne."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from howimetyourcorpus.core.normalize.profiles import PROFILES, NormalizationProfile
+from howimetyourcorpus.core.normalize.rules import DEBUG_COUNTERS, DEBUG_FULL, DEBUG_LEVELS, DEBUG_OFF
+
+ALPHABET = [
+    "a", "B", "é", "Σ", "İ", " ", "  ", "\t", " ", ";", ":", "!", "?", ".", '"', "'", "(", ")", "[", "]",
+    "Ted:", "TED :", "dude", "\n", "\n", "\n", "\n\n", "\r\n", "\r", "\x0b", " \n",
+]
+CUSTOM_RULES = [(r"\bdude\b", "man"), (r"^\s+", ""), (r"$", "!"), (r"a", "\n"), (r"(\w+)!", r"\1 !")]
+CASES = ["none", "lowercase", "UPPERCASE", "Title Case", "Sentence case"]
+
+
+def _both(profile: NormalizationProfile, text: str, debug_level: str = DEBUG_FULL):
+    line = profile.apply(text, engine="line", debug_level=debug_level)
+    document = profile.apply(text, engine="document", debug_level=debug_level)
+    line[1].duration_ms = document[1].duration_ms = 0
+    return line, document
+
+
+def _random_profile(rng: random.Random) -> NormalizationProfile:
+    return NormalizationProfile(
+        id="fuzz",
+        merge_subtitle_breaks=rng.random() < 0.8,
+        max_merge_examples_in_debug=rng.choice([0, 1, 20]),
+        fix_double_spaces=rng.random() < 0.5,
+        fix_french_punctuation=rng.random() < 0.5,
+        normalize_apostrophes=rng.random() < 0.5,
+        normalize_quotes=rng.random() < 0.5,
+        strip_line_spaces=rng.random() < 0.5,
+        case_transform=rng.choice(CASES),
+        custom_regex_rules=rng.sample(CUSTOM_RULES, rng.randint(0, 2)) if rng.random() < 0.4 else [],
+    )
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_document_engine_matches_line_engine_fuzz(seed: int):
+    rng = random.Random(seed)
+    for _ in range(500):
+        profile = _random_profile(rng)
+        text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 80)))
+        level = rng.choice(DEBUG_LEVELS)
+        line, document = _both(profile, text, level)
+        assert document == line, (profile, text, level)
+
+
+def test_document_engine_matches_line_engine_on_transcript():
+    text = (
+        "  Ted: Kids, in 2005 I  was\n"
+        "walking home\n"
+        "(laughs)\n"
+        "MARSHALL: What?!  \"Legendary\" he said;\n"
+        "and then \"wait\n"
+        "[door closes]\n"
+        "\n"
+        "Lily:Hi!!!\r\n"
+        "really ?\n"
+    ) * 40
+    for profile in PROFILES.values():
+        line, document = _both(profile, text)
+        assert document == line
+        assert document[1].merges > 0 and document[2]["merge_examples"]
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        PROFILES["default_en_v1"].apply("Hello", engine="fast")
+
+
+@pytest.mark.parametrize("engine", ["line", "document"])
+def test_debug_levels(engine: str):
+    profile = NormalizationProfile(id="dbg", fix_french_punctuation=True, case_transform="lowercase")
+    text = "Ted: Hello\nthere!\n\nMARSHALL: What?"
+    full = profile.apply(text, engine=engine, debug_level=DEBUG_FULL)
+    counters = profile.apply(text, engine=engine, debug_level=DEBUG_COUNTERS)
+    off = profile.apply(text, engine=engine, debug_level=DEBUG_OFF)
+
+    assert full[0] == counters[0] == off[0]
+    assert full[1].merges == counters[1].merges == off[1].merges == 1
+    assert off[2] == {}
+    assert counters[2] == {k: v for k, v in full[2].items() if isinstance(v, int)}
+    assert all(isinstance(v, int) for v in counters[2].values()) and counters[2]["punctuation_fixes"] == 2
+    assert full[2]["merge_examples"] and full[2]["history"]
+    with pytest.raises(ValueError):
+        profile.apply(text, engine=engine, debug_level="verbose")
@@ -0,0 +1,72 @@
+"""Tests de la normalisation incrémentale : même résultat que profile.apply(), blocs modifiés seuls recalculés."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from howimetyourcorpus.core.normalize.incremental import IncrementalNormalizer, split_blocks
+from howimetyourcorpus.core.normalize.profiles import PROFILES, NormalizationProfile
+from howimetyourcorpus.core.normalize.rules import DEBUG_LEVELS
+
+PIECES = [
+    "Ted: Kids,", "TED : so", "Marshall:", "walking", "home", "(laughs)", "[door closes]", "wait;", "dude!",
+    '"yes"', "  ", "", " ", "\t", "\r\n", "\n", "\n", "\n", "\n\n", "it's", "what?", "(aside",
+]
+
+
+def _random_text(rng: random.Random) -> str:
+    return " ".join(rng.choice(PIECES) for _ in range(rng.randint(0, 60)))
+
+
+def _strip_duration(result):
+    result[1].duration_ms = 0
+    return result
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_matches_apply_fuzz(seed: int):
+    rng = random.Random(seed)
+    normalizer = IncrementalNormalizer(max_chunks=40)
+    profiles = list(PROFILES.values()) + [
+        NormalizationProfile(
+            id="fuzz",
+            fix_double_spaces=False,
+            normalize_quotes=True,
+            case_transform="Sentence case",
+            max_merge_examples_in_debug=1,
+            custom_regex_rules=[(r"\bdude\b", "man"), (r"^\s+", "")],
+        )
+    ]
+    for _ in range(400):
+        profile = rng.choice(profiles)
+        text = _random_text(rng)
+        level = rng.choice(DEBUG_LEVELS)
+        expected = _strip_duration(profile.apply(text, debug_level=level))
+        assert _strip_duration(normalizer.apply(profile, text, debug_level=level)) == expected, (profile, text)
+
+
+def test_split_blocks_starts_at_strong_breaks():
+    text = "Ted: Hello\nthere\n\n(laughs)\nMarshall: Hi\r\nyou"
+    assert split_blocks(text) == ["Ted: Hello\nthere", "", "(laughs)", "Marshall: Hi\nyou"]
+    assert split_blocks("") == []
+
+
+def test_edit_recomputes_only_touched_chunk():
+    profile = PROFILES["default_en_v1"]
+    lines = []
+    for i in range(400):
+        lines += [f"Ted: line {i} is", f"cut here {'x' * (i % 7)}"]
+    normalizer = IncrementalNormalizer()
+    normalizer.apply(profile, "\n".join(lines))
+    chunks = normalizer.misses
+    assert chunks > 10
+
+    lines[301] = "cut here, edited"
+    edited = "\n".join(lines)
+    clean, _stats, _debug = normalizer.apply(profile, edited)
+
+    assert clean == profile.apply(edited)[0]
+    assert normalizer.misses - chunks <= 2
+    assert normalizer.hits >= chunks - 2
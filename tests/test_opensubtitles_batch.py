@@ -0,0 +1,253 @@
+"""Tests du téléchargement OpenSubtitles par lot contre un serveur local de substitution (pas de réseau)."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from howimetyourcorpus.core.models import ProjectConfig
+from howimetyourcorpus.core.pipeline.tasks import DownloadOpenSubtitlesBatchStep
+from howimetyourcorpus.core.storage.db import CorpusDB
+from howimetyourcorpus.core.storage.project_store import ProjectStore
+
+SRT_TEMPLATE = "1\n00:00:01,000 --> 00:00:02,000\nHello {ep}.\n\n2\n00:00:03,000 --> 00:00:04,000\nBye {ep}.\n"
+
+
+class _FakeOpenSubtitles:
+    """État du serveur de substitution : compteurs de requêtes + quota de téléchargement."""
+
+    def __init__(self) -> None:
+        self.searches = 0
+        self.downloads = 0
+        self.quota = 100
+        self.missing = {(1, 3)}
+        self.lock = threading.Lock()
+
+
+def _make_handler(state: _FakeOpenSubtitles):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):  # silence
+            pass
+
+        def _json(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == "/api/v1/subtitles":
+                q = parse_qs(url.query)
+                season, episode = int(q["season_number"][0]), int(q["episode_number"][0])
+                with state.lock:
+                    state.searches += 1
+                if (season, episode) in state.missing:
+                    return self._json(200, {"data": []})
+                file_id = season * 1000 + episode
+                return self._json(200, {"data": [{
+                    "id": str(file_id),
+                    "attributes": {
+                        "language": q["languages"][0],
+                        "download_count": 10,
+                        "files": [{"file_id": file_id, "file_name": f"ep{file_id}.srt"}],
+                    },
+                }]})
+            if url.path.startswith("/files/"):
+                file_id = int(url.path.rsplit("/", 1)[1])
+                body = SRT_TEMPLATE.format(ep=file_id).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return None
+            return self._json(404, {})
+
+        def do_POST(self):
+            if self.path != "/api/v1/download":
+                return self._json(404, {})
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            with state.lock:
+                if state.quota <= 0:
+                    return self._json(406, {"message": "quota"})
+                state.quota -= 1
+                state.downloads += 1
+                remaining = state.quota
+            host, port = self.server.server_address[:2]
+            return self._json(200, {
+                "link": f"http://{host}:{port}/files/{payload['file_id']}",
+                "remaining": remaining,
+            })
+
+    return Handler
+
+
+@pytest.fixture
+def fake_server():
+    state = _FakeOpenSubtitles()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield state, f"http://{host}:{port}/api/v1"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def project(tmp_path: Path):
+    config = ProjectConfig(project_name="os", root_dir=tmp_path, source_id="subslikescript", series_url="")
+    ProjectStore.init_project(config)
+    store = ProjectStore(tmp_path)
+    db = CorpusDB(store.get_db_path())
+    db.init()
+    return {"config": config, "store": store, "db": db}
+
+
+EPISODES = [("S01E01", 1, 1), ("S01E02", 1, 2), ("S01E03", 1, 3)]
+
+
+def _step(base_url: str) -> DownloadOpenSubtitlesBatchStep:
+    return DownloadOpenSubtitlesBatchStep(
+        EPISODES, ["en", "fr"], "key", "0460649", base_url=base_url, min_interval_s=0.0, flush_every=2
+    )
+
+
+def test_batch_downloads_missing_pairs_and_bulk_imports(fake_server, project):
+    state, base_url = fake_server
+    result = _step(base_url).run(project)
+
+    assert result.success, result.message
+    assert sorted(result.data["imported"]) == ["S01E01:en", "S01E01:fr", "S01E02:en", "S01E02:fr"]
+    assert sorted(result.data["not_found"]) == ["S01E03:en", "S01E03:fr"]
+    assert state.searches == 6
+    assert state.downloads == 4
+    db: CorpusDB = project["db"]
+    cues = db.get_cues_for_episode_lang("S01E02", "fr")
+    assert [c["text_clean"] for c in cues] == ["Hello 1002.", "Bye 1002."]
+    assert project["store"].has_episode_subs("S01E01", "en")
+
+
+def test_batch_never_requeries_cached_searches(fake_server, project):
+    state, base_url = fake_server
+    _step(base_url).run(project)
+    searches, downloads = state.searches, state.downloads
+
+    result = _step(base_url).run(project)
+
+    assert result.success
+    assert state.searches == searches  # recherches "introuvables" servies par le cache disque
+    assert state.downloads == downloads
+    assert result.data["imported"] == []  # paires importées par paquet pendant le lot : pas réimportées
+
+
+def test_batch_resumes_after_quota_exhaustion(fake_server, project):
+    state, base_url = fake_server
+    state.quota = 1
+    first = _step(base_url).run(project)
+
+    assert first.success
+    assert len(first.data["imported"]) == 1
+    assert len(first.data["pending_quota"]) == 3
+    searches = state.searches
+
+    state.quota = 100
+    second = _step(base_url).run(project)
+
+    assert second.success
+    assert len(second.data["imported"]) == 3
+    assert state.searches == searches  # reprise sans nouvelle recherche
+    assert len(project["db"].get_tracks_for_episode("S01E02")) == 2
+
+
+def test_batch_imports_downloaded_files_left_by_interrupted_run(fake_server, project):
+    _state, base_url = fake_server
+    store: ProjectStore = project["store"]
+    db: CorpusDB = project["db"]
+    # Simule un arrêt après téléchargement mais avant l'écriture DB.
+    run_without_db = dict(project)
+    run_without_db["db"] = None
+    step = _step(base_url)
+    step.run(run_without_db)
+    cache_path = store.get_cache_dir() / "opensubtitles" / "batch_0460649.json"
+    data = json.loads(cache_path.read_text(encoding="utf-8"))
+    for item in data["items"].values():
+        if item["status"] == "imported":
+            item["status"] = "downloaded"
+    cache_path.write_text(json.dumps(data), encoding="utf-8")
+    assert db.get_tracks_for_episode("S01E01") == []
+
+    result = _step(base_url).run(project)
+
+    assert result.success
+    assert len(db.get_tracks_for_episode("S01E01")) == 2
+
+
+def test_batch_writes_each_track_once(fake_server, project, monkeypatch):
+    _state, base_url = fake_server
+    store: ProjectStore = project["store"]
+    save_subtitles = store.save_episode_subtitles
+    saved: list[tuple[str, str]] = []
+
+    def record(episode_id, lang, *args, **kwargs):
+        saved.append((episode_id, lang))
+        return save_subtitles(episode_id, lang, *args, **kwargs)
+
+    def unexpected_write(*_args, **_kwargs):
+        raise AssertionError("piste écrite deux fois")
+
+    monkeypatch.setattr(store, "save_episode_subtitles", record)
+    monkeypatch.setattr(store, "save_episode_subtitle_content", unexpected_write)
+
+    result = _step(base_url).run(project)
+
+    assert result.success, result.message
+    assert sorted(saved) == [("S01E01", "en"), ("S01E01", "fr"), ("S01E02", "en"), ("S01E02", "fr")]
+    track = next(t for t in project["db"].get_tracks_for_episode("S01E01") if t["lang"] == "en")
+    assert track["source_path"] == str(store.get_episode_subtitle_path("S01E01", "en")[0])
+
+
+class _Crash(BaseException):
+    """Arrêt brutal simulé (ne passe pas par les except Exception du lot)."""
+
+
+def test_batch_resumes_after_crash_between_download_and_flush(fake_server, project, monkeypatch):
+    state, base_url = fake_server
+    db: CorpusDB = project["db"]
+    step = DownloadOpenSubtitlesBatchStep(
+        EPISODES, ["en", "fr"], "key", "0460649", base_url=base_url, min_interval_s=0.0, flush_every=100
+    )
+
+    store: ProjectStore = project["store"]
+    save_subtitles = store.save_episode_subtitles
+    calls = 0
+
+    def crash_after_third(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        save_subtitles(*args, **kwargs)
+        if calls == 3:
+            raise _Crash()
+
+    # Arrêt pendant le lot : fichiers déjà écrits sur disque, aucun paquet importé en DB.
+    monkeypatch.setattr(store, "save_episode_subtitles", crash_after_third)
+    with pytest.raises(_Crash):
+        step.run(project)
+    monkeypatch.undo()
+    assert db.get_tracks_for_episode("S01E01") == []
+    downloads = state.downloads
+
+    result = step.run(project)
+
+    assert result.success, result.message
+    assert sorted(result.data["imported"]) == ["S01E01:en", "S01E01:fr", "S01E02:en", "S01E02:fr"]
+    assert state.downloads == downloads  # fichiers déjà sur disque : pas de nouveau téléchargement
+    assert len(db.get_tracks_for_episode("S01E02")) == 2
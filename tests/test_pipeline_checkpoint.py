@@ -0,0 +1,71 @@
+"""Tests de l'annulation coopérative et de la reprise des jobs au checkpoint."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from howimetyourcorpus.api.jobs import CANCELLED, PENDING, RUNNING, JobStore
+from howimetyourcorpus.core.models import TransformStats
+from howimetyourcorpus.core.pipeline.checkpoint import CancellationToken, StepCheckpoint, checkpoint_path
+from howimetyourcorpus.core.pipeline.runner import PipelineRunner
+from howimetyourcorpus.core.pipeline.tasks import RebuildSegmentsIndexStep
+from howimetyourcorpus.core.storage.db import CorpusDB
+from howimetyourcorpus.core.storage.project_store import ProjectStore
+
+EPISODES = ["S01E01", "S01E02", "S01E03"]
+
+
+@pytest.fixture
+def project(make_project) -> tuple[ProjectStore, CorpusDB]:
+    store, db = make_project(EPISODES)
+    for eid in EPISODES:
+        store.save_episode_clean(eid, "Ted: Hello there. How are you?", TransformStats(), {})
+    return store, db
+
+
+def _segmented(store: ProjectStore) -> list[str]:
+    return [eid for eid in EPISODES if (store._episode_dir(eid) / "segments.jsonl").exists()]
+
+
+def test_cancelled_rebuild_stops_after_current_episode(project):
+    store, db = project
+    token = CancellationToken()
+    segmented: list[str] = []
+
+    def on_progress(_step: str, _pct: float, message: str) -> None:
+        if message.startswith("Segmented "):
+            segmented.append(message.split()[-1])
+            token.cancel()
+
+    ctx = {"store": store, "db": db, "is_cancelled": token}
+    results = PipelineRunner().run([RebuildSegmentsIndexStep()], ctx, on_progress=on_progress)
+
+    assert results[0].message == "Cancelled"
+    assert segmented == ["S01E01"]
+    assert _segmented(store) == ["S01E01"]
+
+
+def test_job_store_cancels_running_batch_then_resumes(tmp_path: Path):
+    store = JobStore(tmp_path)
+    job = store.create("align_batch", "", params={"episode_ids": ["S01E01"]})
+    single = store.create("align", "S01E02")
+    store.claim_next(frozenset(["align"]), timeout=0)
+    token = store.start_run(job.job_id)
+    StepCheckpoint.open(tmp_path, job.job_id).mark_done("align_batch", "S01E01")
+
+    assert store.cancel(job.job_id)
+    assert token.cancelled
+    assert store.get(job.job_id).status == RUNNING
+    store.mark_cancelled(job.job_id, {"done": 0})
+    store.end_run(job.job_id)
+    assert store.get(job.job_id).status == CANCELLED
+
+    assert store.resume(job.job_id)
+    assert store.get(job.job_id).status == PENDING
+    assert not store.resume(single.job_id)
+    store.claim_next(frozenset(["align"]), timeout=0)
+    store.mark_done(job.job_id)
+    assert not checkpoint_path(tmp_path, job.job_id).exists()
+    store.close()
@@ -0,0 +1,191 @@
+"""Tests de l'exécuteur DAG (dépendances par épisode, pools par ressource, writer DB unique)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from howimetyourcorpus.core.models import EpisodeRef, ProjectConfig, SeriesIndex
+from howimetyourcorpus.core.pipeline.dag import DagPipelineRunner, DeferredDbWrites, build_dag
+from howimetyourcorpus.core.pipeline.steps import RESOURCE_NETWORK, Step, StepResult
+from howimetyourcorpus.core.pipeline.tasks import BuildDbIndexStep, NormalizeEpisodeStep, SegmentEpisodeStep
+from howimetyourcorpus.core.storage.db import CorpusDB
+from howimetyourcorpus.core.storage.project_store import ProjectStore
+
+
+class _EpisodeStep(Step):
+    name = "ep"
+
+    def __init__(self, episode_id: str, ok: bool = True) -> None:
+        self.episode_id = episode_id
+        self.ok = ok
+
+    def run(self, context, *, force=False, on_progress=None, on_log=None) -> StepResult:
+        return StepResult(self.ok, "ok" if self.ok else "boom")
+
+
+class _GlobalStep(Step):
+    name = "global"
+
+    def run(self, context, *, force=False, on_progress=None, on_log=None) -> StepResult:
+        return StepResult(True, "global")
+
+
+class _RendezVousNetworkStep(Step):
+    """Ne réussit que si deux instances s'exécutent en même temps (pool réseau concurrent)."""
+
+    name = "rendezvous"
+    resource = RESOURCE_NETWORK
+    barrier = threading.Barrier(2, timeout=5)
+
+    def __init__(self, episode_id: str) -> None:
+        self.episode_id = episode_id
+
+    def run(self, context, *, force=False, on_progress=None, on_log=None) -> StepResult:
+        self.barrier.wait()
+        context["db"].set_episode_status(self.episode_id, "fetched")
+        return StepResult(True, "met")
+
+
+def test_build_dag_chains_episodes_and_barriers():
+    steps = [
+        _EpisodeStep("S01E01"),
+        _EpisodeStep("S01E02"),
+        _EpisodeStep("S01E01"),
+        _GlobalStep(),
+        _EpisodeStep("S01E02"),
+    ]
+    nodes = build_dag(steps)
+
+    assert nodes[0].requires == set() and nodes[1].requires == set()
+    assert nodes[2].requires == {0}
+    assert nodes[3].after == {0, 1, 2}
+    assert nodes[4].requires == {1} and nodes[4].after == {3}
+
+
+def test_dag_isolates_episode_failures():
+    steps = [
+        _EpisodeStep("S01E01", ok=False),
+        _EpisodeStep("S01E02"),
+        _EpisodeStep("S01E01"),
+        _EpisodeStep("S01E02"),
+        _GlobalStep(),
+    ]
+    errors: list[str] = []
+
+    results = DagPipelineRunner(use_processes=False).run(
+        steps, {"config": None, "store": None}, on_error=lambda name, exc: errors.append(str(exc))
+    )
+
+    assert [r.success for r in results] == [False, True, False, True, True]
+    assert results[2].message.startswith("Skipped")
+    assert errors == ["boom"]
+
+
+def test_dag_runs_network_steps_concurrently_and_replays_db_writes():
+    class _RecordingDB:
+        def __init__(self) -> None:
+            self.calls: list[tuple[str, str, str | None]] = []
+
+        def set_episode_status(self, episode_id: str, status: str) -> None:
+            self.calls.append((threading.current_thread().name, episode_id, status))
+
+    db = _RecordingDB()
+    steps = [_RendezVousNetworkStep("S01E01"), _RendezVousNetworkStep("S01E02")]
+
+    results = DagPipelineRunner(use_processes=False).run(steps, {"config": None, "store": None, "db": db})
+
+    assert all(r.success for r in results)
+    assert sorted(c[1] for c in db.calls) == ["S01E01", "S01E02"]
+    assert all(c[0].startswith("himyc-db-writer") for c in db.calls)
+
+
+def test_dag_cancel_still_replays_queued_db_writes():
+    class _RecordingDB:
+        def __init__(self) -> None:
+            self.calls: list[tuple[str, str]] = []
+
+        def set_episode_status(self, episode_id: str, status: str) -> None:
+            self.calls.append((episode_id, status))
+
+    cancel_seen = threading.Event()
+    network_done = threading.Event()
+
+    class _BusyWriterStep(Step):
+        """Occupe le writer jusqu'à l'annulation : le rejeu de l'étape réseau reste en file."""
+
+        name = "busy_writer"
+
+        def __init__(self, episode_id: str) -> None:
+            self.episode_id = episode_id
+
+        def run(self, context, *, force=False, on_progress=None, on_log=None) -> StepResult:
+            cancel_seen.wait(5)
+            time.sleep(0.2)
+            return StepResult(True, "busy")
+
+    class _NetworkStep(Step):
+        name = "fetch"
+        resource = RESOURCE_NETWORK
+
+        def __init__(self, episode_id: str) -> None:
+            self.episode_id = episode_id
+
+        def run(self, context, *, force=False, on_progress=None, on_log=None) -> StepResult:
+            context["db"].set_episode_status(self.episode_id, "fetched")
+            network_done.set()
+            return StepResult(True, "fetched")
+
+    def is_cancelled() -> bool:
+        if network_done.is_set():
+            cancel_seen.set()
+            return True
+        return False
+
+    db = _RecordingDB()
+    steps = [_BusyWriterStep("S01E02"), _NetworkStep("S01E01")]
+
+    results = DagPipelineRunner(use_processes=False).run(
+        steps, {"config": None, "store": None, "db": db, "is_cancelled": is_cancelled}
+    )
+
+    assert results[1].success
+    assert db.calls == [("S01E01", "fetched")]
+
+
+def test_deferred_db_writes_refuse_reads():
+    recorder = DeferredDbWrites()
+    recorder.upsert_segments("S01E01", "sentence", [])
+    with pytest.raises(AttributeError):
+        recorder.get_segments_for_episode("S01E01")
+    assert recorder.calls == [("upsert_segments", ("S01E01", "sentence", []), {})]
+
+
+def test_dag_pipeline_normalize_segment_index_in_process_pool(tmp_path: Path):
+    config = ProjectConfig(project_name="dag", root_dir=tmp_path, source_id="subslikescript", series_url="")
+    ProjectStore.init_project(config)
+    store = ProjectStore(tmp_path)
+    ids = ["S01E01", "S01E02", "S01E03"]
+    refs = [EpisodeRef(episode_id=e, season=1, episode=i + 1, title=e, url="") for i, e in enumerate(ids)]
+    store.save_series_index(SeriesIndex(series_title="T", series_url="", episodes=refs))
+    db = CorpusDB(store.get_db_path())
+    db.init()
+    db.upsert_episodes_batch(refs)
+    for eid in ids[:2]:
+        store.save_episode_raw(eid, f"Ted: Hello from {eid}.\nMarshall: Bye.\n", {})
+
+    steps: list[Step] = []
+    for eid in ids:
+        steps += [NormalizeEpisodeStep(eid, "default_en_v1"), SegmentEpisodeStep(eid, "en")]
+    steps.append(BuildDbIndexStep())
+    ctx = {"config": config, "store": store, "db": db}
+
+    results = DagPipelineRunner(max_cpu_workers=2, use_processes=True).run(steps, ctx)
+
+    assert [r.success for r in results] == [True, True, True, True, False, False, True]
+    assert results[5].message.startswith("Skipped")
+    assert sorted(db.get_episode_ids_indexed()) == ["S01E01", "S01E02"]
+    assert len(db.get_segments_for_episode("S01E02", kind="utterance")) == 2
@@ -0,0 +1,98 @@
+"""Tests des builds incrémentaux par empreintes (build_manifest.json par épisode)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from howimetyourcorpus.core.models import EpisodeRef, ProjectConfig, SeriesIndex, TransformStats
+from howimetyourcorpus.core.normalize.profiles import NormalizationProfile
+from howimetyourcorpus.core.pipeline.manifest import STAGE_NORMALIZE, STAGE_SEGMENT, BuildManifest
+from howimetyourcorpus.core.pipeline.runner import PipelineRunner
+from howimetyourcorpus.core.pipeline.tasks import BuildDbIndexStep, NormalizeEpisodeStep, SegmentEpisodeStep
+from howimetyourcorpus.core.storage.db import CorpusDB
+from howimetyourcorpus.core.storage.project_store import ProjectStore
+
+RAW = {
+    "S01E01": "Ted: Hello there.\nMarshall: Hi, dude.\n",
+    "S01E02": "Robin: Hello.\nLily: Bye.\n",
+    "S01E03": "Barney: Suit up!\n",
+}
+PROFILE_OF = {"S01E01": "prof_a", "S01E02": "prof_a", "S01E03": "prof_b"}
+
+
+@pytest.fixture
+def project(tmp_path: Path):
+    config = ProjectConfig(project_name="mf", root_dir=tmp_path, source_id="subslikescript", series_url="")
+    ProjectStore.init_project(config)
+    store = ProjectStore(tmp_path)
+    refs = [EpisodeRef(episode_id=e, season=1, episode=i + 1, title=e, url="") for i, e in enumerate(RAW)]
+    store.save_series_index(SeriesIndex(series_title="T", series_url="", episodes=refs))
+    db = CorpusDB(store.get_db_path())
+    db.init()
+    db.upsert_episodes_batch(refs)
+    for eid, raw in RAW.items():
+        store.save_episode_raw(eid, raw, {})
+    return config, store, db
+
+
+def _run(config, store, db, profiles: dict[str, NormalizationProfile]) -> list[str]:
+    steps = []
+    for eid in RAW:
+        steps += [NormalizeEpisodeStep(eid, PROFILE_OF[eid]), SegmentEpisodeStep(eid, "en")]
+    steps.append(BuildDbIndexStep())
+    ctx = {"config": config, "store": store, "db": db, "custom_profiles": profiles}
+    results = PipelineRunner().run(steps, ctx)
+    assert all(r.success for r in results)
+    return [r.message for r in results]
+
+
+def test_second_build_skips_every_stage(project):
+    config, store, db = project
+    profiles = {"prof_a": NormalizationProfile(id="prof_a"), "prof_b": NormalizationProfile(id="prof_b")}
+    _run(config, store, db, profiles)
+
+    messages = _run(config, store, db, profiles)
+
+    assert all(m.startswith("Already") for m in messages[:-1])
+    manifest = BuildManifest.load(store, "S01E01")
+    assert manifest.is_up_to_date(
+        STAGE_SEGMENT, {"clean": manifest.stages[STAGE_NORMALIZE]["output"], "lang_hint": "en"}
+    )
+
+
+def test_profile_edit_rebuilds_only_its_episodes_and_cascades_on_changed_clean(project):
+    config, store, db = project
+    profiles = {"prof_a": NormalizationProfile(id="prof_a"), "prof_b": NormalizationProfile(id="prof_b")}
+    _run(config, store, db, profiles)
+
+    # Nouvelle règle de prof_a : ne modifie que le texte de S01E01.
+    profiles["prof_a"] = NormalizationProfile(id="prof_a", custom_regex_rules=[(r"\bdude\b", "man")])
+    messages = _run(config, store, db, profiles)
+
+    assert messages[0].startswith("Normalized")  # S01E01 : profil modifié
+    assert messages[1].startswith("Segmented")  # clean.txt changé -> cascade
+    assert messages[2].startswith("Normalized")  # S01E02 : même profil, re-normalisé...
+    assert messages[3].startswith("Already segmented")  # ...mais clean identique : pas de cascade
+    assert messages[4].startswith("Already normalized")  # S01E03 : autre profil
+    assert messages[5].startswith("Already segmented")
+    assert "man." in store.load_episode_text("S01E01", kind="clean")
+    hits = db.query_kwic("man", window=10)
+    assert [h.episode_id for h in hits] == ["S01E01"]
+
+
+def test_outputs_predating_manifest_are_adopted(project):
+    config, store, db = project
+    store.save_episode_clean("S01E03", "Legacy clean text.", TransformStats(raw_lines=1, clean_lines=1), {})
+    ctx = {"config": config, "store": store, "db": db, "custom_profiles": {}}
+
+    first = NormalizeEpisodeStep("S01E03", "default_en_v1").run(ctx)
+    second = NormalizeEpisodeStep("S01E03", "default_en_v1").run(ctx)
+    rebuilt = NormalizeEpisodeStep("S01E03", "default_fr_v1").run(ctx)
+
+    assert first.message.startswith("Already normalized")
+    assert second.message.startswith("Already normalized")
+    assert rebuilt.message.startswith("Normalized")
+    assert store.load_episode_text("S01E03", kind="clean") != "Legacy clean text."
+
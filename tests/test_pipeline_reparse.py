@@ -0,0 +1,123 @@
+"""Tests ReparseEpisodesStep : reconstruction raw.txt depuis page.html (sans réseau) + invalidation en cascade."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from howimetyourcorpus.core.adapters.subslikescript import SubslikescriptAdapter
+from howimetyourcorpus.core.models import EpisodeRef, ProjectConfig, SeriesIndex, TransformStats
+from howimetyourcorpus.core.pipeline.tasks import ReparseEpisodesStep, SegmentEpisodeStep
+from howimetyourcorpus.core.storage.db import CorpusDB
+from howimetyourcorpus.core.storage.project_store import ProjectStore
+
+EPISODE_URL = "https://subslikescript.com/series/Show-1/season-1/episode-1"
+
+
+@pytest.fixture
+def project(tmp_path: Path, fixtures_dir: Path):
+    config = ProjectConfig(
+        project_name="reparse",
+        root_dir=tmp_path,
+        source_id="subslikescript",
+        series_url="",
+    )
+    ProjectStore.init_project(config)
+    store = ProjectStore(tmp_path)
+    refs = [
+        EpisodeRef(episode_id=f"S01E0{i}", season=1, episode=i, title=f"Ep {i}", url=EPISODE_URL)
+        for i in (1, 2)
+    ]
+    store.save_series_index(SeriesIndex(series_title="Show", series_url="", episodes=refs))
+    db = CorpusDB(store.get_db_path())
+    db.init()
+    db.upsert_episodes_batch(refs)
+    html = (fixtures_dir / "subslikescript_episode.html").read_text(encoding="utf-8")
+    for ref in refs:
+        store.save_episode_html(ref.episode_id, html)
+    return config, store, db, html
+
+
+def _seed_derived(store: ProjectStore, db: CorpusDB, episode_id: str, raw: str) -> None:
+    store.save_episode_raw(episode_id, raw, {"selectors_used": "old"})
+    store.save_episode_clean(episode_id, "Old clean text.", TransformStats(raw_lines=1, clean_lines=1), {})
+    ctx = {"config": None, "store": store, "db": db}
+    assert SegmentEpisodeStep(episode_id).run(ctx).success
+    db.index_episode_text(episode_id, "Old clean text.")
+
+
+def test_reparse_skips_unchanged_output(project):
+    config, store, db, html = project
+    raw, meta = SubslikescriptAdapter().parse_episode(html, EPISODE_URL)
+    _seed_derived(store, db, "S01E01", raw)
+    ctx = {"config": config, "store": store, "db": db}
+
+    result = ReparseEpisodesStep(["S01E01"], max_workers=1).run(ctx)
+
+    assert result.success
+    assert result.data["changed"] == []
+    assert result.data["unchanged"] == 1
+    assert store.has_episode_clean("S01E01")
+    assert "S01E01" in db.get_episode_ids_indexed()
+
+
+def test_reparse_rewrites_changed_raw_and_invalidates_derived(project):
+    config, store, db, _html = project
+    _seed_derived(store, db, "S01E01", "Stale raw text from an older adapter.")
+    ctx = {"config": config, "store": store, "db": db}
+
+    result = ReparseEpisodesStep(["S01E01"], max_workers=1).run(ctx)
+
+    assert result.success
+    assert result.data["changed"] == ["S01E01"]
+    assert "Legendary" in store.load_episode_text("S01E01", kind="raw")
+    ep_dir = store._episode_dir("S01E01")
+    assert not (ep_dir / "clean.txt").exists()
+    assert not (ep_dir / "transform_meta.json").exists()
+    assert not (ep_dir / "segments.jsonl").exists()
+    assert "S01E01" not in db.get_episode_ids_indexed()
+    assert db.get_segments_for_episode("S01E01") == []
+    statuses = {row["episode_id"]: row["status"] for row in db.get_episodes_by_status()}
+    assert statuses["S01E01"] == "fetched"
+
+
+def test_reparse_all_episodes_in_process_pool(project):
+    config, store, db, html = project
+    raw, _meta = SubslikescriptAdapter().parse_episode(html, EPISODE_URL)
+    store.save_episode_raw("S01E01", raw, {})
+    ctx = {"config": config, "store": store, "db": db}
+
+    result = ReparseEpisodesStep(max_workers=2).run(ctx)
+
+    assert result.success
+    assert result.data["changed"] == ["S01E02"]
+    assert result.data["unchanged"] == 1
+    assert store.load_episode_text("S01E02", kind="raw") == raw
+
+
+def test_reparse_reports_parse_failures(project):
+    config, store, db, _html = project
+    store.save_episode_html("S01E02", "<html><body><p>No script here.</p></body></html>")
+    ctx = {"config": config, "store": store, "db": db}
+
+    result = ReparseEpisodesStep(["S01E02"], max_workers=1).run(ctx)
+
+    assert not result.success
+    assert result.data["failed"] == ["S01E02"]
+    assert not store.has_episode_raw("S01E02")
+
+
+def test_reparse_partial_failure_fails_step_and_lists_episodes(project):
+    config, store, db, _html = project
+    store.save_episode_html("S01E02", "<html><body><p>No script here.</p></body></html>")
+    logs: list[tuple[str, str]] = []
+    ctx = {"config": config, "store": store, "db": db}
+
+    result = ReparseEpisodesStep(max_workers=1).run(ctx, on_log=lambda level, msg: logs.append((level, msg)))
+
+    assert not result.success
+    assert result.data["changed"] == ["S01E01"]
+    assert result.data["failed"] == ["S01E02"]
+    assert result.message.endswith("(S01E02)")
+    assert ("warning", "Re-parse failed for: S01E02") in logs
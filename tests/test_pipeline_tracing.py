@@ -0,0 +1,96 @@
+"""Tests du traçage pipeline (spans par étape / sous-opération, export runs/, résumé API)."""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from howimetyourcorpus.api.jobs import JobRecord, _execute_job
+from howimetyourcorpus.api.server import app
+from howimetyourcorpus.core.pipeline.dag import DagPipelineRunner
+from howimetyourcorpus.core.pipeline.runner import PipelineRunner
+from howimetyourcorpus.core.pipeline.tasks import NormalizeEpisodeStep, SegmentEpisodeStep
+from howimetyourcorpus.core.storage.project_store import ProjectStore
+from howimetyourcorpus.core.utils.tracing import Tracer, activate, trace_span
+
+RAW = "Ted: Hello there.\nMarshall: Hi, dude. How are you?\n"
+
+
+def _project(make_project, episodes: list[str]) -> ProjectStore:
+    store, _db = make_project(with_db=False)
+    for eid in episodes:
+        store.save_episode_raw(eid, RAW, {})
+    return store
+
+
+def _steps(episodes: list[str]) -> list:
+    steps: list = []
+    for eid in episodes:
+        steps += [NormalizeEpisodeStep(eid, "default_en_v1"), SegmentEpisodeStep(eid)]
+    return steps
+
+
+def test_trace_span_is_noop_without_active_tracer():
+    with trace_span("normalize", "normalize") as sp:
+        sp.items = 3
+    tracer = Tracer()
+    with activate(tracer), trace_span("normalize", "normalize", episode_id="S01E01") as sp:
+        sp.items = 3
+    assert [(s.name, s.items, s.episode_id) for s in tracer.spans] == [("normalize", 3, "S01E01")]
+
+
+def test_runner_spans_and_exports(make_project, tmp_path: Path):
+    store = _project(make_project, ["S01E01"])
+    tracer = Tracer()
+    with activate(tracer):
+        PipelineRunner().run(_steps(["S01E01"]), {"store": store})
+
+    names = {(s.category, s.name) for s in tracer.spans}
+    assert {("step", "normalize_episode"), ("normalize", "normalize"), ("segment", "segment")} <= names
+    normalize = next(s for s in tracer.spans if s.name == "normalize")
+    assert normalize.bytes == len(RAW) and normalize.items == 2 and normalize.wall_ms >= 0
+
+    paths = tracer.export(tmp_path, "run-1")
+    events = json.loads(paths["trace"].read_text(encoding="utf-8"))["traceEvents"]
+    assert {e["ph"] for e in events} == {"X"}
+    with paths["csv"].open(encoding="utf-8") as f:
+        assert len(list(csv.DictReader(f))) == len(tracer.spans)
+    summary = json.loads(paths["summary"].read_text(encoding="utf-8"))
+    assert summary["run_id"] == "run-1"
+    assert sum(op["count"] for op in summary["operations"]) == len(tracer.spans)
+
+
+def test_dag_collects_spans_from_worker_processes(make_project):
+    episodes = ["S01E01", "S01E02"]
+    store = _project(make_project, episodes)
+    tracer = Tracer()
+    with activate(tracer):
+        results = DagPipelineRunner(max_cpu_workers=2).run(_steps(episodes), {"store": store})
+
+    assert all(r.success for r in results)
+    normalized = {s.episode_id for s in tracer.spans if s.name == "normalize"}
+    assert normalized == set(episodes)
+    assert {s.pid for s in tracer.spans} - {os.getpid()}
+
+
+def test_traced_job_exports_summary_served_by_api(make_project):
+    root = _project(make_project, ["S01E01"]).root_dir
+    job = JobRecord("normalize_transcript", "S01E01", params={"trace": True})
+
+    result = _execute_job(job, root)
+
+    assert result["trace_run_id"] == job.job_id
+    os.environ["HIMYC_PROJECT_PATH"] = str(root)
+    try:
+        client = TestClient(app)
+        runs = client.get("/runs/traces").json()["runs"]
+        assert [r["run_id"] for r in runs] == [job.job_id]
+        summary = client.get(f"/runs/traces/{job.job_id}").json()
+        assert {op["name"] for op in summary["operations"]} >= {"normalize_transcript", "normalize"}
+        assert client.get("/runs/traces/nope").status_code == 404
+    finally:
+        del os.environ["HIMYC_PROJECT_PATH"]
@@ -167,3 +167,22 @@ def test_save_cue_edits_rolls_back_on_subtitle_rewrite_failure(
 
     assignments = store.load_character_assignments()
     assert not any(a.get("character_id") == "ted" for a in assignments)
+
+
+def test_apply_normalization_reuses_unchanged_blocks(tmp_path: Path) -> None:
+    store, db = _init_project(tmp_path)
+    service = PreparerService(store, db)
+    text = "Ted: Kids, in 2005\nI was walking home\n(laughs)\nMarshall: What?  \"Legendary\"\n"
+    options = {"profile_id": "default_en_v1", "input_text": text}
+
+    first = service.apply_normalization("S01E01", "transcript", options)
+    misses = service._normalizer.misses
+    second = PreparerService(store, db).apply_normalization(
+        "S01E01", "transcript", {**options, "input_text": text + "Lily: Hi!", "persist": True}
+    )
+
+    assert first["clean_text"] == "Ted: Kids, in 2005 I was walking home\n(laughs)\nMarshall: What? \"Legendary\""
+    assert second["clean_text"] == first["clean_text"] + "\nLily: Hi!"
+    assert second["stats"].merges == 1
+    assert service._normalizer.misses - misses <= 2
+    assert store.load_episode_text("S01E01", kind="clean") == second["clean_text"]
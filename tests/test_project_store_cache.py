@@ -0,0 +1,105 @@
+"""Tests du cache des fichiers annexes du projet (validation mtime/taille, écriture traversante, copies)."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from howimetyourcorpus.core.models import EpisodeRef, SeriesIndex
+from howimetyourcorpus.core.storage.project_store import ProjectStore
+from howimetyourcorpus.core.storage.project_store_cache import SIDECAR_CACHE
+
+
+@pytest.fixture
+def store(make_project) -> ProjectStore:
+    # Sans corpus.db : les personnages restent dans leurs fichiers JSON (cache des annexes).
+    return make_project(with_db=False)[0]
+
+
+def test_prep_status_loop_parses_once(store: ProjectStore):
+    store.save_episode_prep_status({f"S01E{i:02d}": {"transcript": "edited"} for i in range(1, 201)})
+    misses = SIDECAR_CACHE.misses
+
+    # Nouveau ProjectStore à chaque appel (comme l'API) : le cache est partagé par chemin.
+    statuses = [ProjectStore(store.root_dir).get_episode_prep_status(f"S01E{i:02d}", "transcript") for i in range(1, 201)]
+
+    assert statuses == ["edited"] * 200
+    assert SIDECAR_CACHE.misses == misses
+
+    for i in range(1, 21):
+        store.set_episode_prep_status(f"S01E{i:02d}", "srt_en", "verified")
+    assert SIDECAR_CACHE.misses == misses  # écriture traversante : rien à relire
+    on_disk = json.loads((store.root_dir / store.EPISODE_PREP_STATUS_JSON).read_text(encoding="utf-8"))
+    assert on_disk["statuses"]["S01E20"] == {"transcript": "edited", "srt_en": "verified"}
+
+
+def test_external_change_is_detected(store: ProjectStore):
+    store.save_character_assignments([{"cue_id": "c1", "character_id": "ted"}])
+    assert store.load_character_assignments()[0]["character_id"] == "ted"
+
+    path = store.root_dir / store.CHARACTER_ASSIGNMENTS_JSON
+    stat = path.stat()
+    # Même taille, mtime différent (éditeur externe, synchro) : relu.
+    path.write_text(path.read_text(encoding="utf-8").replace("ted", "bob"), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert store.load_character_assignments()[0]["character_id"] == "bob"
+
+    path.unlink()
+    assert store.load_character_assignments() == []
+
+
+def test_loads_return_copies(store: ProjectStore):
+    store.save_series_index(SeriesIndex("Show", "", [EpisodeRef("S01E01", 1, 1, "Pilot", "")]))
+    store.save_episode_segmentation_options({"S01E01": {"transcript": {}}})
+
+    store.load_series_index().episodes.clear()
+    store.load_episode_segmentation_options()["S01E01"].clear()
+    store.load_project_languages().append("xx")
+
+    assert [ep.episode_id for ep in store.load_series_index().episodes] == ["S01E01"]
+    assert "transcript" in store.load_episode_segmentation_options()["S01E01"]
+    assert "xx" not in store.load_project_languages()
+
+
+def test_loads_return_fresh_objects_from_cache(store: ProjectStore):
+    store.save_series_index(SeriesIndex("Show", "", [EpisodeRef("S01E01", 1, 1, "Pilot", "")]))
+    store.save_episode_prep_status({"S01E01": {"transcript": "edited"}})
+    store.save_character_names([{"id": "ted", "canonical": "Ted", "names_by_lang": {"en": "Ted"}, "aliases": ["T"]}])
+    store.save_character_assignments([{"episode_id": "S01E01", "source_type": "cue", "source_id": "c1", "character_id": "ted"}])
+    misses = SIDECAR_CACHE.misses
+
+    store.load_series_index().episodes[0].title = "changed"
+    store.load_episode_prep_status()["S01E01"]["transcript"] = "verified"
+    ted = store.load_character_names()[0]
+    ted["names_by_lang"]["fr"] = "Théodore"
+    ted["aliases"].append("Teddy")
+    store.load_character_assignments()[0]["character_id"] = "bob"
+    store.load_character_assignments("S01E01")[0]["character_id"] = "bob"
+
+    assert store.load_series_index().episodes[0].title == "Pilot"
+    assert store.get_episode_prep_status("S01E01", "transcript") == "edited"
+    assert store.load_character_names()[0]["names_by_lang"] == {"en": "Ted"}
+    assert store.load_character_names()[0]["aliases"] == ["T"]
+    assert [a["character_id"] for a in store.load_character_assignments()] == ["ted"]
+    assert SIDECAR_CACHE.misses == misses
+
+
+def test_invalid_custom_profiles_are_not_cached(store: ProjectStore):
+    path = store.root_dir / store.PROFILES_JSON
+    path.write_text("{not json", encoding="utf-8")
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            store.load_custom_profiles()
+
+    store.save_custom_profiles([{"id": "mine", "merge_subtitle_breaks": True}])
+    assert list(store.load_custom_profiles()) == ["mine"]
+
+
+def test_config_write_invalidates(store: ProjectStore):
+    assert store.load_config_extra()["project_name"] == "test"
+    store.save_config_extra({"series_imdb_id": "tt0460649"})
+    store.save_config_main(series_url="https://example.org/show")
+    extra = store.load_config_extra()
+    assert extra["series_imdb_id"] == "tt0460649" and extra["series_url"] == "https://example.org/show"
@@ -64,3 +64,24 @@ def test_project_store_load_episode_prep_status_accepts_legacy_dict_schema(tmp_p
     statuses = store.load_episode_prep_status()
     assert statuses["S01E01"]["transcript"] == "verified"
     assert statuses["S01E01"]["srt_en"] == "to_review"
+
+
+def test_concurrent_set_episode_prep_status_keeps_every_update(tmp_path: Path) -> None:
+    import threading
+
+    root = _make_store(tmp_path).root_dir
+
+    def update(worker: int) -> None:
+        for i in range(20):
+            # Un ProjectStore par appel, comme les requêtes API et les workers de jobs.
+            ProjectStore(root).set_episode_prep_status(f"S{worker:02d}E{i:02d}", "transcript", "normalized")
+
+    threads = [threading.Thread(target=update, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    statuses = json.loads((root / ProjectStore.EPISODE_PREP_STATUS_JSON).read_text(encoding="utf-8"))["statuses"]
+    assert len(statuses) == 160
+    assert not list(root.glob("*.tmp"))
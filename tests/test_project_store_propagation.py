@@ -5,8 +5,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from howimetyourcorpus.core.models import ProjectConfig
+from howimetyourcorpus.core.models import EpisodeRef, ProjectConfig
+from howimetyourcorpus.core.segment import Segment
+from howimetyourcorpus.core.storage.db import CorpusDB
 from howimetyourcorpus.core.storage.project_store import ProjectStore
+from howimetyourcorpus.core.subtitles import Cue
 
 
 class _FakePropagationDB:
@@ -23,6 +26,7 @@ class _FakePropagationDB:
         self.get_cues_calls: dict[str, int] = {}
         self.updated_segments: list[tuple[str, str]] = []
         self.updated_cues: list[tuple[str, str]] = []
+        self.apply_calls = 0
 
     def query_alignment_for_episode(self, episode_id: str, run_id: str | None = None) -> list[dict[str, Any]]:  # noqa: ARG002
         return list(self._links)
@@ -30,21 +34,20 @@ class _FakePropagationDB:
     def get_align_run(self, run_id: str) -> dict[str, Any] | None:  # noqa: ARG002
         return dict(self._run)
 
-    def update_segment_speaker(self, segment_id: str, speaker_explicit: str | None) -> None:
-        self.updated_segments.append((segment_id, speaker_explicit or ""))
-
     def get_cues_for_episode_lang(self, episode_id: str, lang: str) -> list[dict[str, Any]]:  # noqa: ARG002
         key = (lang or "").strip().lower()
         self.get_cues_calls[key] = self.get_cues_calls.get(key, 0) + 1
         return self._cues_by_lang.get(key, [])
 
-    def update_cue_text_clean(self, cue_id: str, text_clean: str) -> None:
-        self.updated_cues.append((cue_id, text_clean))
-        for cues in self._cues_by_lang.values():
-            for cue in cues:
-                if cue.get("cue_id") == cue_id:
-                    cue["text_clean"] = text_clean
-                    return
+    def apply_character_propagation(
+        self,
+        segment_speakers: list[tuple[str, str]],
+        cue_texts: list[tuple[str, str]],
+    ) -> tuple[int, int]:
+        self.apply_calls += 1
+        self.updated_segments.extend(segment_speakers)
+        self.updated_cues.extend(cue_texts)
+        return len(segment_speakers), len(cue_texts)
 
 
 def _init_store(tmp_path: Path) -> ProjectStore:
@@ -199,5 +202,69 @@ def test_propagation_rewrites_all_updated_languages_by_default(tmp_path: Path) -
     assert nb_seg == 1
     assert nb_cue == 2
     assert db.get_cues_calls == {"en": 1, "fr": 1}
+    assert db.apply_calls == 1
     assert store.load_episode_subtitle_content("S01E01", "en") is not None
     assert store.load_episode_subtitle_content("S01E01", "fr") is not None
+
+
+def _seed_episode(db: CorpusDB, episode_id: str, episode: int) -> str:
+    db.upsert_episode(EpisodeRef(episode_id=episode_id, season=1, episode=episode, title="", url=""))
+    db.upsert_segments(
+        episode_id,
+        "sentence",
+        [Segment(episode_id=episode_id, kind="sentence", n=0, start_char=0, end_char=5, text="Hello")],
+    )
+    for lang, text in (("en", "Hello"), ("fr", "Bonjour")):
+        db.add_track(f"{episode_id}:{lang}", episode_id, lang, "srt")
+        db.upsert_cues(
+            f"{episode_id}:{lang}",
+            episode_id,
+            lang,
+            [Cue(episode_id=episode_id, lang=lang, n=0, start_ms=0, end_ms=900, text_raw=text, text_clean=text)],
+        )
+    run_id = f"{episode_id}:align:1"
+    db.create_align_run(run_id, episode_id, "en")
+    db.upsert_align_links(
+        run_id,
+        episode_id,
+        [
+            {"segment_id": f"{episode_id}:sentence:0", "cue_id": f"{episode_id}:en:0", "lang": "en", "role": "pivot"},
+            {"cue_id": f"{episode_id}:en:0", "cue_id_target": f"{episode_id}:fr:0", "lang": "fr", "role": "target"},
+        ],
+    )
+    return run_id
+
+
+def test_batch_propagation_updates_db_and_fts_in_one_pass(tmp_path: Path) -> None:
+    store = _init_store(tmp_path)
+    db = CorpusDB(store.get_db_path())
+    db.init()
+    runs = {eid: _seed_episode(db, eid, n) for n, eid in enumerate(("S01E01", "S01E02"), start=1)}
+    store.save_character_names([{"id": "ted", "canonical": "Ted", "names_by_lang": {"fr": "Théodore"}}])
+    store.save_character_assignments(
+        [
+            {"episode_id": eid, "source_type": "segment", "source_id": f"{eid}:sentence:0", "character_id": "ted"}
+            for eid in runs
+        ]
+    )
+
+    counts = store.propagate_character_names_batch(db, runs)
+
+    assert counts == {"S01E01": (1, 2), "S01E02": (1, 2)}
+    assert db.get_distinct_speaker_explicit(list(runs)) == ["Ted"]
+    assert db.get_cues_for_episode_lang("S01E02", "fr")[0]["text_clean"] == "Théodore: Bonjour"
+    assert len(db.query_kwic_cues("Théodore", lang="fr")) == 2
+    conn = db._conn()  # noqa: SLF001 - vérification directe des index FTS
+    try:
+        hits = conn.execute("SELECT segment_id FROM segments_fts WHERE segments_fts MATCH 'speaker_explicit:Ted'").fetchall()
+        assert len(hits) == 2
+        conn.execute("INSERT INTO segments_fts(segments_fts) VALUES('integrity-check')")
+        conn.execute("INSERT INTO cues_fts(cues_fts) VALUES('integrity-check')")
+        triggers = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+        assert {"segments_au", "subtitle_cues_au"} <= triggers
+    finally:
+        conn.close()
+    assert "Théodore: Bonjour" in store.load_episode_subtitle_content("S01E01", "fr")[0]
+
+    # Idempotent : préfixes déjà présents, rien à réécrire.
+    assert store.propagate_character_names_batch(db, runs) == {"S01E01": (1, 0), "S01E02": (1, 0)}
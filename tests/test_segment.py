@@ -3,6 +3,7 @@
 
 from howimetyourcorpus.core.segment import (
     Segment,
+    segment_text,
     segmenter_sentences,
     segmenter_utterances,
 )
@@ -74,3 +75,22 @@ def test_segmenter_utterances_no_speaker_invented():
     segs = segmenter_utterances(text)
     assert len(segs) == 1
     assert segs[0].speaker_explicit is None
+
+
+def test_segment_text_exact_offsets_on_repeated_phrases():
+    text = "  Ted: Okay. Okay.\nMarshall: Okay.\n\n(laughs)\nOkay."
+    sentences, utterances = segment_text(text, "en", episode_id="S01E01")
+    assert [s.text for s in sentences] == ["Ted: Okay.", "Okay.", "Marshall: Okay.\n\n(laughs)\nOkay."]
+    assert [u.text for u in utterances] == ["Okay. Okay.", "Okay.", "(laughs)", "Okay."]
+    assert all(text[s.start_char : s.end_char] == s.text for s in sentences + utterances)
+    assert [u.speaker_explicit for u in utterances] == ["Ted", "Marshall", None, None]
+    assert utterances[2].meta == {"didascalia": True}
+    assert sentences[0].segment_id == "S01E01:sentence:0" and sentences[0].meta == {"lang_hint": "en"}
+
+
+def test_segmenter_sentences_abbreviations_by_lang():
+    en = segmenter_sentences("Mr. Mosby is here. Dr. Stangel too.", "en")
+    assert [s.text for s in en] == ["Mr. Mosby is here.", "Dr. Stangel too."]
+    fr = segmenter_sentences("M. Mosby est là ! Ça va ? Oui, Mme. Eriksen aussi.", "fr")
+    assert [s.text for s in fr] == ["M. Mosby est là !", "Ça va ?", "Oui, Mme. Eriksen aussi."]
+    assert len(segmenter_sentences("Mr. Mosby is here.", "xx")) == 2
@@ -6,9 +6,9 @@ from pathlib import Path
 
 import pytest
 
-from howimetyourcorpus.app.tabs.tab_sous_titres import (
-    _normalize_episode_id,
-    _parse_subtitle_filename,
+from howimetyourcorpus.core.subtitles.bulk_import import (
+    normalize_episode_id as _normalize_episode_id,
+    parse_subtitle_filename as _parse_subtitle_filename,
 )
 
 
@@ -37,6 +37,8 @@ def test_normalize_episode_id(s: str, expected: str | None) -> None:
         ("S01E01.fr.vtt", "S01E01", "fr"),
         ("Show - 1x01 - Title.en.srt", "S01E01", "en"),
         ("Something_2x03_extra.it.srt", "S02E03", "it"),
+        ("S01E01_en.ass", "S01E01", "en"),
+        ("Show - 1x02 - Title.fr.ttml", "S01E02", "fr"),
         ("en.srt", None, None),
         ("random.srt", None, None),
     ],
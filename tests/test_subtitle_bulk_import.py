@@ -0,0 +1,131 @@
+"""Tests de l'import en masse de sous-titres (dossier / ZIP, process pool, FTS différé)."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import zipfile
+from pathlib import Path
+
+from howimetyourcorpus.cli import EXIT_OK, main
+from howimetyourcorpus.core.normalize.profiles import PROFILES
+from howimetyourcorpus.core.storage.db import CorpusDB
+from howimetyourcorpus.core.subtitles import Cue
+from howimetyourcorpus.core.subtitles.bulk_import import (
+    SubtitleFile,
+    discover_subtitle_files,
+    import_subtitles_bulk,
+)
+
+SRT = "1\n00:00:01,000 --> 00:00:02,000\n{text}\n\n2\n00:00:03,000 --> 00:00:04,000\nSuit  up!\n"
+EPISODES = ["S01E01", "S01E02"]
+VTT = "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\n{text}\n"
+
+
+def _write_folder(folder: Path) -> None:
+    (folder / "S01E02").mkdir(parents=True)
+    (folder / "S01E01_en.srt").write_text(SRT.format(text="Legendary"), encoding="utf-8")
+    (folder / "Show - 1x01 - Pilot.fr.srt").write_bytes(SRT.format(text="Légendaire").encode("cp1252"))
+    (folder / "S01E02" / "en.vtt").write_text(VTT.format(text="Wait for it"), encoding="utf-8")
+    (folder / "notes.srt").write_text(SRT.format(text="?"), encoding="utf-8")
+
+
+def _fts_ok(db: CorpusDB) -> None:
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute("INSERT INTO cues_fts(cues_fts, rank) VALUES('integrity-check', 1)")
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+    assert {"subtitle_cues_ai", "subtitle_cues_ad", "subtitle_cues_au"} <= names
+
+
+def test_discover_folder_and_zip(tmp_path: Path):
+    folder = tmp_path / "subs"
+    _write_folder(folder)
+    found = {(Path(f.path).name, f.episode_id, f.lang) for f in discover_subtitle_files(folder)}
+    assert found == {
+        ("S01E01_en.srt", "S01E01", "en"),
+        ("Show - 1x01 - Pilot.fr.srt", "S01E01", "fr"),
+        ("en.vtt", "S01E02", "en"),
+        ("notes.srt", None, None),
+    }
+
+    archive = tmp_path / "subs.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        for p in folder.rglob("*.*"):
+            zf.write(p, p.relative_to(folder).as_posix())
+    zipped = {(f.member, f.episode_id, f.lang) for f in discover_subtitle_files(archive)}
+    assert ("S01E02/en.vtt", "S01E02", "en") in zipped and ("notes.srt", None, None) in zipped
+    assert len(zipped) == 4
+
+
+def test_bulk_import_writes_tracks_and_fts_in_process_pool(make_project, tmp_path: Path):
+    store, db = make_project(EPISODES)
+    folder = tmp_path / "subs"
+    _write_folder(folder)
+    # Piste existante remplacée : ses anciennes cues doivent sortir de l'index FTS.
+    db.add_track("S01E01:en", "S01E01", "en", "srt")
+    db.upsert_cues("S01E01:en", "S01E01", "en", [Cue("S01E01", "en", 1, 0, 500, "Obsolete", "Obsolete")])
+
+    files = discover_subtitle_files(folder)
+    report = import_subtitles_bulk(store, db, files, max_workers=2)
+
+    assert sorted(report.imported) == ["S01E01:en", "S01E01:fr", "S01E02:en"]
+    assert report.cues_imported == 5 and not report.failed
+    assert list(report.skipped) == [str((folder / "notes.srt").resolve())]
+    assert [c["text_raw"] for c in db.get_cues_for_episode_lang("S01E01", "fr")] == ["Légendaire", "Suit  up!"]
+    assert store.load_episode_subtitle_content("S01E02", "en")[1] == "vtt"
+    assert db.query_kwic_cues("Obsolete") == []
+    assert [h.cue_id for h in db.query_kwic_cues("Légendaire")] == ["S01E01:fr:0"]
+    _fts_ok(db)
+    # Triggers rétablis : une écriture ordinaire met toujours l'index à jour.
+    db.upsert_cues("S01E02:en", "S01E02", "en", [Cue("S01E02", "en", 1, 0, 500, "Awesome", "Awesome")])
+    assert [h.cue_id for h in db.query_kwic_cues("Awesome")] == ["S01E02:en:1"]
+    assert db.query_kwic_cues("Wait") == []
+    _fts_ok(db)
+
+
+def test_bulk_import_applies_profile_and_skips_duplicates(make_project, tmp_path: Path):
+    store, db = make_project(EPISODES)
+    folder = tmp_path / "subs"
+    folder.mkdir()
+    (folder / "S01E01_en.srt").write_text(SRT.format(text="Kids!"), encoding="utf-8")
+    files = discover_subtitle_files(folder)
+    duplicate = SubtitleFile(files[0].path, "", "S01E01", "en")
+
+    report = import_subtitles_bulk(store, db, [*files, duplicate], profile_id="default_fr_v1", max_workers=1)
+
+    assert report.imported == ["S01E01:en"] and len(report.skipped) == 1
+    fr = PROFILES["default_fr_v1"]
+    cues = db.get_cues_for_episode_lang("S01E01", "en")
+    assert [c["text_clean"] for c in cues] == [fr.apply("Kids!")[0], fr.apply("Suit  up!")[0]]
+
+
+def test_bulk_import_converts_ass_to_srt(make_project, tmp_path: Path):
+    store, db = make_project(EPISODES)
+    folder = tmp_path / "subs"
+    folder.mkdir()
+    (folder / "S01E01_en.ass").write_text(
+        "[Script Info]\n\n[Events]\n"
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+        "Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,{\\i1}Legendary{\\i0}\\Nwait for it\n",
+        encoding="utf-8",
+    )
+
+    report = import_subtitles_bulk(store, db, discover_subtitle_files(folder), max_workers=1)
+
+    assert report.imported == ["S01E01:en"]
+    with sqlite3.connect(db.db_path) as conn:
+        fmt, meta_json = conn.execute("SELECT format, meta_json FROM subtitle_tracks").fetchone()
+    assert fmt == "srt" and json.loads(meta_json) == {"source": "S01E01_en.ass", "source_format": "ass"}
+    content, fmt = store.load_episode_subtitle_content("S01E01", "en")
+    assert fmt == "srt" and "Legendary\nwait for it" in content
+    assert [c["text_clean"] for c in db.get_cues_for_episode_lang("S01E01", "en")] == ["Legendary wait for it"]
+
+
+def test_cli_import_subs_zip(make_project, tmp_path: Path):
+    store, db = make_project(EPISODES)
+    archive = tmp_path / "subs.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("S01E01.en.srt", SRT.format(text="Legendary"))
+    assert main(["-p", str(store.root_dir), "import-subs", str(archive), "--jobs", "1"]) == EXIT_OK
+    track = db.get_tracks_for_episode("S01E01")[0]
+    assert track["lang"] == "en" and track["source_path"] == f"{archive}/S01E01.en.srt"
@@ -0,0 +1,148 @@
+"""Tests du recalage temporel des sous-titres (estimation, UPDATE unique, SRT réécrit, transformation enregistrée)."""
+
+from __future__ import annotations
+
+import json
+import random
+import sqlite3
+
+import pytest
+
+from howimetyourcorpus.cli import EXIT_OK, main
+from howimetyourcorpus.core.storage.db import CorpusDB
+from howimetyourcorpus.core.subtitles import Cue, parse_subtitle_content
+from howimetyourcorpus.core.subtitles.retiming import (
+    RetimeSegment,
+    Retiming,
+    estimate_retiming,
+    retime_subtitle_track,
+)
+
+
+def _reference(rng: random.Random, n: int = 300) -> list[dict]:
+    cues, t = [], 1000
+    for i in range(n):
+        t += rng.randint(800, 4000)
+        duration = rng.randint(900, 3500)
+        cues.append({"n": i, "start_ms": t, "end_ms": t + duration})
+        t += duration
+    return cues
+
+
+def _desync(rng: random.Random, reference: list[dict], truth: Retiming) -> list[dict]:
+    """Piste d'une autre release : cues manquantes, timecodes bruités, puis inverse de `truth`."""
+    cues = []
+    for c in reference:
+        if rng.random() < 0.1:
+            continue
+        start = c["start_ms"] + rng.randint(-150, 150)
+        end = c["end_ms"] + rng.randint(-150, 150)
+        segment = next(
+            s for s in reversed(truth.segments)
+            if (start - s.offset_ms) / s.scale >= s.start_ms or s is truth.segments[0]
+        )
+        cues.append({
+            "n": len(cues),
+            "start_ms": round((start - segment.offset_ms) / segment.scale),
+            "end_ms": round((end - segment.offset_ms) / segment.scale),
+        })
+    return cues
+
+
+@pytest.mark.parametrize(
+    "truth",
+    [
+        Retiming.shift(-3400),
+        Retiming.from_framerate(23.976, 25, offset_ms=1200),
+        Retiming([RetimeSegment(0, 1.0, 2000), RetimeSegment(300_000, 1.0, -8000)]),
+    ],
+    ids=["offset", "framerate", "piecewise"],
+)
+def test_estimate_recovers_transform(truth: Retiming):
+    rng = random.Random(7)
+    reference = _reference(rng)
+    cues = _desync(rng, reference, truth)
+    estimated = estimate_retiming(reference, cues, reference_lang="en")
+
+    assert estimated.kind == truth.kind
+    assert estimated.score_before < 0.6 < 0.9 < estimated.score_after
+    for got, want in zip(estimated.segments, truth.segments):
+        assert got.scale == pytest.approx(want.scale, rel=1e-4)
+        assert got.offset_ms == pytest.approx(want.offset_ms, abs=60)
+    if truth.kind == "piecewise":
+        assert len(estimated.segments) == 2
+        assert abs(estimated.segments[1].start_ms - 300_000) < 10_000
+
+
+def test_estimate_keeps_synchronous_track():
+    rng = random.Random(3)
+    reference = _reference(rng)
+    estimated = estimate_retiming(reference, _desync(rng, reference, Retiming()))
+    assert estimated.is_identity
+    assert estimated.score_after == estimated.score_before
+
+
+def test_retiming_roundtrip_and_validation():
+    retiming = Retiming([RetimeSegment(0, 1.0, 500), RetimeSegment(10_000, 1.5, -100)])
+    assert retiming.apply_cue(9_999, 12_000) == (10_499, 12_500)  # segment choisi par le début
+    assert retiming.apply_cue(10_000, 11_000) == (14_900, 16_400)
+    assert Retiming.shift(-5000).apply_cue(1000, 2000) == (0, 0)
+    assert Retiming.from_dict(retiming.to_dict()).to_dict() == retiming.to_dict()
+    with pytest.raises(ValueError):
+        Retiming([RetimeSegment(0, 0.0, 0)])
+
+
+def _add_track(db: CorpusDB, lang: str, cues: list[dict]) -> None:
+    db.add_track(f"S01E01:{lang}", "S01E01", lang, "srt", meta_json=json.dumps({"source": f"{lang}.srt"}))
+    db.upsert_cues(
+        f"S01E01:{lang}",
+        "S01E01",
+        lang,
+        [Cue("S01E01", lang, c["n"], c["start_ms"], c["end_ms"], f"ligne {c['n']}", f"ligne {c['n']}") for c in cues],
+    )
+
+
+def test_retime_track_single_update_srt_and_meta(make_project):
+    store, db = make_project(["S01E01"])
+    rng = random.Random(11)
+    truth = Retiming([RetimeSegment(0, 25 / 23.976, 700), RetimeSegment(250_000, 25 / 23.976, 9000)])
+    reference = _reference(rng, 150)
+    _add_track(db, "en", reference)
+    _add_track(db, "fr", _desync(rng, reference, truth))
+    before = db.get_cues_for_episode_lang("S01E01", "fr")
+
+    retiming = Retiming([RetimeSegment(0, 1.0427, 700.4), RetimeSegment(250_000, 1.0427, 9000)])
+    assert retime_subtitle_track(store, db, "S01E01", "fr", retiming) == len(before)
+
+    after = db.get_cues_for_episode_lang("S01E01", "fr")
+    expected = retiming.apply(before)
+    assert [(c["start_ms"], c["end_ms"]) for c in after] == [(c["start_ms"], c["end_ms"]) for c in expected]
+    srt = (store.root_dir / "episodes" / "S01E01" / "subs" / "fr.srt").read_text(encoding="utf-8")
+    cues, _fmt = parse_subtitle_content(srt, "fr.srt")
+    assert [(c.start_ms, c.end_ms) for c in cues] == [(c["start_ms"], c["end_ms"]) for c in after]
+
+    with sqlite3.connect(db.db_path) as conn:
+        meta = json.loads(conn.execute("SELECT meta_json FROM subtitle_tracks WHERE track_id = 'S01E01:fr'").fetchone()[0])
+        conn.execute("INSERT INTO cues_fts(cues_fts, rank) VALUES('integrity-check', 1)")
+        triggers = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+    assert meta["source"] == "fr.srt"
+    assert meta["retiming"][0]["kind"] == "piecewise" and meta["retiming"][0]["applied_at"]
+    assert "subtitle_cues_au" in triggers
+    assert db.query_kwic_cues("ligne", lang="fr")
+
+
+def test_cli_retime_against_reference(make_project, capsys):
+    store, db = make_project(["S01E01"])
+    rng = random.Random(5)
+    reference = _reference(rng, 200)
+    _add_track(db, "en", reference)
+    _add_track(db, "fr", _desync(rng, reference, Retiming.shift(2500)))
+
+    code = main(["-p", str(store.root_dir), "--json", "retime", "fr", "--ref", "en"])
+
+    assert code == EXIT_OK
+    result = [json.loads(line) for line in capsys.readouterr().out.splitlines()][-1]
+    assert result["command"] == "retime" and result["ok"] == 1
+    (retimed,) = result["retimed"]
+    assert retimed["kind"] == "offset" and retimed["segments"][0]["offset_ms"] == pytest.approx(2500, abs=60)
+    assert main(["-p", str(store.root_dir), "retime", "fr"]) == 2
@@ -1,9 +1,25 @@
-"""Tests Phase 3 : parsing SRT/VTT, Cue, normalisation."""
+"""Tests Phase 3 : parsing SRT/VTT (+ ASS/SSA, TTML, SBV via le registre de formats), Cue, normalisation."""
+
+import io
 
 import pytest
 from pathlib import Path
 
-from howimetyourcorpus.core.subtitles import Cue, cues_to_audit_rows, parse_srt, parse_vtt, parse_subtitle_file
+from howimetyourcorpus.core.subtitles import (
+    Cue,
+    cues_to_audit_rows,
+    detect_subtitle_format,
+    parse_srt,
+    parse_subtitle_content,
+    parse_subtitle_file,
+    parse_vtt,
+    to_project_subtitles,
+)
+from howimetyourcorpus.core.subtitles.parsers import (
+    detect_subtitle_encoding,
+    iter_subtitle_stream,
+    read_subtitle_file_content,
+)
 
 
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
@@ -101,3 +117,181 @@ def test_cues_to_audit_rows():
     assert rows[0]["start_ms"] == 1000
     assert rows[1]["cue_id"] == "S01E01:en:1"
     assert rows[1]["text_clean"] == "There"
+
+
+SRT_ACCENTS = "1\r\n00:00:01,000 --> 00:00:02,000\r\nDéjà vu, été\r\n\r\n2\r\n00:00:03,000 --> 00:00:04,000\r\nÇa va\r\n"
+
+
+@pytest.mark.parametrize(
+    ("encoding", "expected"),
+    [("utf-8", "utf-8"), ("utf-8-sig", "utf-8-sig"), ("utf-16", "utf-16"), ("cp1252", "cp1252")],
+)
+def test_subtitle_encoding_detected_once(tmp_path: Path, encoding: str, expected: str):
+    data = SRT_ACCENTS.encode(encoding)
+    assert detect_subtitle_encoding(data) == expected
+    path = tmp_path / "ep.srt"
+    path.write_bytes(data)
+    assert read_subtitle_file_content(path) == SRT_ACCENTS.replace("\r\n", "\n")
+    cues, fmt = parse_subtitle_file(path)
+    assert fmt == "srt"
+    assert [c.text_clean for c in cues] == ["Déjà vu, été", "Ça va"]
+
+
+def test_stream_encoding_covers_whole_file(tmp_path: Path):
+    # Début ASCII (> SUBTITLE_SNIFF_BYTES), cp1252 seulement à la fin : même texte par les deux entrées.
+    blocks = [f"{i}\r\n00:00:01,000 --> 00:00:02,000\r\nLine number {i}\r\n" for i in range(1, 2500)]
+    blocks.append("2500\r\n00:00:03,000 --> 00:00:04,000\r\nCafé Crème\r\n")
+    path = tmp_path / "ep.srt"
+    path.write_bytes("\r\n".join(blocks).encode("cp1252"))
+    assert path.stat().st_size > 100_000
+
+    cues, _fmt = parse_subtitle_file(path)
+    from_content, _ = parse_subtitle_content(read_subtitle_file_content(path))
+
+    assert cues[-1].text_clean == "Café Crème"
+    assert [c.text_clean for c in cues] == [c.text_clean for c in from_content]
+
+
+def test_stream_and_content_detection_agree_on_crlf():
+    vtt = "\r\n" * 8 + "WEBVTT\r\n\r\n00:01.000 --> 00:02.000\r\nHi\r\n"
+    _cues, stream_fmt = iter_subtitle_stream(io.BytesIO(vtt.encode("utf-8")))
+    assert parse_subtitle_content(vtt)[1] == stream_fmt == detect_subtitle_format(vtt) == "vtt"
+
+
+def test_iter_subtitle_stream_is_lazy_and_shares_track_meta():
+    vtt = "WEBVTT\n\nNOTE skipped\nblock\n\n00:01.000 --> 00:02.000\n<v Ted>Hi</v>\n\n00:00:03.000 --> 00:00:04.000\nBye\n"
+    cues, fmt = iter_subtitle_stream(io.BytesIO(vtt.encode("utf-8")), source_path="ep.vtt")
+    assert fmt == "vtt"
+    first = next(cues)
+    assert (first.n, first.start_ms, first.end_ms, first.text_clean) == (0, 1000, 2000, "Hi")
+    rest = list(cues)
+    assert [c.text_clean for c in rest] == ["Bye"]
+    assert first.meta == {"source_path": "ep.vtt"} and rest[0].meta is first.meta
+
+
+ASS = """\ufeff[Script Info]
+ScriptType: v4.00+
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize
+Style: Default,Arial,20
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.50,0:00:03.05,Default,Ted,0,0,0,,{\\i1}Kids,{\\i0} this is\\Nthe story, of how
+Comment: 0,0:00:02.00,0:00:03.00,Default,,0,0,0,,hidden
+Dialogue: 0,0:00:04.00,0:00:05.00,Sign,,0,0,0,,{\\p1}m 0 0 l 100 0 100 100{\\p0}
+Dialogue: 0,0:01:06.00,0:01:07.00,Default,,0,0,0,,{\\pos(10,20)}Wait\\hfor it, 1,2
+"""
+
+TTML = """<?xml version="1.0" encoding="UTF-8"?>
+<tt xmlns="http://www.w3.org/ns/ttml" xmlns:tts="http://www.w3.org/ns/ttml#styling"
+    xmlns:ttp="http://www.w3.org/ns/ttml#parameter" ttp:frameRate="25" ttp:tickRate="10000000">
+  <body>
+    <div begin="00:00:10.000">
+      <p begin="00:00:01.000" end="00:00:02.500">Hello<br/>
+        <span tts:fontStyle="italic">world</span>  !</p>
+      <p begin="5s" dur="1500ms">Second</p>
+      <p begin="00:00:20:05" end="300000000t">Frames</p>
+      <p>Untimed</p>
+    </div>
+  </body>
+</tt>
+"""
+
+SBV = "0:00:01.000,0:00:02.000\nHi\nthere\n\n0:00:03.500,0:00:04.000\n>> Bye\n"
+
+
+def _timed(cues):
+    return [(c.n, c.start_ms, c.end_ms, c.text_raw) for c in cues]
+
+
+def test_parse_ass_strips_override_tags_and_drawings():
+    cues, fmt = parse_subtitle_content(ASS, "ep.ass")
+    assert fmt == "ass"
+    assert _timed(cues) == [
+        (0, 1500, 3050, "Kids, this is\nthe story, of how"),
+        (1, 66000, 67000, "Wait for it, 1,2"),
+    ]
+    assert cues[0].text_clean == "Kids, this is the story, of how"
+    assert cues[0].meta == {"source_path": "ep.ass"} and cues[1].meta is cues[0].meta
+
+
+def test_parse_ssa_follows_format_line():
+    ssa = (
+        "[Script Info]\nScriptType: v4.00\n\n[Events]\n"
+        "Format: Marked, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+        "Dialogue: Marked=0,0:00:02.5,0:00:04.00,Default,,0000,0000,0000,,Hi there\n"
+    )
+    cues, fmt = parse_subtitle_content(ssa)
+    assert fmt == "ass"
+    assert _timed(cues) == [(0, 2500, 4000, "Hi there")]
+
+
+def test_parse_ttml_nested_timing_frames_and_ticks():
+    cues, fmt = parse_subtitle_content(TTML)
+    assert fmt == "ttml"
+    assert _timed(cues) == [
+        (0, 11000, 12500, "Hello\nworld !"),
+        (1, 15000, 16500, "Second"),
+        (2, 30200, 40000, "Frames"),
+    ]
+
+
+def test_ttml_stream_matches_content_parse():
+    cues, fmt = iter_subtitle_stream(io.BytesIO(TTML.encode("utf-16")), source_path="ep.ttml")
+    assert fmt == "ttml"
+    assert _timed(cues) == _timed(parse_subtitle_content(TTML)[0])
+
+
+def test_parse_sbv():
+    cues, fmt = parse_subtitle_content(SBV)
+    assert fmt == "sbv"
+    assert _timed(cues) == [(0, 1000, 2000, "Hi\nthere"), (1, 3500, 4000, ">> Bye")]
+
+
+@pytest.mark.parametrize(
+    ("head", "expected"),
+    [
+        ("1\n00:00:01,000 --> 00:00:02,000\nHi\n", "srt"),
+        ("WEBVTT\n\n00:01.000 --> 00:02.000\nHi\n", "vtt"),
+        (ASS, "ass"),
+        (TTML, "ttml"),
+        ("<tt:tt xmlns:tt='http://www.w3.org/ns/ttml'>", "ttml"),
+        (SBV, "sbv"),
+        ("", "srt"),
+    ],
+)
+def test_detect_subtitle_format(head: str, expected: str):
+    assert detect_subtitle_format(head) == expected
+
+
+@pytest.mark.parametrize(("name", "content"), [("ep.ass", ASS), ("ep.ttml", TTML), ("ep.sbv", SBV)])
+def test_other_formats_convert_to_srt(tmp_path: Path, name: str, content: str):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    cues, fmt = parse_subtitle_file(path)
+    assert fmt == path.suffix[1:]
+    srt, stored_fmt = to_project_subtitles(content, fmt, cues)
+    assert stored_fmt == "srt"
+    assert _timed(parse_srt(srt)) == _timed(cues)
+    assert to_project_subtitles("WEBVTT\n", "vtt", []) == ("WEBVTT\n", "vtt")
+
+
+def test_parsers_and_formats_share_cues_module_without_lazy_imports():
+    import ast
+
+    from howimetyourcorpus.core.subtitles import cues, formats, parsers
+
+    for module in (parsers, formats):
+        tree = ast.parse(Path(module.__file__).read_text(encoding="utf-8"))
+        lazy = [
+            node.module
+            for fn in ast.walk(tree)
+            if isinstance(fn, ast.FunctionDef)
+            for node in ast.walk(fn)
+            if isinstance(node, ast.ImportFrom)
+        ]
+        assert lazy == [], module.__name__
+    assert parsers.Cue is formats.Cue is cues.Cue
+    assert formats.SubtitleFormatRegistry.list_ids() == ["srt", "vtt", "ass", "ttml", "sbv"]